@@ -14,8 +14,6 @@ import schedule
 import time
 
 from src.core.config import settings
-from src.signal_generator import signal_generator
-from src.report_generator import report_generator
 
 def setup_logging(log_level: str = 'INFO', log_file: Optional[str] = None):
     """Setup logging configuration"""
@@ -57,6 +55,10 @@ def generate_signals(pairs: List[str], output_formats: List[str] = None,
     """
     logger = logging.getLogger(__name__)
     
+    # Imported here so --help and argument errors don't load the analysis stack
+    from src.signal_generator import signal_generator
+    from src.report_generator import report_generator
+    
     if output_formats is None:
         output_formats = ['txt', 'json']
     
@@ -45,6 +45,13 @@ except ImportError:
         )
         from yfinance_helper import yfinance_helper
 
+try:
+    from src.core.tracing import traced
+except ImportError:
+    # Standalone Signals checkout: no tracing
+    def traced(name=None, category='stage', capture=(), **static_attributes):
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
 class DataFetcher:
@@ -70,8 +77,8 @@ class DataFetcher:
             'daily': 24,   # 24 hours for daily data
         }
         
-        # Load historical cache
-        self.historical_cache = self._load_historical_cache()
+        # Historical cache is unpickled on first access (see historical_cache)
+        self._historical_cache = None
         
         # Optimized API rotation for 6 AM execution
         self.forex_api_rotation = [
@@ -99,6 +106,17 @@ class DataFetcher:
             return f"{base}/{quote}"
         return symbol  # Return as-is if not standard format
     
+    @property
+    def historical_cache(self) -> Dict:
+        """Historical data cache, loaded from disk on first use"""
+        if self._historical_cache is None:
+            self._historical_cache = self._load_historical_cache()
+        return self._historical_cache
+    
+    @historical_cache.setter
+    def historical_cache(self, cache: Dict):
+        self._historical_cache = cache
+    
     def _load_historical_cache(self) -> Dict:
         """Load historical data cache from disk"""
         try:
@@ -168,6 +186,7 @@ class DataFetcher:
         except Exception:
             return False
     
+    @traced('fetch.forex_data', category='fetch', capture=('pair', 'interval'))
     def fetch_forex_data_smart(self, pair: str, interval: str = '4hour') -> Optional[Dict]:
         """
         Smart forex data fetching with caching and API optimization
@@ -227,6 +246,7 @@ class DataFetcher:
             logger.error(f"Smart fetch error for {pair} {interval}: {e}")
             return None
     
+    @traced('fetch.yfinance', category='fetch', provider='yfinance', capture=('pair', 'interval'))
     def _fetch_yfinance_data(self, pair: str, interval: str) -> Optional[Dict]:
         """Fetch data using yfinance helper"""
         try:
@@ -308,6 +328,7 @@ class DataFetcher:
         except Exception as e:
             logger.debug(f"Cache cleanup error: {e}")
     
+    @traced('fetch.current_price', category='fetch', capture=('pair',))
     def get_current_price_validated(self, pair: str) -> Optional[float]:
         """
         Get current price with multi-source validation
@@ -460,6 +481,18 @@ class DataFetcher:
             logger.error(f"Cache statistics error: {e}")
             return {'error': str(e)}
 
+    def collect_samples(self):
+        """Scrape-time samples from get_cache_statistics for the shared metrics registry"""
+        stats = self.get_cache_statistics()
+        for cache_name in ('historical_cache', 'yfinance_cache'):
+            cache_stats = stats.get(cache_name) or {}
+            for state in ('valid', 'expired'):
+                yield 'signals_cache_entries', {'cache': cache_name, 'state': state}, cache_stats.get(f'{state}_entries')
+        for api_name, used in (stats.get('daily_api_usage') or {}).items():
+            if isinstance(used, (int, float)):
+                yield 'signals_daily_api_calls', {'api': api_name}, used
+
+    @traced('fetch.alpha_vantage', category='fetch', provider='alpha_vantage', capture=('from_symbol', 'to_symbol'))
     @alpha_vantage_rate_limit(priority=1)
     @price_data_cache(ttl=3600)
     def fetch_alpha_vantage_forex(self, from_symbol: str, to_symbol: str, 
@@ -530,6 +563,7 @@ class DataFetcher:
             'last_updated': datetime.now().isoformat()
         }
     
+    @traced('fetch.twelve_data', category='fetch', provider='twelve_data', capture=('symbol', 'interval'))
     @twelve_data_rate_limit(priority=2)
     @price_data_cache(ttl=3600)
     def fetch_twelve_data_forex(self, symbol: str, interval: str = '4h') -> Optional[Dict]:
@@ -613,6 +647,7 @@ class DataFetcher:
         # Use the new smart fetching method with caching and validation
         return self.fetch_forex_data_smart(pair, interval)
     
+    @traced('fetch.fred', category='fetch', provider='fred', capture=('series_id',))
     @fred_rate_limit(priority=3)
     @economic_data_cache(ttl=14400)  # 4 hours
     def fetch_fred_data(self, series_id: str) -> Optional[Dict]:
@@ -661,6 +696,7 @@ class DataFetcher:
             'last_updated': datetime.now().isoformat()
         }
     
+    @traced('fetch.finnhub_calendar', category='fetch', provider='finnhub')
     @finnhub_rate_limit(priority=2)
     def fetch_finnhub_economic_calendar(self) -> Optional[List[Dict]]:
         """
@@ -710,6 +746,7 @@ class DataFetcher:
         
         return high_impact_events
     
+    @traced('fetch.news', category='fetch', provider='newsapi', capture=('query',))
     @news_api_rate_limit(priority=3)
     def fetch_news_sentiment(self, query: str, sources: str = None) -> Optional[List[Dict]]:
         """
@@ -759,6 +796,7 @@ class DataFetcher:
         
         return processed_articles
     
+    @traced('fetch.central_bank_feeds', category='fetch', provider='rss', capture=('currency',))
     def fetch_central_bank_feeds(self, currency: str) -> Optional[List[Dict]]:
         """
         Fetch central bank RSS feeds
@@ -814,6 +852,7 @@ class DataFetcher:
             logger.error(f"Central bank feed error for {currency}: {e}")
             return None
     
+    @traced('fetch.gdelt', category='fetch', provider='gdelt')
     def fetch_gdelt_events(self, currencies: List[str]) -> Optional[List[Dict]]:
         """
         Fetch geopolitical events from GDELT
@@ -966,6 +1005,7 @@ class DataFetcher:
         
         return comprehensive_data
     
+    @traced('fetch.polygon', category='fetch', provider='polygon', capture=('pair',))
     def fetch_polygon_forex(self, pair: str, interval: str = '4hour') -> Optional[Dict]:
         """
         Fetch forex data from Polygon.io (professional-grade data)
@@ -1040,6 +1080,7 @@ class DataFetcher:
             'last_updated': datetime.now().isoformat()
         }
     
+    @traced('fetch.marketstack', category='fetch', provider='marketstack', capture=('pair',))
     def fetch_marketstack_forex(self, pair: str, interval: str = '4hour') -> Optional[Dict]:
         """
         Fetch forex data from MarketStack (historical data)
@@ -1118,6 +1159,7 @@ class DataFetcher:
             'last_updated': datetime.now().isoformat()
         }
     
+    @traced('fetch.exchangerate', category='fetch', provider='exchangerate', capture=('pair',))
     def fetch_exchangerate_forex(self, pair: str, interval: str = '4hour') -> Optional[Dict]:
         """
         Fetch current exchange rates from ExchangeRate-API (current rates only)
@@ -1165,6 +1207,7 @@ class DataFetcher:
             logger.error(f"ExchangeRate-API fetch error for {pair}: {e}")
             return None
     
+    @traced('fetch.freecurrency', category='fetch', provider='freecurrency', capture=('pair',))
     def fetch_freecurrency_forex(self, pair: str) -> Optional[Dict]:
         """Fetch forex data from FreeCurrencyAPI (5000/day limit)"""
         try:
@@ -1203,6 +1246,7 @@ class DataFetcher:
             logger.error(f"FreeCurrency API fetch error for {pair}: {e}")
             return None
     
+    @traced('fetch.currencyapi', category='fetch', provider='currencyapi', capture=('pair',))
     def fetch_currencyapi_forex(self, pair: str) -> Optional[Dict]:
         """Fetch forex data from CurrencyAPI (300/day limit)"""
         try:
@@ -1241,6 +1285,7 @@ class DataFetcher:
             logger.error(f"CurrencyAPI fetch error for {pair}: {e}")
             return None
     
+    @traced('fetch.exchangerates', category='fetch', provider='exchangerates', capture=('pair',))
     def fetch_exchangerates_forex(self, pair: str) -> Optional[Dict]:
         """Fetch forex data from ExchangeRates API (250/day limit)"""
         try:
@@ -1279,6 +1324,7 @@ class DataFetcher:
             logger.error(f"ExchangeRates API fetch error for {pair}: {e}")
             return None
     
+    @traced('fetch.fixer', category='fetch', provider='fixer', capture=('pair',))
     def fetch_fixer_forex(self, pair: str) -> Optional[Dict]:
         """Fetch forex data from Fixer API (100/day limit)"""
         try:
@@ -1318,4 +1364,11 @@ class DataFetcher:
             return None
 
 # Global data fetcher instance
-data_fetcher = DataFetcher()
\ No newline at end of file
+data_fetcher = DataFetcher()
+
+try:
+    from src.core.metrics import registry as metrics_registry
+    metrics_registry.register_collector('signals_data_fetcher', data_fetcher.collect_samples)
+except ImportError:
+    # Standalone Signals checkout, where `src` is this package
+    pass
\ No newline at end of file
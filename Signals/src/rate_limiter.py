@@ -17,6 +17,19 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 from src.core.config import settings
 from .cache_manager import cache_manager
 
+try:
+    from src.core.replay import http_get
+    from src.core.deadline import check as check_deadline, clamp_timeout
+except ImportError:
+    # Standalone Signals checkout: no record/replay transport or run deadline
+    http_get = requests.get
+
+    def check_deadline(stage):
+        pass
+
+    def clamp_timeout(seconds):
+        return seconds
+
 logger = logging.getLogger(__name__)
 
 class RateLimitTracker:
@@ -309,7 +322,7 @@ def robust_api_call(max_attempts: int = 3, base_delay: float = 1.0):
     backoff.expo,
     (requests.exceptions.RequestException, ConnectionError),
     max_tries=3,
-    max_time=30
+    max_time=lambda: clamp_timeout(30)
 )
 @retry(
     stop=stop_after_attempt(3),
@@ -318,10 +331,12 @@ def robust_api_call(max_attempts: int = 3, base_delay: float = 1.0):
 )
 def make_request_with_backoff(url: str, **kwargs) -> requests.Response:
     """Make HTTP request with automatic backoff on failures"""
-    # Set default timeout if not provided
-    kwargs.setdefault('timeout', 10)
+    # Default 10s timeout, shortened to the run deadline when one is set
+    # (an expired deadline raises DeadlineExceeded rather than sending timeout=0)
+    check_deadline('http_request')
+    kwargs['timeout'] = clamp_timeout(kwargs.get('timeout', 10))
     
-    response = requests.get(url, **kwargs)
+    response = http_get(url, **kwargs)
     
     # Raise exception for rate limiting and server errors to trigger retry
     if response.status_code == 429:  # Too Many Requests
@@ -110,6 +110,17 @@ except ImportError:
             sentiment_analyzer = DummyAnalyzer()
             data_fetcher = DummyAnalyzer()
 
+try:
+    from src.core.deadline import allows_optional
+    from src.core.tracing import traced
+except ImportError:
+    # Standalone Signals checkout: no run deadline or tracing, optional stages always run
+    def allows_optional(stage, **details):
+        return True
+
+    def traced(name=None, category='stage', capture=(), **static_attributes):
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -196,6 +207,7 @@ class SignalGenerator:
             'risk_reward_ratio': 2.0
         }
     
+    @traced('generate_weekly_signal', capture=('pair',))
     def generate_weekly_signal(self, pair: str) -> TradingSignal:
         """
         Generate comprehensive weekly trading signal
@@ -210,8 +222,12 @@ class SignalGenerator:
             # 2. Economic Fundamentals
             economic_component = self._analyze_economic_signals(pair)
             
-            # 3. Geopolitical Events (sentiment analysis removed)
-            geopolitical_component = self._analyze_geopolitical_signals(pair)
+            # 3. Geopolitical Events (sentiment analysis removed; optional: dropped
+            #    when the run deadline is close)
+            if allows_optional('analysis.geopolitical', pair=pair):
+                geopolitical_component = self._analyze_geopolitical_signals(pair)
+            else:
+                geopolitical_component = self._create_skipped_component('geopolitical')
             
             # Collect all components (sentiment removed)
             components = {
@@ -271,6 +287,7 @@ class SignalGenerator:
             logger.error(f"Error generating signal for {pair}: {e}")
             return self._create_error_signal(pair, str(e))
     
+    @traced('analysis.technical', capture=('pair',))
     def _analyze_technical_signals(self, pair: str) -> SignalComponent:
         """Enhanced technical analysis using TA-Lib and pandas-ta"""
         try:
@@ -563,6 +580,7 @@ class SignalGenerator:
                 details={'error': str(e), 'analysis_type': 'price_only_failed'}
             )
     
+    @traced('analysis.economic', capture=('pair',))
     def _analyze_economic_signals(self, pair: str) -> SignalComponent:
         """Analyze economic fundamental signals"""
         try:
@@ -622,6 +640,7 @@ class SignalGenerator:
     
     # Sentiment analysis removed - using technical and economic only
     
+    @traced('analysis.geopolitical', capture=('pair',))
     def _analyze_geopolitical_signals(self, pair: str) -> SignalComponent:
         """Analyze geopolitical event signals"""
         try:
@@ -1081,6 +1100,16 @@ class SignalGenerator:
             'confidence_level': confidence
         }
     
+    def _create_skipped_component(self, component: str) -> SignalComponent:
+        """Zero-confidence placeholder for an optional component skipped to meet the run deadline"""
+        return SignalComponent(
+            component=component,
+            score=0.0,
+            confidence=0.0,
+            weight=self.base_weights[component],
+            details={'skipped': 'run deadline'}
+        )
+    
     def _create_error_signal(self, pair: str, error_msg: str) -> TradingSignal:
         """Create error signal when analysis fails"""
         return TradingSignal(
@@ -1136,6 +1165,7 @@ class SignalGenerator:
         logger.info(f"Signal diversity OK: {buy_count} BUY, {sell_count} SELL, {total_active - buy_count - sell_count} HOLD")
         return True
 
+    @traced('generate_signals_for_pairs', category='run')
     def generate_signals_for_pairs(self, pairs: List[str]) -> Dict[str, TradingSignal]:
         """Generate signals for multiple currency pairs"""
         signals = {}
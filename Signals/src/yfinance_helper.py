@@ -11,10 +11,52 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import io
 import time
 
+try:
+    from src.core.replay import active_cassette
+except ImportError:
+    # Standalone Signals checkout: no record/replay transport
+    def active_cassette():
+        return None
+
 logger = logging.getLogger(__name__)
 
+
+def _frame_to_json(frame: pd.DataFrame) -> Dict[str, Any]:
+    tz = getattr(frame.index, 'tz', None)
+    return {'frame': frame.to_json(orient='split', date_format='iso', date_unit='us'),
+            'tz': str(tz) if tz is not None else None, 'index_name': frame.index.name}
+
+
+def _frame_from_json(encoded: Dict[str, Any]) -> pd.DataFrame:
+    frame = pd.read_json(io.StringIO(encoded['frame']), orient='split')
+    if encoded.get('tz') and isinstance(frame.index, pd.DatetimeIndex):
+        index = frame.index if frame.index.tz is not None else frame.index.tz_localize('UTC')
+        frame.index = index.tz_convert(encoded['tz'])
+    frame.index.name = encoded.get('index_name')
+    return frame
+
+
+def _ticker_info(symbol: str) -> Dict[str, Any]:
+    """yf.Ticker(symbol).info, recorded/replayed when a cassette is active"""
+    cassette = active_cassette()
+    fetch = lambda: dict(yf.Ticker(symbol).info)
+    if cassette is None:
+        return fetch()
+    return cassette.call('yfinance.info', {'symbol': symbol}, fetch)
+
+
+def _ticker_history(symbol: str, **kwargs) -> pd.DataFrame:
+    """yf.Ticker(symbol).history(**kwargs), recorded/replayed when a cassette is active"""
+    cassette = active_cassette()
+    fetch = lambda: yf.Ticker(symbol).history(**kwargs)
+    if cassette is None:
+        return fetch()
+    return cassette.call('yfinance.history', {'symbol': symbol, **kwargs}, fetch,
+                         encode=_frame_to_json, decode=_frame_from_json)
+
 class YFinanceHelper:
     """
     yfinance integration for price validation and supplementary data
@@ -81,10 +123,8 @@ class YFinanceHelper:
                 logger.warning(f"No yfinance symbol mapping for {pair}")
                 return None
             
-            ticker = yf.Ticker(yf_symbol)
-            
             # Get current price from info
-            info = ticker.info
+            info = _ticker_info(yf_symbol)
             current_price = info.get('regularMarketPrice') or info.get('bid') or info.get('ask')
             
             if current_price and current_price > 0:
@@ -94,7 +134,7 @@ class YFinanceHelper:
                 return float(current_price)
             
             # Fallback: get latest from history
-            hist_data = ticker.history(period='1d', interval='1m')
+            hist_data = _ticker_history(yf_symbol, period='1d', interval='1m')
             if not hist_data.empty:
                 latest_price = float(hist_data['Close'].iloc[-1])
                 self.price_cache[cache_key] = (latest_price, time.time())
@@ -132,8 +172,7 @@ class YFinanceHelper:
                 logger.warning(f"No yfinance symbol mapping for {pair}")
                 return None
             
-            ticker = yf.Ticker(yf_symbol)
-            hist_data = ticker.history(period=period, interval=interval)
+            hist_data = _ticker_history(yf_symbol, period=period, interval=interval)
             
             if hist_data.empty:
                 logger.warning(f"No historical data from yfinance for {pair}")
@@ -286,8 +325,7 @@ class YFinanceHelper:
             if not yf_symbol:
                 return None
             
-            ticker = yf.Ticker(yf_symbol)
-            info = ticker.info
+            info = _ticker_info(yf_symbol)
             
             market_info = {
                 'market_state': info.get('marketState', 'UNKNOWN'),
@@ -319,8 +357,7 @@ class YFinanceHelper:
             if not yf_symbol:
                 return None
             
-            ticker = yf.Ticker(yf_symbol)
-            info = ticker.info
+            info = _ticker_info(yf_symbol)
             
             quote_data = {
                 'symbol': pair,
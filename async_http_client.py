@@ -15,9 +15,24 @@ from pathlib import Path
 import logging
 from dataclasses import dataclass, asdict
 import pickle
+from urllib.parse import urlsplit
+
+from src.core.deadline import current_deadline
+from src.core.exceptions import CassetteMissError
+from src.core.metrics import registry as metrics_registry
+from src.core.network_health import observe as observe_network
+from src.core.replay import active_cassette, http_request, replay_delay
 
 logger = logging.getLogger(__name__)
 
+HTTP_REQUESTS = metrics_registry.counter(
+    'http_client_requests_total', 'AsyncHttpClient requests by host, outcome and cache tier',
+    ('host', 'outcome', 'cache'))
+HTTP_LATENCY = metrics_registry.histogram(
+    'http_client_request_seconds', 'AsyncHttpClient network request latency', ('host',))
+HTTP_BYTES = metrics_registry.counter(
+    'http_client_downloaded_bytes_total', 'Bytes downloaded by AsyncHttpClient', ('host',))
+
 @dataclass
 class CacheEntry:
     """Cache entry data structure"""
@@ -42,8 +57,15 @@ class RequestMetrics:
     average_response_time: float = 0.0
     bytes_downloaded: int = 0
     
-    def add_request(self, success: bool, response_time: float, bytes_size: int = 0, cache_hit: bool = False):
-        """Add request metrics"""
+    def add_request(self, success: bool, response_time: float, bytes_size: int = 0, cache_hit: bool = False,
+                    host: str = '', cache_tier: str = 'memory'):
+        """Add request metrics (also exported to the shared metrics registry)"""
+        HTTP_REQUESTS.inc(host=host, outcome='success' if success else 'failure',
+                          cache=cache_tier if cache_hit else 'network')
+        if not cache_hit:
+            HTTP_LATENCY.observe(response_time, host=host)
+        if bytes_size:
+            HTTP_BYTES.inc(bytes_size, host=host)
         self.total_requests += 1
         self.total_response_time += response_time
         self.average_response_time = self.total_response_time / self.total_requests
@@ -199,6 +221,8 @@ class AsyncHttpClient:
         if headers:
             request_headers.update(headers)
         
+        host = urlsplit(url).hostname or ''
+        
         # Check cache for GET requests
         cache_key = None
         if method.upper() == 'GET' and self.cache_enabled and cache_ttl is not None:
@@ -207,7 +231,7 @@ class AsyncHttpClient:
             # Try memory cache first
             cached_entry = self._get_from_memory_cache(cache_key)
             if cached_entry:
-                self.metrics.add_request(True, 0.001, 0, cache_hit=True)  # Very fast cache hit
+                self.metrics.add_request(True, 0.001, 0, cache_hit=True, host=host)  # Very fast cache hit
                 logger.debug(f"📦 Memory cache hit for {url}")
                 return cached_entry.data
             
@@ -216,10 +240,16 @@ class AsyncHttpClient:
             if cached_entry:
                 # Save to memory cache for faster access
                 self._save_to_memory_cache(cache_key, cached_entry)
-                self.metrics.add_request(True, 0.01, 0, cache_hit=True)  # Fast disk cache hit
+                self.metrics.add_request(True, 0.01, 0, cache_hit=True, host=host, cache_tier='disk')  # Fast disk cache hit
                 logger.debug(f"💽 Disk cache hit for {url}")
                 return cached_entry.data
         
+        cassette = active_cassette()
+        recorded_request = http_request(method, url, params, json_data if json_data is not None else data) \
+            if cassette else None
+        if cassette and cassette.replaying:
+            return await self._replay_request(cassette, recorded_request, method, url, cache_key, cache_ttl, host)
+        
         # Rate limiting
         async with self.rate_limiter:
             if self.request_delay > 0:
@@ -227,6 +257,7 @@ class AsyncHttpClient:
             
             start_time = time.time()
             session = await self.get_session()
+            observed = False
             
             try:
                 # Prepare request kwargs
@@ -241,8 +272,23 @@ class AsyncHttpClient:
                 if json_data is not None:
                     request_kwargs['json'] = json_data
                 
+                # Never wait past the run deadline
+                deadline = current_deadline()
+                if deadline is not None and 'timeout' not in kwargs:
+                    if deadline.expired:
+                        deadline.skip(f'http.{host}', 'deadline expired before request')
+                        self.metrics.add_request(False, 0.0, host=host)
+                        return None
+                    request_kwargs['timeout'] = aiohttp.ClientTimeout(
+                        total=deadline.clamp(self.timeout.total),
+                        connect=self.timeout.connect,
+                        sock_read=self.timeout.sock_read
+                    )
+                
                 async with session.request(method, url, **request_kwargs) as response:
                     response_time = time.time() - start_time
+                    observed = True
+                    observe_network(url, response.status < 500, response_time, status_code=response.status)
                     
                     # Get response data
                     content_type = response.headers.get('content-type', '').lower()
@@ -255,11 +301,19 @@ class AsyncHttpClient:
                     content_length = response.headers.get('content-length')
                     response_size = int(content_length) if content_length else len(str(response_data))
                     
+                    if cassette and cassette.recording:
+                        cassette.record('http', recorded_request, {
+                            'status': response.status,
+                            'reason': response.reason or '',
+                            'headers': {'Content-Type': response.headers.get('content-type', '')},
+                            'body': response_data if isinstance(response_data, str) else json.dumps(response_data)
+                        }, response_time)
+                    
                     # Check if request was successful
                     response.raise_for_status()
                     
                     # Update metrics
-                    self.metrics.add_request(True, response_time, response_size, cache_hit=False)
+                    self.metrics.add_request(True, response_time, response_size, cache_hit=False, host=host)
                     
                     result = {
                         'data': response_data,
@@ -270,42 +324,87 @@ class AsyncHttpClient:
                     }
                     
                     # Cache successful GET requests
-                    if (method.upper() == 'GET' and self.cache_enabled and 
-                        cache_ttl is not None and cache_key and response.status == 200):
-                        
-                        cache_entry = CacheEntry(
-                            data=result,
-                            timestamp=datetime.now(),
-                            ttl_seconds=cache_ttl,
-                            headers=dict(response.headers)
-                        )
-                        
-                        # Save to both memory and disk cache
-                        self._save_to_memory_cache(cache_key, cache_entry)
-                        if cache_ttl > 300:  # Only disk cache for longer TTL
-                            self._save_to_disk_cache(cache_key, cache_entry)
+                    if method.upper() == 'GET' and response.status == 200:
+                        self._cache_result(cache_key, cache_ttl, result)
                     
                     logger.debug(f"✅ {method} {url} completed in {response_time:.2f}s")
                     return result
                     
             except asyncio.TimeoutError:
                 response_time = time.time() - start_time
-                self.metrics.add_request(False, response_time)
+                self.metrics.add_request(False, response_time, host=host)
+                if not observed:
+                    observe_network(url, False, response_time, error='timeout')
                 logger.error(f"⏰ Request timeout for {method} {url} after {response_time:.2f}s")
                 return None
                 
             except aiohttp.ClientError as e:
                 response_time = time.time() - start_time
-                self.metrics.add_request(False, response_time)
+                self.metrics.add_request(False, response_time, host=host)
+                if not observed:
+                    observe_network(url, False, response_time, error=type(e).__name__)
                 logger.error(f"❌ Client error for {method} {url}: {e}")
                 return None
                 
             except Exception as e:
                 response_time = time.time() - start_time
-                self.metrics.add_request(False, response_time)
+                self.metrics.add_request(False, response_time, host=host)
                 logger.error(f"❌ Unexpected error for {method} {url}: {e}")
                 return None
 
+    def _cache_result(self, cache_key: Optional[str], cache_ttl: Optional[int], result: Dict[str, Any]):
+        """Store a successful GET result in the memory (and, for long TTLs, disk) cache"""
+        if not (self.cache_enabled and cache_ttl is not None and cache_key):
+            return
+        
+        cache_entry = CacheEntry(
+            data=result,
+            timestamp=datetime.now(),
+            ttl_seconds=cache_ttl,
+            headers=result['headers']
+        )
+        
+        # Save to both memory and disk cache
+        self._save_to_memory_cache(cache_key, cache_entry)
+        if cache_ttl > 300:  # Only disk cache for longer TTL
+            self._save_to_disk_cache(cache_key, cache_entry)
+
+    async def _replay_request(self, cassette, recorded_request: Dict[str, Any], method: str, url: str,
+                              cache_key: Optional[str], cache_ttl: Optional[int],
+                              host: str) -> Optional[Dict[str, Any]]:
+        """Serve a request from the active cassette (no rate limiting, no network)"""
+        try:
+            interaction = cassette.lookup('http', recorded_request)
+        except CassetteMissError as e:
+            self.metrics.add_request(False, 0.0, host=host)
+            logger.error(f"📼 {e}")
+            return None
+        
+        await replay_delay(cassette, interaction)
+        recorded = interaction['response']
+        response_time = cassette.delay(interaction)
+        
+        if recorded['status'] >= 400:
+            self.metrics.add_request(False, response_time, host=host)
+            logger.error(f"❌ Client error for {method} {url}: {recorded['status']}, {recorded.get('reason', '')}")
+            return None
+        
+        body = recorded['body']
+        headers = recorded.get('headers', {})
+        is_json = 'json' in headers.get('Content-Type', '').lower()
+        self.metrics.add_request(True, response_time, len(body), cache_hit=False, host=host)
+        
+        result = {
+            'data': json.loads(body) if is_json else body,
+            'status': recorded['status'],
+            'headers': dict(headers),
+            'url': url,
+            'response_time': response_time
+        }
+        if method.upper() == 'GET' and recorded['status'] == 200:
+            self._cache_result(cache_key, cache_ttl, result)
+        return result
+
     async def get(self, url: str, params: Dict = None, headers: Dict = None, 
                  cache_ttl: int = 3600, **kwargs) -> Optional[Dict[str, Any]]:
         """Make GET request with caching"""
@@ -0,0 +1,4 @@
+"""
+Benchmark suites for the daily report system
+Everything here runs against local stand-ins and never touches production services
+"""
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Analysis Pipeline Benchmark
+Times the technical indicators and candlestick patterns across candle counts,
+the enhanced technical analyzer, sentiment scoring, the economic currency
+differential, report formatting and a full offline generate_signals_for_pairs
+run. All market data comes from seeded fixtures, so two runs with the same
+seed analyze identical inputs; results are written as JSON and can be
+compared against a stored baseline to catch regressions.
+
+Usage:
+    python benchmarks/analysis_benchmark.py --output results.json
+    python benchmarks/analysis_benchmark.py --baseline results.json --threshold 0.25
+    python benchmarks/analysis_benchmark.py --sizes 100 1000 --case technical --case report
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import warnings
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from unittest.mock import patch
+
+# Repository root on the path so `src` imports the same way the scripts do
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.analysis_fixtures import FixtureDataFetcher, synthetic_ohlc
+from benchmarks.stats import compare_to_baseline, summarize_latencies
+
+logger = logging.getLogger(__name__)
+
+CANDLE_SIZES = (100, 1000, 10000)
+DEFAULT_PAIRS = ('EURUSD', 'GBPUSD', 'USDJPY', 'AUDUSD')
+REPORT_FORMATS = ('txt', 'json', 'csv', 'html')
+SECTIONS = ('technical', 'enhanced', 'sentiment', 'economic', 'pipeline', 'report')
+
+# Settings validation needs these; the fixture fetcher means they are never sent anywhere
+BENCHMARK_API_KEYS = ('ALPHA_VANTAGE_API_KEY', 'TWELVE_DATA_API_KEY', 'FRED_API_KEY',
+                      'FINNHUB_API_KEY', 'NEWS_API_KEY')
+
+# Modules that hold a module-level reference to the shared data fetcher
+DATA_FETCHER_MODULES = ('src.technical_analysis', 'src.economic_analyzer',
+                        'src.sentiment_analyzer', 'src.signal_generator')
+
+
+def configure_offline_environment():
+    """Placeholder API keys so src.core.config validates without a developer .env"""
+    for key in BENCHMARK_API_KEYS:
+        os.environ.setdefault(f'FOREX_{key}', 'benchmark')
+
+
+def measure(func: Callable[[], Any], min_time: float = 0.2, max_repeat: int = 50) -> Dict[str, Any]:
+    """
+    Time func until min_time has elapsed (at least once, at most max_repeat)
+
+    The first call is a warm-up and is discarded unless it alone took longer
+    than min_time, so multi-second cases are not run twice.
+    """
+    started = time.perf_counter()
+    func()
+    first = time.perf_counter() - started
+    samples = [first] if first >= min_time else []
+
+    started = time.perf_counter()
+    while len(samples) < max_repeat and (not samples or time.perf_counter() - started < min_time):
+        call_started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - call_started)
+    return summarize_latencies(samples, sum(samples)).to_dict()
+
+
+@contextmanager
+def offline_pipeline(fetcher: FixtureDataFetcher) -> Iterator[None]:
+    """
+    Route every analyzer's data fetcher to the fixtures and keep Redis out
+
+    The shared cache manager is switched to its in-memory fallback so runs
+    neither read stale production entries nor write benchmark data back.
+    """
+    import importlib
+    from src.cache_manager import cache_manager
+    from src.utils.lazy import resolve
+
+    cache = resolve(cache_manager)
+    redis_client = cache.redis_client
+    cache.redis_client = None
+    try:
+        with ExitStack() as stack:
+            for module_name in DATA_FETCHER_MODULES:
+                stack.enter_context(patch.object(importlib.import_module(module_name), 'data_fetcher', fetcher))
+            yield
+    finally:
+        cache.clear_cache()
+        cache.redis_client = redis_client
+
+
+def _cold(func: Callable[[], Any]) -> Callable[[], Any]:
+    """Clear the in-memory cache before each call so every iteration does the full work"""
+    from src.cache_manager import cache_manager
+
+    def run():
+        cache_manager.clear_cache()
+        return func()
+    return run
+
+
+def bench_technical(sizes: Sequence[int], seed: int, min_time: float) -> Dict[str, Any]:
+    from src.technical_analysis import technical_analyzer
+
+    results = {}
+    for size in sizes:
+        candles = synthetic_ohlc(size, seed)
+        oldest_first = list(reversed(candles))
+        closes = [c['close'] for c in oldest_first]
+        highs = [c['high'] for c in oldest_first]
+        lows = [c['low'] for c in oldest_first]
+        cases = {
+            'patterns': lambda: technical_analyzer.analyze_4h_candlesticks({'data': candles}),
+            'rsi': lambda: technical_analyzer.calculate_rsi(closes),
+            'macd': lambda: technical_analyzer.calculate_macd(closes),
+            'bollinger': lambda: technical_analyzer.calculate_bollinger_bands(closes),
+            'atr': lambda: technical_analyzer.calculate_atr(highs, lows, closes),
+            'stochastic': lambda: technical_analyzer.calculate_stochastic(highs, lows, closes),
+        }
+        for name, func in cases.items():
+            logger.info(f"⏱️  technical.{name}[{size}]")
+            results[f'technical.{name}[{size}]'] = measure(func, min_time)
+    return results
+
+
+def bench_enhanced(sizes: Sequence[int], seed: int, min_time: float) -> Dict[str, Any]:
+    try:
+        import pandas as pd
+        from Signals.src.enhanced_technical_analysis import EnhancedTechnicalAnalyzer
+    except ImportError as e:
+        # TA-Lib / pandas-ta are optional native builds
+        return {f'enhanced.analyze_forex_pair[{size}]': {'skipped': str(e)} for size in sizes}
+
+    analyzer = EnhancedTechnicalAnalyzer()
+    results = {}
+    for size in sizes:
+        frame = pd.DataFrame(list(reversed(synthetic_ohlc(size, seed))))
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'])
+        frame = frame.set_index('timestamp')
+        logger.info(f"⏱️  enhanced.analyze_forex_pair[{size}]")
+        results[f'enhanced.analyze_forex_pair[{size}]'] = measure(
+            lambda: analyzer.analyze_forex_pair('EURUSD', frame, '4H'), min_time)
+    return results
+
+
+def bench_sentiment(fetcher: FixtureDataFetcher, pairs: Sequence[str], min_time: float) -> Dict[str, Any]:
+    from src.sentiment_analyzer import sentiment_analyzer
+
+    texts = []
+    for pair in pairs:
+        for article in fetcher.fetch_news_sentiment(f"{pair[:3]} {pair[3:]} forex exchange rate"):
+            texts.append(f"{article['title']} {article['description']}")
+    sources = ('alpha_vantage', 'news_vader', 'central_bank')
+
+    def score_all():
+        for index, text in enumerate(texts):
+            sentiment_analyzer._enhance_sentiment_score(text, sources[index % len(sources)])
+
+    logger.info(f"⏱️  sentiment.enhance_score ({len(texts)} texts)")
+    return {f'sentiment.enhance_score[{len(texts)}]': measure(score_all, min_time)}
+
+
+def bench_economic(fetcher: FixtureDataFetcher, pairs: Sequence[str], min_time: float) -> Dict[str, Any]:
+    from src.economic_analyzer import economic_analyzer
+
+    def differentials():
+        for pair in pairs:
+            economic_analyzer.calculate_currency_differential(pair[:3], pair[3:])
+
+    with offline_pipeline(fetcher):
+        logger.info("⏱️  economic.currency_differential")
+        return {f'economic.currency_differential[{len(pairs)}]': measure(_cold(differentials), min_time)}
+
+
+def run_pipeline(fetcher: FixtureDataFetcher, pairs: Sequence[str]) -> Dict[str, Any]:
+    """One offline generate_signals_for_pairs run (no cache, no network)"""
+    from src.cache_manager import cache_manager
+    from src.signal_generator import signal_generator
+
+    with offline_pipeline(fetcher):
+        cache_manager.clear_cache()
+        return signal_generator.generate_signals_for_pairs(list(pairs))
+
+
+def bench_pipeline(fetcher: FixtureDataFetcher, pairs: Sequence[str], min_time: float) -> Dict[str, Any]:
+    from src.signal_generator import signal_generator
+
+    with offline_pipeline(fetcher):
+        logger.info("⏱️  pipeline.generate_signals_for_pairs")
+        return {f'pipeline.generate_signals_for_pairs[{len(pairs)}]': measure(
+            _cold(lambda: signal_generator.generate_signals_for_pairs(list(pairs))), min_time)}
+
+
+def bench_report(fetcher: FixtureDataFetcher, pairs: Sequence[str], min_time: float) -> Dict[str, Any]:
+    from src.report_generator import report_generator
+
+    signals = run_pipeline(fetcher, pairs)
+    results = {}
+    for output_format in REPORT_FORMATS:
+        logger.info(f"⏱️  report.{output_format}")
+        results[f'report.{output_format}[{len(signals)}]'] = measure(
+            lambda: report_generator.generate_comprehensive_report(signals, output_format), min_time)
+    return results
+
+
+def run_benchmark(sizes: Sequence[int] = CANDLE_SIZES, pairs: Sequence[str] = DEFAULT_PAIRS, seed: int = 42,
+                  candles: int = 200, min_time: float = 0.2, sections: Optional[List[str]] = None,
+                  fetcher: Optional[FixtureDataFetcher] = None) -> Dict[str, Any]:
+    """
+    Run the selected sections and return a JSON-serialisable report
+
+    Args:
+        sizes: Candle counts for the technical and enhanced sections
+        pairs: Pairs for the sentiment, economic, pipeline and report sections
+        seed: Fixture seed
+        candles: Candles per interval served by the fixture fetcher
+        min_time: Minimum measured time per case in seconds
+        sections: Subset of SECTIONS (default all)
+        fetcher: Pre-loaded fixtures (default: generated from seed)
+    """
+    configure_offline_environment()
+    sections = sections or list(SECTIONS)
+    unknown = set(sections) - set(SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown benchmark sections: {sorted(unknown)}")
+    fetcher = fetcher or FixtureDataFetcher(seed=seed, candles=candles)
+
+    report: Dict[str, Any] = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {
+            'sizes': list(sizes),
+            'pairs': list(pairs),
+            'seed': fetcher.seed,
+            'candles': fetcher.candles,
+            'min_time': min_time,
+            'sections': sections,
+            'python': platform.python_version(),
+            'platform': platform.platform()
+        },
+        'cases': {}
+    }
+
+    runners = {
+        'technical': lambda: bench_technical(sizes, fetcher.seed, min_time),
+        'enhanced': lambda: bench_enhanced(sizes, fetcher.seed, min_time),
+        'sentiment': lambda: bench_sentiment(fetcher, pairs, min_time),
+        'economic': lambda: bench_economic(fetcher, pairs, min_time),
+        'pipeline': lambda: bench_pipeline(fetcher, pairs, min_time),
+        'report': lambda: bench_report(fetcher, pairs, min_time),
+    }
+    for section in sections:
+        report['cases'].update(runners[section]())
+    report['fixture_calls'] = dict(fetcher.calls)
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    """Print a human-readable summary table"""
+    config = report['config']
+    regressions = {r['case']: r for r in report.get('regressions', [])}
+    print("\n📊 ANALYSIS PIPELINE BENCHMARK")
+    print("=" * 86)
+    print(f"seed={config['seed']} sizes={config['sizes']} pairs={','.join(config['pairs'])} "
+          f"min_time={config['min_time']}s python={config['python']}")
+    print("-" * 86)
+    print(f"{'case':<46}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}{'runs':>6}")
+    for case, result in report['cases'].items():
+        if 'skipped' in result:
+            print(f"{case:<46}{'skipped':>10}  {result['skipped'][:28]}")
+            continue
+        marker = f"  ⚠️ x{regressions[case]['ratio']}" if case in regressions else ''
+        print(f"{case:<46}{result['p50_ms']:>10.3f}{result['p99_ms']:>10.3f}{result['mean_ms']:>10.3f}"
+              f"{result['count']:>6}{marker}")
+    print("=" * 86)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analysis pipeline on seeded offline fixtures")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(CANDLE_SIZES), help="Candle counts")
+    parser.add_argument('--pairs', nargs='+', default=list(DEFAULT_PAIRS), help="Pairs for pipeline sections")
+    parser.add_argument('--case', action='append', choices=SECTIONS, help="Section to run (repeatable, default all)")
+    parser.add_argument('--seed', type=int, default=42, help="Fixture seed")
+    parser.add_argument('--candles', type=int, default=200, help="Candles per interval in pipeline fixtures")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Minimum measured seconds per case")
+    parser.add_argument('--fixtures', help="Load recorded fixtures instead of generating them")
+    parser.add_argument('--record-fixtures', help="Write the fixtures this run used to this file")
+    parser.add_argument('--output', help="Write the JSON report to this file")
+    parser.add_argument('--baseline', help="Compare p50 latencies against this JSON report")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Allowed relative slowdown vs baseline")
+    parser.add_argument('--verbose', action='store_true', help="Show analyzer logs")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        # Flat synthetic candles trip divide-by-zero warnings in the pattern detectors
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    fetcher = FixtureDataFetcher.load(args.fixtures) if args.fixtures else \
+        FixtureDataFetcher(seed=args.seed, candles=args.candles)
+    report = run_benchmark(sizes=args.sizes, pairs=args.pairs, seed=args.seed, candles=args.candles,
+                           min_time=args.min_time, sections=args.case, fetcher=fetcher)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        report['baseline'] = {'path': args.baseline, 'timestamp': baseline.get('timestamp'),
+                              'threshold': args.threshold}
+        report['regressions'] = [r.to_dict() for r in
+                                 compare_to_baseline(report['cases'], baseline.get('cases', {}), args.threshold)]
+
+    print_report(report)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"📁 Report written to {args.output}")
+    if args.record_fixtures:
+        fetcher.save(args.record_fixtures)
+        print(f"📁 Fixtures written to {args.record_fixtures}")
+
+    if report.get('regressions'):
+        print(f"❌ {len(report['regressions'])} case(s) slower than baseline by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Synthetic market data and an offline data-fetcher stand-in
+Seeded OHLC random walks, FRED series, calendar events, news and GDELT
+articles served through the same methods as src.data_fetcher.DataFetcher,
+so the analyzers and the signal generator run without network access.
+Fixtures can be saved and reloaded so a benchmark run is reproducible
+across machines and library versions.
+"""
+
+import json
+import random
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+# Fixed clock so generated timestamps do not depend on when the run starts
+FIXTURE_EPOCH = datetime(2024, 1, 5, 20, 0, 0)
+
+INTERVAL_HOURS = {'30min': 0.5, '1hour': 1, '1h': 1, '4hour': 4, '4h': 4, 'daily': 24}
+
+BASE_PRICES = {
+    'EURUSD': 1.0950, 'GBPUSD': 1.2700, 'USDJPY': 144.50, 'USDCAD': 1.3350,
+    'AUDUSD': 0.6700, 'USDCHF': 0.8500, 'NZDUSD': 0.6200, 'EURJPY': 158.20,
+    'GBPJPY': 183.50, 'CHFJPY': 170.00, 'EURGBP': 0.8620
+}
+
+NEWS_TEMPLATES = [
+    "{base} rallies as central bank signals further rate hikes amid strong growth",
+    "{quote} weakens after disappointing jobs data and dovish comments",
+    "{base}/{quote} steady ahead of inflation release; traders cautious",
+    "Hawkish {base} policymakers push yields higher, bullish momentum builds",
+    "{quote} slides on recession fears and falling consumer confidence",
+    "Risk appetite returns as {base} gains on upbeat PMI surprise",
+    "{base} under pressure as bearish sentiment grows over trade tariffs",
+    "Analysts see {quote} recovery as economic outlook improves",
+]
+
+GDELT_TEMPLATES = [
+    "Central bank meeting raises interest rate expectations in {country}",
+    "Election uncertainty weighs on {country} economic policy outlook",
+    "Trade war fears resurface as {country} announces new tariff measures",
+    "{country} inflation surprises higher, growth forecasts revised",
+    "Local sports results dominate headlines in {country}",
+]
+
+CURRENCY_COUNTRIES = {'USD': 'US', 'EUR': 'EU', 'GBP': 'GB', 'JPY': 'JP', 'CAD': 'CA', 'CHF': 'CH',
+                      'AUD': 'AU', 'NZD': 'NZ'}
+
+
+def _rng(seed: int, *keys: str) -> random.Random:
+    """Independent, order-insensitive stream per (seed, key) so adding a case never shifts another's data"""
+    return random.Random(zlib.crc32('|'.join((str(seed),) + keys).encode()))
+
+
+def synthetic_ohlc(candles: int, seed: int = 42, start_price: float = 1.1, interval: str = '4hour',
+                   volatility: float = 0.002, drift: float = 0.0) -> List[Dict[str, Any]]:
+    """
+    Geometric random-walk OHLC candles, most recent first (provider order)
+
+    Args:
+        candles: Number of candles
+        seed: RNG seed; the same seed always yields the same series
+        start_price: Open of the oldest candle
+        interval: Candle interval key from INTERVAL_HOURS
+        volatility: Per-candle standard deviation of log returns
+        drift: Per-candle mean log return
+
+    Returns:
+        List of {'timestamp', 'open', 'high', 'low', 'close', 'volume'} dicts
+    """
+    rng = _rng(seed, 'ohlc', interval, str(start_price))
+    step = timedelta(hours=INTERVAL_HOURS.get(interval, 4))
+    start = FIXTURE_EPOCH - step * candles
+    decimals = 3 if start_price > 20 else 5
+
+    rows = []
+    price = start_price
+    for index in range(candles):
+        open_price = price
+        close_price = open_price * (1 + rng.gauss(drift, volatility))
+        wick = abs(rng.gauss(0, volatility / 2)) * open_price
+        high = max(open_price, close_price) + wick * rng.random()
+        low = min(open_price, close_price) - wick * rng.random()
+        rows.append({
+            'timestamp': (start + step * index).strftime('%Y-%m-%d %H:%M:%S'),
+            'open': round(open_price, decimals),
+            'high': round(high, decimals),
+            'low': round(low, decimals),
+            'close': round(close_price, decimals),
+            'volume': rng.randint(1000, 50000)
+        })
+        price = close_price
+    rows.reverse()
+    return rows
+
+
+class FixtureDataFetcher:
+    """
+    Offline stand-in for src.data_fetcher.DataFetcher
+
+    Every response comes from `fixtures`; anything not recorded yet is
+    generated from the seed on first request and kept, so `save()` after
+    a run writes exactly the data that run consumed.
+    """
+
+    def __init__(self, seed: int = 42, candles: int = 200, fixtures: Optional[Dict[str, Any]] = None):
+        self.seed = seed
+        self.candles = candles
+        self.fixtures: Dict[str, Any] = fixtures or {}
+        for section in ('forex', 'fred', 'news', 'gdelt'):
+            self.fixtures.setdefault(section, {})
+        self.calls: Dict[str, int] = {}
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'FixtureDataFetcher':
+        data = json.loads(Path(path).read_text())
+        return cls(seed=data.get('seed', 42), candles=data.get('candles', 200), fixtures=data.get('fixtures'))
+
+    def save(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'seed': self.seed, 'candles': self.candles, 'fixtures': self.fixtures}))
+        return path
+
+    def _record(self, method: str):
+        self.calls[method] = self.calls.get(method, 0) + 1
+
+    # DataFetcher interface
+
+    def fetch_forex_data(self, pair: str, interval: str = '4hour') -> Optional[Dict]:
+        self._record('fetch_forex_data')
+        if len(pair) != 6:
+            return None
+        series = self.fixtures['forex'].setdefault(pair, {})
+        if interval not in series:
+            series[interval] = synthetic_ohlc(self.candles, self.seed + zlib.crc32(pair.encode()) % 1000,
+                                              BASE_PRICES.get(pair, 1.0), interval)
+        return {'data': series[interval], 'source': 'fixture', 'last_updated': FIXTURE_EPOCH.isoformat()}
+
+    def get_current_price(self, pair: str) -> Optional[float]:
+        self._record('get_current_price')
+        data = self.fetch_forex_data(pair, '4hour')
+        return data['data'][0]['close'] if data else None
+
+    def fetch_fred_data(self, series_id: str) -> Optional[Dict]:
+        self._record('fetch_fred_data')
+        if series_id not in self.fixtures['fred']:
+            rng = _rng(self.seed, 'fred', series_id)
+            value = rng.uniform(0.5, 6.0)
+            points = []
+            for month in range(24):
+                points.append({'date': (FIXTURE_EPOCH - timedelta(days=30 * month)).strftime('%Y-%m-%d'),
+                               'value': round(value, 3)})
+                value = max(0.0, value + rng.gauss(0, 0.15))
+            self.fixtures['fred'][series_id] = points
+        return {'series_id': series_id, 'data': self.fixtures['fred'][series_id], 'source': 'fixture',
+                'last_updated': FIXTURE_EPOCH.isoformat()}
+
+    def fetch_finnhub_economic_calendar(self) -> Optional[List[Dict]]:
+        self._record('fetch_finnhub_economic_calendar')
+        if 'calendar' not in self.fixtures:
+            rng = _rng(self.seed, 'calendar')
+            self.fixtures['calendar'] = [
+                {'date': (FIXTURE_EPOCH + timedelta(hours=6 * i)).isoformat(), 'country': country,
+                 'event': event, 'impact': 'high', 'estimate': round(rng.uniform(-1, 4), 1),
+                 'previous': round(rng.uniform(-1, 4), 1)}
+                for i, (country, event) in enumerate([
+                    ('US', 'Nonfarm Payrolls'), ('EU', 'ECB Interest Rate Decision'), ('GB', 'CPI YoY'),
+                    ('JP', 'BoJ Policy Rate'), ('CA', 'Employment Change'), ('CH', 'SNB Rate Decision')])
+            ]
+        return self.fixtures['calendar']
+
+    def fetch_news_sentiment(self, query: str, sources: str = None) -> Optional[List[Dict]]:
+        self._record('fetch_news_sentiment')
+        if query not in self.fixtures['news']:
+            rng = _rng(self.seed, 'news', query)
+            words = [w for w in query.split() if len(w) == 3 and w.isupper()] or ['USD', 'EUR']
+            base, quote = (words + words)[:2]
+            self.fixtures['news'][query] = [
+                {'title': rng.choice(NEWS_TEMPLATES).format(base=base, quote=quote),
+                 'description': rng.choice(NEWS_TEMPLATES).format(base=quote, quote=base),
+                 'content': '', 'source': 'fixture',
+                 'published_at': (FIXTURE_EPOCH - timedelta(hours=i)).isoformat(), 'url': ''}
+                for i in range(20)
+            ]
+        return self.fixtures['news'][query]
+
+    def fetch_central_bank_feeds(self, currency: str) -> Optional[List[Dict]]:
+        self._record('fetch_central_bank_feeds')
+        return self.fetch_news_sentiment(f"{currency} central bank policy")
+
+    def fetch_gdelt_events(self, currencies: List[str]) -> Optional[List[Dict]]:
+        self._record('fetch_gdelt_events')
+        key = ','.join(currencies)
+        if key not in self.fixtures['gdelt']:
+            rng = _rng(self.seed, 'gdelt', key)
+            events = []
+            for i in range(15):
+                country = CURRENCY_COUNTRIES.get(rng.choice(currencies), 'US')
+                title = rng.choice(GDELT_TEMPLATES).format(country=country)
+                events.append({'title': title, 'url': '',
+                               'published': (FIXTURE_EPOCH - timedelta(hours=i)).strftime('%Y%m%dT%H%M%SZ'),
+                               'tone': round(rng.uniform(-8, 8), 2),
+                               'relevance': 'high' if i % 3 == 0 else 'medium'})
+            self.fixtures['gdelt'][key] = events
+        return self.fixtures['gdelt'][key]
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Messaging Delivery Benchmark
+Drives UnifiedMultiMessenger and MessagingManager against local Telegram/Signal
+stand-ins and reports p50/p99 latency and messages per second
+
+Usage:
+    python benchmarks/messaging_benchmark.py --messages 200 --concurrency 4 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+
+# Repository root on the path so the messengers import the same way the scripts do
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.messaging_stubs import TelegramStubServer, SignalStubServer, StubBehavior
+from benchmarks.stats import summarize_latencies
+from utils.http_client_pool import get_client_pool, close_http_clients
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_BOT_TOKEN = '1234567890:benchmark-token'
+BENCHMARK_TELEGRAM_GROUP = '-1000000000000'
+BENCHMARK_SIGNAL_NUMBER = '+10000000000'
+BENCHMARK_SIGNAL_GROUP = 'group.benchmark'
+
+DRIVERS = ('unified', 'manager')
+
+
+def configure_stub_environment(telegram_url: str, signal_url: str):
+    """
+    Point both messaging stacks at the stand-ins
+
+    Credentials are overwritten so a developer .env can never leak real
+    tokens or groups into a benchmark run.
+    """
+    os.environ.update({
+        # utils.env_config / UnifiedMultiMessenger
+        'TELEGRAM_BOT_TOKEN': BENCHMARK_BOT_TOKEN,
+        'TELEGRAM_GROUP_ID': BENCHMARK_TELEGRAM_GROUP,
+        'TELEGRAM_API_URL': telegram_url,
+        'SIGNAL_PHONE_NUMBER': BENCHMARK_SIGNAL_NUMBER,
+        'SIGNAL_GROUP_ID': BENCHMARK_SIGNAL_GROUP,
+        'SIGNAL_API_URL': signal_url,
+        'MYMAMA_USERNAME': 'benchmark',
+        'MYMAMA_PASSWORD': 'benchmark',
+        # forex_signals.core.config / MessagingManager
+        'SIGNAL_CLI_URL': signal_url,
+        'MESSAGE_RETRY_ATTEMPTS': '1',
+        'MESSAGE_RETRY_DELAY': '1',
+    })
+    for key in ('ALPHA_VANTAGE_API_KEY', 'TWELVE_DATA_API_KEY', 'FRED_API_KEY', 'FINNHUB_API_KEY'):
+        os.environ.setdefault(key, 'benchmark-key')
+
+
+async def _run_load(send: Callable[[int], Awaitable[Dict[str, Any]]], messages: int,
+                    concurrency: int) -> Dict[str, Any]:
+    """
+    Run `messages` sends with bounded concurrency and collect latencies
+
+    Args:
+        send: Coroutine factory taking the message index and returning {platform: result}
+        messages: Number of sends to issue
+        concurrency: Maximum in-flight sends
+
+    Returns:
+        Latency summary plus delivery counters
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    delivered = 0
+    failed = 0
+
+    async def one(index: int):
+        nonlocal delivered, failed
+        async with semaphore:
+            started = time.perf_counter()
+            results = await send(index)
+            latencies.append(time.perf_counter() - started)
+            for result in results.values():
+                if result.success:
+                    delivered += 1
+                else:
+                    failed += 1
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(messages)))
+    wall_time = time.perf_counter() - wall_start
+
+    summary = summarize_latencies(latencies, wall_time).to_dict()
+    summary.update({
+        'wall_time_s': round(wall_time, 3),
+        'platform_deliveries': delivered,
+        'platform_failures': failed,
+        'messages_per_s': round(delivered / wall_time, 3) if wall_time > 0 else 0.0
+    })
+    return summary
+
+
+async def bench_unified_multi_messenger(messages: int, concurrency: int, pacing: bool,
+                                        attachments: int = 0, chunked: bool = False) -> Dict[str, Any]:
+    """
+    Benchmark UnifiedMultiMessenger.send_to_all (and optionally send_attachment)
+
+    With chunked=True each message is a multi-part report sent through the
+    idempotent chunked path, which the Signal JSON-RPC mode batches.
+    """
+    from src.messengers.unified_messenger import UnifiedMultiMessenger
+
+    multi = UnifiedMultiMessenger(platforms=['telegram', 'signal'])
+    if not pacing:
+        for messenger in multi.messengers.values():
+            messenger.rate_limiter.min_interval = 0
+
+    try:
+        if chunked:
+            # Throwaway outbox so repeated benchmark runs never skip as duplicates
+            from src.messengers.delivery_outbox import DeliveryOutbox
+            outbox_dir = tempfile.mkdtemp()
+            multi._outbox = DeliveryOutbox(Path(outbox_dir) / 'outbox.json')
+            report = "\n".join(f"EURUSD BUY 1.0850 line {n} " + "x" * 60 for n in range(90))
+            result = await _run_load(
+                lambda i: multi.send_to_all(f"Benchmark report {i}\n{report}", report_id=f"benchmark-{i}"),
+                messages, concurrency
+            )
+        else:
+            result = await _run_load(
+                lambda i: multi.send_to_all(f"Benchmark message {i}\nEURUSD BUY 1.0850"),
+                messages, concurrency
+            )
+
+        if attachments:
+            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
+                tmp.write(b'\x89PNG\r\n\x1a\n' + b'\x00' * 2048)
+                attachment_path = tmp.name
+            try:
+                result['attachments'] = await _run_load(
+                    lambda i: multi.send_attachment(attachment_path, caption=f"Benchmark attachment {i}"),
+                    attachments, concurrency
+                )
+            finally:
+                os.unlink(attachment_path)
+
+        result['rate_limit'] = {
+            platform: messenger.get_rate_limit_stats() for platform, messenger in multi.messengers.items()
+        }
+        return result
+    finally:
+        await multi.cleanup()
+
+
+async def bench_messaging_manager(messages: int, concurrency: int) -> Dict[str, Any]:
+    """Benchmark forex_signals MessagingManager.send_message"""
+    from forex_signals.core.config import get_settings
+    from forex_signals.messaging import MessagingManager
+
+    # Settings are lru_cached; make sure the stand-in environment is picked up
+    get_settings.cache_clear()
+    manager = MessagingManager()
+
+    return await _run_load(
+        lambda i: manager.send_message(f"Benchmark message {i}\nEURUSD BUY 1.0850"),
+        messages, concurrency
+    )
+
+
+async def run_benchmark(messages: int = 100, concurrency: int = 4, drivers: Optional[List[str]] = None,
+                        behavior: Optional[StubBehavior] = None, pacing: bool = False,
+                        attachments: int = 0, signal_jsonrpc: bool = False,
+                        chunked: bool = False) -> Dict[str, Any]:
+    """
+    Start the stand-ins, run the selected drivers and return a JSON-serialisable report
+
+    Each driver gets fresh stand-in servers so their counters are not mixed.
+    """
+    behavior = behavior or StubBehavior()
+    drivers = drivers or list(DRIVERS)
+    report: Dict[str, Any] = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {
+            'messages': messages,
+            'concurrency': concurrency,
+            'pacing': pacing,
+            'attachments': attachments,
+            'signal_jsonrpc': signal_jsonrpc,
+            'chunked': chunked,
+            'latency': behavior.latency,
+            'jitter': behavior.jitter,
+            'rate_limit_every': behavior.rate_limit_every,
+            'retry_after': behavior.retry_after,
+            'untrusted_identity_every': behavior.untrusted_identity_every
+        },
+        'results': {}
+    }
+
+    for driver in drivers:
+        telegram = TelegramStubServer(behavior)
+        signal = SignalStubServer(behavior, group_id=BENCHMARK_SIGNAL_GROUP, phone_number=BENCHMARK_SIGNAL_NUMBER,
+                                  jsonrpc=signal_jsonrpc)
+        async with telegram, signal:
+            configure_stub_environment(telegram.base_url, signal.base_url)
+            logger.info(f"📊 Running {driver} benchmark: {messages} messages, concurrency {concurrency}")
+
+            if driver == 'unified':
+                result = await bench_unified_multi_messenger(messages, concurrency, pacing, attachments, chunked)
+            elif driver == 'manager':
+                result = await bench_messaging_manager(messages, concurrency)
+            else:
+                raise ValueError(f"Unknown benchmark driver: {driver}")
+
+            result['stubs'] = {'telegram': telegram.stats.to_dict(), 'signal': signal.stats.to_dict()}
+            result['http_pool'] = get_client_pool().stats()
+            report['results'][driver] = result
+
+            # Stand-in ports change per driver; drop connections to the old ones
+            await close_http_clients()
+
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    """Print a human-readable summary table"""
+    config = report['config']
+    print("\n📊 MESSAGING DELIVERY BENCHMARK")
+    print("=" * 78)
+    print(f"messages={config['messages']} concurrency={config['concurrency']} pacing={config['pacing']} "
+          f"latency={config['latency']}s rate_limit_every={config['rate_limit_every']} "
+          f"untrusted_every={config['untrusted_identity_every']}")
+    print("-" * 78)
+    print(f"{'driver':<12}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}{'msgs/s':>10}{'ok':>8}{'failed':>8}{'429s':>8}")
+    for driver, result in report['results'].items():
+        throttled = sum(stub['rate_limited'] for stub in result['stubs'].values())
+        print(f"{driver:<12}{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['mean_ms']:>10.1f}"
+              f"{result['messages_per_s']:>10.1f}{result['platform_deliveries']:>8}"
+              f"{result['platform_failures']:>8}{throttled:>8}")
+        if 'attachments' in result:
+            att = result['attachments']
+            print(f"{'  attach':<12}{att['p50_ms']:>10.1f}{att['p99_ms']:>10.1f}{att['mean_ms']:>10.1f}"
+                  f"{att['messages_per_s']:>10.1f}{att['platform_deliveries']:>8}{att['platform_failures']:>8}")
+    print("=" * 78)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark messaging delivery against local API stand-ins")
+    parser.add_argument('--messages', type=int, default=100, help="Messages per driver")
+    parser.add_argument('--concurrency', type=int, default=4, help="Maximum in-flight sends")
+    parser.add_argument('--driver', action='append', choices=DRIVERS, help="Driver to run (repeatable, default all)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Stand-in base latency in seconds")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Stand-in random extra latency in seconds")
+    parser.add_argument('--rate-limit-every', type=int, default=0, help="Answer every Nth send with 429")
+    parser.add_argument('--retry-after', type=int, default=1, help="retry_after returned with 429")
+    parser.add_argument('--untrusted-every', type=int, default=0, help="Answer every Nth Signal send with Untrusted Identity")
+    parser.add_argument('--attachments', type=int, default=0, help="Attachments to send through UnifiedMultiMessenger")
+    parser.add_argument('--pacing', action='store_true', help="Keep the messengers' per-chat send pacing")
+    parser.add_argument('--signal-jsonrpc', action='store_true', help="Serve signal-cli JSON-RPC so Signal sends batch")
+    parser.add_argument('--chunked', action='store_true', help="Send multi-part reports via the idempotent chunked path")
+    parser.add_argument('--seed', type=int, default=42, help="Seed for stand-in jitter")
+    parser.add_argument('--output', help="Write the JSON report to this file")
+    parser.add_argument('--verbose', action='store_true', help="Show messenger logs")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    behavior = StubBehavior(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_every=args.rate_limit_every,
+        retry_after=args.retry_after,
+        untrusted_identity_every=args.untrusted_every,
+        seed=args.seed
+    )
+
+    report = asyncio.run(run_benchmark(
+        messages=args.messages,
+        concurrency=args.concurrency,
+        drivers=args.driver,
+        behavior=behavior,
+        pacing=args.pacing,
+        attachments=args.attachments,
+        signal_jsonrpc=args.signal_jsonrpc,
+        chunked=args.chunked
+    ))
+
+    print_report(report)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"📁 Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Local Telegram Bot API and signal-cli-rest-api stand-ins
+aiohttp servers that emulate the endpoints our messengers use, with configurable
+latency, 429 throttling (retry_after) and Signal untrusted-identity errors
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StubBehavior:
+    """Failure and latency profile for a stand-in server"""
+    latency: float = 0.0                 # Base latency added to every response (seconds)
+    jitter: float = 0.0                  # Uniform random latency added on top (seconds)
+    rate_limit_every: int = 0            # Every Nth send answers 429 (0 disables)
+    retry_after: int = 1                 # retry_after value returned with 429 responses
+    untrusted_identity_every: int = 0    # Every Nth Signal send answers "Untrusted Identity" (0 disables)
+    seed: Optional[int] = None           # Seed for jitter so runs are reproducible
+
+
+@dataclass
+class StubStats:
+    """Counters recorded by a stand-in server"""
+    requests: int = 0
+    sends: int = 0
+    delivered: int = 0
+    rate_limited: int = 0
+    untrusted_identity: int = 0
+    trust_requests: int = 0
+    by_endpoint: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, endpoint: str):
+        self.requests += 1
+        self.by_endpoint[endpoint] = self.by_endpoint.get(endpoint, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'sends': self.sends,
+            'delivered': self.delivered,
+            'rate_limited': self.rate_limited,
+            'untrusted_identity': self.untrusted_identity,
+            'trust_requests': self.trust_requests,
+            'by_endpoint': dict(self.by_endpoint)
+        }
+
+
+class _StubServer(ABC):
+    """Common lifecycle for the aiohttp stand-ins"""
+
+    def __init__(self, behavior: Optional[StubBehavior] = None, host: str = '127.0.0.1', port: int = 0):
+        self.behavior = behavior or StubBehavior()
+        self.host = host
+        self.port = port
+        self.stats = StubStats()
+        self._rng = random.Random(self.behavior.seed)
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @abstractmethod
+    def _build_app(self) -> web.Application:
+        """aiohttp application serving the platform's routes"""
+
+    async def start(self) -> str:
+        """Start the server and return its base URL"""
+        self._runner = web.AppRunner(self._build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # Resolve the ephemeral port when port=0 was requested
+        if self._runner.addresses:
+            self.port = self._runner.addresses[0][1]
+        logger.info(f"🧪 {self.__class__.__name__} listening on {self.base_url}")
+        return self.base_url
+
+    async def stop(self):
+        """Stop the server"""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def _simulate_latency(self):
+        delay = self.behavior.latency
+        if self.behavior.jitter:
+            delay += self._rng.uniform(0, self.behavior.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _should_throttle(self) -> bool:
+        every = self.behavior.rate_limit_every
+        return bool(every) and self.stats.sends % every == 0
+
+
+class TelegramStubServer(_StubServer):
+    """
+    Telegram Bot API stand-in
+    Serves /bot<token>/sendMessage, /sendDocument, /sendPhoto and /getMe
+    """
+
+    def __init__(self, behavior: Optional[StubBehavior] = None, **kwargs):
+        super().__init__(behavior, **kwargs)
+        self._next_message_id = 1
+
+    def _build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/bot{token}/sendMessage', self._handle_send)
+        app.router.add_post('/bot{token}/sendDocument', self._handle_send)
+        app.router.add_post('/bot{token}/sendPhoto', self._handle_send)
+        app.router.add_get('/bot{token}/getMe', self._handle_get_me)
+        return app
+
+    async def _handle_send(self, request: web.Request) -> web.Response:
+        endpoint = request.path.rsplit('/', 1)[-1]
+        self.stats.record(endpoint)
+        self.stats.sends += 1
+
+        # Drain the body so multipart uploads are fully received
+        await request.read()
+        await self._simulate_latency()
+
+        if self._should_throttle():
+            self.stats.rate_limited += 1
+            retry_after = self.behavior.retry_after
+            return web.json_response(
+                {
+                    'ok': False,
+                    'error_code': 429,
+                    'description': f'Too Many Requests: retry after {retry_after}',
+                    'parameters': {'retry_after': retry_after}
+                },
+                status=429,
+                headers={'Retry-After': str(retry_after)}
+            )
+
+        message_id = self._next_message_id
+        self._next_message_id += 1
+        self.stats.delivered += 1
+        return web.json_response({
+            'ok': True,
+            'result': {'message_id': message_id, 'date': int(time.time())}
+        })
+
+    async def _handle_get_me(self, request: web.Request) -> web.Response:
+        self.stats.record('getMe')
+        await self._simulate_latency()
+        return web.json_response({
+            'ok': True,
+            'result': {'id': 1, 'is_bot': True, 'username': 'benchmark_stub_bot'}
+        })
+
+
+class SignalStubServer(_StubServer):
+    """
+    signal-cli-rest-api stand-in
+    Serves /v2/send, /v1/groups/<number>, /v1/about and the identity trust endpoints,
+    plus signal-cli's daemon JSON-RPC endpoint (/api/v1/rpc) when jsonrpc=True.
+    Latency is charged per HTTP request, so a JSON-RPC batch pays it once.
+    """
+
+    def __init__(self, behavior: Optional[StubBehavior] = None, group_id: str = 'group.benchmark',
+                 phone_number: str = '+10000000000', jsonrpc: bool = False, **kwargs):
+        super().__init__(behavior, **kwargs)
+        self.group_id = group_id
+        self.phone_number = phone_number
+        self.jsonrpc = jsonrpc
+        self._untrusted_uuid: Optional[str] = None
+        self.rpc_sends: list = []
+
+    def _build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/v2/send', self._handle_send)
+        app.router.add_get('/v1/groups/{number}', self._handle_groups)
+        app.router.add_get('/v1/about', self._handle_about)
+        app.router.add_route('*', '/v1/identities/{number}/trust', self._handle_trust)
+        app.router.add_route('*', '/v1/identities/{number}/trust/{uuid}', self._handle_trust)
+        app.router.add_route('*', '/v2/identities/{number}/trust/{uuid}', self._handle_trust)
+        if self.jsonrpc:
+            app.router.add_post('/api/v1/rpc', self._handle_rpc)
+        return app
+
+    def _should_report_untrusted(self) -> bool:
+        every = self.behavior.untrusted_identity_every
+        return bool(every) and self._untrusted_uuid is None and self.stats.sends % every == 0
+
+    async def _handle_send(self, request: web.Request) -> web.Response:
+        self.stats.record('v2/send')
+        self.stats.sends += 1
+
+        await request.read()
+        await self._simulate_latency()
+
+        if self._should_throttle():
+            self.stats.rate_limited += 1
+            return web.json_response(
+                {'error': 'Rate limit exceeded'},
+                status=429,
+                headers={'Retry-After': str(self.behavior.retry_after)}
+            )
+
+        if self._should_report_untrusted():
+            self.stats.untrusted_identity += 1
+            self._untrusted_uuid = str(uuid.uuid4())
+            return web.json_response(
+                {'error': f'Failed to send message: Untrusted Identity for "{self._untrusted_uuid}"'},
+                status=400
+            )
+
+        self.stats.delivered += 1
+        return web.json_response({'timestamp': str(int(time.time() * 1000))}, status=201)
+
+    async def _handle_rpc(self, request: web.Request) -> web.Response:
+        self.stats.record('api/v1/rpc')
+        body = await request.json()
+        await self._simulate_latency()
+
+        calls = body if isinstance(body, list) else [body]
+        responses = []
+        for call in calls:
+            method = call.get('method')
+            if method == 'version':
+                result = {'version': 'stub'}
+            elif method == 'send':
+                self.stats.sends += 1
+                params = call.get('params', {})
+                if self._should_throttle():
+                    self.stats.rate_limited += 1
+                    responses.append({'jsonrpc': '2.0', 'id': call.get('id'), 'error': {
+                        'code': -5, 'message': 'Failed to send message due to rate limiting',
+                        'data': {'retryAfterSeconds': self.behavior.retry_after}
+                    }})
+                    continue
+                self.stats.delivered += 1
+                self.rpc_sends.append(params)
+                result = {'timestamp': int(time.time() * 1000), 'results': self._rpc_send_results(params)}
+            elif method == 'trust':
+                self.stats.trust_requests += 1
+                self._untrusted_uuid = None
+                result = {}
+            else:
+                responses.append({'jsonrpc': '2.0', 'id': call.get('id'),
+                                  'error': {'code': -32601, 'message': f'Method not found: {method}'}})
+                continue
+            responses.append({'jsonrpc': '2.0', 'id': call.get('id'), 'result': result})
+
+        return web.json_response(responses if isinstance(body, list) else responses[0])
+
+    def _rpc_send_results(self, params: Dict[str, Any]) -> list:
+        """Per-recipient outcome of a JSON-RPC send; one group member may be untrusted"""
+        if 'recipient' in params:
+            return [{'recipientAddress': {'uuid': recipient, 'number': None},
+                     'type': 'IDENTITY_FAILURE' if recipient == self._untrusted_uuid else 'SUCCESS'}
+                    for recipient in params['recipient']]
+        results = [{'recipientAddress': {'uuid': None, 'number': self.phone_number}, 'type': 'SUCCESS'}]
+        if self._should_report_untrusted():
+            self.stats.untrusted_identity += 1
+            self._untrusted_uuid = str(uuid.uuid4())
+        if self._untrusted_uuid:
+            results.append({'recipientAddress': {'uuid': self._untrusted_uuid, 'number': None},
+                            'type': 'IDENTITY_FAILURE'})
+        return results
+
+    async def _handle_groups(self, request: web.Request) -> web.Response:
+        self.stats.record('v1/groups')
+        await self._simulate_latency()
+        return web.json_response([{
+            'id': self.group_id,
+            'name': 'Benchmark Group',
+            'members': [request.match_info['number']],
+            'admins': [],
+            'pending_requests': []
+        }])
+
+    async def _handle_about(self, request: web.Request) -> web.Response:
+        self.stats.record('v1/about')
+        return web.json_response({'versions': ['v1', 'v2'], 'mode': 'stub'})
+
+    async def _handle_trust(self, request: web.Request) -> web.Response:
+        self.stats.record('identities/trust')
+        self.stats.trust_requests += 1
+        await request.read()
+        # Any trust request clears the outstanding untrusted identity
+        self._untrusted_uuid = None
+        return web.Response(status=204)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run local Telegram/Signal API stand-ins")
+    parser.add_argument('--telegram-port', type=int, default=8081)
+    parser.add_argument('--signal-port', type=int, default=8082)
+    parser.add_argument('--latency', type=float, default=0.0, help="Base response latency in seconds")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Random extra latency in seconds")
+    parser.add_argument('--rate-limit-every', type=int, default=0, help="Answer every Nth send with 429")
+    parser.add_argument('--retry-after', type=int, default=1, help="retry_after returned with 429")
+    parser.add_argument('--untrusted-every', type=int, default=0, help="Answer every Nth Signal send with Untrusted Identity")
+    parser.add_argument('--signal-jsonrpc', action='store_true', help="Also serve the signal-cli JSON-RPC endpoint")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    async def serve():
+        behavior = StubBehavior(
+            latency=args.latency,
+            jitter=args.jitter,
+            rate_limit_every=args.rate_limit_every,
+            retry_after=args.retry_after,
+            untrusted_identity_every=args.untrusted_every
+        )
+        telegram = TelegramStubServer(behavior, port=args.telegram_port)
+        signal = SignalStubServer(behavior, port=args.signal_port, jsonrpc=args.signal_jsonrpc)
+        async with telegram, signal:
+            print(f"TELEGRAM_API_URL={telegram.base_url}")
+            print(f"SIGNAL_API_URL={signal.base_url}")
+            try:
+                await asyncio.Event().wait()
+            finally:
+                print(json.dumps({'telegram': telegram.stats.to_dict(), 'signal': signal.stats.to_dict()}, indent=2))
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
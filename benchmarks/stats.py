@@ -0,0 +1,102 @@
+"""
+Latency statistics helpers shared by the benchmark suites
+"""
+
+import math
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a sample set
+
+    Args:
+        samples: Observed values (any order)
+        pct: Percentile in the range 0-100
+
+    Returns:
+        The percentile value, or 0.0 for an empty sample set
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class LatencySummary:
+    """Summary of a latency sample set (all times in milliseconds)"""
+    count: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    throughput_per_s: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def summarize_latencies(latencies_s: List[float], wall_time_s: float) -> LatencySummary:
+    """
+    Summarize per-operation latencies measured in seconds
+
+    Args:
+        latencies_s: Individual operation latencies in seconds
+        wall_time_s: Wall-clock duration of the whole run in seconds
+
+    Returns:
+        LatencySummary with p50/p99/mean/max and operations per second
+    """
+    count = len(latencies_s)
+    return LatencySummary(
+        count=count,
+        p50_ms=round(percentile(latencies_s, 50) * 1000, 3),
+        p99_ms=round(percentile(latencies_s, 99) * 1000, 3),
+        mean_ms=round((sum(latencies_s) / count * 1000) if count else 0.0, 3),
+        max_ms=round((max(latencies_s) * 1000) if count else 0.0, 3),
+        throughput_per_s=round(count / wall_time_s, 3) if wall_time_s > 0 else 0.0
+    )
+
+
+@dataclass
+class Regression:
+    """A benchmark case that got slower than its baseline"""
+    case: str
+    baseline_ms: float
+    current_ms: float
+    ratio: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def compare_to_baseline(current: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+                        threshold: float = 0.25, min_delta_ms: float = 0.05,
+                        metric: str = 'p50_ms') -> List[Regression]:
+    """
+    Cases whose `metric` grew by more than `threshold` over the baseline
+
+    Args:
+        current: {case: summary dict} from this run
+        baseline: {case: summary dict} from a stored run
+        threshold: Allowed relative slowdown (0.25 = 25%)
+        min_delta_ms: Absolute slowdown below which differences are noise
+        metric: Summary field to compare
+
+    Returns:
+        Regressions, worst first; cases missing from either side are ignored
+    """
+    regressions = []
+    for case, result in current.items():
+        before = baseline.get(case, {}).get(metric)
+        after = result.get(metric)
+        if before is None or after is None:
+            continue
+        if after - before > min_delta_ms and after > before * (1 + threshold):
+            regressions.append(Regression(case=case, baseline_ms=before, current_ms=after,
+                                          ratio=round(after / before, 3) if before else math.inf))
+    regressions.sort(key=lambda r: r.ratio, reverse=True)
+    return regressions
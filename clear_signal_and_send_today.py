@@ -92,8 +92,11 @@ async def send_todays_financial_data():
         platforms = ['signal', 'telegram', 'whatsapp']
         multi_messenger = UnifiedMultiMessenger(platforms)
         
-        # Prepare message content
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+        # Prepare message content. The outbox keys chunks by report id and content digest,
+        # so the header carries only the date: a same-day rerun of the same report resends
+        # just the chunks/heatmaps a platform has not acknowledged, a corrected one goes out in full
+        timestamp = datetime.now().strftime('%Y-%m-%d')
+        report_id = f"daily-report-{timestamp}"
         
         if scraped_data and scraped_data.get('forex_data'):
             # Use real data
@@ -125,12 +128,15 @@ Next scheduled report: Monday 6:00 AM PST"""
         logger.info("📤 Sending to all platforms...")
         
         # Send the message
-        results = await multi_messenger.send_to_all(final_message)
+        results = await multi_messenger.send_to_all(final_message, report_id=report_id)
         
         # Check results
         success_count = 0
         for platform, result in results.items():
-            if result.success:
+            if result.success and result.metadata.get('duplicate'):
+                logger.info(f"⏭️ {platform.upper()}: Already delivered today, not resent")
+                success_count += 1
+            elif result.success:
                 logger.info(f"✅ {platform.upper()}: Message sent successfully")
                 success_count += 1
             else:
@@ -162,14 +168,16 @@ Next scheduled report: Monday 6:00 AM PST"""
                         logger.info("📊 Sending categorical heatmap...")
                         await multi_messenger.send_attachment(
                             file_path=str(categorical_heatmap[0]),
-                            caption="Interest Rate Analysis - Categorical View"
+                            caption="Interest Rate Analysis - Categorical View",
+                            report_id=report_id
                         )
                     
                     if forex_heatmap:
                         logger.info("🌍 Sending forex pairs heatmap...")
                         await multi_messenger.send_attachment(
                             file_path=str(forex_heatmap[0]),
-                            caption="Forex Pairs Interest Rate Differentials"
+                            caption="Forex Pairs Interest Rate Differentials",
+                            report_id=report_id
                         )
                         
             except Exception as e:
@@ -16,10 +16,16 @@ from enum import Enum
 from pathlib import Path
 from functools import wraps
 from tenacity import (
-    retry, stop_after_attempt, wait_exponential, wait_fixed,
-    retry_if_exception_type, retry_if_result, before_sleep_log
+    retry, stop_after_attempt, stop_any, wait_exponential, wait_fixed,
+    retry_if_exception_type, retry_if_not_exception_type, retry_if_result, before_sleep_log
 )
 
+from src.core.circuit_breaker import (
+    CircuitBreaker as SharedCircuitBreaker, CircuitBreakerConfig, CircuitState, register_circuit_breaker
+)
+from src.core.deadline import budget_exhausted, clamped_wait
+from src.core.exceptions import CircuitBreakerOpenError
+
 logger = logging.getLogger(__name__)
 
 class ErrorSeverity(str, Enum):
@@ -76,55 +82,26 @@ class ErrorRecord:
     stack_trace: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
 
-class CircuitBreakerState(str, Enum):
-    """Circuit breaker states"""
-    CLOSED = "closed"     # Normal operation
-    OPEN = "open"         # Failing, reject calls
-    HALF_OPEN = "half_open"  # Testing if service recovered
+class ThrottledError(Exception):
+    """
+    Raised when a service asks the caller to slow down (e.g. HTTP 429)
 
-@dataclass
-class CircuitBreaker:
-    """Circuit breaker for external service calls"""
-    name: str
-    failure_threshold: int = 5
-    recovery_timeout: int = 60
-    state: CircuitBreakerState = CircuitBreakerState.CLOSED
-    failure_count: int = 0
-    last_failure_time: Optional[datetime] = None
-    
-    def can_execute(self) -> bool:
-        """Check if operation can be executed"""
-        if self.state == CircuitBreakerState.CLOSED:
-            return True
-        elif self.state == CircuitBreakerState.OPEN:
-            if self._should_attempt_reset():
-                self.state = CircuitBreakerState.HALF_OPEN
-                return True
-            return False
-        else:  # HALF_OPEN
-            return True
-    
-    def record_success(self):
-        """Record successful operation"""
-        self.failure_count = 0
-        self.state = CircuitBreakerState.CLOSED
-        self.last_failure_time = None
-    
-    def record_failure(self):
-        """Record failed operation"""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now()
-        
-        if self.state == CircuitBreakerState.HALF_OPEN:
-            self.state = CircuitBreakerState.OPEN
-        elif self.failure_count >= self.failure_threshold:
-            self.state = CircuitBreakerState.OPEN
+    Throttling means the service is healthy but busy, so circuit breakers count
+    it separately from failures and retries wait for the server's retry_after.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+# Breakers come from the shared sliding-window implementation
+CircuitBreakerState = CircuitState
+
+class CircuitBreaker(SharedCircuitBreaker):
+    """Circuit breaker for external service calls; keyword arguments are CircuitBreakerConfig fields"""
     
-    def _should_attempt_reset(self) -> bool:
-        """Check if enough time has passed to attempt reset"""
-        if not self.last_failure_time:
-            return True
-        return datetime.now() - self.last_failure_time > timedelta(seconds=self.recovery_timeout)
+    def __init__(self, name: str, **config):
+        super().__init__(name, CircuitBreakerConfig(**config))
 
 class EnhancedErrorHandler:
     """
@@ -154,9 +131,10 @@ class EnhancedErrorHandler:
         logger.info("Enhanced error handler initialized")
     
     def get_or_create_circuit_breaker(self, name: str, **kwargs) -> CircuitBreaker:
-        """Get or create circuit breaker for service"""
+        """Get or create circuit breaker for service (kwargs are CircuitBreakerConfig fields)"""
         if name not in self.circuit_breakers:
-            self.circuit_breakers[name] = CircuitBreaker(name=name, **kwargs)
+            # Shared with other handlers through the global registry
+            self.circuit_breakers[name] = register_circuit_breaker(CircuitBreaker(name, **kwargs))
         return self.circuit_breakers[name]
     
     async def handle_error(self, error: Exception, context: ErrorContext) -> bool:
@@ -190,7 +168,7 @@ class EnhancedErrorHandler:
             circuit_breaker = self.get_or_create_circuit_breaker(
                 f"{context.component}_{context.operation}"
             )
-            if not circuit_breaker.can_execute():
+            if circuit_breaker.state is CircuitState.OPEN:
                 logger.warning(f"Circuit breaker OPEN for {context.operation}")
                 return False
         
@@ -269,6 +247,8 @@ class EnhancedErrorHandler:
                     pass
                 def record_success(self):
                     pass
+                def record_throttle(self):
+                    pass
             self.circuit_breakers[service_name] = MockCircuitBreaker()
         return self.circuit_breakers[service_name]
     
@@ -308,7 +288,8 @@ class EnhancedErrorHandler:
             'circuit_breakers': {
                 name: {
                     'state': cb.state,
-                    'failure_count': cb.failure_count
+                    'failure_count': cb.failure_count,
+                    'throttle_count': getattr(cb, 'throttle_count', 0)
                 }
                 for name, cb in self.circuit_breakers.items()
             }
@@ -324,6 +305,16 @@ def get_error_handler() -> EnhancedErrorHandler:
         _global_error_handler = EnhancedErrorHandler()
     return _global_error_handler
 
+def _wait_honoring_retry_after(fallback_wait, max_delay: float):
+    """Tenacity wait that uses a ThrottledError's retry_after when present"""
+    def wait(retry_state) -> float:
+        outcome = retry_state.outcome
+        error = outcome.exception() if outcome is not None else None
+        if isinstance(error, ThrottledError) and error.retry_after is not None:
+            return min(error.retry_after, max_delay)
+        return fallback_wait(retry_state)
+    return wait
+
 # Decorator for resilient operations
 def resilient_operation(
     operation_name: str,
@@ -369,7 +360,7 @@ def resilient_operation(
                     f"{component}_{operation_name}"
                 )
                 if not circuit_breaker.can_execute():
-                    raise Exception(f"Circuit breaker open for {operation_name}")
+                    raise CircuitBreakerOpenError(circuit_breaker.name, round(circuit_breaker.retry_in(), 1))
             
             # Configure retry based on strategy
             if retry_strategy == RetryStrategy.NO_RETRY:
@@ -386,29 +377,49 @@ def resilient_operation(
             
             elif retry_strategy == RetryStrategy.FIXED_DELAY:
                 retry_decorator = retry(
-                    stop=stop_after_attempt(max_retries),
-                    wait=wait_fixed(base_delay),
+                    stop=stop_any(stop_after_attempt(max_retries), budget_exhausted),
+                    retry=retry_if_not_exception_type(CircuitBreakerOpenError),
+                    wait=clamped_wait(_wait_honoring_retry_after(wait_fixed(base_delay), max_delay)),
                     before_sleep=before_sleep_log(logger, logging.WARNING)
                 )
             else:  # EXPONENTIAL_BACKOFF or CIRCUIT_BREAKER
                 retry_decorator = retry(
-                    stop=stop_after_attempt(max_retries),
-                    wait=wait_exponential(multiplier=base_delay, max=max_delay),
+                    stop=stop_any(stop_after_attempt(max_retries), budget_exhausted),
+                    retry=retry_if_not_exception_type(CircuitBreakerOpenError),
+                    wait=clamped_wait(_wait_honoring_retry_after(
+                        wait_exponential(multiplier=base_delay, max=max_delay), max_delay
+                    )),
                     before_sleep=before_sleep_log(logger, logging.WARNING)
                 )
             
+            attempts = 0
+            
             @retry_decorator
             async def retryable_func():
+                nonlocal attempts
+                attempts += 1
+                # Retries are admitted like any other call: no retrying into an
+                # open circuit, and only the allowed probes while half-open
+                if (retry_strategy == RetryStrategy.CIRCUIT_BREAKER and attempts > 1
+                        and not circuit_breaker.can_execute()):
+                    raise CircuitBreakerOpenError(circuit_breaker.name, round(circuit_breaker.retry_in(), 1))
+                started = time.monotonic()
                 try:
                     result = await func(*args, **kwargs)
                     if retry_strategy == RetryStrategy.CIRCUIT_BREAKER:
-                        circuit_breaker.record_success()
+                        circuit_breaker.record_success(time.monotonic() - started)
                     return result
+                except ThrottledError:
+                    # Busy, not broken: keep it out of failure stats and let the
+                    # retry wait for the server's retry_after
+                    if retry_strategy == RetryStrategy.CIRCUIT_BREAKER:
+                        circuit_breaker.record_throttle()
+                    raise
                 except Exception as e:
                     context.retry_count = getattr(retryable_func.retry, 'statistics', {}).get('attempt_number', 1) - 1
                     should_continue = await error_handler.handle_error(e, context)
                     if retry_strategy == RetryStrategy.CIRCUIT_BREAKER:
-                        circuit_breaker.record_failure()
+                        circuit_breaker.record_failure(e, time.monotonic() - started)
                     if not should_continue:
                         raise
                     raise  # Re-raise for retry mechanism
@@ -466,6 +477,12 @@ def circuit_breaker_protection(service_name: str):
         max_retries=3
     )
 
+def record_service_throttle(service_name: str):
+    """Count a throttle against the breaker used by circuit_breaker_protection(service_name)"""
+    get_error_handler().get_or_create_circuit_breaker(
+        f"external_service_{service_name}_call"
+    ).record_throttle()
+
 # Data validation helpers
 class DataValidator:
     """Helper class for data validation"""
@@ -21,6 +21,7 @@ from enhanced_error_handler import (
     EnhancedErrorHandler, ErrorContext, ErrorCategory, ErrorSeverity,
     resilient_operation, MessageResult, MessageStatus
 )
+from src.messengers.delivery_outbox import DeliveryOutbox, content_report_id, idempotency_key
 
 logger = logging.getLogger(__name__)
 
@@ -458,10 +459,11 @@ class EnhancedTelegramMessenger:
 class EnhancedMessagingSystem:
     """Enhanced messaging system with queue, fallbacks, and delivery confirmation"""
     
-    def __init__(self, config_file: str = "config.json"):
+    def __init__(self, config_file: str = "config.json", outbox: Optional[DeliveryOutbox] = None):
         self.config = self._load_config(config_file)
         self.message_queue = MessageQueue()
         self.error_handler = EnhancedErrorHandler()
+        self.outbox = outbox or DeliveryOutbox()
         
         # Initialize messengers
         self.messengers = {}
@@ -504,7 +506,8 @@ class EnhancedMessagingSystem:
     
     async def send_financial_alert(self, message: str, 
                                  priority: MessagePriority = MessagePriority.HIGH,
-                                 immediate: bool = True) -> str:
+                                 immediate: bool = True,
+                                 report_id: Optional[str] = None) -> str:
         """
         Send financial alert with high priority
         
@@ -512,18 +515,23 @@ class EnhancedMessagingSystem:
             message: Alert message content
             priority: Message priority level
             immediate: Whether to send immediately or queue
+            report_id: Idempotency scope; without one the message is always sent
             
         Returns:
             Message ID
         """
         delivery_methods = [DeliveryMethod.SIGNAL, DeliveryMethod.TELEGRAM]
         
+        metadata = {'type': 'financial_alert', 'urgent': immediate}
+        if report_id:
+            metadata['report_id'] = report_id
+        
         message_id = self.message_queue.add_message(
             content=message,
             priority=priority,
             delivery_methods=delivery_methods,
             financial_data=True,
-            metadata={'type': 'financial_alert', 'urgent': immediate}
+            metadata=metadata
         )
         
         if immediate:
@@ -567,12 +575,31 @@ class EnhancedMessagingSystem:
         
         message = self.message_queue.messages[message_id]
         
+        # Delivery methods are fallbacks for each other, so one acknowledgement
+        # on any of them means the report has already reached the users
+        keys = {method: self._idempotency_key(message, method) for method in message.delivery_methods}
+        for method, key in keys.items():
+            if key and self.outbox.is_acknowledged(key):
+                logger.info(f"Message {message_id} already delivered via {method.value}, not resending")
+                self.message_queue.mark_delivered(
+                    message_id=message_id,
+                    method=method,
+                    success=True,
+                    response_data={'duplicate': True, 'idempotency_key': key}
+                )
+                return
+        
         # Try each delivery method
         for method in message.delivery_methods:
             if method in self.messengers:
                 try:
                     result = await self._send_via_messenger(message, method)
                     
+                    if keys[method] and result.status == MessageStatus.SUCCESS:
+                        self.outbox.acknowledge(keys[method], result.message_id, message.content)
+                    elif keys[method]:
+                        self.outbox.record_failure(keys[method], result.error)
+                    
                     self.message_queue.mark_delivered(
                         message_id=message_id,
                         method=method,
@@ -596,6 +623,14 @@ class EnhancedMessagingSystem:
                         error_message=str(e)
                     )
     
+    def _idempotency_key(self, message: QueuedMessage, method: DeliveryMethod) -> Optional[str]:
+        """Outbox key for a queued message with a report_id (None: no dedup, always send)"""
+        report_id = message.metadata.get('report_id')
+        if not report_id:
+            return None
+        digest = content_report_id(f"{message.content}|{message.metadata.get('file_path', '')}")
+        return idempotency_key(report_id, method.value, digest=digest)
+    
     async def _send_via_messenger(self, message: QueuedMessage, method: DeliveryMethod) -> MessageResult:
         """Send message via specific messenger"""
         messenger = self.messengers.get(method)
@@ -671,6 +706,7 @@ class EnhancedMessagingSystem:
         return {
             'messengers': messenger_status,
             'queue': queue_stats,
+            'outbox': self.outbox.get_statistics(),
             'processor_running': self._running,
             'timestamp': datetime.now().isoformat()
         }
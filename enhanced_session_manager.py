@@ -8,35 +8,47 @@ import os
 import json
 import logging
 import asyncio
+import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
-import hashlib
 import sys
 
 # Add parent directory to path for SecureConfigManager
 sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent / 'utils'))
 from secure_config_manager import SecureConfigManager
 from intelligent_cache import IntelligentCache, CacheEntryType, get_cache
+from session_store import SessionStore, session_checksum, staging_lock
 
 logger = logging.getLogger(__name__)
 
 class SessionInfo:
     """Session information and metadata"""
     
-    def __init__(self, session_name: str, data: Dict[str, Any]):
+    def __init__(self, session_name: str, data: Dict[str, Any], checksum: Optional[str] = None):
         self.session_name = session_name
         self.data = data
         self.created_at = datetime.now()
         self.last_used = datetime.now()
         self.use_count = 0
         self.version = 1
-        self.checksum = self._calculate_checksum(data)
+        self._checksum = checksum
+    
+    @property
+    def checksum(self) -> str:
+        """Checksum for session data integrity, hashed on first use"""
+        if self._checksum is None:
+            self._checksum = self._calculate_checksum(self.data)
+        return self._checksum
+    
+    @checksum.setter
+    def checksum(self, value: Optional[str]):
+        self._checksum = value
     
     def _calculate_checksum(self, data: Dict[str, Any]) -> str:
         """Calculate checksum for session data integrity"""
-        data_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(data_str.encode()).hexdigest()[:16]
+        return session_checksum(data)
     
     def mark_used(self):
         """Mark session as used"""
@@ -67,12 +79,11 @@ class SessionInfo:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SessionInfo':
         """Create SessionInfo from dictionary"""
-        session_info = cls(data['session_name'], data['data'])
+        session_info = cls(data['session_name'], data['data'], checksum=data.get('checksum'))
         session_info.created_at = datetime.fromisoformat(data['created_at'])
         session_info.last_used = datetime.fromisoformat(data['last_used'])
         session_info.use_count = data.get('use_count', 0)
         session_info.version = data.get('version', 1)
-        session_info.checksum = data.get('checksum', session_info.checksum)
         return session_info
 
 class EnhancedSessionManager:
@@ -102,6 +113,10 @@ class EnhancedSessionManager:
         }
         self.cache = get_cache(cache_config)
         
+        # Decrypted session files, re-read only when their mtime/size change
+        self.store = SessionStore(self._read_session_file, self._write_session_file,
+                                  max_entries=self.max_cached_sessions)
+        
         # Session pool for rotation
         self.active_sessions: Dict[str, SessionInfo] = {}
         self.session_lock = asyncio.Lock()
@@ -209,11 +224,55 @@ class EnhancedSessionManager:
             logger.error(f"❌ Error loading session {session_name}: {e}")
             return None
     
+    def _write_session_file(self, session_file: Path, payload: Dict[str, Any]) -> bool:
+        """Encrypt a session payload into session_file (runs in a worker thread)"""
+        session_subdir = session_file.parent
+        session_subdir.mkdir(exist_ok=True)
+        
+        # Use a temporary secure manager for this session
+        session_secure_manager = SecureConfigManager(session_subdir)
+        encrypted_file = session_subdir / "config.enc"
+        
+        with staging_lock(encrypted_file):
+            if not session_secure_manager.encrypt_config(payload) or not encrypted_file.exists():
+                return False
+            
+            # Move encrypted file to correct location
+            encrypted_file.rename(session_file)
+        
+        # Secure permissions
+        os.chmod(session_file, 0o600)
+        os.chmod(session_subdir, 0o700)
+        
+        # Remove old plaintext session if it exists
+        plaintext_session = session_subdir / "session.json"
+        if plaintext_session.exists():
+            plaintext_session.unlink()
+        
+        return True
+    
+    def _read_session_file(self, session_file: Path) -> Optional[Dict[str, Any]]:
+        """Decrypt a session file (runs in a worker thread)"""
+        session_secure_manager = SecureConfigManager(session_file.parent)
+        encrypted_file = session_file.parent / "config.enc"
+        with staging_lock(encrypted_file):
+            # Copy rather than move, so concurrent loads never find the session missing
+            shutil.copyfile(session_file, encrypted_file)
+            try:
+                return session_secure_manager.decrypt_config()
+            finally:
+                encrypted_file.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _verify_checksum(payload: Dict[str, Any]) -> bool:
+        """Checksum check, run only when a changed file is actually decrypted"""
+        expected_checksum = payload.get('metadata', {}).get('checksum', '')
+        return not expected_checksum or expected_checksum == session_checksum(payload.get('session_data', {}))
+    
     async def _save_encrypted_session(self, session_info: SessionInfo) -> bool:
         """Save session to encrypted disk storage"""
         try:
-            session_subdir = self.session_dir / session_info.session_name
-            session_subdir.mkdir(exist_ok=True)
+            session_file = self.session_dir / session_info.session_name / "session.enc"
             
             # Prepare session data with metadata
             session_data_with_metadata = {
@@ -227,30 +286,7 @@ class EnhancedSessionManager:
                 }
             }
             
-            # Use a temporary secure manager for this session
-            session_secure_manager = SecureConfigManager(session_subdir)
-            success = session_secure_manager.encrypt_config(session_data_with_metadata)
-            
-            if success:
-                # Move encrypted file to correct location
-                encrypted_file = session_subdir / "config.enc"
-                session_file = session_subdir / "session.enc"
-                
-                if encrypted_file.exists():
-                    encrypted_file.rename(session_file)
-                    
-                    # Secure permissions
-                    os.chmod(session_file, 0o600)
-                    os.chmod(session_subdir, 0o700)
-                    
-                    # Remove old plaintext session if it exists
-                    plaintext_session = session_subdir / "session.json"
-                    if plaintext_session.exists():
-                        plaintext_session.unlink()
-                    
-                    return True
-            
-            return False
+            return await self.store.save_async(session_file, session_data_with_metadata)
             
         except Exception as e:
             logger.error(f"Error saving encrypted session: {e}")
@@ -259,23 +295,22 @@ class EnhancedSessionManager:
     async def _load_encrypted_session(self, session_name: str) -> Optional[SessionInfo]:
         """Load session from encrypted disk storage"""
         try:
-            session_subdir = self.session_dir / session_name
-            session_file = session_subdir / "session.enc"
+            session_file = self.session_dir / session_name / "session.enc"
             
             if not session_file.exists():
                 return None
             
-            # Use a temporary secure manager for this session
-            session_secure_manager = SecureConfigManager(session_subdir)
-            decrypted_data = session_secure_manager.decrypt_config()
+            decrypted_data = await self.store.load_async(session_file, verify=self._verify_checksum)
+            if decrypted_data is None and session_file.exists():
+                logger.warning(f"⚠️ Session checksum mismatch or unreadable session for {session_name}")
             
             if decrypted_data:
                 # Extract session data and metadata
                 session_data = decrypted_data.get('session_data', {})
                 metadata = decrypted_data.get('metadata', {})
                 
-                # Create session info
-                session_info = SessionInfo(session_name, session_data)
+                # Create session info; the checksum was verified when the file was decrypted
+                session_info = SessionInfo(session_name, session_data, checksum=metadata.get('checksum') or None)
                 
                 # Restore metadata
                 if metadata:
@@ -283,12 +318,6 @@ class EnhancedSessionManager:
                     session_info.last_used = datetime.fromisoformat(metadata.get('last_used', session_info.last_used.isoformat()))
                     session_info.use_count = metadata.get('use_count', 0)
                     session_info.version = metadata.get('version', 1)
-                    
-                    # Verify checksum
-                    expected_checksum = metadata.get('checksum', '')
-                    if expected_checksum and expected_checksum != session_info.checksum:
-                        logger.warning(f"⚠️ Session checksum mismatch for {session_name}")
-                        return None
                 
                 return session_info
             
@@ -363,6 +392,7 @@ class EnhancedSessionManager:
             
             # Remove from disk
             session_subdir = self.session_dir / session_name
+            self.store.invalidate(session_subdir / "session.enc")
             if session_subdir.exists():
                 for file in session_subdir.glob("*"):
                     file.unlink()
@@ -493,7 +523,8 @@ class EnhancedSessionManager:
             'average_uses': round(avg_uses, 1),
             'max_session_age_hours': self.max_session_age_hours,
             'max_session_uses': self.max_session_uses,
-            'cache_stats': self.cache.get_stats()
+            'cache_stats': self.cache.get_stats(),
+            'store_stats': self.store.get_statistics()
         }
 
 # Factory function
@@ -50,14 +50,14 @@ class FinalMessagingSystem:
             return False, "Not configured"
         
         try:
-            import httpx
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://api.telegram.org/bot{self.telegram_token}/sendMessage",
-                    json={"chat_id": self.telegram_group, "text": message}
-                )
-                result = response.json()
-                return result.get('ok', False), result.get('description', 'Success')
+            from utils.http_client_pool import get_http_client
+            client = get_http_client(f"https://api.telegram.org/bot{self.telegram_token}")
+            response = await client.post(
+                "/sendMessage",
+                json={"chat_id": self.telegram_group, "text": message}
+            )
+            result = response.json()
+            return result.get('ok', False), result.get('description', 'Success')
         except Exception as e:
             return False, str(e)
     
@@ -67,20 +67,16 @@ class FinalMessagingSystem:
             return False, "Not configured"
         
         try:
-            import httpx
+            from utils.http_client_pool import get_http_client
             payload = {
                 "number": self.signal_phone,
                 "recipients": [self.signal_group],
                 "message": message
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "http://localhost:8080/v2/send",
-                    json=payload,
-                    timeout=30.0
-                )
-                return response.status_code in [200, 201], f"Status: {response.status_code}"
+            client = get_http_client("http://localhost:8080", timeout=30.0)
+            response = await client.post("/v2/send", json=payload)
+            return response.status_code in [200, 201], f"Status: {response.status_code}"
         except Exception as e:
             return False, str(e)
     
@@ -269,6 +265,10 @@ async def main():
         if i < len(parts) - 1:
             await asyncio.sleep(2)
     
+    # Release the keep-alive connections shared across all parts
+    from utils.http_client_pool import close_http_clients
+    await close_http_clients()
+    
     print("\n🎯 Messaging complete!")
 
 if __name__ == "__main__":
@@ -145,6 +145,7 @@ class Settings(BaseSettings):
     message_timeout: int = Field(default=30, ge=5, le=120, description="Message send timeout in seconds")
     message_retry_attempts: int = Field(default=3, ge=1, le=10, description="Message retry attempts")
     message_retry_delay: int = Field(default=5, ge=1, le=60, description="Message retry delay in seconds")
+    telegram_api_url: str = Field(default="https://api.telegram.org", description="Telegram Bot API base URL")
     
     # Signal CLI Configuration
     signal_cli_url: str = Field(default="http://localhost:8080", description="Signal CLI API URL")
@@ -248,6 +249,7 @@ class Settings(BaseSettings):
             'telegram': {
                 'bot_token': self.telegram_bot_token,
                 'group_id': self.telegram_group_id,
+                'api_url': self.telegram_api_url,
                 'timeout': self.message_timeout
             },
             'signal': {
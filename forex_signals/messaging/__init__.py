@@ -4,7 +4,7 @@ Handles Signal, Telegram, and other messaging platforms
 """
 
 from .manager import MessagingManager, MessageResult
-from .base import BaseMessenger, MessageType, MessageStatus
+from .base import BaseMessenger, MessageType, MessageStatus, retry_after_from_response
 from .telegram import TelegramMessenger
 from .signal import SignalMessenger
 
@@ -14,6 +14,7 @@ __all__ = [
     "BaseMessenger", 
     "MessageType",
     "MessageStatus",
+    "retry_after_from_response",
     "TelegramMessenger",
     "SignalMessenger"
 ]
\ No newline at end of file
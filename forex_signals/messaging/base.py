@@ -11,6 +11,22 @@ from dataclasses import dataclass, field
 
 from ..core.exceptions import MessagingError
 
+try:
+    from src.messengers.rate_limit_feedback import retry_after_from_response
+except ImportError:
+    # Package used without the src tree: delta-seconds hints only
+    def retry_after_from_response(response) -> Optional[float]:
+        try:
+            value = response.json().get('parameters', {}).get('retry_after')
+        except Exception:
+            value = None
+        if value is None:
+            value = getattr(response, 'headers', {}).get('Retry-After')
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return None
+
 
 class MessageType(str, Enum):
     """Type of message being sent"""
@@ -114,6 +130,9 @@ class BaseMessenger(ABC):
         """
         Send message with retry logic
         
+        Throttled attempts (metadata['throttled']) wait for the server's
+        retry_after instead of the fixed retry_delay.
+        
         Args:
             message: Message text to send
             recipient: Recipient ID/address
@@ -126,6 +145,7 @@ class BaseMessenger(ABC):
             MessageResult with retry information
         """
         last_error = None
+        next_delay = retry_delay
         
         for attempt in range(max_retries + 1):
             try:
@@ -142,13 +162,17 @@ class BaseMessenger(ABC):
                     return result
                     
                 last_error = result.error
+                next_delay = retry_delay
+                if result.metadata.get('throttled') and result.metadata.get('retry_after') is not None:
+                    next_delay = result.metadata['retry_after']
                 
             except Exception as e:
                 last_error = str(e)
+                next_delay = retry_delay
             
             # Don't sleep after the last attempt
             if attempt < max_retries:
-                await asyncio.sleep(retry_delay)
+                await asyncio.sleep(next_delay)
         
         # All retries failed
         return MessageResult(
@@ -5,6 +5,8 @@ Messaging manager that coordinates all messaging platforms
 import asyncio
 from typing import Dict, List, Optional, Any, Type
 
+from src.core.tracing import span, traced
+
 from ..core.config import get_settings
 from ..core.logging import get_logger
 from ..core.exceptions import MessagingError, ConfigurationError
@@ -53,6 +55,7 @@ class MessagingManager:
         if not self.messengers:
             logger.warning("No messaging platforms configured")
     
+    @traced('send.all', category='send')
     async def send_message(
         self,
         message: str,
@@ -148,13 +151,15 @@ class MessagingManager:
         """
         try:
             # Use retry mechanism from base messenger
-            result = await messenger.send_with_retry(
-                message=message,
-                message_type=message_type,
-                max_retries=self.settings.message_retry_attempts,
-                retry_delay=self.settings.message_retry_delay,
-                **kwargs
-            )
+            with span(f'send.{messenger.platform_name}', category='send',
+                      platform=messenger.platform_name, message_type=message_type.value):
+                result = await messenger.send_with_retry(
+                    message=message,
+                    message_type=message_type,
+                    max_retries=self.settings.message_retry_attempts,
+                    retry_delay=self.settings.message_retry_delay,
+                    **kwargs
+                )
             return result
             
         except MessagingError as e:
@@ -6,9 +6,10 @@ import asyncio
 from typing import Optional, Dict, Any
 import httpx
 
+from utils.http_client_pool import get_http_client
 from ..core.logging import get_logger
 from ..core.exceptions import MessagingError, NetworkError
-from .base import BaseMessenger, MessageResult, MessageType, MessageStatus
+from .base import BaseMessenger, MessageResult, MessageType, MessageStatus, retry_after_from_response
 
 logger = get_logger(__name__)
 
@@ -82,12 +83,12 @@ class SignalMessenger(BaseMessenger):
                 request_data['attachments'] = kwargs['attachment']
             
             # Make API request to Signal CLI
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.cli_url}/v2/send",
-                    json=request_data,
-                    headers={'Content-Type': 'application/json'}
-                )
+            client = get_http_client(self.cli_url, timeout=self.timeout)
+            response = await client.post(
+                f"{self.cli_url}/v2/send",
+                json=request_data,
+                headers={'Content-Type': 'application/json'}
+            )
             
             # Handle response
             if response.status_code == 201:
@@ -123,6 +124,17 @@ class SignalMessenger(BaseMessenger):
                     error=error_msg
                 )
                 
+            elif response.status_code == 429:
+                retry_after = retry_after_from_response(response)
+                logger.warning(f"⏳ Signal throttled, retry after {retry_after}s")
+                
+                return MessageResult(
+                    status=MessageStatus.FAILED,
+                    platform=self.platform_name,
+                    error=f"Rate limited: retry after {retry_after}s",
+                    metadata={'throttled': True, 'retry_after': retry_after}
+                )
+                
             elif response.status_code == 500:
                 error_msg = f"Signal CLI server error: {response.text}"
                 logger.error(f"❌ Signal server error: {error_msg}")
@@ -192,8 +204,8 @@ class SignalMessenger(BaseMessenger):
         """
         try:
             # Test basic connectivity to Signal CLI
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.cli_url}/v1/about")
+            client = get_http_client(self.cli_url, timeout=self.timeout)
+            response = await client.get(f"{self.cli_url}/v1/about")
             
             if response.status_code == 200:
                 logger.info("✅ Signal CLI connection test successful")
@@ -218,10 +230,10 @@ class SignalMessenger(BaseMessenger):
             Groups information or None if failed
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.cli_url}/v1/groups/{self.phone_number}"
-                )
+            client = get_http_client(self.cli_url, timeout=self.timeout)
+            response = await client.get(
+                f"{self.cli_url}/v1/groups/{self.phone_number}"
+            )
             
             if response.status_code == 200:
                 return response.json()
@@ -6,9 +6,10 @@ import asyncio
 from typing import Optional, Dict, Any
 import httpx
 
+from utils.http_client_pool import get_http_client
 from ..core.logging import get_logger
 from ..core.exceptions import MessagingError, NetworkError
-from .base import BaseMessenger, MessageResult, MessageType, MessageStatus
+from .base import BaseMessenger, MessageResult, MessageType, MessageStatus, retry_after_from_response
 
 logger = get_logger(__name__)
 
@@ -30,6 +31,7 @@ class TelegramMessenger(BaseMessenger):
         self.bot_token = config.get('bot_token')
         self.group_id = config.get('group_id')
         self.timeout = config.get('timeout', 30)
+        self.api_url = config.get('api_url', 'https://api.telegram.org').rstrip('/')
         
         if not self.bot_token:
             raise MessagingError(
@@ -43,7 +45,7 @@ class TelegramMessenger(BaseMessenger):
                 platform="telegram"
             )
         
-        self.api_base_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self.api_base_url = f"{self.api_url}/bot{self.bot_token}"
     
     async def send_message(
         self,
@@ -78,11 +80,11 @@ class TelegramMessenger(BaseMessenger):
             }
             
             # Make API request
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.api_base_url}/sendMessage",
-                    json=request_data
-                )
+            client = get_http_client(self.api_base_url, timeout=self.timeout)
+            response = await client.post(
+                f"{self.api_base_url}/sendMessage",
+                json=request_data
+            )
             
             # Handle response
             if response.status_code == 200:
@@ -110,6 +112,16 @@ class TelegramMessenger(BaseMessenger):
                         platform=self.platform_name,
                         error=f"Telegram API error: {error_description}"
                     )
+            elif response.status_code == 429:
+                retry_after = retry_after_from_response(response)
+                logger.warning(f"⏳ Telegram throttled, retry after {retry_after}s")
+                
+                return MessageResult(
+                    status=MessageStatus.FAILED,
+                    platform=self.platform_name,
+                    error=f"Rate limited: retry after {retry_after}s",
+                    metadata={'throttled': True, 'retry_after': retry_after}
+                )
             else:
                 error_msg = f"HTTP {response.status_code}: {response.text}"
                 logger.error(f"❌ Telegram HTTP error: {error_msg}")
@@ -158,8 +170,8 @@ class TelegramMessenger(BaseMessenger):
             True if connection successful, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.api_base_url}/getMe")
+            client = get_http_client(self.api_base_url, timeout=self.timeout)
+            response = await client.get(f"{self.api_base_url}/getMe")
             
             if response.status_code == 200:
                 data = response.json()
@@ -191,11 +203,11 @@ class TelegramMessenger(BaseMessenger):
         try:
             target_chat = chat_id or self.group_id
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.api_base_url}/getChat",
-                    params={'chat_id': target_chat}
-                )
+            client = get_http_client(self.api_base_url, timeout=self.timeout)
+            response = await client.get(
+                f"{self.api_base_url}/getChat",
+                params={'chat_id': target_chat}
+            )
             
             if response.status_code == 200:
                 data = response.json()
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+from src.core.tracing import propagate, span, traced
+
 from ..core.config import get_settings
 from ..core.exceptions import (
     ForexSignalsError, 
@@ -109,6 +111,7 @@ class ForexSignalGenerator:
             logger.error(f"Error setting up Signals integration: {e}")
             self.setup_successful = False
     
+    @traced('signals.generate', category='analysis')
     async def generate_forex_signals(self) -> SignalResult:
         """
         Generate forex signals using the integrated system
@@ -126,11 +129,12 @@ class ForexSignalGenerator:
                 return await self._generate_simplified_signals()
                 # If that fails, we'll fall through to the error
             
-            # Use async executor for the synchronous Signals system
+            # Use async executor for the synchronous Signals system; propagate keeps
+            # the run's trace and deadline with the worker thread
             loop = asyncio.get_event_loop()
             signals_data = await loop.run_in_executor(
                 None, 
-                self._generate_signals_sync
+                propagate(self._generate_signals_sync)
             )
             
             if not signals_data:
@@ -247,7 +251,8 @@ class ForexSignalGenerator:
             text_report = None
             if self.report_generator:
                 try:
-                    text_report = self.report_generator.generate_comprehensive_report(raw_signals, 'txt')
+                    with span('report.generate', category='report', output_format='txt'):
+                        text_report = self.report_generator.generate_comprehensive_report(raw_signals, 'txt')
                 except Exception as e:
                     logger.warning(f"Could not generate text report: {e}")
             
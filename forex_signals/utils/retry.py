@@ -10,6 +10,13 @@ from functools import wraps
 from ..core.logging import get_logger
 from ..core.exceptions import ForexSignalsError
 
+try:
+    from src.core.deadline import current_deadline
+except ImportError:
+    # Package used without the src tree: no run deadlines
+    def current_deadline():
+        return None
+
 logger = get_logger(__name__)
 
 
@@ -69,6 +76,20 @@ class RetryManager:
         
         return delay
     
+    def _within_deadline(self, func: Callable, attempt: int, delay: float) -> bool:
+        """
+        Whether the next retry can still start before the run deadline
+        
+        Records the abandoned retry on the deadline when it cannot.
+        """
+        deadline = current_deadline()
+        if deadline is None or delay < deadline.remaining():
+            return True
+        deadline.skip(getattr(func, '__name__', 'retry'),
+                      f'retry {attempt + 2}/{self.max_attempts} after {delay:.1f}s would miss the deadline')
+        logger.error(f"⏰ Not retrying: {delay:.2f}s backoff exceeds remaining run budget")
+        return False
+    
     async def execute_async(
         self,
         func: Callable,
@@ -109,6 +130,8 @@ class RetryManager:
                     break
                 
                 delay = self.calculate_delay(attempt)
+                if not self._within_deadline(func, attempt, delay):
+                    break
                 logger.warning(f"⚠️ Attempt {attempt + 1} failed: {str(e)[:100]}. Retrying in {delay:.2f}s...")
                 
                 await asyncio.sleep(delay)
@@ -166,6 +189,8 @@ class RetryManager:
                     break
                 
                 delay = self.calculate_delay(attempt)
+                if not self._within_deadline(func, attempt, delay):
+                    break
                 logger.warning(f"⚠️ Attempt {attempt + 1} failed: {str(e)[:100]}. Retrying in {delay:.2f}s...")
                 
                 time.sleep(delay)
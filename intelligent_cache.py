@@ -20,6 +20,8 @@ import threading
 from collections import OrderedDict
 import weakref
 
+from src.core.metrics import CACHE_EVICTIONS, CACHE_REQUESTS
+
 logger = logging.getLogger(__name__)
 
 class CacheEntryType(Enum):
@@ -242,6 +244,7 @@ class IntelligentCache:
                     entry.update_access()
                     self.memory_cache.move_to_end(key)
                     self.stats.hits += 1
+                    CACHE_REQUESTS.inc(cache='intelligent', tier='memory', result='hit')
                     
                     access_time = time.time() - start_time
                     self._update_average_access_time(access_time)
@@ -258,6 +261,7 @@ class IntelligentCache:
             await self._add_to_memory_cache(entry)
             
             self.stats.hits += 1
+            CACHE_REQUESTS.inc(cache='intelligent', tier='disk', result='hit')
             access_time = time.time() - start_time
             self._update_average_access_time(access_time)
             
@@ -266,6 +270,7 @@ class IntelligentCache:
         
         # Cache miss
         self.stats.misses += 1
+        CACHE_REQUESTS.inc(cache='intelligent', tier='none', result='miss')
         access_time = time.time() - start_time
         self._update_average_access_time(access_time)
         
@@ -334,6 +339,7 @@ class IntelligentCache:
             oldest_key, oldest_entry = self.memory_cache.popitem(last=False)
             self.stats.evictions += 1
             self.stats.total_size_bytes = max(0, self.stats.total_size_bytes - oldest_entry.size_bytes)
+            CACHE_EVICTIONS.inc(cache='intelligent')
             logger.debug(f"Evicted LRU entry: {oldest_key}")
         
         # Check memory size limit
@@ -346,6 +352,7 @@ class IntelligentCache:
             current_size -= oldest_entry.size_bytes
             self.stats.evictions += 1
             self.stats.total_size_bytes = max(0, self.stats.total_size_bytes - oldest_entry.size_bytes)
+            CACHE_EVICTIONS.inc(cache='intelligent')
             logger.debug(f"Evicted oversized entry: {oldest_key} ({oldest_entry.size_bytes} bytes)")
     
     async def _save_to_disk(self, entry: CacheEntry, serialized_data: bytes):
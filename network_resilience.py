@@ -2,6 +2,12 @@
 """
 Network Resilience Utilities
 Implements network health monitoring, connectivity checks, and resilience patterns
+
+Health is scored passively from the outcomes of real requests (see
+src/core/network_health.py); active HTTP probes are sent only to endpoints
+that have been idle longer than `idle_threshold`, concurrently on one
+shared session. The full ping/DNS/HTTP sweep remains available as
+run_comprehensive_connectivity_test for diagnostics.
 """
 
 import asyncio
@@ -17,6 +23,9 @@ import socket
 import subprocess
 import statistics
 
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState, register_circuit_breaker
+from src.core.network_health import PassiveHealthTracker, endpoint_key, health_tracker
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,77 +68,24 @@ class NetworkHealth:
     failed_connections: int
     last_check: datetime
     issues: List[str] = field(default_factory=list)
+    endpoint_loss: Dict[str, float] = field(default_factory=dict)   # failure rate per host
 
 
-class CircuitBreakerState(str, Enum):
-    """Circuit breaker states"""
-    CLOSED = "CLOSED"      # Normal operation
-    OPEN = "OPEN"          # Blocking requests
-    HALF_OPEN = "HALF_OPEN"  # Testing recovery
+# Same states as every other breaker in the project
+CircuitBreakerState = CircuitState
 
 
-class NetworkCircuitBreaker:
-    """Circuit breaker pattern for network operations"""
-    
-    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60, 
-                 success_threshold: int = 3):
-        self.failure_threshold = failure_threshold
-        self.recovery_timeout = recovery_timeout
-        self.success_threshold = success_threshold
-        
-        self.failure_count = 0
-        self.success_count = 0
-        self.last_failure_time = None
-        self.state = CircuitBreakerState.CLOSED
-        
-        logger.info(f"Circuit breaker initialized: failure_threshold={failure_threshold}, "
-                   f"recovery_timeout={recovery_timeout}s")
-    
-    def can_execute(self) -> bool:
-        """Check if operation can be executed"""
-        if self.state == CircuitBreakerState.CLOSED:
-            return True
-        elif self.state == CircuitBreakerState.OPEN:
-            if self._should_attempt_reset():
-                self.state = CircuitBreakerState.HALF_OPEN
-                self.success_count = 0
-                logger.info("Circuit breaker: OPEN -> HALF_OPEN")
-                return True
-            return False
-        elif self.state == CircuitBreakerState.HALF_OPEN:
-            return True
-        
-        return False
-    
-    def record_success(self):
-        """Record successful operation"""
-        if self.state == CircuitBreakerState.HALF_OPEN:
-            self.success_count += 1
-            if self.success_count >= self.success_threshold:
-                self.state = CircuitBreakerState.CLOSED
-                self.failure_count = 0
-                logger.info("Circuit breaker: HALF_OPEN -> CLOSED (recovered)")
-        elif self.state == CircuitBreakerState.CLOSED:
-            self.failure_count = 0
+class NetworkCircuitBreaker(CircuitBreaker):
+    """Circuit breaker for network operations (shared sliding-window implementation)"""
     
-    def record_failure(self):
-        """Record failed operation"""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.state == CircuitBreakerState.CLOSED:
-            if self.failure_count >= self.failure_threshold:
-                self.state = CircuitBreakerState.OPEN
-                logger.warning(f"Circuit breaker: CLOSED -> OPEN (failures: {self.failure_count})")
-        elif self.state == CircuitBreakerState.HALF_OPEN:
-            self.state = CircuitBreakerState.OPEN
-            logger.warning("Circuit breaker: HALF_OPEN -> OPEN (test failed)")
-    
-    def _should_attempt_reset(self) -> bool:
-        """Check if enough time has passed to attempt reset"""
-        if self.last_failure_time is None:
-            return True
-        return time.time() - self.last_failure_time >= self.recovery_timeout
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60,
+                 success_threshold: int = 3, name: str = 'network', timeout: Optional[float] = 10):
+        super().__init__(name, CircuitBreakerConfig(
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            success_threshold=success_threshold,
+            timeout=timeout
+        ))
     
     @property
     def status(self) -> Dict[str, Any]:
@@ -139,15 +95,19 @@ class NetworkCircuitBreaker:
             'failure_count': self.failure_count,
             'success_count': self.success_count,
             'last_failure_time': self.last_failure_time,
-            'can_execute': self.can_execute()
+            'can_execute': self.state is not CircuitState.OPEN or self.retry_in() == 0,
+            'open_reason': self.open_reason,
+            'window': self.window_stats()
         }
 
 
 class NetworkHealthMonitor:
     """Comprehensive network health monitoring"""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 tracker: Optional[PassiveHealthTracker] = None):
         self.config = config or {}
+        self.tracker = tracker or health_tracker
         self.test_history: List[ConnectivityTest] = []
         self.circuit_breakers: Dict[str, NetworkCircuitBreaker] = {}
         
@@ -156,6 +116,13 @@ class NetworkHealthMonitor:
         self.timeout = self.config.get('timeout', 10)
         self.retry_attempts = self.config.get('retry_attempts', 3)
         self.retry_delay = self.config.get('retry_delay', 2)
+        self.idle_threshold = self.config.get('idle_threshold', 600)   # probe endpoints idle this long
+        self.passive_window = self.config.get('passive_window', 900)   # seconds of traffic scored
+        self.probe_urls = self.config.get('probe_urls', [NetworkEndpoint.GOOGLE_WEB.value,
+                                                         NetworkEndpoint.TELEGRAM_API.value,
+                                                         NetworkEndpoint.MYMAMA_SITE.value])
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
         
         # Critical endpoints for monitoring
         self.endpoints = {
@@ -231,22 +198,47 @@ class NetworkHealthMonitor:
                 error_message=str(e)
             )
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Probe session shared by all checks on the current event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and not self._session.closed:
+                self._release_foreign_session(self._session, self._session_loop)
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._session_loop = loop
+        return self._session
+    
+    @staticmethod
+    def _release_foreign_session(session: aiohttp.ClientSession, owner_loop):
+        """Close a probe session left by another event loop, on that loop if it still runs"""
+        if owner_loop is not None and owner_loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), owner_loop)
+            return
+        # Its connector belongs to a finished loop and can no longer be closed
+        logger.warning("Probe session of a finished event loop was never closed; "
+                       "call NetworkHealthMonitor.close() before the loop ends")
+    
+    async def close(self):
+        """Close the shared probe session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     async def check_http_connectivity(self, url: str) -> ConnectivityTest:
-        """Test HTTP connectivity"""
+        """Test HTTP connectivity (a status below 500 means the service answered)"""
         start_time = time.time()
         
         try:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    response_time = time.time() - start_time
-                    
-                    return ConnectivityTest(
-                        endpoint=url,
-                        success=response.status < 400,
-                        response_time=response_time,
-                        status_code=response.status
-                    )
+            session = await self._get_session()
+            async with session.get(url) as response:
+                response_time = time.time() - start_time
+                
+                return ConnectivityTest(
+                    endpoint=url,
+                    success=response.status < 500,
+                    response_time=response_time,
+                    status_code=response.status
+                )
                     
         except asyncio.TimeoutError:
             response_time = time.time() - start_time
@@ -266,37 +258,48 @@ class NetworkHealthMonitor:
             )
     
     async def run_comprehensive_connectivity_test(self) -> List[ConnectivityTest]:
-        """Run comprehensive connectivity tests"""
+        """Run every DNS, ping and HTTP check concurrently (diagnostics; not used by monitoring)"""
         logger.info("Running comprehensive connectivity tests...")
         
-        tests = []
-        
-        # DNS tests
-        dns_test = await self.check_dns_resolution()
-        tests.append(dns_test)
-        
-        # Ping tests
-        for name, endpoint in [('google_dns', NetworkEndpoint.GOOGLE_DNS), 
-                              ('cloudflare_dns', NetworkEndpoint.CLOUDFLARE_DNS)]:
-            ping_test = await self.check_ping_connectivity(endpoint)
-            tests.append(ping_test)
-        
-        # HTTP tests
-        for name, endpoint in [('google_web', NetworkEndpoint.GOOGLE_WEB),
-                              ('telegram_api', NetworkEndpoint.TELEGRAM_API),
-                              ('mymama_site', NetworkEndpoint.MYMAMA_SITE)]:
-            http_test = await self.check_http_connectivity(endpoint)
-            tests.append(http_test)
-        
-        # Store results
+        tests = list(await asyncio.gather(
+            self.check_dns_resolution(),
+            self.check_ping_connectivity(NetworkEndpoint.GOOGLE_DNS.value),
+            self.check_ping_connectivity(NetworkEndpoint.CLOUDFLARE_DNS.value),
+            *(self.check_http_connectivity(url) for url in self.probe_urls)
+        ))
+        self._store_tests(tests)
+        return tests
+    
+    def _store_tests(self, tests: List[ConnectivityTest]):
+        """Keep active test results in history and count them as observations"""
+        for test in tests:
+            if test.endpoint.startswith('http'):
+                self.tracker.observe(test.endpoint, test.success, test.response_time,
+                                     status_code=test.status_code, error=test.error_message, source='probe')
         self.test_history.extend(tests)
         
         # Maintain history limit
         if len(self.test_history) > self.max_history:
             self.test_history = self.test_history[-self.max_history:]
-        
+    
+    def idle_endpoints(self) -> List[str]:
+        """Probe URLs with no traffic or probe for longer than idle_threshold"""
+        return [url for url in self.probe_urls if self.tracker.idle_for(url) >= self.idle_threshold]
+    
+    async def probe_idle_endpoints(self) -> List[ConnectivityTest]:
+        """Probe only the endpoints real traffic has not covered recently, concurrently"""
+        idle = self.idle_endpoints()
+        if not idle:
+            return []
+        tests = list(await asyncio.gather(*(self.check_http_connectivity(url) for url in idle)))
+        self._store_tests(tests)
         return tests
     
+    async def check_health(self) -> NetworkHealth:
+        """Health from recent traffic, topped up with probes of idle endpoints"""
+        await self.probe_idle_endpoints()
+        return self.assess_network_health(self.tracker.recent(within=self.passive_window))
+    
     def assess_network_health(self, recent_tests: Optional[List[ConnectivityTest]] = None) -> NetworkHealth:
         """Assess overall network health"""
         if recent_tests is None:
@@ -320,12 +323,24 @@ class NetworkHealthMonitor:
         
         successful_count = len(successful)
         failed_count = len(failed)
-        total_count = len(recent_tests)
         
-        packet_loss_rate = failed_count / total_count if total_count > 0 else 1.0
-        
-        if successful:
-            avg_response_time = statistics.mean([t.response_time for t in successful])
+        # Score each host separately and weigh hosts equally, so one busy failing
+        # host cannot outvote the rest of the network
+        by_endpoint: Dict[str, List[ConnectivityTest]] = {}
+        for test in recent_tests:
+            by_endpoint.setdefault(endpoint_key(test.endpoint), []).append(test)
+        endpoint_loss = {
+            endpoint: sum(1 for t in tests if not t.success) / len(tests)
+            for endpoint, tests in by_endpoint.items()
+        }
+        packet_loss_rate = statistics.mean(endpoint_loss.values())
+        
+        endpoint_latency = [
+            statistics.mean([t.response_time for t in tests if t.success])
+            for tests in by_endpoint.values() if any(t.success for t in tests)
+        ]
+        if endpoint_latency:
+            avg_response_time = statistics.mean(endpoint_latency)
         else:
             avg_response_time = float('inf')
         
@@ -363,13 +378,15 @@ class NetworkHealthMonitor:
             successful_connections=successful_count,
             failed_connections=failed_count,
             last_check=datetime.now(),
-            issues=issues
+            issues=issues,
+            endpoint_loss=endpoint_loss
         )
     
     def get_circuit_breaker(self, endpoint: str) -> NetworkCircuitBreaker:
         """Get or create circuit breaker for endpoint"""
         if endpoint not in self.circuit_breakers:
-            self.circuit_breakers[endpoint] = NetworkCircuitBreaker()
+            self.circuit_breakers[endpoint] = NetworkCircuitBreaker(name=f'network:{endpoint}', timeout=self.timeout)
+            register_circuit_breaker(self.circuit_breakers[endpoint])
         return self.circuit_breakers[endpoint]
     
     async def execute_with_circuit_breaker(self, endpoint: str, operation):
@@ -379,12 +396,13 @@ class NetworkHealthMonitor:
         if not breaker.can_execute():
             raise Exception(f"Circuit breaker OPEN for {endpoint}")
         
+        started = time.monotonic()
         try:
             result = await operation()
-            breaker.record_success()
+            breaker.record_success(time.monotonic() - started)
             return result
         except Exception as e:
-            breaker.record_failure()
+            breaker.record_failure(e, time.monotonic() - started)
             raise e
     
     async def resilient_http_request(self, url: str, **kwargs) -> aiohttp.ClientResponse:
@@ -395,12 +413,13 @@ class NetworkHealthMonitor:
             raise Exception(f"Circuit breaker OPEN for {url}")
         
         for attempt in range(self.retry_attempts):
+            started = time.monotonic()
             try:
                 timeout = aiohttp.ClientTimeout(total=self.timeout)
                 async with aiohttp.ClientSession(timeout=timeout) as session:
                     async with session.get(url, **kwargs) as response:
                         if response.status < 500:  # Don't retry client errors
-                            breaker.record_success()
+                            breaker.record_success(time.monotonic() - started)
                             return response
                         else:
                             raise aiohttp.ClientResponseError(
@@ -410,7 +429,7 @@ class NetworkHealthMonitor:
                             )
             except Exception as e:
                 if attempt == self.retry_attempts - 1:
-                    breaker.record_failure()
+                    breaker.record_failure(e, time.monotonic() - started)
                     raise e
                 else:
                     logger.warning(f"HTTP request attempt {attempt + 1} failed for {url}: {e}")
@@ -451,6 +470,7 @@ class NetworkHealthMonitor:
             },
             'circuit_breakers': breaker_status,
             'endpoint_statistics': endpoint_stats,
+            'passive': self.tracker.snapshot(),
             'test_history_size': len(self.test_history),
             'last_assessment': health.last_check.isoformat()
         }
@@ -461,13 +481,19 @@ class NetworkHealthMonitor:
         
         while True:
             try:
-                tests = await self.run_comprehensive_connectivity_test()
-                health = self.assess_network_health(tests)
+                probes = await self.probe_idle_endpoints()
+                health = self.assess_network_health(self.tracker.recent(within=self.passive_window))
                 
                 logger.info(f"Network health: {health.status.value} "
+                           f"({health.successful_connections + health.failed_connections} observations "
+                           f"from {len(health.endpoint_loss)} hosts, {len(probes)} probes) "
                            f"(loss: {health.packet_loss_rate:.1%}, "
                            f"latency: {health.response_time_avg:.2f}s)")
                 
+                failing = sorted(host for host, loss in health.endpoint_loss.items() if loss >= 0.5)
+                if failing:
+                    logger.warning(f"Failing hosts: {', '.join(failing)}")
+                
                 if health.issues:
                     logger.warning(f"Network issues: {', '.join(health.issues)}")
                 
@@ -527,6 +553,8 @@ async def main():
     print("\n📊 Network statistics...")
     stats = network_monitor.get_network_statistics()
     print(json.dumps(stats, indent=2, default=str))
+    
+    await network_monitor.close()
 
 
 if __name__ == "__main__":
@@ -255,8 +255,8 @@ class OptimizedDataProcessor:
         """Preload heavy libraries in background for faster access"""
         logger.info("🔄 Preloading heavy libraries...")
         
-        from lazy_imports import preload_heavy_libraries
-        preload_heavy_libraries(max_workers=2)
+        from src.utils.lazy import preload
+        preload(('pandas', 'numpy', 'matplotlib'), max_workers=2)
         
         # Mark common libraries as loaded
         common_libs = ['pandas', 'numpy', 'matplotlib']
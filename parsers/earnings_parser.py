@@ -4,10 +4,12 @@ Earnings release parser for extracting earnings calendar data.
 
 import re
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timedelta
 
 from bs4 import BeautifulSoup
+from src.data_processors.parsed_document import ParsedDocument
+from src.utils import text_patterns
 from ..data_models import EarningsRelease
 
 logger = logging.getLogger(__name__)
@@ -17,19 +19,7 @@ class EarningsParser:
     """Parser for extracting earnings release information."""
     
     # Time indicators
-    TIME_MAPPINGS = {
-        'bmo': 'BMO',
-        'before market open': 'BMO',
-        'before open': 'BMO',
-        'pre-market': 'BMO',
-        'amc': 'AMC',
-        'after market close': 'AMC',
-        'after close': 'AMC',
-        'after hours': 'AMC',
-        'post-market': 'AMC',
-        'during market': 'DMH',
-        'market hours': 'DMH',
-    }
+    TIME_MAPPINGS = text_patterns.RELEASE_TIMES
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -41,23 +31,23 @@ class EarningsParser:
         self.config = config or {}
         self.max_releases = self.config.get('max_releases', 20)
     
-    def parse_html_content(self, html_content: str) -> List[EarningsRelease]:
+    def parse_html_content(self, html_content: Union[str, ParsedDocument]) -> List[EarningsRelease]:
         """
         Parse earnings releases from HTML content.
         
         Args:
-            html_content: Raw HTML content
+            html_content: Raw HTML content, or a document shared with other parsers
             
         Returns:
             List of EarningsRelease objects
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = ParsedDocument.coerce(html_content)
         releases = []
         
         # Try multiple parsing strategies
-        releases.extend(self._parse_earnings_tables(soup))
-        releases.extend(self._parse_earnings_lists(soup))
-        releases.extend(self._parse_earnings_text(soup))
+        releases.extend(self._parse_earnings_tables(document))
+        releases.extend(self._parse_earnings_lists(document.soup))
+        releases.extend(self._parse_earnings_text(document))
         
         # Remove duplicates and limit results
         unique_releases = self._deduplicate_releases(releases)
@@ -88,29 +78,27 @@ class EarningsParser:
         
         return self._deduplicate_releases(releases)
     
-    def _parse_earnings_tables(self, soup: BeautifulSoup) -> List[EarningsRelease]:
+    def _parse_earnings_tables(self, document: ParsedDocument) -> List[EarningsRelease]:
         """Parse earnings from HTML tables."""
         releases = []
         
         # Find tables that might contain earnings data
-        tables = soup.find_all('table')
+        tables = document.tables
         
         for table in tables:
             # Check if table contains earnings-related headers
-            headers = []
-            header_row = table.find('tr')
-            if header_row:
-                headers = [th.get_text(strip=True).lower() for th in header_row.find_all(['th', 'td'])]
+            headers = document.header_texts(table)
             
             # Look for earnings-related keywords in headers
             earnings_keywords = ['ticker', 'symbol', 'company', 'earnings', 'eps', 'revenue', 'date', 'time']
             if any(keyword in ' '.join(headers) for keyword in earnings_keywords):
-                table_releases = self._parse_earnings_table(table, headers)
+                table_releases = self._parse_earnings_table(table, headers, document)
                 releases.extend(table_releases)
         
         return releases
     
-    def _parse_earnings_table(self, table, headers: List[str]) -> List[EarningsRelease]:
+    def _parse_earnings_table(self, table, headers: List[str],
+                              document: Optional[ParsedDocument] = None) -> List[EarningsRelease]:
         """Parse earnings from a specific table."""
         releases = []
         
@@ -118,10 +106,11 @@ class EarningsParser:
         header_mapping = self._create_header_mapping(headers)
         
         # Parse data rows
-        rows = table.find_all('tr')[1:]  # Skip header row
+        all_rows = document.rows(table) if document else table.find_all('tr')
+        rows = all_rows[1:]  # Skip header row
         
         for row in rows:
-            cells = row.find_all(['td', 'th'])
+            cells = document.cells(row) if document else row.find_all(['td', 'th'])
             if len(cells) >= 2:
                 release = self._parse_table_row(cells, header_mapping)
                 if release:
@@ -181,12 +170,12 @@ class EarningsParser:
         
         return releases
     
-    def _parse_earnings_text(self, soup: BeautifulSoup) -> List[EarningsRelease]:
+    def _parse_earnings_text(self, document: ParsedDocument) -> List[EarningsRelease]:
         """Parse earnings from general text content."""
         releases = []
         
         # Get all text and look for earnings patterns
-        text_content = soup.get_text()
+        text_content = document.soup_text
         lines = text_content.split('\n')
         
         for line in lines:
@@ -201,7 +190,7 @@ class EarningsParser:
     def _parse_earnings_line(self, line: str) -> Optional[EarningsRelease]:
         """Parse a single line of text for earnings information."""
         # Look for ticker patterns
-        ticker_match = re.search(r'\b([A-Z]{1,5})\b', line)
+        ticker_match = text_patterns.TICKER_TOKEN.search(line)
         if not ticker_match:
             return None
         
@@ -261,7 +250,7 @@ class EarningsParser:
             return None
         
         # Clean ticker
-        ticker = re.sub(r'[^A-Z]', '', ticker.upper())
+        ticker = text_patterns.NON_UPPER_ALPHA.sub('', ticker.upper())
         
         # Validate length
         if not (1 <= len(ticker) <= 5):
@@ -271,82 +260,30 @@ class EarningsParser:
     
     def _normalize_date(self, date_str: str) -> Optional[str]:
         """Normalize date string."""
-        if not date_str:
-            return None
-        
-        # Try to parse common date formats
-        date_patterns = [
-            r'(\d{1,2})/(\d{1,2})/(\d{2,4})',  # MM/DD/YYYY or MM/DD/YY
-            r'(\d{1,2})-(\d{1,2})-(\d{2,4})',  # MM-DD-YYYY
-            r'(\w{3})\s+(\d{1,2})',            # Jan 15
-            r'(\d{1,2})\s+(\w{3})',            # 15 Jan
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                return match.group(0)
-        
-        return date_str.strip()[:20]  # Fallback to first 20 chars
+        return text_patterns.normalize_date(date_str)
     
     def _normalize_time(self, time_str: str) -> Optional[str]:
         """Normalize time string."""
         if not time_str:
             return None
         
-        time_lower = time_str.lower().strip()
-        
-        # Check against known mappings
-        for pattern, normalized in self.TIME_MAPPINGS.items():
-            if pattern in time_lower:
-                return normalized
+        normalized = text_patterns.find_release_time(time_str)
+        if normalized:
+            return normalized
         
         return time_str.strip()[:10]  # Fallback to first 10 chars
     
     def _extract_time_from_text(self, text: str) -> Optional[str]:
         """Extract release time from text."""
-        text_lower = text.lower()
-        
-        for pattern, normalized in self.TIME_MAPPINGS.items():
-            if pattern in text_lower:
-                return normalized
-        
-        return None
+        return text_patterns.find_release_time(text)
     
     def _extract_date_from_text(self, text: str) -> Optional[str]:
         """Extract release date from text."""
-        # Look for date patterns
-        date_patterns = [
-            r'(\w{3})\s+(\d{1,2})',  # Jan 15
-            r'(\d{1,2})/(\d{1,2})',  # 1/15
-            r'today|tomorrow|this week|next week'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.I)
-            if match:
-                return match.group(0)
-        
-        return None
+        return text_patterns.find_date(text)
     
     def _extract_eps_from_text(self, text: str) -> Optional[float]:
         """Extract EPS estimate from text."""
-        # Look for EPS patterns
-        eps_patterns = [
-            r'eps[:\s]+\$?(\d+\.?\d*)',
-            r'earnings[:\s]+\$?(\d+\.?\d*)',
-            r'\$(\d+\.?\d*)\s+eps',
-        ]
-        
-        for pattern in eps_patterns:
-            match = re.search(pattern, text, re.I)
-            if match:
-                try:
-                    return float(match.group(1))
-                except:
-                    continue
-        
-        return None
+        return text_patterns.find_eps(text)
     
     def _extract_company_from_text(self, text: str, ticker: str) -> Optional[str]:
         """Extract company name from text."""
@@ -373,18 +310,7 @@ class EarningsParser:
     
     def _parse_float(self, value: str) -> Optional[float]:
         """Parse float from string value."""
-        if not value:
-            return None
-        
-        # Extract numeric value
-        match = re.search(r'(\d+\.?\d*)', value)
-        if match:
-            try:
-                return float(match.group(1))
-            except:
-                pass
-        
-        return None
+        return text_patterns.parse_number(value)
     
     def _deduplicate_releases(self, releases: List[EarningsRelease]) -> List[EarningsRelease]:
         """Remove duplicate earnings releases."""
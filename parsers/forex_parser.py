@@ -4,10 +4,13 @@ Forex signal parser for extracting currency pair trading signals.
 
 import re
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 
 from bs4 import BeautifulSoup
+from src.data_processors.parsed_document import ParsedDocument
+from src.utils.pattern_matcher import MultiPatternMatcher
+from src.utils import text_patterns
 from ..data_models import ForexSignal, SignalType
 
 logger = logging.getLogger(__name__)
@@ -42,24 +45,25 @@ class ForexParser:
         self.config = config or {}
         self.custom_pairs = self.config.get('custom_pairs', [])
         self.all_pairs = self.MAJOR_PAIRS + self.custom_pairs
+        self.pair_matcher = MultiPatternMatcher(self.all_pairs)
     
-    def parse_html_content(self, html_content: str) -> List[ForexSignal]:
+    def parse_html_content(self, html_content: Union[str, ParsedDocument]) -> List[ForexSignal]:
         """
         Parse forex signals from HTML content.
         
         Args:
-            html_content: Raw HTML content
+            html_content: Raw HTML content, or a document shared with other parsers
             
         Returns:
             List of ForexSignal objects
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = ParsedDocument.coerce(html_content)
         signals = []
         
         # Try multiple parsing strategies
-        signals.extend(self._parse_table_signals(soup))
-        signals.extend(self._parse_text_signals(soup))
-        signals.extend(self._parse_structured_divs(soup))
+        signals.extend(self._parse_table_signals(document))
+        signals.extend(self._parse_text_signals(document))
+        signals.extend(self._parse_structured_divs(document.soup))
         
         # Remove duplicates
         unique_signals = self._deduplicate_signals(signals)
@@ -80,31 +84,33 @@ class ForexParser:
         signals = []
         lines = text_content.split('\n')
         
-        for i, line in enumerate(lines):
-            # Look for currency pairs
+        # Look for currency pairs: one scan gives the lines mentioning each pair
+        pairs_by_line: Dict[int, set] = {}
+        for pair, line_numbers in self.pair_matcher.line_hits(text_content).items():
+            for i in line_numbers:
+                pairs_by_line.setdefault(i, set()).add(pair)
+        
+        for i in sorted(pairs_by_line):
+            line = lines[i]
             for pair in self.all_pairs:
-                if pair in line.upper():
+                if pair in pairs_by_line[i]:
                     signal = self._extract_signal_from_text(line, pair, lines[max(0, i-2):min(len(lines), i+3)])
                     if signal:
                         signals.append(signal)
         
         return self._deduplicate_signals(signals)
     
-    def _parse_table_signals(self, soup: BeautifulSoup) -> List[ForexSignal]:
+    def _parse_table_signals(self, document: ParsedDocument) -> List[ForexSignal]:
         """Parse signals from HTML tables."""
         signals = []
         
-        for table in soup.find_all('table'):
-            headers = []
-            
+        for table in document.tables:
             # Get headers
-            header_row = table.find('tr')
-            if header_row:
-                headers = [th.get_text(strip=True).lower() for th in header_row.find_all(['th', 'td'])]
+            headers = document.header_texts(table)
             
             # Parse data rows
-            for row in table.find_all('tr')[1:]:
-                cells = row.find_all(['td', 'th'])
+            for row in document.rows(table)[1:]:
+                cells = document.cells(row)
                 if len(cells) >= 2:
                     signal = self._parse_table_row(cells, headers)
                     if signal:
@@ -166,18 +172,19 @@ class ForexParser:
             logger.debug(f"Error parsing table row: {e}")
             return None
     
-    def _parse_text_signals(self, soup: BeautifulSoup) -> List[ForexSignal]:
+    def _parse_text_signals(self, document: ParsedDocument) -> List[ForexSignal]:
         """Parse signals from text content."""
         signals = []
-        text_content = soup.get_text()
+        text_content = document.soup_text
         
         # Split into paragraphs or sections
-        sections = re.split(r'\n\s*\n', text_content)
+        sections = text_patterns.PARAGRAPH_BREAK.split(text_content)
         
         for section in sections:
             # Look for currency pairs
+            found_pairs = self.pair_matcher.found(section)
             for pair in self.all_pairs:
-                if pair in section.upper():
+                if pair in found_pairs:
                     signal = self._extract_signal_from_text(section, pair)
                     if signal:
                         signals.append(signal)
@@ -218,14 +225,14 @@ class ForexParser:
             signal_type = self._detect_signal_type(text)
             
             # Extract prices using regex
-            prices = re.findall(r'\d+\.?\d*', text)
+            prices = text_patterns.NUMBER_TOKENS.findall(text)
             entry_price = float(prices[0]) if prices else None
             stop_loss = None
             take_profit = None
             
             # Look for SL/TP patterns
-            sl_match = re.search(r'(?:sl|stop loss)[:\s]*(\d+\.?\d*)', text, re.I)
-            tp_match = re.search(r'(?:tp|take profit|target)[:\s]*(\d+\.?\d*)', text, re.I)
+            sl_match = text_patterns.STOP_LOSS.search(text)
+            tp_match = text_patterns.TAKE_PROFIT.search(text)
             
             if sl_match:
                 stop_loss = float(sl_match.group(1))
@@ -260,26 +267,16 @@ class ForexParser:
             stop_loss = None
             take_profit = None
             
-            # Look for price patterns
-            price_pattern = r'(\d+\.?\d*)'
-            
             # Entry price patterns
-            entry_patterns = [
-                rf'{pair}.*?@\s*{price_pattern}',
-                rf'entry[:\s]*{price_pattern}',
-                rf'buy\s+{pair}.*?{price_pattern}',
-                rf'sell\s+{pair}.*?{price_pattern}'
-            ]
-            
-            for pattern in entry_patterns:
-                match = re.search(pattern, full_text, re.I)
+            for pattern in text_patterns.pair_entry_patterns(pair):
+                match = pattern.search(full_text)
                 if match:
                     entry_price = float(match.group(1))
                     break
             
             # SL/TP extraction
-            sl_match = re.search(rf'(?:sl|stop loss)[:\s]*{price_pattern}', full_text, re.I)
-            tp_match = re.search(rf'(?:tp|take profit|target)[:\s]*{price_pattern}', full_text, re.I)
+            sl_match = text_patterns.STOP_LOSS.search(full_text)
+            tp_match = text_patterns.TAKE_PROFIT.search(full_text)
             
             if sl_match:
                 stop_loss = float(sl_match.group(1))
@@ -341,14 +338,9 @@ class ForexParser:
         """Extract price from row data."""
         for key in keys:
             if key in row_data:
-                try:
-                    # Extract numeric value
-                    price_text = row_data[key]
-                    price_match = re.search(r'(\d+\.?\d*)', price_text)
-                    if price_match:
-                        return float(price_match.group(1))
-                except:
-                    continue
+                price = text_patterns.parse_number(row_data[key])
+                if price is not None:
+                    return price
         return None
     
     def _extract_analysis(self, row_data: Dict[str, str]) -> Optional[str]:
@@ -3,9 +3,11 @@ Generic table parser for extracting structured data from HTML tables.
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Union
 from bs4 import BeautifulSoup, Tag
 
+from src.data_processors.parsed_document import ParsedDocument
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,22 +62,21 @@ class TableParser:
             logger.error(f"Error parsing table: {e}")
             return []
     
-    def parse_all_tables(self, html_content: str,
+    def parse_all_tables(self, html_content: Union[str, ParsedDocument],
                         table_selector: str = 'table',
                         required_headers: Optional[List[str]] = None) -> List[List[Dict[str, Any]]]:
         """
         Parse all tables in HTML content.
         
         Args:
-            html_content: Raw HTML content
+            html_content: Raw HTML content, or a document shared with other parsers
             table_selector: CSS selector for tables
             required_headers: List of required header names
             
         Returns:
             List of table data (each table is a list of row dictionaries)
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        tables = soup.select(table_selector)
+        tables = ParsedDocument.coerce(html_content).select(table_selector)
         
         all_table_data = []
         for i, table in enumerate(tables):
@@ -86,22 +87,21 @@ class TableParser:
         
         return all_table_data
     
-    def find_table_by_headers(self, html_content: str, 
+    def find_table_by_headers(self, html_content: Union[str, ParsedDocument],
                              target_headers: List[str],
                              min_matches: int = 1) -> Optional[List[Dict[str, Any]]]:
         """
         Find and parse a table containing specific headers.
         
         Args:
-            html_content: Raw HTML content
+            html_content: Raw HTML content, or a document shared with other parsers
             target_headers: Headers to search for
             min_matches: Minimum number of headers that must match
             
         Returns:
             Table data if found, None otherwise
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        tables = soup.find_all('table')
+        tables = ParsedDocument.coerce(html_content).tables
         
         for table in tables:
             headers = self._extract_headers(table)
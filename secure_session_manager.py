@@ -4,16 +4,20 @@ Secure Session Manager
 Encrypts and manages browser session data securely
 """
 
+import asyncio
 import os
 import json
 import logging
+import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional
 import sys
 
 # Add parent directory to path for SecureConfigManager
 sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent / 'utils'))
 from secure_config_manager import SecureConfigManager
+from session_store import SessionStore, staging_lock
 
 logger = logging.getLogger(__name__)
 
@@ -26,27 +30,61 @@ class SecureSessionManager:
         
         # Initialize secure config manager for session encryption
         self.secure_manager = SecureConfigManager(self.session_dir)
+        
+        # Decrypted sessions stay in memory until their file changes
+        self.store = SessionStore(self._read_encrypted, self._write_encrypted)
     
-    def save_session_state(self, session_data: Dict[str, Any], session_name: str = "mymama_session") -> bool:
-        """Save encrypted browser session state"""
-        try:
-            session_subdir = self.session_dir / session_name
-            session_subdir.mkdir(exist_ok=True)
-            
-            # Encrypt and save session data
-            session_file = session_subdir / "session.enc"
+    def _session_file(self, session_name: str) -> Path:
+        return self.session_dir / session_name / "session.enc"
+    
+    def _write_encrypted(self, session_file: Path, session_data: Dict[str, Any]) -> bool:
+        """Encrypt session data into session_file"""
+        session_subdir = session_file.parent
+        encrypted_file = self.session_dir / "config.enc"
+        
+        # config.enc is shared by every session: stage and rename under its lock
+        with staging_lock(encrypted_file):
             success = self.secure_manager.encrypt_config(session_data)
             
             if success:
                 # Move encrypted file to correct location
-                encrypted_file = self.session_dir / "config.enc"
                 if encrypted_file.exists():
                     encrypted_file.rename(session_file)
                     
                 # Secure permissions
                 os.chmod(session_file, 0o600)
                 os.chmod(session_subdir, 0o700)
-                
+        
+        return bool(success)
+    
+    def _read_encrypted(self, session_file: Path) -> Optional[Dict[str, Any]]:
+        """Decrypt session_file through a staged copy, leaving the file itself untouched"""
+        temp_encrypted = self.session_dir / "config.enc"
+        
+        with staging_lock(temp_encrypted):
+            # Copy rather than move, so concurrent loads never find the session missing
+            shutil.copyfile(session_file, temp_encrypted)
+            
+            try:
+                session_data = self.secure_manager.decrypt_config()
+            finally:
+                temp_encrypted.unlink(missing_ok=True)
+        
+        if session_data:
+            logger.info(f"✅ Session state decrypted successfully from {session_file}")
+            return session_data
+        
+        return None
+    
+    def save_session_state(self, session_data: Dict[str, Any], session_name: str = "mymama_session") -> bool:
+        """Save encrypted browser session state"""
+        try:
+            session_subdir = self.session_dir / session_name
+            session_subdir.mkdir(exist_ok=True)
+            
+            # Encrypt and save session data
+            session_file = self._session_file(session_name)
+            if self.store.save(session_file, session_data):
                 # Remove old plaintext session if it exists
                 old_session = session_subdir / "session.json"
                 if old_session.exists():
@@ -63,10 +101,10 @@ class SecureSessionManager:
             return False
     
     def load_session_state(self, session_name: str = "mymama_session") -> Optional[Dict[str, Any]]:
-        """Load encrypted browser session state"""
+        """Load encrypted browser session state (decrypted once per file change)"""
         try:
             session_subdir = self.session_dir / session_name
-            session_file = session_subdir / "session.enc"
+            session_file = self._session_file(session_name)
             
             if not session_file.exists():
                 # Try to migrate existing plaintext session
@@ -82,26 +120,24 @@ class SecureSessionManager:
                 logger.warning(f"No encrypted session found: {session_file}")
                 return None
             
-            # Temporarily move encrypted file for decryption
-            temp_encrypted = self.session_dir / "config.enc"
-            session_file.rename(temp_encrypted)
-            
-            try:
-                session_data = self.secure_manager.decrypt_config()
-                if session_data:
-                    logger.info(f"✅ Session state decrypted successfully from {session_file}")
-                    return session_data
-            finally:
-                # Move file back
-                if temp_encrypted.exists():
-                    temp_encrypted.rename(session_file)
-            
-            return None
+            return self.store.load(session_file)
             
         except Exception as e:
             logger.error(f"Failed to load encrypted session: {e}")
             return None
     
+    async def save_session_state_async(self, session_data: Dict[str, Any],
+                                       session_name: str = "mymama_session") -> bool:
+        """save_session_state() with encryption off the event loop"""
+        return await asyncio.to_thread(self.save_session_state, session_data, session_name)
+    
+    async def load_session_state_async(self, session_name: str = "mymama_session") -> Optional[Dict[str, Any]]:
+        """load_session_state(); cache hits return immediately, decryption runs in a thread"""
+        cached = self.store.peek(self._session_file(session_name))
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self.load_session_state, session_name)
+    
     def migrate_existing_sessions(self) -> bool:
         """Migrate all existing plaintext sessions to encrypted format"""
         try:
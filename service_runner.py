@@ -18,6 +18,8 @@ from messenger_compatibility import TelegramMessenger, SignalMessenger
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).parent / 'utils'))
+from browser_pool import close_browser_pool
 
 # Configure logging
 logging.basicConfig(
@@ -101,6 +103,10 @@ class ServiceRunner:
             
             # Send error notification
             await self.send_error_notification(str(e))
+            
+        finally:
+            # Each job runs on its own event loop; don't leave Chromium behind
+            await close_browser_pool()
     
     async def send_error_notification(self, error_msg):
         """Send error notification to administrators"""
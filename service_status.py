@@ -10,6 +10,10 @@ from datetime import datetime
 from pathlib import Path
 import json
 
+from src.core.metrics import DEFAULT_METRICS_PORT, histogram_quantile, parse_metrics
+
+METRICS_URL = os.getenv('SIGNALS_METRICS_URL', f'http://127.0.0.1:{DEFAULT_METRICS_PORT}/metrics')
+
 def check_service(service_name):
     """Check if systemd service is active"""
     try:
@@ -30,6 +34,42 @@ def check_signal_api():
     except:
         return False
 
+def get_metrics_summary(url=METRICS_URL):
+    """Read the daemon's /metrics endpoint; None if it is not running"""
+    try:
+        response = requests.get(url, timeout=5)
+        response.raise_for_status()
+    except requests.RequestException:
+        return None
+    metrics = parse_metrics(response.text)
+
+    cache_counts = {}
+    for labels, value in metrics.get('cache_requests_total', []):
+        counts = cache_counts.setdefault(labels.get('cache', ''), {'hit': 0.0, 'miss': 0.0})
+        if labels.get('result') in counts:
+            counts[labels['result']] += value
+    cache_hit_ratios = {
+        cache: counts['hit'] / (counts['hit'] + counts['miss'])
+        for cache, counts in cache_counts.items() if counts['hit'] + counts['miss'] > 0
+    }
+
+    buckets = {}
+    for labels, value in metrics.get('api_call_seconds_bucket', []):
+        le = float('inf') if labels['le'] == '+Inf' else float(labels['le'])
+        buckets.setdefault(labels.get('api', ''), {})[le] = value
+    provider_latency = {
+        api: {'p50': histogram_quantile(0.5, api_buckets), 'p95': histogram_quantile(0.95, api_buckets),
+              'count': api_buckets.get(float('inf'), 0)}
+        for api, api_buckets in buckets.items()
+    }
+
+    open_breakers = [labels.get('breaker') for labels, value in metrics.get('circuit_breaker_open', []) if value]
+    return {
+        'cache_hit_ratios': cache_hit_ratios,
+        'provider_latency': provider_latency,
+        'open_breakers': open_breakers,
+    }
+
 def get_last_report_time():
     """Get time of last report"""
     try:
@@ -125,6 +165,22 @@ def main():
     except:
         print("Next Scheduled:      Unable to calculate")
     
+    # Performance metrics from the signals daemon
+    print("")
+    print("Performance Metrics:")
+    print("-" * 30)
+    summary = get_metrics_summary()
+    if summary is None:
+        print(f"Metrics endpoint:    🔴 Unavailable ({METRICS_URL})")
+    else:
+        for cache, ratio in sorted(summary['cache_hit_ratios'].items()):
+            print(f"Cache {cache:14} {ratio * 100:5.1f}% hits")
+        for api, latency in sorted(summary['provider_latency'].items()):
+            if latency['p50'] is not None:
+                print(f"API {api:16} p50 {latency['p50'] * 1000:7.0f}ms  p95 {latency['p95'] * 1000:7.0f}ms  "
+                      f"({latency['count']:.0f} calls)")
+        print(f"Open breakers:       {', '.join(summary['open_breakers']) or 'none'}")
+    
     # Quick Actions
     print("")
     print("Quick Actions:")
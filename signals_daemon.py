@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Resident Signals Daemon
+Keeps the daily signal pipeline (Signals analyzers, API caches, HTTP
+clients, messengers) warm in one long-lived process instead of rebuilding
+it for every scheduled run. Runs are scheduled internally and can be
+triggered over a local Unix socket:
+
+    python signals_daemon.py serve              # start the daemon
+    python signals_daemon.py run-now            # run the daily job now
+    python signals_daemon.py run-pairs EURUSD GBPUSD
+    python signals_daemon.py status
+    python signals_daemon.py reload             # re-read config (also SIGHUP)
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import schedule
+
+from src.core.deadline import Deadline, run_deadline
+from src.core.exceptions import DeadlineExceeded
+from src.core.metrics import DEFAULT_METRICS_PORT, MetricsServer, registry as metrics_registry
+from src.core.tracing import trace_run
+
+# The scrapers import the browser pool from utils/ as a top-level module
+sys.path.append(str(Path(__file__).parent / 'utils'))
+from browser_pool import close_browser_pool
+
+logger = logging.getLogger('signals_daemon')
+
+PROJECT_DIR = Path(__file__).parent
+DEFAULT_CONFIG = PROJECT_DIR / 'config.json'
+DEFAULT_SOCKET = Path(os.getenv('SIGNALS_DAEMON_SOCKET', str(PROJECT_DIR / 'cache' / 'signals_daemon.sock')))
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
+
+# Largest request/response line accepted on the socket
+MAX_MESSAGE_BYTES = 1_000_000
+
+# End-to-end budget for one run, and how long past it a run that ignores
+# the deadline may continue before it is cancelled
+DEFAULT_RUN_BUDGET = 1200.0
+HARD_DEADLINE_GRACE = 30.0
+
+JOBS = metrics_registry.counter('signals_jobs_total', 'Daily signal job runs', ('trigger', 'outcome'))
+JOB_DURATION = metrics_registry.histogram('signals_job_seconds', 'Daily signal job duration', ('trigger',),
+                                          buckets=(5, 15, 30, 60, 120, 300, 600, 1200))
+
+
+@dataclass
+class DaemonConfig:
+    """Schedule and socket settings, re-read on reload"""
+    report_time: str = '06:00'
+    report_days: List[str] = field(default_factory=lambda: list(WEEKDAYS))
+    prewarm_minutes: int = 5                        # rebuild anything cold this long before a run
+    socket_path: str = str(DEFAULT_SOCKET)
+    trace_dir: Optional[str] = None                 # write a Chrome trace per run when set
+    metrics_port: Optional[int] = DEFAULT_METRICS_PORT  # local /metrics endpoint; None disables
+    run_budget_seconds: Optional[float] = DEFAULT_RUN_BUDGET  # per-run deadline; None = unbounded
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_CONFIG) -> 'DaemonConfig':
+        """
+        Load from the `daemon` section of config.json
+
+        Falls back to `app_settings.report_time`/`report_days` (as used by
+        service_runner.py), then to 06:00 on weekdays.
+        """
+        config = cls()
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return config
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read {path}: {e}; using defaults")
+            return config
+
+        app_settings = data.get('app_settings', {})
+        section = {**{k: app_settings[k] for k in ('report_time', 'report_days') if k in app_settings},
+                   **data.get('daemon', {})}
+        for key, value in section.items():
+            if hasattr(config, key):
+                setattr(config, key, value)
+        return config
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'report_time': self.report_time,
+            'report_days': list(self.report_days),
+            'prewarm_minutes': self.prewarm_minutes,
+            'socket_path': self.socket_path,
+            'trace_dir': self.trace_dir,
+            'metrics_port': self.metrics_port,
+            'run_budget_seconds': self.run_budget_seconds
+        }
+
+
+@dataclass
+class JobRecord:
+    """One run of the daily job"""
+    job_id: str
+    trigger: str                                    # 'schedule' or 'api'
+    pairs: Optional[List[str]] = None               # None = configured pairs
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    duration: float = 0.0
+    success: Optional[bool] = None
+    error: Optional[str] = None
+    trace_path: Optional[str] = None
+    deadline: Optional[Dict[str, Any]] = None       # budget used and stages skipped to meet it
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'trigger': self.trigger,
+            'pairs': self.pairs,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'duration': round(self.duration, 3),
+            'success': self.success,
+            'error': self.error,
+            'trace_path': self.trace_path,
+            'deadline': self.deadline
+        }
+
+
+def _default_system_factory():
+    """Build the production pipeline (EnhancedAPISignalsDailyV2)"""
+    from enhanced_api_signals_daily import EnhancedAPISignalsDailyV2
+    return EnhancedAPISignalsDailyV2()
+
+
+def _clear_settings_cache():
+    """Make the next get_settings() re-read .env and the environment"""
+    try:
+        from forex_signals.core.config import get_settings
+        get_settings.cache_clear()
+    except ImportError:
+        pass
+
+
+class SignalsDaemon:
+    """
+    Long-lived host for the daily signal job
+
+    The pipeline object is built once (in the background at startup) and
+    reused by every run, so a scheduled or triggered run only pays for
+    fetching data and sending messages. Runs are serialized; a trigger that
+    arrives during a run waits for it. Reloading re-reads the daemon config
+    and application settings and rebuilds the pipeline object, while the
+    imported analysis modules and their caches stay warm.
+    """
+
+    def __init__(self, config_path: Path = DEFAULT_CONFIG, config: Optional[DaemonConfig] = None,
+                 system_factory: Optional[Callable[[], Any]] = None, tick: float = 30.0):
+        """
+        Args:
+            config_path: config.json with the `daemon` section
+            config: Use this config instead of reading config_path
+            system_factory: Builds the pipeline; must provide
+                            `generate_and_send_daily_signals()` and
+                            `signal_generator.currency_pairs`
+            tick: Seconds between schedule checks
+        """
+        self.config_path = Path(config_path)
+        self.config = config or DaemonConfig.load(self.config_path)
+        self.system_factory = system_factory or _default_system_factory
+        self.tick = tick
+
+        self.system = None
+        self.scheduler = schedule.Scheduler()
+        self.current_job: Optional[JobRecord] = None
+        self.history: deque = deque(maxlen=20)
+        self.started_at = time.time()
+        self.config_loaded_at = datetime.now().isoformat()
+        self.warmup_seconds: Optional[float] = None
+
+        self._job_lock = asyncio.Lock()
+        # Warm-ups run in worker threads (prewarm, reload, first run) and may overlap
+        self._warm_lock = threading.Lock()
+        self._tasks: set = set()
+        self._stop: Optional[asyncio.Event] = None
+        self._schedule_jobs()
+
+    # Warm state
+
+    def warm_up(self) -> bool:
+        """Build the pipeline if it is not built yet (blocking)"""
+        if self.system is not None:
+            return True
+        with self._warm_lock:
+            # Another thread may have built it while we waited
+            if self.system is not None:
+                return True
+            started = time.monotonic()
+            try:
+                self.system = self.system_factory()
+            except Exception as e:
+                logger.error(f"❌ Warm-up failed: {e}", exc_info=True)
+                return False
+            self.warmup_seconds = time.monotonic() - started
+        logger.info(f"🔥 Pipeline warm in {self.warmup_seconds:.1f}s")
+        return True
+
+    async def _ensure_system(self):
+        if self.system is None and not await asyncio.to_thread(self.warm_up):
+            raise RuntimeError('pipeline could not be initialized')
+
+    # Jobs
+
+    async def run_job(self, pairs: Optional[List[str]] = None, trigger: str = 'api') -> JobRecord:
+        """
+        Run the daily job on the warm pipeline
+
+        Args:
+            pairs: Analyze only these pairs for this run (None = configured pairs)
+            trigger: 'schedule' or 'api', recorded in status
+        """
+        record = JobRecord(job_id=uuid.uuid4().hex[:12], trigger=trigger,
+                           pairs=[p.upper() for p in pairs] if pairs else None)
+        async with self._job_lock:
+            record.started_at = datetime.now().isoformat()
+            self.current_job = record
+            started = time.monotonic()
+            logger.info(f"📅 Job {record.job_id} started ({trigger}"
+                        f"{', pairs ' + ', '.join(record.pairs) if record.pairs else ''})")
+            try:
+                await self._ensure_system()
+                generator = self.system.signal_generator
+                configured_pairs = generator.currency_pairs
+                if record.pairs:
+                    generator.currency_pairs = record.pairs
+                try:
+                    with run_deadline(self.config.run_budget_seconds, name=f'job {record.job_id}') as deadline:
+                        try:
+                            record.success = bool(await self._run_budgeted(record, deadline))
+                        finally:
+                            if deadline is not None:
+                                record.deadline = deadline.report()
+                                for skip in record.deadline['skipped']:
+                                    logger.warning(f"⏱️ Job {record.job_id} skipped {skip['stage']}: {skip['reason']}")
+                finally:
+                    generator.currency_pairs = configured_pairs
+            except Exception as e:
+                record.success = False
+                record.error = str(e)
+                logger.error(f"❌ Job {record.job_id} failed: {e}", exc_info=True)
+            finally:
+                record.duration = time.monotonic() - started
+                record.finished_at = datetime.now().isoformat()
+                self.current_job = None
+                self.history.append(record)
+                JOBS.inc(trigger=trigger, outcome='success' if record.success else 'failure')
+                JOB_DURATION.observe(record.duration, trigger=trigger)
+            logger.info(f"{'✅' if record.success else '❌'} Job {record.job_id} finished in {record.duration:.1f}s")
+        return record
+
+    async def _run_budgeted(self, record: JobRecord, deadline: Optional[Deadline]) -> bool:
+        """
+        Run the pipeline within the run deadline
+
+        Stages shorten their own waits to the deadline; a run still going
+        HARD_DEADLINE_GRACE seconds after it is cancelled.
+        """
+        if deadline is None:
+            return await self._run_traced(record)
+        try:
+            return await asyncio.wait_for(self._run_traced(record), deadline.remaining() + HARD_DEADLINE_GRACE)
+        except asyncio.TimeoutError:
+            deadline.skip('daily_signals', 'cancelled at hard deadline')
+            raise DeadlineExceeded('daily_signals', deadline.budget)
+
+    async def _run_traced(self, record: JobRecord) -> bool:
+        """Run the pipeline, exporting a Chrome trace and stage summary if trace_dir is set"""
+        if not self.config.trace_dir:
+            return await self.system.generate_and_send_daily_signals()
+        tracer = None
+        try:
+            with trace_run('daily_signals', job_id=record.job_id, trigger=record.trigger) as tracer:
+                return await self.system.generate_and_send_daily_signals()
+        finally:
+            if tracer is not None:
+                path = Path(self.config.trace_dir) / f"trace_{datetime.now():%Y%m%d_%H%M%S}_{record.job_id}.json"
+                try:
+                    record.trace_path = str(tracer.export_chrome_trace(path))
+                except OSError as e:
+                    logger.warning(f"Could not write trace {path}: {e}")
+                logger.info(f"Stage summary for job {record.job_id}:\n{tracer.format_summary(limit=25)}")
+
+    def _spawn(self, coroutine) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes"""
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    # Scheduling
+
+    def _schedule_jobs(self):
+        self.scheduler.clear()
+        report_time = self.config.report_time
+        prewarm_time = None
+        if self.config.prewarm_minutes:
+            run_at = datetime.strptime(report_time, '%H:%M')
+            prewarm_at = run_at - timedelta(minutes=self.config.prewarm_minutes)
+            if prewarm_at.date() == run_at.date():
+                prewarm_time = prewarm_at.strftime('%H:%M')
+
+        for day in self.config.report_days:
+            getattr(self.scheduler.every(), day.lower()).at(report_time).do(self._on_scheduled_run)
+            if prewarm_time:
+                getattr(self.scheduler.every(), day.lower()).at(prewarm_time).do(self._on_prewarm)
+        logger.info(f"✅ Scheduled for {', '.join(self.config.report_days)} at {report_time}")
+
+    def _on_scheduled_run(self):
+        self._spawn(self.run_job(trigger='schedule'))
+
+    def _on_prewarm(self):
+        if self.system is None:
+            self._spawn(asyncio.to_thread(self.warm_up))
+
+    def next_run(self) -> Optional[str]:
+        """Next scheduled daily run"""
+        runs = [job.next_run for job in self.scheduler.jobs if job.job_func.func == self._on_scheduled_run]
+        return min(runs).isoformat() if runs else None
+
+    async def _scheduler_loop(self):
+        while not self._stop.is_set():
+            try:
+                self.scheduler.run_pending()
+            except Exception as e:
+                logger.error(f"Unexpected error in scheduler: {e}", exc_info=True)
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.tick)
+            except asyncio.TimeoutError:
+                pass
+
+    # Config
+
+    async def reload_config(self) -> Dict[str, Any]:
+        """Re-read daemon config and settings; rebuild the pipeline after any running job"""
+        config = DaemonConfig.load(self.config_path)
+        async with self._job_lock:
+            self.config = config
+            self.config_loaded_at = datetime.now().isoformat()
+            self._schedule_jobs()
+            _clear_settings_cache()
+            self.system = None
+        logger.info("🔄 Configuration reloaded")
+        self._spawn(asyncio.to_thread(self.warm_up))
+        return self.config.to_dict()
+
+    # API
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'warm': self.system is not None,
+            'warmup_seconds': round(self.warmup_seconds, 3) if self.warmup_seconds is not None else None,
+            'running': self.current_job.to_dict() if self.current_job else None,
+            'next_run': self.next_run(),
+            'last_runs': [record.to_dict() for record in list(self.history)[-5:]],
+            'config': self.config.to_dict(),
+            'config_loaded_at': self.config_loaded_at
+        }
+
+    async def handle_command(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute one API request
+
+        Commands: run-now, run-pairs (pairs), status, reload. Runs wait for
+        completion unless `wait` is false.
+        """
+        command = request.get('command')
+        if command in ('run-now', 'run-pairs'):
+            pairs = request.get('pairs') if command == 'run-pairs' else None
+            if command == 'run-pairs' and not pairs:
+                return {'ok': False, 'error': 'run-pairs needs a non-empty "pairs" list'}
+            job = self.run_job(pairs=pairs, trigger='api')
+            if request.get('wait', True):
+                record = await job
+                return {'ok': bool(record.success), 'job': record.to_dict()}
+            self._spawn(job)
+            return {'ok': True, 'queued': True}
+        if command == 'status':
+            return {'ok': True, 'status': self.status()}
+        if command == 'reload':
+            return {'ok': True, 'config': await self.reload_config()}
+        return {'ok': False, 'error': f'unknown command: {command}'}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            line = await reader.readline()
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError('request must be a JSON object')
+            except ValueError as e:
+                response = {'ok': False, 'error': f'bad request: {e}'}
+            else:
+                response = await self.handle_command(request)
+            writer.write(json.dumps(response).encode() + b'\n')
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            logger.debug(f"Client disconnected: {e}")
+        finally:
+            writer.close()
+
+    # Lifecycle
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    async def serve(self, install_signal_handlers: bool = True):
+        """Start the socket API and scheduler; return after stop() or SIGTERM/SIGINT"""
+        self._stop = asyncio.Event()
+        socket_path = Path(self.config.socket_path)
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            socket_path.unlink()
+
+        server = await asyncio.start_unix_server(self._handle_client, path=str(socket_path),
+                                                 limit=MAX_MESSAGE_BYTES)
+        os.chmod(socket_path, 0o600)
+
+        if install_signal_handlers:
+            loop = asyncio.get_running_loop()
+            loop.add_signal_handler(signal.SIGTERM, self.stop)
+            loop.add_signal_handler(signal.SIGINT, self.stop)
+            loop.add_signal_handler(signal.SIGHUP, lambda: self._spawn(self.reload_config()))
+
+        metrics_server = None
+        if self.config.metrics_port is not None:
+            metrics_server = MetricsServer(port=int(self.config.metrics_port))
+            try:
+                metrics_server.start()
+            except OSError as e:
+                logger.warning(f"Metrics endpoint unavailable on port {self.config.metrics_port}: {e}")
+                metrics_server = None
+
+        logger.info(f"🏃 Signals daemon listening on {socket_path}")
+        self._spawn(asyncio.to_thread(self.warm_up))
+        try:
+            await self._scheduler_loop()
+        finally:
+            logger.info("Signals daemon shutting down...")
+            if metrics_server is not None:
+                metrics_server.stop()
+            server.close()
+            await server.wait_closed()
+            for task in list(self._tasks):
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            await close_browser_pool()
+            if socket_path.exists():
+                socket_path.unlink()
+
+
+async def send_command(command: str, socket_path: Path = DEFAULT_SOCKET,
+                       timeout: Optional[float] = None, **params) -> Dict[str, Any]:
+    """Send one request to a running daemon and return its response"""
+    reader, writer = await asyncio.open_unix_connection(str(socket_path), limit=MAX_MESSAGE_BYTES)
+    try:
+        writer.write(json.dumps({'command': command, **params}).encode() + b'\n')
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+        return json.loads(line)
+    finally:
+        writer.close()
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Resident daemon for the daily signal job')
+    parser.add_argument('command', choices=['serve', 'run-now', 'run-pairs', 'status', 'reload'])
+    parser.add_argument('pairs', nargs='*', help='Currency pairs for run-pairs')
+    parser.add_argument('--config', default=str(DEFAULT_CONFIG), help='config.json path')
+    parser.add_argument('--socket', help='Socket path (default from config)')
+    parser.add_argument('--no-wait', action='store_true', help='Return once a run is queued')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        daemon = SignalsDaemon(Path(args.config))
+        if args.socket:
+            daemon.config.socket_path = args.socket
+        asyncio.run(daemon.serve())
+        return
+
+    socket_path = Path(args.socket or DaemonConfig.load(Path(args.config)).socket_path)
+    params: Dict[str, Any] = {}
+    if args.command == 'run-pairs':
+        params['pairs'] = args.pairs
+    if args.command in ('run-now', 'run-pairs'):
+        params['wait'] = not args.no_wait
+    try:
+        response = asyncio.run(send_command(args.command, socket_path, **params))
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"Signals daemon is not running (no socket at {socket_path})", file=sys.stderr)
+        sys.exit(2)
+    print(json.dumps(response, indent=2))
+    sys.exit(0 if response.get('ok') else 1)
+
+
+if __name__ == "__main__":
+    main()
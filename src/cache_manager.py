@@ -7,10 +7,14 @@ import hashlib
 import logging
 from typing import Any, Dict, Optional, Union
 from functools import wraps
-import redis
 from datetime import datetime, timedelta
 
 from src.core.config import settings
+from src.core.metrics import CACHE_REQUESTS
+from src.core.tracing import set_attribute, span
+from .utils.lazy import LazySingleton, lazy_import
+
+redis = lazy_import('redis')
 
 logger = logging.getLogger(__name__)
 
@@ -79,18 +83,29 @@ class CacheManager:
         """Retrieve data from cache"""
         cache_key = self._generate_key("cache", key)
         
-        # Try Redis first
-        if self.redis_client:
-            try:
-                data = self.redis_client.get(cache_key)
-                if data:
-                    return self._deserialize_data(data)
-            except (redis.ConnectionError, redis.TimeoutError) as e:
-                logger.warning(f"Redis get failed: {e}. Using fallback.")
-                self.redis_client = None
-        
-        # Fallback to memory cache
-        return self._fallback_get(cache_key)
+        with span('cache.get', category='cache'):
+            # Try Redis first
+            if self.redis_client:
+                try:
+                    data = self.redis_client.get(cache_key)
+                    if data:
+                        set_attribute('tier', 'redis')
+                        set_attribute('hit', True)
+                        CACHE_REQUESTS.inc(cache='cache_manager', tier='redis', result='hit')
+                        return self._deserialize_data(data)
+                except (redis.ConnectionError, redis.TimeoutError) as e:
+                    logger.warning(f"Redis get failed: {e}. Using fallback.")
+                    self.redis_client = None
+            
+            # Fallback to memory cache
+            value = self._fallback_get(cache_key)
+            set_attribute('tier', 'memory')
+            set_attribute('hit', value is not None)
+            if value is None:
+                CACHE_REQUESTS.inc(cache='cache_manager', tier='none', result='miss')
+            else:
+                CACHE_REQUESTS.inc(cache='cache_manager', tier='memory', result='hit')
+            return value
     
     def delete(self, key: str) -> bool:
         """Delete data from cache"""
@@ -282,5 +297,5 @@ def economic_data_cache(ttl: int = None):
     
     return cached(ttl=ttl, key_func=key_func)
 
-# Global cache manager instance
-cache_manager = CacheManager()
\ No newline at end of file
+# Global cache manager instance (connects to Redis on first use)
+cache_manager = LazySingleton(CacheManager, 'cache_manager')
\ No newline at end of file
@@ -12,6 +12,7 @@ from collections import defaultdict, OrderedDict
 
 from .logging_config import get_logger
 from .exceptions import CacheException, CacheConnectionError
+from .metrics import CACHE_EVICTIONS, CACHE_REQUESTS
 
 
 logger = get_logger(__name__)
@@ -55,7 +56,8 @@ class CacheEntry:
 class LRUCache:
     """Thread-safe LRU cache with size limits and TTL support."""
     
-    def __init__(self, max_size: int = 1000, max_memory_mb: int = 100):
+    def __init__(self, max_size: int = 1000, max_memory_mb: int = 100, name: str = 'lru'):
+        self.name = name
         self.max_size = max_size
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
@@ -78,6 +80,8 @@ class LRUCache:
         for key in expired_keys:
             del self.cache[key]
             self.stats['evictions'] += 1
+        if expired_keys:
+            CACHE_EVICTIONS.inc(len(expired_keys), cache=self.name)
     
     def _evict_lru(self) -> None:
         """Evict least recently used entries to maintain size limits."""
@@ -85,6 +89,7 @@ class LRUCache:
         while len(self.cache) >= self.max_size:
             self.cache.popitem(last=False)
             self.stats['evictions'] += 1
+            CACHE_EVICTIONS.inc(cache=self.name)
         
         # Evict by memory usage
         total_memory = sum(entry.size_bytes for entry in self.cache.values())
@@ -92,6 +97,7 @@ class LRUCache:
             _, entry = self.cache.popitem(last=False)
             total_memory -= entry.size_bytes
             self.stats['memory_evictions'] += 1
+            CACHE_EVICTIONS.inc(cache=self.name)
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
@@ -104,12 +110,15 @@ class LRUCache:
                     # Move to end (most recently used)
                     self.cache.move_to_end(key)
                     self.stats['hits'] += 1
+                    CACHE_REQUESTS.inc(cache=self.name, tier='memory', result='hit')
                     return entry.access()
                 else:
                     del self.cache[key]
                     self.stats['evictions'] += 1
+                    CACHE_EVICTIONS.inc(cache=self.name)
             
             self.stats['misses'] += 1
+            CACHE_REQUESTS.inc(cache=self.name, tier='none', result='miss')
             return None
     
     def set(self, key: str, value: Any, ttl: int = 3600, tags: List[str] = None) -> None:
@@ -174,10 +183,10 @@ class SmartCacheManager:
     
     def __init__(self):
         self.caches: Dict[str, LRUCache] = {
-            'api_responses': LRUCache(max_size=500, max_memory_mb=50),
-            'processed_data': LRUCache(max_size=200, max_memory_mb=30),
-            'analysis_results': LRUCache(max_size=100, max_memory_mb=20),
-            'temporary': LRUCache(max_size=50, max_memory_mb=10)
+            'api_responses': LRUCache(max_size=500, max_memory_mb=50, name='api_responses'),
+            'processed_data': LRUCache(max_size=200, max_memory_mb=30, name='processed_data'),
+            'analysis_results': LRUCache(max_size=100, max_memory_mb=20, name='analysis_results'),
+            'temporary': LRUCache(max_size=50, max_memory_mb=10, name='temporary')
         }
         self.cache_strategies = {
             'api_responses': self._api_response_strategy,
@@ -0,0 +1,560 @@
+"""
+Circuit breaker shared by every external call path
+One implementation behind circuit_breaker.py, the messenger/scraper
+`circuit_breaker_protection` decorator, network_resilience and
+forex_signals. Each breaker keeps a fixed-size ring buffer of recent
+outcomes and latencies, so it can open on a high error rate or a high
+slow-call rate over the window, not only after a streak of consecutive
+failures. A service that is degrading (answers getting slower) trips the
+breaker before callers start piling up on timeouts.
+
+Admission in the closed state reads one attribute and takes no lock;
+recording an outcome is O(1) under a plain lock, and the window is only
+scanned when a failure or slow call could open the circuit. While half-open
+only `half_open_max_calls` probes run at a time and every other caller is
+rejected immediately instead of queueing behind the recovering service.
+
+All breakers created through `get_circuit_breaker` share one registry that
+is exported on the metrics endpoint.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core.exceptions import CircuitBreakerOpenError, CircuitBreakerTimeoutError
+from src.core.metrics import registry as metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"       # Normal operation
+    OPEN = "open"           # Failing, requests blocked
+    HALF_OPEN = "half_open"  # Testing if service recovered
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Configuration for circuit breaker"""
+    failure_threshold: int = 5          # Consecutive failures before opening
+    recovery_timeout: float = 60        # Seconds open before a half-open probe
+    success_threshold: int = 3          # Probe successes needed to close from half-open
+    timeout: Optional[float] = 30.0     # Call timeout in seconds (None = no limit)
+    excluded_exceptions: List[type] = field(default_factory=list)  # Exceptions to ignore
+    recorded_exceptions: Tuple[type, ...] = (Exception,)           # Exceptions counted as failures
+
+    # Sliding window
+    window_size: int = 50               # Most recent outcomes kept
+    window_seconds: float = 300         # Outcomes older than this are ignored
+    minimum_calls: int = 10             # Calls in the window before rates can open the circuit
+    failure_rate_threshold: float = 0.5
+    slow_call_threshold: Optional[float] = None  # Seconds; default half the timeout
+    slow_call_rate_threshold: float = 0.5
+
+    # Recovery
+    half_open_max_calls: int = 1        # Concurrent probes while half-open
+    exponential_backoff: bool = True    # Double the recovery timeout after each failed probe
+    max_recovery_timeout: float = 1800  # Maximum recovery timeout (30 minutes)
+
+
+@dataclass
+class CircuitStats:
+    """Circuit breaker statistics"""
+    total_requests: int = 0
+    successful_requests: int = 0
+    failed_requests: int = 0
+    timeouts: int = 0
+    slow_calls: int = 0
+    throttles: int = 0
+    rejected_requests: int = 0
+    circuit_opened_count: int = 0
+    circuit_closed_count: int = 0
+    current_failure_streak: int = 0
+    last_failure_time: Optional[float] = None
+    last_success_time: Optional[float] = None
+    state_changed_at: Optional[float] = None
+
+    def success_rate(self) -> float:
+        """Calculate success rate percentage"""
+        return (self.successful_requests / max(1, self.total_requests)) * 100
+
+
+class CircuitBreaker:
+    """
+    Sliding-window circuit breaker
+
+    Use `call`/`call_async`, or `can_execute()` followed by exactly one of
+    `record_success`, `record_failure` or `record_throttle` when the call
+    is made elsewhere (the half-open probe slot is released on record).
+    """
+
+    def __init__(self, name: str, config: Optional[CircuitBreakerConfig] = None):
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        if self.config.slow_call_threshold is not None:
+            self._slow_threshold = self.config.slow_call_threshold
+        else:
+            self._slow_threshold = self.config.timeout / 2 if self.config.timeout else None
+
+        size = max(1, self.config.window_size)
+        self._times = [-math.inf] * size
+        self._failed = [False] * size
+        self._slow = [False] * size
+        self._latency = [-1.0] * size
+        self._cursor = 0
+
+        self._state = CircuitState.CLOSED
+        self._stats = CircuitStats()
+        self._lock = threading.Lock()
+        self._opened_at = 0.0
+        self._open_reason: Optional[str] = None
+        self._recovery_attempt_count = 0
+        self._probes_in_flight = 0
+        self._probe_started_at = 0.0
+        self._probe_successes = 0
+        self._state_listeners: List[Callable] = []
+
+        logger.debug(f"🔌 Circuit breaker '{name}' initialized in {self._state.value} state")
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @property
+    def stats(self) -> CircuitStats:
+        return self._stats
+
+    @property
+    def failure_count(self) -> int:
+        """Current run of consecutive failures"""
+        return self._stats.current_failure_streak
+
+    @property
+    def success_count(self) -> int:
+        """Successful probes since the circuit went half-open"""
+        return self._probe_successes
+
+    @property
+    def throttle_count(self) -> int:
+        return self._stats.throttles
+
+    @property
+    def last_failure_time(self) -> Optional[float]:
+        return self._stats.last_failure_time
+
+    @property
+    def open_reason(self) -> Optional[str]:
+        """What opened the circuit (None while closed)"""
+        return self._open_reason
+
+    def add_state_listener(self, listener: Callable[[str, CircuitState, CircuitState], None]):
+        """Add a listener for state changes"""
+        self._state_listeners.append(listener)
+
+    # Admission
+
+    def can_execute(self) -> bool:
+        """
+        Whether a call may proceed now
+
+        Closed: lock-free. Open: moves to half-open once the recovery timeout
+        has passed. Half-open: admits up to half_open_max_calls probes at a
+        time; a probe that never records its outcome frees its slot after
+        the recovery timeout.
+        """
+        if self._state is CircuitState.CLOSED:
+            return True
+        transition = None
+        with self._lock:
+            now = time.monotonic()
+            if self._state is CircuitState.OPEN and now - self._opened_at >= self._recovery_timeout():
+                transition = self._set_state(CircuitState.HALF_OPEN, 'recovery timeout elapsed', now)
+            if self._state is CircuitState.CLOSED:
+                allowed = True
+            elif self._state is CircuitState.HALF_OPEN and (
+                    self._probes_in_flight < self.config.half_open_max_calls
+                    or now - self._probe_started_at >= self._recovery_timeout()):
+                if self._probes_in_flight >= self.config.half_open_max_calls:
+                    self._probes_in_flight = 0  # Abandoned probes
+                self._probes_in_flight += 1
+                self._probe_started_at = now
+                allowed = True
+            else:
+                self._stats.rejected_requests += 1
+                allowed = False
+        if transition:
+            self._notify(*transition)
+        return allowed
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit admits a probe"""
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._recovery_timeout() - time.monotonic())
+
+    def _recovery_timeout(self) -> float:
+        base = self.config.recovery_timeout
+        if not self.config.exponential_backoff:
+            return base
+        return min(base * min(2 ** self._recovery_attempt_count, 8), self.config.max_recovery_timeout)
+
+    def _open_error(self) -> Exception:
+        """Exception raised by call/call_async when the circuit rejects a call"""
+        return CircuitBreakerOpenError(self.name, round(self.retry_in(), 1))
+
+    # Recording
+
+    def record_success(self, latency: Optional[float] = None):
+        """Record a successful call; latency (seconds) feeds the slow-call rate"""
+        self._record(False, latency)
+
+    def record_failure(self, exception: Optional[BaseException] = None, latency: Optional[float] = None):
+        """Record a failed call; excluded or unrecorded exception types are ignored"""
+        if exception is not None and not self._counts_as_failure(exception):
+            self._release_probe()
+            return
+        self._record(True, latency, timeout=isinstance(exception, (TimeoutError, asyncio.TimeoutError)))
+
+    def record_throttle(self):
+        """Record a throttled call; the service answered, so state is unchanged"""
+        with self._lock:
+            self._stats.throttles += 1
+            self._release_probe_locked()
+
+    def _counts_as_failure(self, exception: BaseException) -> bool:
+        if any(isinstance(exception, exc_type) for exc_type in self.config.excluded_exceptions):
+            logger.debug(f"Ignoring excluded exception: {type(exception).__name__}")
+            return False
+        return isinstance(exception, self.config.recorded_exceptions)
+
+    def _release_probe(self):
+        with self._lock:
+            self._release_probe_locked()
+
+    def _release_probe_locked(self):
+        if self._state is CircuitState.HALF_OPEN and self._probes_in_flight:
+            self._probes_in_flight -= 1
+
+    def _record(self, failed: bool, latency: Optional[float], timeout: bool = False):
+        now = time.monotonic()
+        slow = latency is not None and self._slow_threshold is not None and latency >= self._slow_threshold
+        transition = None
+        with self._lock:
+            i = self._cursor
+            self._times[i] = now
+            self._failed[i] = failed
+            self._slow[i] = slow
+            self._latency[i] = latency if latency is not None else -1.0
+            self._cursor = (i + 1) % len(self._times)
+
+            stats = self._stats
+            stats.total_requests += 1
+            stats.timeouts += timeout
+            stats.slow_calls += slow
+            if failed:
+                stats.failed_requests += 1
+                stats.current_failure_streak += 1
+                stats.last_failure_time = time.time()
+            else:
+                stats.successful_requests += 1
+                stats.current_failure_streak = 0
+                stats.last_success_time = time.time()
+
+            if self._state is CircuitState.HALF_OPEN:
+                self._release_probe_locked()
+                if failed or slow:
+                    self._recovery_attempt_count += 1
+                    transition = self._set_state(CircuitState.OPEN, 'probe failed' if failed else 'probe slow', now)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.config.success_threshold:
+                        transition = self._set_state(CircuitState.CLOSED, 'probes succeeded', now)
+            elif self._state is CircuitState.CLOSED and (failed or slow):
+                reason = self._trip_reason(now)
+                if reason:
+                    transition = self._set_state(CircuitState.OPEN, reason, now)
+        if transition:
+            self._notify(*transition)
+
+    def _window_counts(self, now: float) -> Tuple[int, int, int]:
+        cutoff = now - self.config.window_seconds
+        calls = failures = slow = 0
+        for recorded_at, failed, was_slow in zip(self._times, self._failed, self._slow):
+            if recorded_at >= cutoff:
+                calls += 1
+                failures += failed
+                slow += was_slow
+        return calls, failures, slow
+
+    def _trip_reason(self, now: float) -> Optional[str]:
+        """Why the circuit should open now, or None (called under the lock)"""
+        config = self.config
+        streak = self._stats.current_failure_streak
+        if streak >= config.failure_threshold:
+            return f'{streak} consecutive failures'
+        calls, failures, slow = self._window_counts(now)
+        if calls < config.minimum_calls:
+            return None
+        if failures / calls >= config.failure_rate_threshold:
+            return f'failure rate {failures / calls:.0%} over last {calls} calls'
+        if self._slow_threshold is not None and slow / calls >= config.slow_call_rate_threshold:
+            return f'slow-call rate {slow / calls:.0%} (>= {self._slow_threshold:g}s) over last {calls} calls'
+        return None
+
+    # State changes
+
+    def _set_state(self, new_state: CircuitState, reason: str, now: float):
+        """Change state under the lock; returns the transition for _notify"""
+        old_state = self._state
+        self._state = new_state
+        self._stats.state_changed_at = time.time()
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if new_state is CircuitState.OPEN:
+            self._opened_at = now
+            self._open_reason = reason
+            self._stats.circuit_opened_count += 1
+        elif new_state is CircuitState.CLOSED:
+            self._open_reason = None
+            self._recovery_attempt_count = 0
+            self._stats.circuit_closed_count += 1
+            self._stats.current_failure_streak = 0
+            # Outcomes from before the outage must not reopen the circuit
+            self._times = [-math.inf] * len(self._times)
+        return old_state, new_state, reason
+
+    def _notify(self, old_state: CircuitState, new_state: CircuitState, reason: str):
+        log = logger.warning if new_state is CircuitState.OPEN else logger.info
+        log(f"🔄 Circuit '{self.name}': {old_state.value} → {new_state.value} ({reason})")
+        for listener in self._state_listeners:
+            try:
+                listener(self.name, old_state, new_state)
+            except Exception as e:
+                logger.warning(f"State listener error: {e}")
+
+    def force_open(self, reason: str = 'forced open'):
+        with self._lock:
+            transition = self._set_state(CircuitState.OPEN, reason, time.monotonic())
+        self._notify(*transition)
+
+    def force_close(self, reason: str = 'forced closed'):
+        with self._lock:
+            transition = self._set_state(CircuitState.CLOSED, reason, time.monotonic())
+        self._notify(*transition)
+
+    def reset(self):
+        """Closed state with empty statistics and window"""
+        with self._lock:
+            self._set_state(CircuitState.CLOSED, 'reset', time.monotonic())
+            self._stats = CircuitStats()
+            self._cursor = 0
+
+    # Calls
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Execute a sync function with circuit breaker protection
+
+        The call runs inline; one that overruns config.timeout is recorded as
+        a timed-out failure (a worker thread could not cancel it either).
+        """
+        if not self.can_execute():
+            raise self._open_error()
+        started = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e, time.monotonic() - started)
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
+        elapsed = time.monotonic() - started
+        if self.config.timeout is not None and elapsed > self.config.timeout:
+            self._record(True, elapsed, timeout=True)
+        else:
+            self._record(False, elapsed)
+        return result
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Execute an async function with circuit breaker protection and timeout"""
+        if not self.can_execute():
+            raise self._open_error()
+        started = time.monotonic()
+        try:
+            if self.config.timeout is None:
+                result = await func(*args, **kwargs)
+            else:
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout=self.config.timeout)
+        except asyncio.TimeoutError:
+            self._record(True, time.monotonic() - started, timeout=True)
+            raise CircuitBreakerTimeoutError(self.name, self.config.timeout) from None
+        except Exception as e:
+            self.record_failure(e, time.monotonic() - started)
+            raise
+        except BaseException:
+            # Cancelled: no outcome, but free the probe slot
+            self._release_probe()
+            raise
+        self._record(False, time.monotonic() - started)
+        return result
+
+    # Reporting
+
+    def window_stats(self) -> Dict[str, Any]:
+        """Error rate, slow-call rate and latency over the current window"""
+        with self._lock:
+            cutoff = time.monotonic() - self.config.window_seconds
+            entries = [(failed, slow, latency) for recorded_at, failed, slow, latency
+                       in zip(self._times, self._failed, self._slow, self._latency) if recorded_at >= cutoff]
+        calls = len(entries)
+        latencies = sorted(latency for _, _, latency in entries if latency >= 0)
+        return {
+            'calls': calls,
+            'failure_rate': round(sum(e[0] for e in entries) / calls, 4) if calls else 0.0,
+            'slow_call_rate': round(sum(e[1] for e in entries) / calls, 4) if calls else 0.0,
+            'latency_avg': round(sum(latencies) / len(latencies), 4) if latencies else None,
+            'latency_p95': round(latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))], 4)
+            if latencies else None
+        }
+
+    def get_health_status(self) -> Dict[str, Any]:
+        """Get detailed health status"""
+        stats = self._stats
+        return {
+            'name': self.name,
+            'state': self._state.value,
+            'healthy': self._state in (CircuitState.CLOSED, CircuitState.HALF_OPEN),
+            'open_reason': self._open_reason,
+            'stats': {
+                'total_requests': stats.total_requests,
+                'success_rate': round(stats.success_rate(), 2),
+                'failure_streak': stats.current_failure_streak,
+                'circuit_opens': stats.circuit_opened_count,
+                'timeouts': stats.timeouts,
+                'slow_calls': stats.slow_calls,
+                'throttles': stats.throttles,
+                'rejected': stats.rejected_requests
+            },
+            'window': self.window_stats(),
+            'config': {
+                'failure_threshold': self.config.failure_threshold,
+                'failure_rate_threshold': self.config.failure_rate_threshold,
+                'slow_call_threshold': self._slow_threshold,
+                'recovery_timeout': self.config.recovery_timeout,
+                'timeout': self.config.timeout
+            },
+            'last_state_change': stats.state_changed_at,
+            'retry_in': round(self.retry_in(), 1),
+            'recovery_attempts': self._recovery_attempt_count
+        }
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(name='{self.name}', state={self._state.value}, "
+                f"failures={self.failure_count}/{self.config.failure_threshold})")
+
+
+class CircuitBreakerRegistry:
+    """Registry to manage multiple circuit breakers"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, config: Optional[CircuitBreakerConfig] = None) -> CircuitBreaker:
+        """Get the breaker called name, creating it with config if needed"""
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name, config)
+                logger.info(f"🔌 Registered circuit breaker: {name}")
+            return breaker
+
+    def add(self, breaker: CircuitBreaker) -> CircuitBreaker:
+        """Register an already constructed breaker (e.g. a subclass); an existing name wins"""
+        with self._lock:
+            return self._breakers.setdefault(breaker.name, breaker)
+
+    def get(self, name: str) -> Optional[CircuitBreaker]:
+        """Get circuit breaker by name"""
+        return self._breakers.get(name)
+
+    def get_all_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get status of all circuit breakers"""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {name: cb.get_health_status() for name, cb in breakers}
+
+    def reset_all(self):
+        """Reset all circuit breakers to closed state"""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for cb in breakers:
+            cb.reset()
+        logger.info("🔄 All circuit breakers reset")
+
+    def export_metrics(self) -> Dict[str, Any]:
+        """Export metrics for monitoring systems"""
+        statuses = self.get_all_status()
+        return {
+            'timestamp': time.time(),
+            'circuit_breakers': statuses,
+            'summary': {
+                'total_breakers': len(statuses),
+                'open_breakers': sum(1 for s in statuses.values() if s['state'] == CircuitState.OPEN.value),
+                'healthy_breakers': sum(1 for s in statuses.values() if s['healthy']),
+                'total_requests': sum(s['stats']['total_requests'] for s in statuses.values()),
+                'total_failures': sum(self._breakers[name].stats.failed_requests for name in statuses)
+            }
+        }
+
+    def collect_samples(self):
+        """Scrape-time samples for the shared metrics registry"""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        for name, cb in breakers:
+            stats = cb.stats
+            window = cb.window_stats()
+            labels = {'breaker': name}
+            yield 'circuit_breaker_open', labels, 1 if cb.state is CircuitState.OPEN else 0
+            yield 'circuit_breaker_half_open', labels, 1 if cb.state is CircuitState.HALF_OPEN else 0
+            yield 'circuit_breaker_failure_rate', labels, window['failure_rate']
+            yield 'circuit_breaker_slow_call_rate', labels, window['slow_call_rate']
+            yield 'circuit_breaker_requests_total', labels, stats.total_requests
+            yield 'circuit_breaker_failures_total', labels, stats.failed_requests
+            yield 'circuit_breaker_timeouts_total', labels, stats.timeouts
+            yield 'circuit_breaker_slow_calls_total', labels, stats.slow_calls
+            yield 'circuit_breaker_rejected_total', labels, stats.rejected_requests
+            yield 'circuit_breaker_opens_total', labels, stats.circuit_opened_count
+
+
+# Global registry
+circuit_breaker_registry = CircuitBreakerRegistry()
+metrics_registry.register_collector('circuit_breakers', circuit_breaker_registry.collect_samples)
+
+
+def get_circuit_breaker(name: str, config: Optional[CircuitBreakerConfig] = None) -> CircuitBreaker:
+    """Get or create a circuit breaker from the global registry"""
+    return circuit_breaker_registry.register(name, config)
+
+
+def register_circuit_breaker(breaker: CircuitBreaker) -> CircuitBreaker:
+    """Add a breaker built elsewhere to the global registry (and metrics)"""
+    return circuit_breaker_registry.add(breaker)
+
+
+def get_all_circuit_breakers() -> Dict[str, Dict[str, Any]]:
+    """Get status of all circuit breakers"""
+    return circuit_breaker_registry.get_all_status()
+
+
+def reset_all_circuit_breakers():
+    """Reset all circuit breakers"""
+    circuit_breaker_registry.reset_all()
@@ -0,0 +1,203 @@
+"""
+Run-level deadlines for scheduled signal runs
+A Deadline is installed in a contextvar for the duration of a run and read
+by every layer that waits: HTTP timeouts, rate-limit waits, retry backoff,
+browser timeouts and message throttling clamp themselves to the remaining
+budget instead of using their fixed worst-case values. Optional work
+(sentiment, geopolitical) is skipped once the budget drops into the
+reserve kept for mandatory stages, and every skip is recorded so the run
+can report what it left out.
+
+Outside `run_deadline` all helpers behave exactly like the fixed timeouts
+they replace. The contextvar follows asyncio tasks automatically; thread
+pool work sees it when submitted through `src.core.tracing.propagate` or
+`asyncio.to_thread`.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.core.exceptions import DeadlineExceeded
+
+# Fraction of the budget kept back for mandatory stages when none is given
+DEFAULT_RESERVE_FRACTION = 0.2
+
+_current_deadline: contextvars.ContextVar[Optional['Deadline']] = contextvars.ContextVar(
+    'current_deadline', default=None)
+
+
+class Deadline:
+    """
+    Absolute end time for a run plus a log of what was skipped to meet it
+
+    Args:
+        seconds: Budget from now
+        name: Label used in logs and the report
+        reserve: Seconds kept for mandatory work; optional stages are
+            skipped once less than this remains (default 20% of budget)
+        expires_at: Absolute time.monotonic() end (overrides seconds)
+    """
+
+    def __init__(self, seconds: float, name: str = 'run', reserve: Optional[float] = None,
+                 expires_at: Optional[float] = None):
+        self.name = name
+        self.started_at = time.monotonic()
+        self.expires_at = expires_at if expires_at is not None else self.started_at + seconds
+        self.budget = self.expires_at - self.started_at
+        self.reserve = reserve if reserve is not None else self.budget * DEFAULT_RESERVE_FRACTION
+        self.skipped: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def clamp(self, seconds: float) -> float:
+        """The smaller of seconds and the remaining budget"""
+        return max(0.0, min(seconds, self.remaining()))
+
+    def skip(self, stage: str, reason: str, **details):
+        """Record work that was left out to stay within the deadline"""
+        with self._lock:
+            self.skipped.append({
+                'stage': stage,
+                'reason': reason,
+                'at_s': round(time.monotonic() - self.started_at, 3),
+                'remaining_s': round(self.remaining(), 3),
+                **details
+            })
+
+    def check(self, stage: str):
+        """Raise DeadlineExceeded (and record the skip) if the budget is spent"""
+        if self.expired:
+            self.skip(stage, 'deadline expired')
+            raise DeadlineExceeded(stage, self.budget)
+
+    def allows_optional(self, stage: str, **details) -> bool:
+        """True while more than the reserve remains; otherwise records the skip"""
+        if self.remaining() > self.reserve:
+            return True
+        self.skip(stage, 'budget reserved for mandatory stages', **details)
+        return False
+
+    def report(self) -> Dict[str, Any]:
+        elapsed = time.monotonic() - self.started_at
+        with self._lock:
+            skipped = list(self.skipped)
+        return {
+            'name': self.name,
+            'budget_s': round(self.budget, 3),
+            'elapsed_s': round(elapsed, 3),
+            'remaining_s': round(self.remaining(), 3),
+            'expired': self.expired,
+            'skipped': skipped
+        }
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@contextmanager
+def run_deadline(seconds: Optional[float] = None, name: str = 'run', reserve: Optional[float] = None,
+                 until: Optional[datetime] = None) -> Iterator[Optional[Deadline]]:
+    """
+    Install a deadline for the block
+
+    A nested deadline never outlives its parent. With neither seconds nor
+    until the block runs unbounded and yields None.
+    """
+    if until is not None:
+        until_seconds = (until - datetime.now()).total_seconds()
+        seconds = until_seconds if seconds is None else min(seconds, until_seconds)
+    if seconds is None:
+        yield None
+        return
+
+    parent = _current_deadline.get()
+    expires_at = time.monotonic() + max(0.0, seconds)
+    if parent is not None:
+        expires_at = min(expires_at, parent.expires_at)
+    deadline = Deadline(seconds, name=name, reserve=reserve, expires_at=expires_at)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+        if parent is not None and deadline.skipped:
+            with parent._lock:
+                parent.skipped.extend(deadline.skipped)
+
+
+def remaining(default: Optional[float] = None) -> Optional[float]:
+    """Seconds left in the current run, or default when no deadline is set"""
+    deadline = _current_deadline.get()
+    return deadline.remaining() if deadline is not None else default
+
+
+def clamp_timeout(seconds: float) -> float:
+    """A fixed timeout shortened to the remaining budget"""
+    deadline = _current_deadline.get()
+    return deadline.clamp(seconds) if deadline is not None else seconds
+
+
+def fits(seconds: float) -> bool:
+    """Whether a wait of this length ends before the deadline"""
+    deadline = _current_deadline.get()
+    return deadline is None or seconds < deadline.remaining()
+
+
+def check(stage: str):
+    """Raise DeadlineExceeded if the current run is out of time"""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check(stage)
+
+
+def allows_optional(stage: str, **details) -> bool:
+    """Whether optional work may still run (always True without a deadline)"""
+    deadline = _current_deadline.get()
+    return deadline is None or deadline.allows_optional(stage, **details)
+
+
+def _wait_or_skip(seconds: float, stage: str):
+    deadline = _current_deadline.get()
+    if deadline is not None and seconds >= deadline.remaining():
+        deadline.skip(stage, f'wait of {seconds:.1f}s exceeds remaining budget')
+        raise DeadlineExceeded(stage, deadline.budget)
+
+
+def budget_sleep(seconds: float, stage: str):
+    """time.sleep that raises DeadlineExceeded instead of sleeping past the deadline"""
+    _wait_or_skip(seconds, stage)
+    time.sleep(seconds)
+
+
+async def budget_sleep_async(seconds: float, stage: str):
+    """asyncio.sleep that raises DeadlineExceeded instead of sleeping past the deadline"""
+    _wait_or_skip(seconds, stage)
+    await asyncio.sleep(seconds)
+
+
+def budget_exhausted(retry_state) -> bool:
+    """tenacity stop condition: stop once the deadline has passed or the next sleep would reach it"""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return False
+    upcoming = getattr(retry_state, 'upcoming_sleep', 0) or 0
+    return deadline.expired or upcoming >= deadline.remaining()
+
+
+def clamped_wait(wait: Callable[[Any], float]) -> Callable[[Any], float]:
+    """tenacity wait strategy shortened to the remaining budget"""
+    def _wait(retry_state) -> float:
+        return clamp_timeout(wait(retry_state))
+    return _wait
@@ -63,6 +63,41 @@ class APIResponseError(APIException):
         )
 
 
+class CassetteMissError(APIException):
+    """Raised when a replayed run makes a request that was never recorded."""
+    def __init__(self, kind: str, request: str):
+        super().__init__(
+            f"No recorded {kind} response for {request}",
+            error_code="CASSETTE_MISS",
+            details={"kind": kind, "request": request}
+        )
+
+
+class CircuitBreakerOpenError(APIException):
+    """Raised when a call is rejected because its circuit breaker is open."""
+    def __init__(self, name: str, retry_in: float = None):
+        super().__init__(
+            f"Circuit '{name}' is open",
+            error_code="CIRCUIT_BREAKER_OPEN",
+            details={"circuit_breaker": name, "retry_in": retry_in}
+        )
+
+
+class CircuitBreakerTimeoutError(APITimeoutError):
+    """Raised when a call made through a circuit breaker times out."""
+    pass
+
+
+class DeadlineExceeded(ForexSignalException):
+    """Raised when a stage cannot finish within the run's deadline."""
+    def __init__(self, stage: str, budget_seconds: float):
+        super().__init__(
+            f"Run deadline reached during {stage} (budget {budget_seconds:.0f}s)",
+            error_code="DEADLINE_EXCEEDED",
+            details={"stage": stage, "budget_seconds": budget_seconds}
+        )
+
+
 # Data Related Exceptions
 class DataException(ForexSignalException):
     """Base exception for data-related errors."""
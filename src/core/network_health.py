@@ -0,0 +1,118 @@
+"""
+Passive network health from real traffic
+The HTTP clients report the outcome and latency of every live request here
+(AsyncHttpClient, the requests path used by make_request_with_backoff, and
+the pooled httpx clients behind the messengers). NetworkHealthMonitor scores
+health from these observations and only sends active probes to endpoints
+that have seen no traffic for a while, so a busy run is monitored for free
+and problems show up on the first failing real request.
+
+Endpoints are keyed by host. A response below 500 counts as reachable: a
+4xx is the service answering, not the network failing.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Observations kept per endpoint
+DEFAULT_PER_ENDPOINT = 50
+
+
+def endpoint_key(url: str) -> str:
+    """Host of a URL (bare hosts and IPs are returned as-is)"""
+    if '://' in url:
+        return (urlsplit(url).hostname or url).lower()
+    return url.split('/')[0].lower()
+
+
+@dataclass
+class NetworkObservation:
+    """One request outcome (same fields as network_resilience.ConnectivityTest)"""
+    endpoint: str
+    success: bool
+    response_time: float
+    timestamp: datetime = field(default_factory=datetime.now)
+    error_message: Optional[str] = None
+    status_code: Optional[int] = None
+    source: str = 'traffic'             # 'traffic' or 'probe'
+
+
+class PassiveHealthTracker:
+    """Recent request outcomes per endpoint and when each endpoint was last used"""
+
+    def __init__(self, per_endpoint: int = DEFAULT_PER_ENDPOINT):
+        self.per_endpoint = per_endpoint
+        self._recent: Dict[str, Deque[Tuple[float, NetworkObservation]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, url: str, success: bool, response_time: float, status_code: Optional[int] = None,
+                error: Optional[str] = None, source: str = 'traffic') -> NetworkObservation:
+        """Record a request outcome; cheap enough to call on every request"""
+        endpoint = endpoint_key(url)
+        observation = NetworkObservation(endpoint=endpoint, success=success, response_time=response_time,
+                                         error_message=error, status_code=status_code, source=source)
+        now = time.monotonic()
+        with self._lock:
+            recent = self._recent.get(endpoint)
+            if recent is None:
+                recent = self._recent[endpoint] = deque(maxlen=self.per_endpoint)
+            recent.append((now, observation))
+        return observation
+
+    def idle_for(self, url: str) -> float:
+        """Seconds since the endpoint was last observed (inf if never)"""
+        with self._lock:
+            recent = self._recent.get(endpoint_key(url))
+            last_seen = recent[-1][0] if recent else None
+        return time.monotonic() - last_seen if last_seen is not None else float('inf')
+
+    def recent(self, within: Optional[float] = None, url: Optional[str] = None) -> List[NetworkObservation]:
+        """Observations from the last `within` seconds, oldest first"""
+        cutoff = time.monotonic() - within if within is not None else float('-inf')
+        with self._lock:
+            if url is not None:
+                queues = [self._recent.get(endpoint_key(url), ())]
+            else:
+                queues = list(self._recent.values())
+            entries = [entry for queue in queues for entry in queue if entry[0] >= cutoff]
+        entries.sort(key=lambda entry: entry[0])
+        return [observation for _, observation in entries]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint success rate, latency and idle time"""
+        now = time.monotonic()
+        with self._lock:
+            endpoints = {endpoint: list(queue) for endpoint, queue in self._recent.items()}
+        result = {}
+        for endpoint, entries in endpoints.items():
+            observations = [observation for _, observation in entries]
+            successful = [o.response_time for o in observations if o.success]
+            failures = [o for o in observations if not o.success]
+            result[endpoint] = {
+                'observations': len(observations),
+                'probes': sum(1 for o in observations if o.source == 'probe'),
+                'success_rate': round(len(successful) / len(observations), 3),
+                'avg_response_time': round(sum(successful) / len(successful), 4) if successful else None,
+                'idle_seconds': round(now - entries[-1][0], 1),
+                'last_error': failures[-1].error_message if failures else None
+            }
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._recent.clear()
+
+
+# Process-wide tracker fed by the HTTP clients
+health_tracker = PassiveHealthTracker()
+
+
+def observe(url: str, success: bool, response_time: float, status_code: Optional[int] = None,
+            error: Optional[str] = None, source: str = 'traffic') -> NetworkObservation:
+    """Record a request outcome on the process-wide tracker"""
+    return health_tracker.observe(url, success, response_time, status_code, error, source)
@@ -0,0 +1,328 @@
+"""
+Record/replay transport for external API traffic
+A cassette captures every response the data layer receives (HTTP via
+make_request_with_backoff, AsyncHttpClient and the price validator, plus
+yfinance calls) and serves them back in the same order on later runs, so a
+full signal run can be profiled or load-tested without network access or
+API quota. Replay can reproduce the recorded latency, add a fixed delay, or
+run at full speed.
+
+Credentials never reach the cassette: key/token query parameters, keys
+embedded in known URL paths (ExchangeRate-API's /v6/<key>/), and secret
+values from the environment or the loaded settings objects are redacted
+before a request is matched or stored, so a cassette recorded with one set
+of keys replays under any other.
+
+Activate with `use_cassette(path, mode)` or the environment:
+    FOREX_REPLAY_CASSETTE=cassettes/run.json.gz
+    FOREX_REPLAY_MODE=record|replay        (default replay)
+    FOREX_REPLAY_LATENCY=recorded|<seconds> (default: no delay)
+"""
+
+import asyncio
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from src.core.exceptions import CassetteMissError
+from src.core.network_health import observe as observe_network
+
+MODES = ('record', 'replay')
+REDACTED = 'REDACTED'
+CASSETTE_VERSION = 1
+
+_SECRET_PARAM = re.compile(r'(api_?key|access_?key|token|secret|password|^key$)', re.IGNORECASE)
+_SECRET_ENV = re.compile(r'(KEY|TOKEN|SECRET|PASSWORD)$')
+
+
+# Hosts whose API key is a path segment: host -> pattern capturing (prefix, key)
+_SECRET_PATHS = {
+    'v6.exchangerate-api.com': re.compile(r'^(/v6/)([^/]+)'),
+}
+
+# Pydantic settings modules whose `settings` instance may hold keys not in os.environ
+_SETTINGS_MODULES = ('src.core.config', 'core.config', 'Signals.src.core.config')
+
+
+def _loaded_settings() -> List[Any]:
+    """Settings instances already created by the running code (never imports or builds one)"""
+    instances = [getattr(sys.modules[name], 'settings', None) for name in _SETTINGS_MODULES
+                 if name in sys.modules]
+    forex_config = sys.modules.get('forex_signals.core.config')
+    if forex_config is not None and forex_config.get_settings.cache_info().currsize:
+        instances.append(forex_config.get_settings())
+    return [instance for instance in instances if instance is not None]
+
+
+def _secret_values() -> List[str]:
+    """Credential values from the environment and settings, longest first so overlaps redact fully"""
+    values = {value for name, value in os.environ.items()
+              if _SECRET_ENV.search(name.upper()) and len(value) >= 6}
+    for instance in _loaded_settings():
+        for name in getattr(type(instance), 'model_fields', {}):
+            if not _SECRET_ENV.search(name.upper()):
+                continue
+            value = getattr(instance, name, None)
+            if hasattr(value, 'get_secret_value'):
+                value = value.get_secret_value()
+            if isinstance(value, str) and len(value) >= 6:
+                values.add(value)
+    return sorted(values, key=len, reverse=True)
+
+
+def _redact_path(host: str, path: str) -> str:
+    pattern = _SECRET_PATHS.get((host or '').lower())
+    return pattern.sub(lambda m: m.group(1) + REDACTED, path, count=1) if pattern else path
+
+
+def redact_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Canonical, credential-free form of a request URL (query merged and sorted)"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((str(k), str(v)) for k, v in params.items() if v is not None)
+    query = sorted((k, REDACTED if _SECRET_PARAM.search(k) else v) for k, v in query)
+    path = _redact_path(parts.hostname, parts.path)
+    canonical = urlunsplit((parts.scheme, parts.netloc, path, urlencode(query), ''))
+    for secret in _secret_values():
+        canonical = canonical.replace(secret, REDACTED)
+    return canonical
+
+
+def http_request(method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                 body: Any = None) -> Dict[str, Any]:
+    """Identity of an HTTP request as stored in a cassette"""
+    request = {'method': method.upper(), 'url': redact_url(url, params)}
+    if body is not None:
+        encoded = body if isinstance(body, (str, bytes)) else json.dumps(body, sort_keys=True, default=str)
+        if isinstance(encoded, str):
+            encoded = encoded.encode()
+        request['body_sha1'] = hashlib.sha1(encoded).hexdigest()
+    return request
+
+
+class Cassette:
+    """
+    Ordered store of recorded interactions keyed by request identity
+
+    Identical requests are kept as a sequence and replayed in recorded
+    order (the last one repeats), so retries and polling loops see the same
+    progression of responses they saw while recording.
+    """
+
+    def __init__(self, path: Union[str, Path], mode: str = 'replay',
+                 latency: Union[None, str, float] = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {MODES}")
+        if latency not in (None, 'recorded') and not isinstance(latency, (int, float)):
+            raise ValueError(f"latency must be None, 'recorded' or seconds, not {latency!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self.stats = {'played': 0, 'missed': 0, 'recorded': 0}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if mode == 'replay':
+            self.load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    @staticmethod
+    def key(kind: str, request: Dict[str, Any]) -> str:
+        return hashlib.sha1(json.dumps([kind, request], sort_keys=True, default=str).encode()).hexdigest()[:20]
+
+    def load(self):
+        """Read interactions from disk (gzip when the path ends in .gz)"""
+        opener = gzip.open if self.path.suffix == '.gz' else open
+        with opener(self.path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')} in {self.path}")
+        self.interactions = data['interactions']
+        self._cursors.clear()
+
+    def save(self) -> Path:
+        """Write interactions to disk (gzip when the path ends in .gz)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        opener = gzip.open if self.path.suffix == '.gz' else open
+        with self._lock:
+            payload = {'version': CASSETTE_VERSION, 'interactions': self.interactions}
+            with opener(self.path, 'wt', encoding='utf-8') as f:
+                json.dump(payload, f, separators=(',', ':'), default=str)
+        return self.path
+
+    def lookup(self, kind: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Next recorded interaction for request; raises CassetteMissError if none"""
+        key = self.key(kind, request)
+        with self._lock:
+            recorded = self.interactions.get(key)
+            if not recorded:
+                self.stats['missed'] += 1
+                raise CassetteMissError(kind, json.dumps(request, sort_keys=True))
+            index = self._cursors.get(key, 0)
+            self._cursors[key] = index + 1
+            self.stats['played'] += 1
+            return recorded[min(index, len(recorded) - 1)]
+
+    def record(self, kind: str, request: Dict[str, Any], response: Dict[str, Any], elapsed: float):
+        """Append an interaction; response must be JSON-serialisable"""
+        interaction = {'request': request, 'response': response, 'elapsed': round(elapsed, 4)}
+        with self._lock:
+            self.interactions.setdefault(self.key(kind, request), []).append(interaction)
+            self.stats['recorded'] += 1
+
+    def delay(self, interaction: Dict[str, Any]) -> float:
+        """Seconds a replayed interaction should take"""
+        if self.latency == 'recorded':
+            return interaction.get('elapsed', 0.0)
+        return float(self.latency or 0.0)
+
+    def call(self, kind: str, request: Dict[str, Any], func: Callable[[], Any],
+             encode: Callable[[Any], Any] = lambda value: value,
+             decode: Callable[[Any], Any] = lambda value: value) -> Any:
+        """
+        Record or replay an arbitrary client call (e.g. a yfinance lookup)
+
+        Exceptions raised while recording are stored and re-raised on replay
+        as RuntimeError, so callers' error handling runs the same way.
+        """
+        if self.replaying:
+            interaction = self.lookup(kind, request)
+            pause = self.delay(interaction)
+            if pause:
+                time.sleep(pause)
+            response = interaction['response']
+            if 'error' in response:
+                raise RuntimeError(response['error'])
+            return decode(response['value'])
+
+        started = time.perf_counter()
+        try:
+            value = func()
+        except Exception as e:
+            self.record(kind, request, {'error': f'{type(e).__name__}: {e}'}, time.perf_counter() - started)
+            raise
+        self.record(kind, request, {'value': encode(value)}, time.perf_counter() - started)
+        return value
+
+
+_active: Optional[Cassette] = None
+_env_checked = False
+_active_lock = threading.Lock()
+
+
+def _latency_from_env(value: Optional[str]) -> Union[None, str, float]:
+    if not value:
+        return None
+    return 'recorded' if value == 'recorded' else float(value)
+
+
+def active_cassette() -> Optional[Cassette]:
+    """The installed cassette, configured from FOREX_REPLAY_* on first use"""
+    global _active, _env_checked
+    if _env_checked:
+        return _active
+    with _active_lock:
+        if not _env_checked:
+            path = os.environ.get('FOREX_REPLAY_CASSETTE')
+            if path and _active is None:
+                _active = Cassette(path, os.environ.get('FOREX_REPLAY_MODE', 'replay'),
+                                   _latency_from_env(os.environ.get('FOREX_REPLAY_LATENCY')))
+                if _active.recording:
+                    atexit.register(_active.save)
+            _env_checked = True
+    return _active
+
+
+@contextmanager
+def use_cassette(path: Union[str, Path], mode: str = 'replay',
+                 latency: Union[None, str, float] = None) -> Iterator[Cassette]:
+    """Install a cassette for the duration of the block; recordings are saved on exit"""
+    global _active, _env_checked
+    cassette = Cassette(path, mode, latency)
+    with _active_lock:
+        previous, previous_checked = _active, _env_checked
+        _active, _env_checked = cassette, True
+    try:
+        yield cassette
+    finally:
+        with _active_lock:
+            _active, _env_checked = previous, previous_checked
+        if cassette.recording:
+            cassette.save()
+
+
+def _replayed_response(interaction: Dict[str, Any], url: str) -> requests.Response:
+    recorded = interaction['response']
+    response = requests.Response()
+    response.status_code = recorded['status']
+    response.reason = recorded.get('reason', '')
+    response.headers.update(recorded.get('headers', {}))
+    response._content = recorded['body'].encode('utf-8')
+    response.encoding = 'utf-8'
+    response.url = url
+    return response
+
+
+def _live_get(url: str, **kwargs) -> requests.Response:
+    """requests.get reporting its outcome to the passive network health tracker"""
+    started = time.perf_counter()
+    try:
+        response = requests.get(url, **kwargs)
+    except requests.RequestException as e:
+        observe_network(url, False, time.perf_counter() - started, error=type(e).__name__)
+        raise
+    observe_network(url, response.status_code < 500, time.perf_counter() - started,
+                    status_code=response.status_code)
+    return response
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """requests.get through the active cassette (plain requests.get when none is installed)"""
+    cassette = active_cassette()
+    if cassette is None:
+        return _live_get(url, **kwargs)
+
+    request = http_request('GET', url, kwargs.get('params'))
+    if cassette.replaying:
+        interaction = cassette.lookup('http', request)
+        pause = cassette.delay(interaction)
+        if pause:
+            time.sleep(pause)
+        return _replayed_response(interaction, url)
+
+    started = time.perf_counter()
+    response = _live_get(url, **kwargs)
+    cassette.record('http', request, {
+        'status': response.status_code,
+        'reason': response.reason,
+        'headers': {'Content-Type': response.headers.get('Content-Type', '')},
+        'body': response.text
+    }, time.perf_counter() - started)
+    return response
+
+
+async def replay_delay(cassette: Cassette, interaction: Dict[str, Any]):
+    """Async counterpart of the replay latency simulation"""
+    pause = cassette.delay(interaction)
+    if pause:
+        await asyncio.sleep(pause)
@@ -0,0 +1,283 @@
+"""
+Hierarchical run tracing for the forex signal system
+Records nested spans (signal run -> per-pair analysis -> fetch / cache
+lookup -> report -> platform send) with attributes such as pair, provider
+and cache tier. The active tracer and parent span live in contextvars, so
+nesting follows asyncio tasks automatically and executor work keeps its
+parent when submitted through `propagate`. Output is Chrome trace-event
+JSON (chrome://tracing, Perfetto) plus a per-stage summary table.
+
+Outside `trace_run` every span is a no-op, so instrumented hot paths cost
+one contextvar lookup when tracing is off.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+_span_ids = itertools.count(1)
+
+
+@dataclass
+class Span:
+    """One timed unit of work"""
+    name: str
+    category: str
+    start: float
+    span_id: int
+    parent_id: Optional[int] = None
+    duration: Optional[float] = None
+    thread_id: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'category': self.category,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'duration_ms': round((self.duration or 0.0) * 1000, 3),
+            'attributes': dict(self.attributes),
+            'error': self.error,
+        }
+
+
+class Tracer:
+    """Collects finished spans for one run"""
+
+    def __init__(self, name: str = 'run'):
+        self.name = name
+        self.origin = time.perf_counter()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, category: str, parent: Optional[Span],
+                   attributes: Dict[str, Any]) -> Span:
+        return Span(name=name, category=category, start=time.perf_counter(),
+                    span_id=next(_span_ids), parent_id=parent.span_id if parent else None,
+                    thread_id=threading.get_ident(), attributes=attributes)
+
+    def finish_span(self, span: Span):
+        span.duration = time.perf_counter() - span.start
+        with self._lock:
+            self.spans.append(span)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Complete ('X') events in microseconds relative to the run start"""
+        pid = os.getpid()
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        events = []
+        for span in spans:
+            args = {k: _jsonable(v) for k, v in span.attributes.items()}
+            args['span_id'] = span.span_id
+            if span.parent_id is not None:
+                args['parent_id'] = span.parent_id
+            if span.error:
+                args['error'] = span.error
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((span.start - self.origin) * 1e6, 3),
+                'dur': round((span.duration or 0.0) * 1e6, 3),
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': {'run': self.name}}
+
+    def export_chrome_trace(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()))
+        return path
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Per-stage totals, slowest first
+
+        `self_ms` excludes time spent in child spans, so stages that only
+        wait on their children do not hide where the time actually went.
+        """
+        with self._lock:
+            spans = list(self.spans)
+        child_time: Dict[int, float] = {}
+        for span in spans:
+            if span.parent_id is not None:
+                child_time[span.parent_id] = child_time.get(span.parent_id, 0.0) + (span.duration or 0.0)
+
+        stages: Dict[str, Dict[str, Any]] = {}
+        for span in spans:
+            duration = span.duration or 0.0
+            stage = stages.setdefault(span.name, {'stage': span.name, 'count': 0, 'errors': 0,
+                                                  'total_ms': 0.0, 'self_ms': 0.0, 'max_ms': 0.0})
+            stage['count'] += 1
+            stage['errors'] += 1 if span.error else 0
+            stage['total_ms'] += duration * 1000
+            stage['self_ms'] += max(duration - child_time.get(span.span_id, 0.0), 0.0) * 1000
+            stage['max_ms'] = max(stage['max_ms'], duration * 1000)
+
+        rows = sorted(stages.values(), key=lambda row: row['total_ms'], reverse=True)
+        for row in rows:
+            row['mean_ms'] = row['total_ms'] / row['count']
+            for key in ('total_ms', 'self_ms', 'max_ms', 'mean_ms'):
+                row[key] = round(row[key], 3)
+        return rows
+
+    def format_summary(self, limit: Optional[int] = None) -> str:
+        rows = self.summary()[:limit] if limit else self.summary()
+        width = max([len(row['stage']) for row in rows] + [5])
+        lines = [f"{'stage':<{width}}  {'count':>5}  {'total ms':>10}  {'self ms':>10}  "
+                 f"{'mean ms':>9}  {'max ms':>9}  {'errors':>6}"]
+        for row in rows:
+            lines.append(f"{row['stage']:<{width}}  {row['count']:>5}  {row['total_ms']:>10.1f}  "
+                         f"{row['self_ms']:>10.1f}  {row['mean_ms']:>9.1f}  {row['max_ms']:>9.1f}  "
+                         f"{row['errors']:>6}")
+        return '\n'.join(lines)
+
+
+_current_tracer: contextvars.ContextVar[Optional[Tracer]] = contextvars.ContextVar('tracer', default=None)
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar('span', default=None)
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _current_tracer.get()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def set_attribute(key: str, value: Any):
+    """Attach an attribute to the innermost open span (no-op when not tracing)"""
+    span = _current_span.get()
+    if span is not None:
+        span.set_attribute(key, value)
+
+
+@contextmanager
+def trace_run(name: str = 'run', tracer: Optional[Tracer] = None, **attributes) -> Iterator[Tracer]:
+    """
+    Activate a tracer and open its root span
+
+    Example:
+        with trace_run('daily_signals') as tracer:
+            await generator.generate_signals_for_pairs(pairs)
+        tracer.export_chrome_trace('logs/trace.json')
+        print(tracer.format_summary())
+    """
+    tracer = tracer or Tracer(name)
+    tracer_token = _current_tracer.set(tracer)
+    span_token = _current_span.set(None)
+    try:
+        with span(name, category='run', **attributes):
+            yield tracer
+    finally:
+        _current_span.reset(span_token)
+        _current_tracer.reset(tracer_token)
+
+
+@contextmanager
+def span(name: str, category: str = 'stage', **attributes) -> Iterator[Optional[Span]]:
+    """Time the enclosed block as a child of the current span"""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield None
+        return
+    active = tracer.start_span(name, category, _current_span.get(), attributes)
+    token = _current_span.set(active)
+    try:
+        yield active
+    except BaseException as e:
+        if not isinstance(e, (GeneratorExit, asyncio.CancelledError)):
+            active.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        tracer.finish_span(active)
+
+
+def traced(name: Optional[str] = None, category: str = 'stage', capture: Iterable[str] = (),
+           **static_attributes) -> Callable:
+    """
+    Decorator form of `span` for sync and async functions
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Chrome trace category
+        capture: Argument names recorded as span attributes (e.g. 'pair')
+        static_attributes: Fixed attributes such as provider='fred'
+    """
+    capture = tuple(capture)
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        signature = inspect.signature(func) if capture else None
+
+        def attributes_for(args, kwargs) -> Dict[str, Any]:
+            attributes = dict(static_attributes)
+            if signature is not None:
+                try:
+                    bound = signature.bind_partial(*args, **kwargs).arguments
+                except TypeError:
+                    bound = {}
+                for arg in capture:
+                    if arg in bound:
+                        attributes[arg] = bound[arg]
+            return attributes
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_tracer.get() is None:
+                    return await func(*args, **kwargs)
+                with span(span_name, category, **attributes_for(args, kwargs)):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_tracer.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name, category, **attributes_for(args, kwargs)):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def propagate(func: Callable) -> Callable:
+    """
+    Bind func to the caller's context for `run_in_executor`
+
+    asyncio tasks copy contextvars on creation, thread pools do not; spans
+    opened inside the worker would otherwise lose their parent.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # A Context can only be entered by one thread at a time
+        return context.copy().run(func, *args, **kwargs)
+    return wrapper
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
 
 from .exceptions import DataValidationError, InvalidCurrencyPairError
+from ..utils import text_patterns
 
 
 class CurrencyPairValidator:
@@ -152,27 +153,25 @@ class PriceValidator:
 class DateTimeValidator:
     """Validator for date and time parameters."""
     
+    # Common datetime formats, tried in order
+    DATETIME_FORMATS = (
+        '%Y-%m-%d %H:%M:%S',
+        '%Y-%m-%dT%H:%M:%S',
+        '%Y-%m-%dT%H:%M:%SZ',
+        '%Y-%m-%d',
+        '%d/%m/%Y',
+        '%m/%d/%Y'
+    )
+    
     @staticmethod
     def validate_datetime_string(dt_string: str, field_name: str = 'datetime') -> datetime:
         """Validate and parse datetime string."""
         if not isinstance(dt_string, str):
             raise DataValidationError(field_name, str(dt_string), 'string')
         
-        # Common datetime formats
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%m/%d/%Y'
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(dt_string, fmt)
-            except ValueError:
-                continue
+        parsed = text_patterns.parse_datetime(dt_string, DateTimeValidator.DATETIME_FORMATS)
+        if parsed is not None:
+            return parsed
         
         raise DataValidationError(field_name, dt_string, 'valid datetime format')
     
@@ -4,15 +4,15 @@ Handles Alpha Vantage, Twelve Data, FRED, Finnhub, News API, Reddit, and more
 """
 import json
 import logging
-import pandas as pd
 import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
-import feedparser
 from urllib.parse import urlencode
 
 from src.core.config import settings
+from src.core.tracing import traced
 from .cache_manager import cache_manager, price_data_cache, economic_data_cache
+from .utils.lazy import LazySingleton
 from .rate_limiter import (
     alpha_vantage_rate_limit, twelve_data_rate_limit, fred_rate_limit,
     finnhub_rate_limit, news_api_rate_limit, reddit_rate_limit,
@@ -28,6 +28,7 @@ class DataFetcher:
         self.alpha_vantage_calls_today = 0
         self.twelve_data_calls_today = 0
         
+    @traced('fetch.alpha_vantage', category='fetch', provider='alpha_vantage', capture=('from_symbol', 'to_symbol'))
     @alpha_vantage_rate_limit(priority=1)
     @price_data_cache(ttl=3600)
     def fetch_alpha_vantage_forex(self, from_symbol: str, to_symbol: str, 
@@ -98,6 +99,7 @@ class DataFetcher:
             'last_updated': datetime.now().isoformat()
         }
     
+    @traced('fetch.twelve_data', category='fetch', provider='twelve_data', capture=('symbol', 'interval'))
     @twelve_data_rate_limit(priority=2)
     @price_data_cache(ttl=3600)
     def fetch_twelve_data_forex(self, symbol: str, interval: str = '4h') -> Optional[Dict]:
@@ -164,6 +166,7 @@ class DataFetcher:
             'last_updated': datetime.now().isoformat()
         }
     
+    @traced('fetch.forex_data', category='fetch', capture=('pair', 'interval'))
     def fetch_forex_data(self, pair: str, interval: str = '4hour') -> Optional[Dict]:
         """
         Intelligent forex data fetching with fallback strategy
@@ -196,6 +199,7 @@ class DataFetcher:
         logger.error(f"Failed to fetch forex data for {pair}")
         return None
     
+    @traced('fetch.fred', category='fetch', provider='fred', capture=('series_id',))
     @fred_rate_limit(priority=3)
     @economic_data_cache(ttl=14400)  # 4 hours
     def fetch_fred_data(self, series_id: str) -> Optional[Dict]:
@@ -244,6 +248,7 @@ class DataFetcher:
             'last_updated': datetime.now().isoformat()
         }
     
+    @traced('fetch.finnhub_calendar', category='fetch', provider='finnhub')
     @finnhub_rate_limit(priority=2)
     def fetch_finnhub_economic_calendar(self) -> Optional[List[Dict]]:
         """
@@ -293,6 +298,7 @@ class DataFetcher:
         
         return high_impact_events
     
+    @traced('fetch.news', category='fetch', provider='newsapi', capture=('query',))
     @news_api_rate_limit(priority=3)
     def fetch_news_sentiment(self, query: str, sources: str = None) -> Optional[List[Dict]]:
         """
@@ -342,6 +348,7 @@ class DataFetcher:
         
         return processed_articles
     
+    @traced('fetch.central_bank_feeds', category='fetch', provider='rss', capture=('currency',))
     def fetch_central_bank_feeds(self, currency: str) -> Optional[List[Dict]]:
         """
         Fetch central bank RSS feeds
@@ -377,6 +384,7 @@ class DataFetcher:
             if cached_feed:
                 return cached_feed
             
+            import feedparser
             feed = feedparser.parse(feed_url)
             processed_entries = []
             
@@ -397,6 +405,7 @@ class DataFetcher:
             logger.error(f"Central bank feed error for {currency}: {e}")
             return None
     
+    @traced('fetch.gdelt', category='fetch', provider='gdelt')
     def fetch_gdelt_events(self, currencies: List[str]) -> Optional[List[Dict]]:
         """
         Fetch geopolitical events from GDELT
@@ -467,6 +476,7 @@ class DataFetcher:
         
         return processed_events
     
+    @traced('fetch.current_price', category='fetch', capture=('pair',))
     def get_current_price(self, pair: str) -> Optional[float]:
         """
         Get current exchange rate for a currency pair
@@ -574,5 +584,5 @@ class DataFetcher:
         
         return comprehensive_data
 
-# Global data fetcher instance
-data_fetcher = DataFetcher()
\ No newline at end of file
+# Global data fetcher instance (built on first use)
+data_fetcher = LazySingleton(DataFetcher, 'data_fetcher')
\ No newline at end of file
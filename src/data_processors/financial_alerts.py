@@ -3,12 +3,17 @@ Financial alerts data processor.
 Converts raw scraped content into structured data models.
 """
 
-import re
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import asdict
+from typing import List, Dict, Any, Optional, Tuple, Union
 from bs4 import BeautifulSoup, Tag
 from datetime import datetime
 
+from .parsed_document import ParsedDocument
+from .incremental import ChangeSet, SectionHashStore, SectionState, section_hash
+from ..utils.pattern_matcher import MultiPatternMatcher
+from ..utils import text_patterns
+
 from .data_models import (
     ForexForecast, StockCryptoForecast, OptionsTrade, 
     SwingTrade, DayTrade, EarningsReport, TableSection,
@@ -17,10 +22,25 @@ from .data_models import (
 
 logger = logging.getLogger(__name__)
 
+TABLE_HEADINGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+# Incrementally processed text sections: name -> (report field, item model)
+TEXT_SECTIONS = {
+    'forex': ('forex_forecasts', ForexForecast),
+    'stock_crypto': ('stock_crypto_forecasts', StockCryptoForecast),
+    'options': ('options_trades', OptionsTrade),
+    'swing': ('swing_trades', SwingTrade),
+    'day': ('day_trades', DayTrade),
+    'earnings': ('earnings_reports', EarningsReport)
+}
+
 
 class FinancialAlertsProcessor:
     """Processes scraped financial data into structured format."""
     
+    # Bump when extraction logic changes so stored section results are re-parsed
+    PARSER_VERSION = 1
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize processor with configuration.
@@ -48,15 +68,26 @@ class FinancialAlertsProcessor:
             'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA',
             'JPM', 'BAC', 'WMT', 'JNJ', 'PG', 'V', 'MA', 'UNH'
         ]
+        
+        # Premium sections, located by their (case-sensitive) headers
+        self.premium_sections = [
+            'Premium Swing Trades', 'Premium Day Trades', 'Most Anticipated Earnings Releases'
+        ]
+        
+        # One pass over the text finds every pair, ticker and section header
+        self.symbol_matcher = MultiPatternMatcher(
+            self.forex_pairs + self.options_tickers + self.stock_tickers
+        )
+        self.section_matcher = MultiPatternMatcher(self.premium_sections, case=None)
 
-    def process_scraped_data(self, html_content: str, text_content: str, 
+    def process_scraped_data(self, html_content: Union[str, ParsedDocument], text_content: Optional[str] = None,
                            source_url: Optional[str] = None) -> StructuredFinancialReport:
         """
         Main method to process all scraped data.
         
         Args:
-            html_content: Raw HTML content
-            text_content: Plain text content
+            html_content: Raw HTML content, or an already parsed document
+            text_content: Plain text content (defaults to the HTML's text)
             source_url: Source URL for reference
             
         Returns:
@@ -64,8 +95,8 @@ class FinancialAlertsProcessor:
         """
         logger.info("🔍 Processing scraped data into structured format...")
         
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse HTML once; every extractor shares the document's indexes
+        document = ParsedDocument.coerce(html_content, text_content)
         
         # Initialize report
         report = StructuredFinancialReport(
@@ -74,13 +105,13 @@ class FinancialAlertsProcessor:
         )
         
         # Process each section
-        report.forex_forecasts = self._extract_forex_forecasts(soup, text_content)
-        report.stock_crypto_forecasts = self._extract_stock_crypto_forecasts(soup, text_content)
-        report.options_trades = self._extract_options_trades(soup, text_content)
-        report.swing_trades = self._extract_swing_trades(soup, text_content)
-        report.day_trades = self._extract_day_trades(soup, text_content)
-        report.earnings_reports = self._extract_earnings_reports(soup, text_content)
-        report.table_sections = self._extract_table_sections(soup)
+        report.forex_forecasts = self._extract_forex_forecasts(document)
+        report.stock_crypto_forecasts = self._extract_stock_crypto_forecasts(document)
+        report.options_trades = self._extract_options_trades(document)
+        report.swing_trades = self._extract_swing_trades(document)
+        report.day_trades = self._extract_day_trades(document)
+        report.earnings_reports = self._extract_earnings_reports(document)
+        report.table_sections = self._extract_table_sections(document)
         
         # Log summary
         stats = report.get_summary_stats()
@@ -91,30 +122,141 @@ class FinancialAlertsProcessor:
         
         return report
 
-    def _extract_forex_forecasts(self, soup: BeautifulSoup, text_content: str) -> List[ForexForecast]:
+    def process_incremental(self, html_content: Union[str, ParsedDocument], store: SectionHashStore,
+                            text_content: Optional[str] = None,
+                            source_url: Optional[str] = None) -> Tuple[StructuredFinancialReport, ChangeSet]:
+        """
+        Process a page, parsing only the sections that changed since the last run.
+        
+        Each section (forex, stock_crypto, options, swing, day, earnings and
+        every table as 'table:<n>') is fingerprinted by exactly the lines or
+        markup its extractor reads. Sections whose fingerprint matches the
+        store reuse the stored items; the rest are parsed. An identical page
+        skips fingerprinting altogether.
+        
+        Args:
+            html_content: Raw HTML content, or an already parsed document
+            store: Section state of the previous run; updated with this run's
+            text_content: Plain text content (defaults to the HTML's text)
+            source_url: Source URL for reference
+            
+        Returns:
+            (report, change set against the previous run)
+        """
+        document = ParsedDocument.coerce(html_content, text_content)
+        previous = dict(store.sections)
+        page_hash = section_hash([self.PARSER_VERSION, document.html_content, document.text])
+        
+        if page_hash == store.page_hash:
+            current = previous
+            parsed, reused = [], list(previous)
+        else:
+            current, parsed, reused = {}, [], []
+            for name, digest in self.section_fingerprints(document).items():
+                stored = previous.get(name)
+                if stored is not None and stored.get('hash') == digest:
+                    current[name] = stored
+                    reused.append(name)
+                else:
+                    items = self._extract_section(name, document)
+                    current[name] = {'hash': digest, 'items': [asdict(item) for item in items]}
+                    parsed.append(name)
+        
+        report = self._report_from_sections(current, source_url)
+        change_set = ChangeSet.compare(previous, current)
+        change_set.parsed_sections = parsed
+        change_set.reused_sections = reused
+        store.update(page_hash, current)
+        
+        logger.info(f"🔁 Incremental processing: parsed {len(parsed)}, reused {len(reused)} sections; "
+                    f"{change_set.summary()}")
+        return report, change_set
+
+    def section_fingerprints(self, document: ParsedDocument) -> Dict[str, str]:
+        """
+        Content hash of every section's extractor input.
+        
+        Text sections hash the context windows their parsers read around each
+        pair/ticker or below their header; tables hash their markup and the
+        heading that titles them.
+        """
+        lines = document.lines
+        symbol_lines = document.pattern_lines(self.symbol_matcher)
+        header_lines = document.pattern_lines(self.section_matcher)
+        
+        def window(index: Optional[int], before: int, after: int) -> Optional[str]:
+            if index is None:
+                return None
+            return '\n'.join(lines[max(0, index - before):min(len(lines), index + after)])
+        
+        def first(hits: Optional[List[int]]) -> Optional[int]:
+            return hits[0] if hits else None
+        
+        inputs: Dict[str, Any] = {
+            'forex': [window(first(symbol_lines.get(pair)), 1, 15) for pair in self.forex_pairs],
+            'stock_crypto': [window(self._stock_crypto_line(ticker, document), 2, 10)
+                             for ticker in self.stock_tickers],
+            'options': [window(first(symbol_lines.get(ticker)), 1, 20) for ticker in self.options_tickers]
+        }
+        for name, header in zip(('swing', 'day', 'earnings'), self.premium_sections):
+            inputs[name] = window(first(header_lines.get(header)), 0, 50)
+        
+        for i, table in enumerate(document.tables):
+            heading = table.find_previous_sibling(TABLE_HEADINGS)
+            inputs[f'table:{i}'] = [str(heading) if heading else None, str(table)]
+        
+        return {name: section_hash([self.PARSER_VERSION, name, parts]) for name, parts in inputs.items()}
+
+    def _extract_section(self, name: str, document: ParsedDocument) -> List:
+        """Run the extractor of a single section."""
+        if name.startswith('table:'):
+            index = int(name.split(':', 1)[1])
+            table_section = self._parse_table(index, document.tables[index], document)
+            return [table_section] if table_section else []
+        extractors = {
+            'forex': self._extract_forex_forecasts,
+            'stock_crypto': self._extract_stock_crypto_forecasts,
+            'options': self._extract_options_trades,
+            'swing': self._extract_swing_trades,
+            'day': self._extract_day_trades,
+            'earnings': self._extract_earnings_reports
+        }
+        return extractors[name](document)
+
+    def _report_from_sections(self, sections: Dict[str, SectionState],
+                              source_url: Optional[str] = None) -> StructuredFinancialReport:
+        """Rebuild a report from per-section item dictionaries."""
+        report = StructuredFinancialReport(source_url=source_url, timestamp=datetime.now())
+        for name, state in sections.items():
+            if name.startswith('table:'):
+                field_name, model_class = 'table_sections', TableSection
+            elif name in TEXT_SECTIONS:
+                field_name, model_class = TEXT_SECTIONS[name]
+            else:
+                continue
+            getattr(report, field_name).extend(model_class(**item) for item in state.get('items', []))
+        return report
+
+    def _extract_forex_forecasts(self, document: ParsedDocument) -> List[ForexForecast]:
         """Extract forex forecasts from content."""
         logger.info("🔍 Extracting forex forecasts...")
         forecasts = []
         
-        lines = text_content.split('\n')
-        
         for pair in self.forex_pairs:
-            forecast = self._parse_forex_pair(pair, lines, soup)
+            forecast = self._parse_forex_pair(pair, document)
             if forecast:
                 forecasts.append(forecast)
                 logger.info(f"✅ Extracted {pair}: {forecast.trade_type}")
         
         return forecasts
 
-    def _parse_forex_pair(self, pair: str, lines: List[str], soup: BeautifulSoup) -> Optional[ForexForecast]:
+    def _parse_forex_pair(self, pair: str, document: ParsedDocument) -> Optional[ForexForecast]:
         """Parse individual forex pair data."""
         try:
             # Find the pair in content
-            pair_line_index = None
-            for i, line in enumerate(lines):
-                if pair in line.upper():
-                    pair_line_index = i
-                    break
+            lines = document.lines
+            pair_lines = document.pattern_lines(self.symbol_matcher).get(pair)
+            pair_line_index = pair_lines[0] if pair_lines else None
             
             if pair_line_index is None:
                 return None
@@ -140,19 +282,19 @@ class FinancialAlertsProcessor:
                 
                 # Extract high
                 if 'HIGH:' in line_upper:
-                    high_match = re.search(r'HIGH:\s*([\d.]+)', line_upper)
+                    high_match = text_patterns.FOREX_HIGH.search(line_upper)
                     if high_match:
                         high = high_match.group(1)
                 
                 # Extract average
                 if 'AVERAGE:' in line_upper:
-                    avg_match = re.search(r'AVERAGE:\s*([\d.]+)', line_upper)
+                    avg_match = text_patterns.FOREX_AVERAGE.search(line_upper)
                     if avg_match:
                         average = avg_match.group(1)
                 
                 # Extract low
                 if 'LOW:' in line_upper:
-                    low_match = re.search(r'LOW:\s*([\d.]+)', line_upper)
+                    low_match = text_patterns.FOREX_LOW.search(line_upper)
                     if low_match:
                         low = low_match.group(1)
                 
@@ -160,24 +302,24 @@ class FinancialAlertsProcessor:
                 if '14 DAY' in line_upper or 'PIPS' in line_upper:
                     if any(x in line_upper for x in ['AVERAGE', 'PIPS']):
                         # Extract PIPS value or range
-                        pips_match = re.search(r'(\d+(?:\s*-\s*\d+)?)\s*PIPS', line_upper)
+                        pips_match = text_patterns.FOREX_PIPS.search(line_upper)
                         if pips_match:
                             fourteen_day_average = f"{pips_match.group(1)} PIPS"
                 
                 # Extract trade type (MT4 BUY/SELL)
                 if 'MT4' in line_upper:
                     if 'BUY' in line_upper:
-                        buy_match = re.search(r'MT4\s+BUY\s*[<>]\s*([\d.]+)', line_upper)
+                        buy_match = text_patterns.MT4_BUY.search(line_upper)
                         if buy_match:
                             trade_type = f"MT4 BUY < {buy_match.group(1)}"
                     elif 'SELL' in line_upper:
-                        sell_match = re.search(r'MT4\s+SELL\s*[<>]\s*([\d.]+)', line_upper)
+                        sell_match = text_patterns.MT4_SELL.search(line_upper)
                         if sell_match:
                             trade_type = f"MT4 SELL < {sell_match.group(1)}"
                 
                 # Extract exit level
                 if 'EXIT:' in line_upper:
-                    exit_match = re.search(r'EXIT:?\s*([\d.]+)', line_upper)
+                    exit_match = text_patterns.FOREX_EXIT.search(line_upper)
                     if exit_match:
                         exit_level = exit_match.group(1)
                 
@@ -211,31 +353,33 @@ class FinancialAlertsProcessor:
             logger.warning(f"Error parsing forex pair {pair}: {e}")
             return None
 
-    def _extract_stock_crypto_forecasts(self, soup: BeautifulSoup, text_content: str) -> List[StockCryptoForecast]:
+    def _extract_stock_crypto_forecasts(self, document: ParsedDocument) -> List[StockCryptoForecast]:
         """Extract stock & crypto forecasts from content."""
         logger.info("🔍 Extracting stock & crypto forecasts...")
         forecasts = []
         
         # Look for stock/crypto patterns in text
-        lines = text_content.split('\n')
-        
         for ticker in self.stock_tickers:
-            forecast = self._parse_stock_crypto(ticker, lines)
+            forecast = self._parse_stock_crypto(ticker, document)
             if forecast:
                 forecasts.append(forecast)
                 logger.info(f"✅ Extracted stock/crypto {ticker}: {forecast.direction}")
         
         return forecasts
 
-    def _parse_stock_crypto(self, ticker: str, lines: List[str]) -> Optional[StockCryptoForecast]:
+    def _stock_crypto_line(self, ticker: str, document: ParsedDocument) -> Optional[int]:
+        """First line mentioning ticker together with a trade direction."""
+        for i in document.pattern_lines(self.symbol_matcher).get(ticker, []):
+            if any(x in document.upper_lines[i] for x in ['BUY', 'SELL', 'LONG', 'SHORT']):
+                return i
+        return None
+
+    def _parse_stock_crypto(self, ticker: str, document: ParsedDocument) -> Optional[StockCryptoForecast]:
         """Parse individual stock/crypto data."""
         try:
             # Find ticker in content
-            ticker_line_index = None
-            for i, line in enumerate(lines):
-                if ticker in line.upper() and any(x in line.upper() for x in ['BUY', 'SELL', 'LONG', 'SHORT']):
-                    ticker_line_index = i
-                    break
+            lines = document.lines
+            ticker_line_index = self._stock_crypto_line(ticker, document)
             
             if ticker_line_index is None:
                 return None
@@ -262,19 +406,19 @@ class FinancialAlertsProcessor:
                 
                 # Extract entry price
                 if 'ENTRY' in line_upper:
-                    entry_match = re.search(r'ENTRY:?\s*\$?([\d.]+)', line_upper)
+                    entry_match = text_patterns.STOCK_ENTRY.search(line_upper)
                     if entry_match:
                         entry = entry_match.group(1)
                 
                 # Extract take profit
                 if 'TAKE PROFIT' in line_upper or 'TP' in line_upper:
-                    tp_match = re.search(r'(?:TAKE PROFIT|TP):?\s*\$?([\d.]+)', line_upper)
+                    tp_match = text_patterns.STOCK_TAKE_PROFIT.search(line_upper)
                     if tp_match:
                         take_profit = tp_match.group(1)
                 
                 # Extract stop loss
                 if 'STOP LOSS' in line_upper or 'SL' in line_upper:
-                    sl_match = re.search(r'(?:STOP LOSS|SL):?\s*\$?([\d.]+)', line_upper)
+                    sl_match = text_patterns.STOCK_STOP_LOSS.search(line_upper)
                     if sl_match:
                         stop_loss = sl_match.group(1)
                 
@@ -302,30 +446,26 @@ class FinancialAlertsProcessor:
             logger.warning(f"Error parsing stock/crypto {ticker}: {e}")
             return None
 
-    def _extract_options_trades(self, soup: BeautifulSoup, text_content: str) -> List[OptionsTrade]:
+    def _extract_options_trades(self, document: ParsedDocument) -> List[OptionsTrade]:
         """Extract options trades from content."""
         logger.info("🔍 Extracting options trades...")
         trades = []
         
-        lines = text_content.split('\n')
-        
         for ticker in self.options_tickers:
-            trade = self._parse_options_trade(ticker, lines)
+            trade = self._parse_options_trade(ticker, document)
             if trade:
                 trades.append(trade)
                 logger.info(f"✅ Extracted options {ticker}: CALL {trade.call_strike}, PUT {trade.put_strike}")
         
         return trades
 
-    def _parse_options_trade(self, ticker: str, lines: List[str]) -> Optional[OptionsTrade]:
+    def _parse_options_trade(self, ticker: str, document: ParsedDocument) -> Optional[OptionsTrade]:
         """Parse individual options trade data."""
         try:
             # Find ticker in content
-            ticker_line_index = None
-            for i, line in enumerate(lines):
-                if ticker in line.upper():
-                    ticker_line_index = i
-                    break
+            lines = document.lines
+            ticker_lines = document.pattern_lines(self.symbol_matcher).get(ticker)
+            ticker_line_index = ticker_lines[0] if ticker_lines else None
             
             if ticker_line_index is None:
                 return None
@@ -347,32 +487,32 @@ class FinancialAlertsProcessor:
                 
                 # Extract 52 week high
                 if '52 WEEK HIGH:' in line_upper:
-                    high_match = re.search(r'52 WEEK HIGH:\s*([\d.]+)', line_upper)
+                    high_match = text_patterns.WEEK_52_HIGH.search(line_upper)
                     if high_match:
                         fifty_two_week_high = high_match.group(1)
                 
                 # Extract 52 week low
                 if '52 WEEK LOW:' in line_upper:
-                    low_match = re.search(r'52 WEEK LOW:\s*([\d.]+)', line_upper)
+                    low_match = text_patterns.WEEK_52_LOW.search(line_upper)
                     if low_match:
                         fifty_two_week_low = low_match.group(1)
                 
                 # Extract strike prices - look for pattern "CALL > 352.42"
                 if 'CALL' in line_upper and '>' in line_upper:
-                    call_match = re.search(r'CALL\s*>\s*([\d.]+)', line_upper)
+                    call_match = text_patterns.CALL_STRIKE.search(line_upper)
                     if call_match:
                         call_strike = f"CALL > {call_match.group(1)}"
                 
                 if 'PUT' in line_upper and '<' in line_upper:
-                    put_match = re.search(r'PUT\s*<\s*([\d.]+)', line_upper)
+                    put_match = text_patterns.PUT_STRIKE.search(line_upper)
                     if put_match:
                         put_strike = f"PUT < {put_match.group(1)}"
                 
                 # Also check for combined strike price line
                 if 'STRIKE PRICE:' in line_upper:
                     # Look for both CALL and PUT in same line
-                    call_match = re.search(r'CALL\s*>\s*([\d.]+)', line_upper)
-                    put_match = re.search(r'PUT\s*<\s*([\d.]+)', line_upper)
+                    call_match = text_patterns.CALL_STRIKE.search(line_upper)
+                    put_match = text_patterns.PUT_STRIKE.search(line_upper)
                     
                     if call_match:
                         call_strike = f"CALL > {call_match.group(1)}"
@@ -407,32 +547,29 @@ class FinancialAlertsProcessor:
             logger.warning(f"Error parsing options trade {ticker}: {e}")
             return None
 
-    def _extract_swing_trades(self, soup: BeautifulSoup, text_content: str) -> List[SwingTrade]:
+    def _extract_swing_trades(self, document: ParsedDocument) -> List[SwingTrade]:
         """Extract premium swing trades from content."""
         logger.info("🔍 Extracting swing trades...")
-        return self._extract_premium_trades(text_content, "Premium Swing Trades", SwingTrade)
+        return self._extract_premium_trades(document, "Premium Swing Trades", SwingTrade)
 
-    def _extract_day_trades(self, soup: BeautifulSoup, text_content: str) -> List[DayTrade]:
+    def _extract_day_trades(self, document: ParsedDocument) -> List[DayTrade]:
         """Extract premium day trades from content."""
         logger.info("🔍 Extracting day trades...")
-        return self._extract_premium_trades(text_content, "Premium Day Trades", DayTrade)
+        return self._extract_premium_trades(document, "Premium Day Trades", DayTrade)
 
-    def _extract_earnings_reports(self, soup: BeautifulSoup, text_content: str) -> List[EarningsReport]:
+    def _extract_earnings_reports(self, document: ParsedDocument) -> List[EarningsReport]:
         """Extract earnings reports from content."""
         logger.info("🔍 Extracting earnings reports...")
-        return self._extract_premium_trades(text_content, "Most Anticipated Earnings Releases", EarningsReport)
+        return self._extract_premium_trades(document, "Most Anticipated Earnings Releases", EarningsReport)
 
-    def _extract_premium_trades(self, text_content: str, section_name: str, model_class) -> List:
+    def _extract_premium_trades(self, document: ParsedDocument, section_name: str, model_class) -> List:
         """Extract premium trades/earnings from specific section."""
         trades = []
-        lines = text_content.split('\n')
+        lines = document.lines
         
         # Find the section
-        section_start = None
-        for i, line in enumerate(lines):
-            if section_name in line:
-                section_start = i
-                break
+        header_lines = document.pattern_lines(self.section_matcher).get(section_name)
+        section_start = header_lines[0] if header_lines else None
         
         if section_start is None:
             return trades
@@ -446,7 +583,7 @@ class FinancialAlertsProcessor:
             line = section_lines[i].strip()
             
             # Look for company pattern: "Company Name (TICKER)"
-            company_match = re.match(r'^(.+?)\s*\(([A-Z]+)\)$', line)
+            company_match = text_patterns.COMPANY_WITH_TICKER.match(line)
             
             if company_match:
                 company_name = company_match.group(1).strip()
@@ -491,54 +628,61 @@ class FinancialAlertsProcessor:
         
         return trades
 
-    def _extract_table_sections(self, soup: BeautifulSoup) -> List[TableSection]:
+    def _extract_table_sections(self, document: ParsedDocument) -> List[TableSection]:
         """Extract table sections from HTML."""
         logger.info("🔍 Extracting table sections...")
         table_sections = []
         
         # Find all tables
-        tables = soup.find_all('table')
+        tables = document.tables
         
         for i, table in enumerate(tables):
-            try:
-                # Extract table title (look for heading before table)
-                title = f"Table {i + 1}"
-                
-                # Look for preceding heading
-                prev_sibling = table.find_previous_sibling(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                if prev_sibling:
-                    title = prev_sibling.get_text().strip()
-                
-                # Extract headers
-                headers = []
-                header_row = table.find('tr')
-                if header_row:
-                    for th in header_row.find_all(['th', 'td']):
-                        headers.append(th.get_text().strip())
-                
-                # Extract data rows
-                rows = []
-                for row in table.find_all('tr')[1:]:  # Skip header row
-                    row_data = []
-                    for cell in row.find_all(['td', 'th']):
-                        row_data.append(cell.get_text().strip())
-                    if row_data:
-                        rows.append(row_data)
-                
-                if headers and rows:
-                    table_section = TableSection(
-                        title=title,
-                        headers=headers,
-                        rows=rows
-                    )
-                    table_sections.append(table_section)
-                    logger.info(f"✅ Extracted table: {title} ({len(rows)} rows)")
-                    
-            except Exception as e:
-                logger.warning(f"Error processing table {i}: {e}")
+            table_section = self._parse_table(i, table, document)
+            if table_section:
+                table_sections.append(table_section)
         
         return table_sections
 
+    def _parse_table(self, index: int, table: Tag, document: ParsedDocument) -> Optional[TableSection]:
+        """Parse one table into a TableSection (None if it has no header or data rows)."""
+        try:
+            # Extract table title (look for heading before table)
+            title = f"Table {index + 1}"
+            
+            # Look for preceding heading
+            prev_sibling = table.find_previous_sibling(TABLE_HEADINGS)
+            if prev_sibling:
+                title = prev_sibling.get_text().strip()
+            
+            # Extract headers
+            headers = []
+            table_rows = document.rows(table)
+            if table_rows:
+                for th in document.cells(table_rows[0]):
+                    headers.append(th.get_text().strip())
+            
+            # Extract data rows
+            rows = []
+            for row in table_rows[1:]:  # Skip header row
+                row_data = []
+                for cell in document.cells(row):
+                    row_data.append(cell.get_text().strip())
+                if row_data:
+                    rows.append(row_data)
+            
+            if headers and rows:
+                logger.info(f"✅ Extracted table: {title} ({len(rows)} rows)")
+                return TableSection(
+                    title=title,
+                    headers=headers,
+                    rows=rows
+                )
+                
+        except Exception as e:
+            logger.warning(f"Error processing table {index}: {e}")
+        
+        return None
+
     def validate_report(self, report: StructuredFinancialReport) -> Tuple[bool, List[str]]:
         """
         Validate the generated report for completeness and accuracy.
@@ -0,0 +1,194 @@
+"""
+Incremental processing state for scraped pages.
+Keeps a content hash and the parsed items of every report section (forex,
+options, swing, day, earnings, each table) between scrapes, so unchanged
+sections are rebuilt from the previous run instead of being parsed again, and
+describes what changed as a structured change set.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Section state: {'hash': str, 'items': [dict, ...]}
+SectionState = Dict[str, Any]
+
+
+def section_hash(parts: Any) -> str:
+    """Stable digest of a section's inputs (any JSON-serializable value)"""
+    payload = json.dumps(parts, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass
+class SectionChange:
+    """How one section differs from the previous scrape"""
+    section: str
+    status: str                                     # 'added', 'changed', 'removed' or 'unchanged'
+    previous_hash: Optional[str] = None
+    current_hash: Optional[str] = None
+    added_items: List[Dict[str, Any]] = field(default_factory=list)    # new or modified items
+    removed_items: List[Dict[str, Any]] = field(default_factory=list)  # items no longer present
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'section': self.section,
+            'status': self.status,
+            'previous_hash': self.previous_hash,
+            'current_hash': self.current_hash,
+            'added_items': self.added_items,
+            'removed_items': self.removed_items
+        }
+
+
+@dataclass
+class ChangeSet:
+    """Per-section differences between two scrapes"""
+    changes: Dict[str, SectionChange] = field(default_factory=dict)
+    parsed_sections: List[str] = field(default_factory=list)
+    reused_sections: List[str] = field(default_factory=list)
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def compare(cls, previous: Dict[str, SectionState],
+                current: Dict[str, SectionState]) -> 'ChangeSet':
+        """
+        Diff two section state maps
+
+        A section counts as changed only when its items differ; a new hash
+        that parses to the same items (e.g. whitespace edits) is unchanged.
+        """
+        change_set = cls()
+        for name in list(current) + [name for name in previous if name not in current]:
+            before = previous.get(name) or {}
+            after = current.get(name) or {}
+            old_items = before.get('items', [])
+            new_items = after.get('items', [])
+
+            added = [item for item in new_items if item not in old_items]
+            removed = [item for item in old_items if item not in new_items]
+            if not added and not removed:
+                status = 'unchanged'
+            elif not old_items:
+                status = 'added'
+            elif not new_items:
+                status = 'removed'
+            else:
+                status = 'changed'
+
+            change_set.changes[name] = SectionChange(
+                section=name,
+                status=status,
+                previous_hash=before.get('hash'),
+                current_hash=after.get('hash'),
+                added_items=added,
+                removed_items=removed
+            )
+        return change_set
+
+    @property
+    def changed_sections(self) -> List[str]:
+        """Names of sections whose items changed"""
+        return [name for name, change in self.changes.items() if change.status != 'unchanged']
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changed_sections)
+
+    def summary(self) -> str:
+        """One-line description, e.g. 'forex changed (+1/-1), table:2 added (+1)'"""
+        parts = []
+        for name in self.changed_sections:
+            change = self.changes[name]
+            counts = [f"+{len(change.added_items)}"] if change.added_items else []
+            if change.removed_items:
+                counts.append(f"-{len(change.removed_items)}")
+            parts.append(f"{name} {change.status} ({'/'.join(counts)})")
+        return ', '.join(parts) if parts else 'no changes'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Changed sections with their item diffs, for JSON output and senders"""
+        return {
+            'timestamp': self.timestamp.isoformat(),
+            'has_changes': self.has_changes,
+            'changed_sections': self.changed_sections,
+            'parsed_sections': self.parsed_sections,
+            'reused_sections': self.reused_sections,
+            'sections': {name: self.changes[name].to_dict() for name in self.changed_sections}
+        }
+
+
+class SectionHashStore:
+    """
+    Persistent section hashes and parsed items of the last processed page
+
+    The file is rewritten atomically after each update; an unreadable file is
+    treated as empty (fail open: a lost store means one full re-parse and
+    every section reported as added, never a missed change).
+    """
+
+    def __init__(self, state_file: Union[str, Path]):
+        """
+        Args:
+            state_file: JSON file holding the section state
+        """
+        self.state_file = Path(state_file)
+        self.page_hash: Optional[str] = None
+        self.sections: Dict[str, SectionState] = {}
+        self.updated_at: Optional[str] = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Load the previous run's state from disk"""
+        try:
+            if self.state_file.exists():
+                with open(self.state_file, 'r') as f:
+                    data = json.load(f)
+                self.page_hash = data.get('page_hash')
+                self.sections = dict(data.get('sections', {}))
+                self.updated_at = data.get('updated_at')
+                logger.debug(f"Loaded {len(self.sections)} section hashes from {self.state_file}")
+        except Exception as e:
+            logger.error(f"Failed to load section hashes: {e}")
+            self.page_hash = None
+            self.sections = {}
+
+    def _save(self):
+        """Write state atomically so a crash never leaves a truncated file"""
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    'page_hash': self.page_hash,
+                    'updated_at': self.updated_at,
+                    'sections': self.sections
+                }, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.state_file)
+        except Exception as e:
+            logger.error(f"Failed to save section hashes: {e}")
+
+    def get(self, section: str) -> Optional[SectionState]:
+        """Stored state of a section, or None"""
+        return self.sections.get(section)
+
+    def update(self, page_hash: Optional[str], sections: Dict[str, SectionState]):
+        """Replace the stored state with the current page's sections"""
+        with self._lock:
+            self.page_hash = page_hash
+            self.sections = dict(sections)
+            self.updated_at = datetime.now().isoformat()
+            self._save()
+
+    def clear(self):
+        """Forget all state, forcing a full parse on the next run"""
+        self.update(None, {})
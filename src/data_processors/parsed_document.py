@@ -0,0 +1,167 @@
+"""
+Parsed document shared by the HTML parsers.
+Parses a scraped page once and keeps indexes (tables, rows, text lines,
+currency pair mentions) that every parser would otherwise rebuild.
+"""
+
+import importlib.util
+import logging
+import re
+from functools import cached_property
+from typing import Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup, Tag
+
+from ..utils.pattern_matcher import MultiPatternMatcher
+
+logger = logging.getLogger(__name__)
+
+# lxml is several times faster than the pure-Python parser on the daily page
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Every 6-letter window (EURUSD) and slash form (EUR/USD) in upper-cased text;
+# zero-width lookaheads so overlapping windows are all reported
+_PAIR_WINDOW = re.compile(r'(?=([A-Z]{6}|[A-Z]{3}/[A-Z]{3}))')
+_PAIR_TOKEN = re.compile(r'[A-Z]{6}|[A-Z]{3}/[A-Z]{3}')
+
+
+class ParsedDocument:
+    """
+    A scraped HTML page parsed once (on first use), with lazily built indexes.
+
+    Pass it wherever a parser accepts HTML; `ParsedDocument.coerce()` turns raw
+    HTML into a document and returns existing documents unchanged.
+    """
+
+    def __init__(self, html_content: str, text_content: Optional[str] = None,
+                 parser: Optional[str] = None):
+        """
+        Args:
+            html_content: Raw HTML of the page
+            text_content: Rendered text (e.g. Playwright inner_text); defaults to the soup's text
+            parser: BeautifulSoup parser backend (default: lxml when installed)
+        """
+        self.html_content = html_content or ''
+        self._text_content = text_content
+        self.parser = parser or HTML_PARSER
+        self._rows: Dict[int, List[Tag]] = {}
+        self._cells: Dict[int, List[Tag]] = {}
+        self._line_indices: Dict[tuple, List[int]] = {}
+        self._pattern_lines: Dict[int, tuple] = {}
+
+    @classmethod
+    def coerce(cls, content: Union[str, 'ParsedDocument'],
+               text_content: Optional[str] = None) -> 'ParsedDocument':
+        """Return content as a ParsedDocument, parsing it only if needed."""
+        if isinstance(content, ParsedDocument):
+            if text_content is not None and content._text_content is None:
+                content._text_content = text_content
+                for name in ('text', 'lines', 'upper_lines', 'pair_mentions'):
+                    content.__dict__.pop(name, None)
+                content._line_indices.clear()
+                content._pattern_lines.clear()
+            return content
+        return cls(content, text_content)
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """The parsed HTML, built on first access."""
+        return BeautifulSoup(self.html_content, self.parser)
+
+    # Text indexes
+
+    @cached_property
+    def soup_text(self) -> str:
+        """Text of the parsed HTML (soup.get_text())."""
+        return self.soup.get_text()
+
+    @cached_property
+    def text(self) -> str:
+        """Rendered text when provided, otherwise the parsed HTML's text."""
+        return self._text_content if self._text_content is not None else self.soup_text
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Text split into lines."""
+        return self.text.split('\n')
+
+    @cached_property
+    def upper_lines(self) -> List[str]:
+        """Upper-cased lines, for case-insensitive lookups."""
+        return [line.upper() for line in self.lines]
+
+    @cached_property
+    def pair_mentions(self) -> Dict[str, List[int]]:
+        """
+        Line indices of every currency pair mention, keyed as written.
+
+        Both 'EURUSD' and 'EUR/USD' forms are indexed, so `pair in line.upper()`
+        becomes a dictionary lookup.
+        """
+        mentions: Dict[str, List[int]] = {}
+        for i, line in enumerate(self.upper_lines):
+            for window in set(_PAIR_WINDOW.findall(line)):
+                mentions.setdefault(window, []).append(i)
+        return mentions
+
+    def line_indices(self, needle: str, case_sensitive: bool = False) -> List[int]:
+        """Indices of all lines containing needle (memoized)."""
+        key = (needle, case_sensitive)
+        if key not in self._line_indices:
+            if not case_sensitive and _PAIR_TOKEN.fullmatch(needle.upper()):
+                self._line_indices[key] = list(self.pair_mentions.get(needle.upper(), []))
+            elif case_sensitive:
+                self._line_indices[key] = [i for i, line in enumerate(self.lines) if needle in line]
+            else:
+                upper = needle.upper()
+                self._line_indices[key] = [i for i, line in enumerate(self.upper_lines) if upper in line]
+        return self._line_indices[key]
+
+    def pattern_lines(self, matcher: MultiPatternMatcher) -> Dict[str, List[int]]:
+        """
+        Line indices of every pattern of a matcher, from one pass over the text.
+
+        Memoized per matcher, so extractors sharing a matcher scan the text once.
+        """
+        cached = self._pattern_lines.get(id(matcher))
+        if cached is None or cached[0] is not matcher:
+            cached = (matcher, matcher.line_hits(self.text))
+            self._pattern_lines[id(matcher)] = cached
+        return cached[1]
+
+    def find_line(self, needle: str, case_sensitive: bool = False) -> Optional[int]:
+        """Index of the first line containing needle, or None."""
+        indices = self.line_indices(needle, case_sensitive)
+        return indices[0] if indices else None
+
+    # Table indexes
+
+    @cached_property
+    def tables(self) -> List[Tag]:
+        """All table elements in document order."""
+        return self.soup.find_all('table')
+
+    def rows(self, table: Tag) -> List[Tag]:
+        """All tr elements of a table (memoized)."""
+        key = id(table)
+        if key not in self._rows:
+            self._rows[key] = table.find_all('tr')
+        return self._rows[key]
+
+    def cells(self, row: Tag) -> List[Tag]:
+        """All td/th elements of a row (memoized)."""
+        key = id(row)
+        if key not in self._cells:
+            self._cells[key] = row.find_all(['td', 'th'])
+        return self._cells[key]
+
+    def header_texts(self, table: Tag) -> List[str]:
+        """Lower-cased, stripped texts of a table's first row."""
+        rows = self.rows(table)
+        return [cell.get_text(strip=True).lower() for cell in self.cells(rows[0])] if rows else []
+
+    def select(self, selector: str) -> List[Tag]:
+        """CSS select on the parsed document; 'table' is served from the index."""
+        if selector == 'table':
+            return self.tables
+        return self.soup.select(selector)
@@ -2,8 +2,6 @@
 Economic analysis for currency fundamental strength assessment
 Processes FRED data, economic indicators, and calendar events
 """
-import numpy as np
-import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -11,6 +9,9 @@ import logging
 
 from src.core.config import settings
 from .data_fetcher import data_fetcher
+from .utils.lazy import LazySingleton, lazy_import
+
+np = lazy_import('numpy')
 
 logger = logging.getLogger(__name__)
 
@@ -576,4 +577,4 @@ class EconomicAnalyzer:
             return {'events': [], 'impact_score': 0.0}
 
 # Global economic analyzer instance
-economic_analyzer = EconomicAnalyzer()
\ No newline at end of file
+economic_analyzer = LazySingleton(EconomicAnalyzer, 'economic_analyzer')
\ No newline at end of file
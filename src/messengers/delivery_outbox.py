@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Delivery Outbox
+Records which (report, platform, chunk) deliveries were acknowledged so that retries
+and reruns resend only the chunks that are still missing
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers in one process are still serialised per file
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTBOX_FILE = Path(__file__).parent.parent.parent / 'logs' / 'delivery_outbox.json'
+
+
+def content_report_id(content: Union[str, bytes]) -> str:
+    """Stable digest of message (or file) content"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+def idempotency_key(report_id: str, platform: str, chunk: Union[int, str] = 0,
+                    digest: Optional[str] = None) -> str:
+    """
+    Idempotency key for one deliverable unit
+
+    Args:
+        report_id: Caller-chosen report identity (e.g. 'daily-report-2025-08-18')
+        platform: Messaging platform name
+        chunk: Chunk index for split text, or a label such as 'attachment:heatmap.png'
+        digest: Digest of the full content (see content_report_id); a corrected
+                report under the same report_id gets new keys and is sent in full
+    """
+    key = f"{report_id}:{platform.lower()}:{chunk}"
+    return f"{key}@{digest}" if digest else key
+
+
+_path_locks: Dict[Path, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def _path_lock(path: Path) -> threading.Lock:
+    """Process-wide lock per outbox file, shared by every instance using it"""
+    with _path_locks_guard:
+        return _path_locks.setdefault(path.resolve(), threading.Lock())
+
+
+@dataclass
+class OutboxEntry:
+    """Acknowledgement or last failure for a single idempotency key"""
+    key: str
+    status: str                         # 'acked' or 'failed'
+    updated_at: str
+    attempts: int = 0
+    message_id: Optional[str] = None
+    digest: Optional[str] = None        # sha256 prefix of the delivered chunk, for diagnostics
+    error: Optional[str] = None
+
+
+class DeliveryOutbox:
+    """
+    Persistent record of acknowledged deliveries
+
+    Entries expire after `ttl_hours`, so a report id can be reused the next day
+    and the file never grows unbounded. Every update re-reads the file under an
+    exclusive lock and rewrites it atomically, so several outboxes (instances or
+    processes) sharing one file never drop each other's acknowledgements. An
+    unreadable file is treated as empty (fail open: a lost outbox can cause a
+    duplicate, never a missed report).
+    """
+
+    ACKED = 'acked'
+    FAILED = 'failed'
+
+    def __init__(self, outbox_file: Union[str, Path] = DEFAULT_OUTBOX_FILE, ttl_hours: float = 24.0):
+        """
+        Args:
+            outbox_file: JSON file holding the outbox entries
+            ttl_hours: How long acknowledgements suppress resends
+        """
+        self.outbox_file = Path(outbox_file)
+        self.ttl = timedelta(hours=ttl_hours)
+        self._entries: Dict[str, OutboxEntry] = {}
+        self._lock = _path_lock(self.outbox_file)
+        self._load()
+
+    def _read_file(self) -> Optional[Dict[str, OutboxEntry]]:
+        """Entries currently on disk; {} if there is no file, None if it cannot be read"""
+        try:
+            if not self.outbox_file.exists():
+                return {}
+            with open(self.outbox_file, 'r') as f:
+                data = json.load(f)
+            return {key: OutboxEntry(**entry) for key, entry in data.get('entries', {}).items()}
+        except Exception as e:
+            logger.error(f"Failed to load delivery outbox: {e}")
+            return None
+
+    def _load(self):
+        """Load unexpired entries from disk"""
+        self._entries = self._read_file() or {}
+        self._prune()
+        logger.debug(f"Loaded {len(self._entries)} outbox entries from {self.outbox_file}")
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock on <outbox>.lock, held across the read-modify-write of an update"""
+        try:
+            self.outbox_file.parent.mkdir(parents=True, exist_ok=True)
+            lock_file = open(self.outbox_file.with_suffix('.lock'), 'a')
+        except OSError as e:
+            logger.error(f"Failed to lock delivery outbox: {e}")
+            yield
+            return
+        # Closing the file releases the lock
+        with lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    @contextmanager
+    def _update(self):
+        """
+        Serialise an update with every other writer of the outbox file
+
+        The in-memory entries are refreshed from disk first, so the change is
+        applied on top of whatever other outboxes acknowledged in the meantime.
+        """
+        with self._lock, self._file_lock():
+            current = self._read_file()
+            if current is not None:
+                self._entries = current
+                self._prune()
+            yield
+
+    def _save(self):
+        """Write entries atomically so a crash never leaves a truncated file"""
+        tmp_name = None
+        try:
+            self.outbox_file.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp file: a fixed name would be clobbered by a concurrent writer
+            fd, tmp_name = tempfile.mkstemp(dir=self.outbox_file.parent,
+                                            prefix=f".{self.outbox_file.name}.", suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'entries': {k: asdict(v) for k, v in self._entries.items()}}, f, indent=2)
+            os.replace(tmp_name, self.outbox_file)
+            tmp_name = None
+        except Exception as e:
+            logger.error(f"Failed to save delivery outbox: {e}")
+        finally:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def _prune(self) -> int:
+        """Drop expired entries, returning how many were removed"""
+        cutoff = datetime.now() - self.ttl
+        expired = [k for k, v in self._entries.items() if datetime.fromisoformat(v.updated_at) < cutoff]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def is_acknowledged(self, key: str) -> bool:
+        """True if the key was delivered within the TTL"""
+        entry = self._entries.get(key)
+        if entry is None or entry.status != self.ACKED:
+            return False
+        return datetime.fromisoformat(entry.updated_at) >= datetime.now() - self.ttl
+
+    def acknowledge(self, key: str, message_id: Optional[str] = None, content: Optional[str] = None):
+        """Record a confirmed delivery"""
+        with self._update():
+            previous = self._entries.get(key)
+            self._entries[key] = OutboxEntry(
+                key=key,
+                status=self.ACKED,
+                updated_at=datetime.now().isoformat(),
+                attempts=(previous.attempts if previous else 0) + 1,
+                message_id=message_id,
+                digest=content_report_id(content) if content is not None else None
+            )
+            self._save()
+
+    def record_failure(self, key: str, error: Optional[str] = None):
+        """Record a failed attempt; never overwrites an acknowledgement"""
+        with self._update():
+            previous = self._entries.get(key)
+            if previous and previous.status == self.ACKED:
+                return
+            self._entries[key] = OutboxEntry(
+                key=key,
+                status=self.FAILED,
+                updated_at=datetime.now().isoformat(),
+                attempts=(previous.attempts if previous else 0) + 1,
+                error=error
+            )
+            self._save()
+
+    def pending_keys(self, keys: List[str]) -> List[str]:
+        """Subset of keys that still need delivery, in order"""
+        return [key for key in keys if not self.is_acknowledged(key)]
+
+    def forget(self, report_id: str) -> int:
+        """Drop every entry of a report so it can be sent again deliberately"""
+        with self._update():
+            keys = [k for k in self._entries if k.startswith(f"{report_id}:")]
+            for key in keys:
+                del self._entries[key]
+            if keys:
+                self._save()
+            return len(keys)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Outbox statistics"""
+        acked = sum(1 for e in self._entries.values() if e.status == self.ACKED)
+        return {
+            'entries': len(self._entries),
+            'acked': acked,
+            'failed': len(self._entries) - acked,
+            'outbox_file': str(self.outbox_file)
+        }
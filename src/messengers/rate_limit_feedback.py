@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Rate Limit Feedback
+Parses server-provided retry hints (Telegram retry_after, HTTP Retry-After) and feeds
+them into a per-chat adaptive limiter that learns the sustainable send rate
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]] = None,
+                      body: Optional[Dict[str, Any]] = None) -> Optional[float]:
+    """
+    Extract the server-requested wait from a throttled response
+
+    Telegram puts it in the JSON body as parameters.retry_after; other APIs send
+    a Retry-After header holding either delta-seconds or an HTTP date.
+
+    Args:
+        headers: Response headers (case-insensitive mapping preferred)
+        body: Decoded JSON body, if any
+
+    Returns:
+        Seconds to wait, or None when the response carries no hint
+    """
+    if isinstance(body, dict):
+        parameters = body.get('parameters')
+        if isinstance(parameters, dict) and parameters.get('retry_after') is not None:
+            try:
+                return max(0.0, float(parameters['retry_after']))
+            except (TypeError, ValueError):
+                pass
+
+    if headers:
+        value = headers.get('Retry-After') or headers.get('retry-after')
+        if value:
+            value = value.strip()
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(value)
+                    if retry_at.tzinfo is None:
+                        retry_at = retry_at.replace(tzinfo=timezone.utc)
+                    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+                except (TypeError, ValueError):
+                    logger.debug(f"Unparseable Retry-After header: {value}")
+
+    return None
+
+
+def retry_after_from_response(response) -> Optional[float]:
+    """Extract retry_after from an httpx/requests style response object"""
+    try:
+        body = response.json()
+    except Exception:
+        body = None
+    return parse_retry_after(getattr(response, 'headers', None), body)
+
+
+@dataclass
+class ChatRateState:
+    """Learned pacing for a single chat/group"""
+    interval: float                 # Current minimum spacing between sends (seconds)
+    next_allowed: float = 0.0       # Monotonic time before which no send may start
+    successes: int = 0
+    throttles: int = 0
+    last_retry_after: Optional[float] = None
+    blocked_until: float = 0.0      # Monotonic end of the server's retry_after window
+    resume_interval: Optional[float] = None  # Pace to return to once that window has passed
+
+    @property
+    def rate_per_minute(self) -> float:
+        return 60.0 / self.interval if self.interval > 0 else float('inf')
+
+
+class AdaptiveRateLimiter:
+    """
+    Per-chat AIMD send pacer
+
+    Every throttle response blocks the chat for the server's retry_after and
+    multiplies the send interval; every success shrinks it again. Once the
+    retry_after window has passed the next send resumes one step slower than
+    the pace that drew the 429, rather than decaying from the backed-off
+    interval, so a single throttle costs the window and not the next few dozen
+    sends. Over a busy morning the interval settles just below the point where
+    the server starts answering 429, which is the maximum sustainable rate.
+    """
+
+    THROTTLE_FLOOR = 0.5
+
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 60.0,
+                 increase_factor: float = 2.0, decrease_factor: float = 0.9,
+                 default_retry_after: float = 5.0):
+        """
+        Args:
+            min_interval: Fastest allowed spacing between sends to one chat
+            max_interval: Slowest spacing the limiter will back off to
+            increase_factor: Interval multiplier applied on each throttle
+            decrease_factor: Interval multiplier applied on each success
+            default_retry_after: Block time used when the server gives no hint
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.increase_factor = increase_factor
+        self.decrease_factor = decrease_factor
+        self.default_retry_after = default_retry_after
+        self._states: Dict[str, ChatRateState] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _state(self, key: str) -> ChatRateState:
+        state = self._states.get(key)
+        if state is None:
+            state = ChatRateState(interval=self.min_interval)
+            self._states[key] = state
+        return state
+
+    async def acquire(self, key: str, slots: int = 1) -> float:
+        """
+        Wait until a send to `key` is allowed and reserve the slot
+
+        Args:
+            key: Chat/group identifier
+            slots: Messages going out in this send; a batched request reserves
+                one interval per message so the chat's pace is kept
+
+        Returns:
+            Seconds spent waiting
+        """
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            state = self._state(key)
+            delay = state.next_allowed - time.monotonic()
+            if delay > 0:
+                logger.info(f"Rate limiting {key}: waiting {delay:.1f}s")
+                await asyncio.sleep(delay)
+            else:
+                delay = 0.0
+            if state.resume_interval is not None and time.monotonic() >= state.blocked_until:
+                # The server's window has passed: resume the pace from before the 429
+                state.interval = max(self.min_interval, min(state.interval, state.resume_interval))
+                state.resume_interval = None
+            state.next_allowed = time.monotonic() + state.interval * max(1, slots)
+            return delay
+
+    def on_success(self, key: str):
+        """Record a delivered message and speed up towards min_interval"""
+        state = self._state(key)
+        state.successes += 1
+        state.interval = max(self.min_interval, state.interval * self.decrease_factor)
+
+    def on_throttle(self, key: str, retry_after: Optional[float] = None) -> float:
+        """
+        Record a throttle response
+
+        Args:
+            key: Chat/group identifier
+            retry_after: Server-requested wait in seconds, if provided
+
+        Returns:
+            Seconds the chat is now blocked for
+        """
+        state = self._state(key)
+        state.throttles += 1
+        state.last_retry_after = retry_after
+        wait = retry_after if retry_after is not None else self.default_retry_after
+        if state.resume_interval is None:
+            # Undo one success step: the pace that drew this 429 was just too fast
+            state.resume_interval = state.interval / self.decrease_factor
+        # Floor keeps the multiplicative increase meaningful when min_interval is 0
+        state.interval = min(self.max_interval,
+                             max(self.min_interval, state.interval, self.THROTTLE_FLOOR) * self.increase_factor)
+        state.blocked_until = max(state.blocked_until, time.monotonic() + wait)
+        state.next_allowed = max(state.next_allowed, state.blocked_until)
+        logger.warning(
+            f"Throttled on {key}: blocking {wait:.1f}s, pacing now {state.interval:.2f}s between sends"
+        )
+        return wait
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-chat pacing statistics"""
+        return {
+            key: {
+                'interval': round(state.interval, 3),
+                'rate_per_minute': round(state.rate_per_minute, 2),
+                'successes': state.successes,
+                'throttles': state.throttles,
+                'last_retry_after': state.last_retry_after
+            }
+            for key, state in self._states.items()
+        }
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Signal JSON-RPC Client
+Talks to a signal-cli daemon (`signal-cli daemon --http`) over its JSON-RPC endpoint.
+The daemon keeps one JVM warm, so sends skip the per-call JVM startup that makes
+signal-cli-rest-api slow in `normal` mode, and several sends share one request
+"""
+
+import base64
+import itertools
+import logging
+import mimetypes
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RPC_PATH = '/api/v1/rpc'
+RATE_LIMIT_ERROR_CODE = -5          # signal-cli's RATELIMIT_ERROR
+RATE_LIMIT_FAILURE = 'RATE_LIMIT_FAILURE'
+IDENTITY_FAILURE = 'IDENTITY_FAILURE'
+
+
+class SignalJsonRpcError(Exception):
+    """JSON-RPC endpoint unreachable or not speaking JSON-RPC"""
+    pass
+
+
+def rest_group_to_rpc_target(recipient: str) -> Dict[str, Any]:
+    """
+    Convert a signal-cli-rest-api recipient into JSON-RPC send parameters
+
+    The REST API addresses groups as 'group.' + base64(internal group id);
+    signal-cli itself expects the internal id. Phone numbers/UUIDs pass through.
+    """
+    recipient = str(recipient).strip('"\'')
+    if recipient.startswith('group.'):
+        try:
+            return {'groupId': base64.b64decode(recipient[len('group.'):]).decode('utf-8')}
+        except (ValueError, UnicodeDecodeError):
+            logger.warning(f"Could not decode REST group id {recipient}, passing it through")
+            return {'groupId': recipient[len('group.'):]}
+    if recipient.startswith('+') or '-' in recipient:
+        return {'recipient': [recipient]}
+    return {'groupId': recipient}
+
+
+def attachment_data_uri(file_path: Path) -> str:
+    """Inline an attachment the way signal-cli accepts it over JSON-RPC"""
+    content_type = mimetypes.guess_type(str(file_path))[0] or 'application/octet-stream'
+    data = base64.b64encode(Path(file_path).read_bytes()).decode('ascii')
+    return f"data:{content_type};filename={Path(file_path).name};base64,{data}"
+
+
+class SignalJsonRpcClient:
+    """
+    Minimal JSON-RPC 2.0 client for signal-cli's `send`, `trust` and `version` methods
+
+    Requests are sent as one JSON-RPC batch over a keep-alive HTTP connection;
+    results come back in request order with either a result or an error per item.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, rpc_path: str = DEFAULT_RPC_PATH):
+        """
+        Args:
+            client: HTTP client whose base URL points at the signal-cli daemon
+            rpc_path: JSON-RPC endpoint path on that client
+        """
+        self.client = client
+        self.rpc_path = rpc_path
+        self._ids = itertools.count(1)
+
+    async def call_batch(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute several JSON-RPC calls in one HTTP request
+
+        Args:
+            calls: [{'method': ..., 'params': {...}}, ...]
+
+        Returns:
+            One response object per call, in call order ({'result': ...} or {'error': ...})
+
+        Raises:
+            SignalJsonRpcError: Endpoint missing, unreachable or malformed response
+        """
+        requests = [
+            {'jsonrpc': '2.0', 'id': next(self._ids), 'method': call['method'], 'params': call.get('params', {})}
+            for call in calls
+        ]
+        try:
+            response = await self.client.post(self.rpc_path, json=requests)
+        except httpx.HTTPError as e:
+            raise SignalJsonRpcError(f"JSON-RPC endpoint unreachable: {e}") from e
+
+        if response.status_code != 200:
+            raise SignalJsonRpcError(f"JSON-RPC endpoint returned HTTP {response.status_code}")
+
+        try:
+            body = response.json()
+        except ValueError as e:
+            raise SignalJsonRpcError("JSON-RPC endpoint returned non-JSON body") from e
+
+        if isinstance(body, dict):
+            body = [body]
+        if not isinstance(body, list):
+            raise SignalJsonRpcError("Unexpected JSON-RPC response shape")
+
+        by_id = {item.get('id'): item for item in body if isinstance(item, dict)}
+        return [by_id.get(request['id'], {'error': {'message': 'No response for request'}}) for request in requests]
+
+    async def version(self) -> Optional[str]:
+        """Probe the daemon; returns its version string"""
+        response = (await self.call_batch([{'method': 'version'}]))[0]
+        if 'error' in response:
+            raise SignalJsonRpcError(f"version call failed: {response['error']}")
+        result = response.get('result') or {}
+        return result.get('version') if isinstance(result, dict) else str(result)
+
+    @staticmethod
+    def send_call(account: str, recipient: str, message: str,
+                  attachments: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Build one `send` call for call_batch()"""
+        params = {'account': str(account).strip('"\''), 'message': message}
+        params.update(rest_group_to_rpc_target(recipient))
+        if attachments:
+            params['attachments'] = attachments
+        return {'method': 'send', 'params': params}
+
+    @staticmethod
+    def trust_call(account: str, recipient: str) -> Dict[str, Any]:
+        """Build one `trust` call accepting every known key of a recipient"""
+        return {'method': 'trust', 'params': {'account': str(account).strip('"\''),
+                                              'recipient': recipient, 'trustAllKnownKeys': True}}
+
+    @staticmethod
+    def failed_recipients(response: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Recipients a `send` did not reach, mapped to their failure type
+
+        Only meaningful when the call itself succeeded; everyone else received
+        the message and must not get it again.
+        """
+        failed = {}
+        for result in (response.get('result') or {}).get('results', []):
+            if result.get('type', 'SUCCESS') == 'SUCCESS':
+                continue
+            address = result.get('recipientAddress') or {}
+            recipient = address.get('number') or address.get('uuid')
+            if recipient:
+                failed[recipient] = result['type']
+        return failed
+
+    @staticmethod
+    def rate_limited(response: Dict[str, Any]) -> bool:
+        """Whether signal-cli refused a `send` because of Signal's rate limit"""
+        error = response.get('error')
+        if isinstance(error, dict):
+            return error.get('code') == RATE_LIMIT_ERROR_CODE or 'rate limit' in str(error.get('message', '')).lower()
+        results = (response.get('result') or {}).get('results', [])
+        return bool(results) and all(r.get('type') == RATE_LIMIT_FAILURE for r in results)
+
+    @staticmethod
+    def retry_after(response: Dict[str, Any]) -> Optional[float]:
+        """Server-requested wait for a rate-limited `send`, when signal-cli reports one"""
+        error = response.get('error')
+        sources = [error.get('data') or {}] if isinstance(error, dict) else (response.get('result') or {}).get('results', [])
+        for source in sources:
+            if isinstance(source, dict) and source.get('retryAfterSeconds') is not None:
+                try:
+                    return max(0.0, float(source['retryAfterSeconds']))
+                except (TypeError, ValueError):
+                    pass
+        return None
+
+    @staticmethod
+    def send_error(response: Dict[str, Any]) -> Optional[str]:
+        """Error text for a `send` response, or None when every recipient succeeded"""
+        if 'error' in response:
+            error = response['error']
+            return error.get('message', str(error)) if isinstance(error, dict) else str(error)
+        result = response.get('result') or {}
+        failures = [r.get('type') for r in result.get('results', []) if r.get('type', 'SUCCESS') != 'SUCCESS']
+        return f"Recipient failures: {', '.join(failures)}" if failures else None
@@ -13,19 +13,28 @@ import httpx
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Union
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
+from urllib.parse import urlsplit
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 # Environment configuration
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent / 'utils'))
 from env_config import EnvironmentConfig
+from utils.http_client_pool import get_http_client, is_shared_client
 from enhanced_error_handler import (
     resilient_operation, ErrorCategory, ErrorSeverity, RetryStrategy,
-    circuit_breaker_protection
+    circuit_breaker_protection, record_service_throttle, ThrottledError
 )
+from .rate_limit_feedback import AdaptiveRateLimiter, retry_after_from_response
+from .delivery_outbox import DeliveryOutbox, content_report_id, idempotency_key
+from .signal_jsonrpc import (
+    SignalJsonRpcClient, SignalJsonRpcError, attachment_data_uri, IDENTITY_FAILURE, RATE_LIMIT_FAILURE
+)
+from src.core.deadline import fits as fits_deadline
+from src.core.tracing import set_attribute, span
 
 logger = logging.getLogger(__name__)
 
@@ -75,8 +84,8 @@ class PlatformError(MessagingError):
     """Platform-specific messaging error"""
     pass
 
-class RateLimitError(MessagingError):
-    """Rate limiting error"""
+class RateLimitError(MessagingError, ThrottledError):
+    """Rate limiting error carrying the server's retry_after (seconds) when provided"""
     pass
 
 class UnifiedBaseMessenger(ABC):
@@ -101,9 +110,14 @@ class UnifiedBaseMessenger(ABC):
         self.config = self._get_platform_config()
         self.client = None
         
-        # Rate limiting
-        self.last_message_time = {}
+        # Rate limiting - per-chat pacing that adapts to the server's 429 feedback
         self.rate_limit_delay = self.config.get('rate_limit_delay', 1.0)
+        self.max_throttle_retries = self.config.get('max_throttle_retries', 3)
+        self.max_retry_after = self.config.get('max_retry_after', 60.0)
+        self.rate_limiter = AdaptiveRateLimiter(
+            min_interval=self.rate_limit_delay,
+            max_interval=self.config.get('max_rate_limit_delay', 30.0)
+        )
         
         logger.info(f"🚀 {self.__class__.__name__} initialized for {platform_name}")
     
@@ -127,17 +141,64 @@ class UnifiedBaseMessenger(ABC):
         """Send attachment implementation"""
         pass
     
-    async def _apply_rate_limiting(self, chat_id: str):
+    async def _apply_rate_limiting(self, chat_id: str, slots: int = 1):
         """Apply rate limiting to prevent spam"""
-        last_time = self.last_message_time.get(chat_id, 0)
-        current_time = datetime.now().timestamp()
+        await self.rate_limiter.acquire(str(chat_id), slots)
+    
+    def _record_throttle(self, key: str, error: RateLimitError, attempt: int) -> Optional[MessageResult]:
+        """
+        Feed a 429 back to the limiter and the circuit breaker
         
-        if current_time - last_time < self.rate_limit_delay:
-            delay = self.rate_limit_delay - (current_time - last_time)
-            logger.info(f"Rate limiting: waiting {delay:.1f}s")
-            await asyncio.sleep(delay)
+        Returns:
+            The failure to report when waiting it out is no longer worthwhile, else None
+        """
+        wait = self.rate_limiter.on_throttle(key, error.retry_after)
+        record_service_throttle("messaging_platform")
+        # Waiting out the throttle must not push the run past its deadline
+        past_deadline = not fits_deadline(wait)
+        if attempt >= self.max_throttle_retries or wait > self.max_retry_after or past_deadline:
+            return MessageResult(
+                status=MessageStatus.FAILED,
+                platform=self.platform_name,
+                error=str(error),
+                metadata={'throttled': True, 'retry_after': error.retry_after,
+                          'deadline': past_deadline},
+                retry_count=attempt
+            )
+        return None
+    
+    async def _send_with_rate_limit_feedback(self, rate_key: str, send_func, *args, **kwargs) -> MessageResult:
+        """
+        Send through the adaptive limiter, waiting out 429 responses
         
-        self.last_message_time[chat_id] = datetime.now().timestamp()
+        Throttling is not a failure: it is reported to the limiter and counted
+        separately on the circuit breaker, and the send is retried once the
+        server's retry_after has passed.
+        """
+        key = str(rate_key)
+        with span(f'send.{self.platform_name}', category='send',
+                  platform=self.platform_name, operation=send_func.__name__.strip('_')):
+            for attempt in range(self.max_throttle_retries + 1):
+                await self._apply_rate_limiting(key)
+                try:
+                    result = await send_func(*args, **kwargs)
+                except RateLimitError as e:
+                    failure = self._record_throttle(key, e, attempt)
+                    if failure is not None:
+                        set_attribute('status', failure.status.value)
+                        return failure
+                    continue
+                
+                if result.success:
+                    self.rate_limiter.on_success(key)
+                result.retry_count = attempt
+                set_attribute('status', getattr(result.status, 'value', result.status))
+                set_attribute('attempts', attempt + 1)
+                return result
+    
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Learned per-chat pacing statistics"""
+        return self.rate_limiter.get_stats()
     
     @circuit_breaker_protection("messaging_platform")
     async def send_message(self, message: str, chat_id: Optional[str] = None, **kwargs) -> MessageResult:
@@ -153,15 +214,14 @@ class UnifiedBaseMessenger(ABC):
             MessageResult with delivery status
         """
         try:
-            if not self.client:
+            if not self.client or getattr(self.client, 'is_closed', False):
                 await self._initialize_client()
             
-            # Apply rate limiting
+            # Send message, paced per chat
             target_chat = chat_id or self._get_default_chat_id()
-            await self._apply_rate_limiting(target_chat)
-            
-            # Send message
-            result = await self._send_text_message(message, chat_id=chat_id, **kwargs)
+            result = await self._send_with_rate_limit_feedback(
+                target_chat, self._send_text_message, message, chat_id=chat_id, **kwargs
+            )
             
             if result.success:
                 logger.info(f"✅ Message sent via {self.platform_name}: {result.message_id}")
@@ -191,15 +251,14 @@ class UnifiedBaseMessenger(ABC):
             MessageResult with delivery status
         """
         try:
-            if not self.client:
+            if not self.client or getattr(self.client, 'is_closed', False):
                 await self._initialize_client()
             
-            # Apply rate limiting
+            # Send attachment, paced per chat
             target_chat = chat_id or self._get_default_chat_id()
-            await self._apply_rate_limiting(target_chat)
-            
-            # Send attachment
-            result = await self._send_attachment(attachment, chat_id=chat_id, **kwargs)
+            result = await self._send_with_rate_limit_feedback(
+                target_chat, self._send_attachment, attachment, chat_id=chat_id, **kwargs
+            )
             
             if result.success:
                 logger.info(f"✅ Attachment sent via {self.platform_name}: {attachment.file_path.name}")
@@ -254,9 +313,12 @@ class UnifiedBaseMessenger(ABC):
         """Get maximum message length for platform"""
         return self.config.get('max_message_length', 2000)
     
-    async def _send_long_message(self, message: str, **kwargs) -> MessageResult:
-        """Send long message by splitting into chunks"""
+    def _split_message(self, message: str) -> List[str]:
+        """Split a message into platform-sized chunks, numbered when there is more than one"""
         max_length = self._get_max_message_length()
+        if len(message) <= max_length:
+            return [message]
+        
         chunks = []
         current_chunk = ""
         
@@ -271,15 +333,25 @@ class UnifiedBaseMessenger(ABC):
         if current_chunk:
             chunks.append(current_chunk.strip())
         
-        results = []
-        for i, chunk in enumerate(chunks):
-            prefix = f"[Part {i+1}/{len(chunks)}]\n" if len(chunks) > 1 else ""
-            result = await self.send_message(prefix + chunk, **kwargs)
-            results.append(result)
-            
-            # Brief delay between chunks
-            if i < len(chunks) - 1:
-                await asyncio.sleep(1)
+        if len(chunks) == 1:
+            return chunks
+        return [f"[Part {i+1}/{len(chunks)}]\n{chunk}" for i, chunk in enumerate(chunks)]
+    
+    async def send_batch(self, messages: List[str], chat_id: Optional[str] = None, **kwargs) -> List[MessageResult]:
+        """
+        Send several messages (e.g. chunks of one report) to a chat in order
+        
+        Platforms that can deliver several messages per request override this;
+        the default sends them one by one, paced by the rate limiter.
+        
+        Returns:
+            One MessageResult per message, in order
+        """
+        return [await self.send_message(message, chat_id=chat_id, **kwargs) for message in messages]
+    
+    async def _send_long_message(self, message: str, **kwargs) -> MessageResult:
+        """Send long message by splitting into chunks"""
+        results = await self.send_batch(self._split_message(message), **kwargs)
         
         # Return overall result
         success_count = sum(1 for r in results if r.success)
@@ -301,10 +373,10 @@ class UnifiedBaseMessenger(ABC):
         return await self.send_message(formatted_data, **kwargs)
     
     async def cleanup(self):
-        """Clean up client resources"""
+        """Clean up client resources (pooled HTTP clients stay open for reuse)"""
         if self.client:
             try:
-                if hasattr(self.client, 'close'):
+                if not is_shared_client(self.client) and hasattr(self.client, 'close'):
                     await self.client.close()
                 self.client = None
             except Exception as e:
@@ -323,13 +395,13 @@ class UnifiedTelegramMessenger(UnifiedBaseMessenger):
             'thread_id': self.credentials.get('TELEGRAM_THREAD_ID'),
             'max_message_length': 4096,
             'rate_limit_delay': 1.0,
-            'api_url': 'https://api.telegram.org'
+            'api_url': self.credentials.get('TELEGRAM_API_URL') or 'https://api.telegram.org'
         }
     
     async def _initialize_client(self):
-        """Initialize Telegram HTTP client"""
-        self.client = httpx.AsyncClient(
-            base_url=f"{self.config['api_url']}/bot{self.config['bot_token']}",
+        """Initialize Telegram HTTP client from the shared keep-alive pool"""
+        self.client = get_http_client(
+            f"{self.config['api_url']}/bot{self.config['bot_token']}",
             timeout=30.0
         )
     
@@ -368,7 +440,7 @@ class UnifiedTelegramMessenger(UnifiedBaseMessenger):
                 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:  # Rate limited
-                raise RateLimitError(f"Telegram rate limit: {e}")
+                raise RateLimitError(f"Telegram rate limit: {e}", retry_after_from_response(e.response))
             return MessageResult(
                 status=MessageStatus.FAILED,
                 platform=self.platform_name,
@@ -413,6 +485,14 @@ class UnifiedTelegramMessenger(UnifiedBaseMessenger):
                         error=result_data.get('description', 'Unknown error')
                     )
                     
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:  # Rate limited
+                raise RateLimitError(f"Telegram rate limit: {e}", retry_after_from_response(e.response))
+            return MessageResult(
+                status=MessageStatus.FAILED,
+                platform=self.platform_name,
+                error=f"HTTP error: {e}"
+            )
         except Exception as e:
             return MessageResult(
                 status=MessageStatus.FAILED,
@@ -641,30 +721,220 @@ class UnifiedWhatsAppMessenger(UnifiedBaseMessenger):
 class UnifiedSignalMessenger(UnifiedBaseMessenger):
     """Unified Signal messenger implementation"""
     
+    # Seconds before an unavailable JSON-RPC endpoint is probed again (auto mode)
+    JSONRPC_REPROBE_INTERVAL = 300.0
+    
     def __init__(self, env_config: EnvironmentConfig):
         super().__init__('signal', env_config)
+        self.rpc = None
+        self._jsonrpc_available: Optional[bool] = True if self.config['send_mode'] == 'jsonrpc' else None
+        self._jsonrpc_probe_after = 0.0
     
     def _get_platform_config(self) -> Dict[str, Any]:
+        api_url = self.credentials.get('SIGNAL_API_URL') or 'http://localhost:8080'
+        send_mode = (self.credentials.get('SIGNAL_SEND_MODE') or 'auto').lower()
+        if send_mode not in ('auto', 'jsonrpc', 'rest'):
+            logger.warning(f"Unknown SIGNAL_SEND_MODE '{send_mode}', using auto")
+            send_mode = 'auto'
         return {
             'phone_number': self.credentials['SIGNAL_PHONE_NUMBER'],
             'group_id': self.credentials['SIGNAL_GROUP_ID'],
-            'api_url': self.credentials.get('SIGNAL_API_URL', 'http://localhost:8080'),
+            'api_url': api_url,
+            # signal-cli daemon JSON-RPC endpoint; 'auto' probes it and falls back to REST
+            'rpc_url': self.credentials.get('SIGNAL_RPC_URL') or f"{api_url.rstrip('/')}/api/v1/rpc",
+            'send_mode': send_mode,
             'max_message_length': 2000,  # Conservative limit
             'rate_limit_delay': 2.0
         }
     
     async def _initialize_client(self):
-        """Initialize Signal HTTP client"""
-        self.client = httpx.AsyncClient(
-            base_url=self.config['api_url'],
-            timeout=30.0
-        )
+        """Initialize Signal HTTP client from the shared keep-alive pool"""
+        self.client = get_http_client(self.config['api_url'], timeout=30.0)
+        if self.config['send_mode'] != 'rest':
+            rpc_url = urlsplit(self.config['rpc_url'])
+            self.rpc = SignalJsonRpcClient(
+                get_http_client(f"{rpc_url.scheme}://{rpc_url.netloc}", timeout=30.0),
+                rpc_path=rpc_url.path or '/'
+            )
     
-    async def _send_text_message(self, message: str, chat_id: Optional[str] = None, **kwargs) -> MessageResult:
-        """Send text message via Signal CLI API"""
+    async def _use_jsonrpc(self) -> bool:
+        """Whether sends should go through the JSON-RPC daemon, probing it when unknown"""
+        if self.config['send_mode'] == 'rest':
+            return False
+        if self.rpc is None or getattr(self.rpc.client, 'is_closed', False):
+            await self._initialize_client()
+        
+        loop_time = asyncio.get_running_loop().time()
+        if self._jsonrpc_available is None or (
+                self._jsonrpc_available is False and loop_time >= self._jsonrpc_probe_after):
+            try:
+                version = await self.rpc.version()
+                self._jsonrpc_available = True
+                logger.info(f"📡 Signal JSON-RPC daemon available (signal-cli {version}), using batched sends")
+            except SignalJsonRpcError as e:
+                self._disable_jsonrpc(e)
+        return bool(self._jsonrpc_available)
+    
+    def _disable_jsonrpc(self, reason: Exception):
+        """Fall back to REST until the next probe"""
+        self._jsonrpc_available = False
+        try:
+            self._jsonrpc_probe_after = asyncio.get_running_loop().time() + self.JSONRPC_REPROBE_INTERVAL
+        except RuntimeError:
+            self._jsonrpc_probe_after = 0.0
+        logger.info(f"Signal JSON-RPC unavailable ({reason}); using REST /v2/send")
+    
+    async def _send_jsonrpc(self, messages: List[str], target: str,
+                            attachments: Optional[List[str]] = None) -> List[Optional[MessageResult]]:
+        """
+        Send messages to one target in a single JSON-RPC batch
+        
+        Returns:
+            One MessageResult per message, or None where nothing was sent and the
+            message must be retried over REST. Messages signal-cli refused for rate
+            limiting come back failed with metadata['throttled'] set.
+        """
+        calls = [
+            SignalJsonRpcClient.send_call(self.config['phone_number'], target, message, attachments)
+            for message in messages
+        ]
+        try:
+            responses = await self.rpc.call_batch(calls)
+        except SignalJsonRpcError as e:
+            self._disable_jsonrpc(e)
+            return [None] * len(messages)
+        
+        results: List[Optional[MessageResult]] = []
+        for message, response in zip(messages, responses):
+            if SignalJsonRpcClient.rate_limited(response):
+                results.append(MessageResult(
+                    status=MessageStatus.FAILED,
+                    platform=self.platform_name,
+                    error=f"Signal rate limit: {SignalJsonRpcClient.send_error(response)}",
+                    metadata={'throttled': True, 'retry_after': SignalJsonRpcClient.retry_after(response),
+                              'transport': 'jsonrpc'}
+                ))
+                continue
+            if 'error' in response:
+                # Nothing was sent (membership, untrusted identity on a direct send): the
+                # REST path knows how to repair these
+                logger.warning(f"Signal JSON-RPC send failed, retrying over REST: {SignalJsonRpcClient.send_error(response)}")
+                results.append(None)
+                continue
+            
+            metadata = {'group_id': target, 'transport': 'jsonrpc'}
+            failed = SignalJsonRpcClient.failed_recipients(response)
+            if failed:
+                # Everyone else already has the message, so only these recipients are retried
+                if RATE_LIMIT_FAILURE in failed.values():
+                    self.rate_limiter.on_throttle(target, SignalJsonRpcClient.retry_after(response))
+                    record_service_throttle("messaging_platform")
+                still_failed = await self._retry_recipients(message, failed, attachments)
+                if still_failed:
+                    metadata['failed_recipients'] = still_failed
+            timestamp = (response.get('result') or {}).get('timestamp', datetime.now().timestamp())
+            results.append(MessageResult(
+                status=MessageStatus.SUCCESS,
+                platform=self.platform_name,
+                message_id=f"signal_{timestamp}",
+                metadata=metadata
+            ))
+        return results
+    
+    async def _retry_recipients(self, message: str, failed: Dict[str, str],
+                                attachments: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Resend a message directly to the recipients a group send did not reach
+        
+        Identity failures are trusted first; rate-limited recipients are left for
+        the limiter rather than retried straight away.
+        
+        Returns:
+            Recipients still not reached, mapped to their failure type
+        """
+        account = self.config['phone_number']
+        retry = [recipient for recipient, kind in failed.items() if kind != RATE_LIMIT_FAILURE]
+        still_failed = {recipient: kind for recipient, kind in failed.items() if kind == RATE_LIMIT_FAILURE}
+        if not retry:
+            return still_failed
+        
+        trust = [SignalJsonRpcClient.trust_call(account, r) for r in retry if failed[r] == IDENTITY_FAILURE]
+        try:
+            if trust:
+                await self.rpc.call_batch(trust)
+            responses = await self.rpc.call_batch(
+                [SignalJsonRpcClient.send_call(account, r, message, attachments) for r in retry]
+            )
+        except SignalJsonRpcError as e:
+            logger.warning(f"Signal retry to {len(retry)} recipient(s) failed: {e}")
+            return failed
+        
+        for recipient, response in zip(retry, responses):
+            if SignalJsonRpcClient.send_error(response):
+                still_failed[recipient] = failed[recipient]
+        if still_failed:
+            logger.warning(f"Signal message not delivered to {len(still_failed)} recipient(s): {still_failed}")
+        return still_failed
+    
+    async def send_batch(self, messages: List[str], chat_id: Optional[str] = None, **kwargs) -> List[MessageResult]:
+        """
+        Send several messages in one JSON-RPC request when the daemon is available
+        
+        The request reserves one pacing slot per message, and messages refused for
+        rate limiting are resent once the server's wait has passed, as single sends
+        are. Only messages the daemon did not send at all fall back to REST.
+        """
+        if len(messages) < 2 or not await self._use_jsonrpc():
+            return await super().send_batch(messages, chat_id=chat_id, **kwargs)
+        
+        target = chat_id or self._get_default_chat_id()
+        results: List[Optional[MessageResult]] = [None] * len(messages)
+        pending = list(range(len(messages)))
+        with span(f'send.{self.platform_name}', category='send',
+                  platform=self.platform_name, operation='send_batch', messages=len(messages)):
+            for attempt in range(self.max_throttle_retries + 1):
+                await self._apply_rate_limiting(target, slots=len(pending))
+                throttled = []
+                for index, result in zip(pending, await self._send_jsonrpc([messages[i] for i in pending], target)):
+                    results[index] = result
+                    if result is None:
+                        continue
+                    if result.metadata.get('throttled'):
+                        throttled.append(index)
+                    elif result.success:
+                        self.rate_limiter.on_success(target)
+                        result.retry_count = attempt
+                if not throttled:
+                    break
+                
+                first = results[throttled[0]]
+                failure = self._record_throttle(target, RateLimitError(first.error, first.metadata.get('retry_after')), attempt)
+                if failure is not None:
+                    for index in throttled:
+                        results[index] = replace(failure)
+                    break
+                pending = throttled
+        
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = await self.send_message(messages[index], chat_id=chat_id, transport='rest', **kwargs)
+        
+        logger.info(f"✅ Signal batch: {sum(1 for r in results if r.success)}/{len(results)} messages delivered")
+        return results
+    
+    async def _send_text_message(self, message: str, chat_id: Optional[str] = None,
+                                 transport: Optional[str] = None, **kwargs) -> MessageResult:
+        """Send text message via the signal-cli JSON-RPC daemon, or the REST API"""
         try:
             target_group = chat_id or self.config['group_id']
             
+            if transport != 'rest' and await self._use_jsonrpc():
+                result = (await self._send_jsonrpc([message], target_group))[0]
+                if result is not None and result.metadata.get('throttled'):
+                    raise RateLimitError(result.error, result.metadata.get('retry_after'))
+                if result is not None:
+                    return result
+            
             # Check group membership status before sending
             await self._check_and_fix_group_membership(target_group)
             
@@ -678,6 +948,9 @@ class UnifiedSignalMessenger(UnifiedBaseMessenger):
             logger.info(f"Sending Signal message to group {target_group} from {self.config['phone_number']}")
             response = await self.client.post('/v2/send', json=payload)
             
+            if response.status_code == 429:
+                raise RateLimitError(f"Signal rate limit: {response.text[:200]}", retry_after_from_response(response))
+            
             if response.status_code == 201:
                 result_data = response.json()
                 logger.info(f"Signal message sent successfully: {result_data.get('timestamp')}")
@@ -725,6 +998,8 @@ class UnifiedSignalMessenger(UnifiedBaseMessenger):
                     error=f"HTTP {response.status_code}: {response.text[:200]}"
                 )
             
+        except RateLimitError:
+            raise
         except httpx.HTTPStatusError as e:
             return MessageResult(
                 status=MessageStatus.FAILED,
@@ -739,10 +1014,19 @@ class UnifiedSignalMessenger(UnifiedBaseMessenger):
             )
     
     async def _send_attachment(self, attachment: AttachmentData, chat_id: Optional[str] = None, **kwargs) -> MessageResult:
-        """Send attachment via Signal CLI API"""
+        """Send attachment via the signal-cli JSON-RPC daemon, or the REST API"""
         try:
             target_group = chat_id or self.config['group_id']
             
+            if await self._use_jsonrpc():
+                result = (await self._send_jsonrpc(
+                    [attachment.caption or ''], target_group, [attachment_data_uri(attachment.file_path)]
+                ))[0]
+                if result is not None and result.metadata.get('throttled'):
+                    raise RateLimitError(result.error, result.metadata.get('retry_after'))
+                if result is not None:
+                    return result
+            
             with open(attachment.file_path, 'rb') as f:
                 files = {'attachment': f}
                 data = {
@@ -753,6 +1037,9 @@ class UnifiedSignalMessenger(UnifiedBaseMessenger):
                 
                 response = await self.client.post('/v2/send', data=data, files=files)
                 
+                if response.status_code == 429:
+                    raise RateLimitError(f"Signal rate limit: {response.text[:200]}", retry_after_from_response(response))
+                
                 if response.status_code in [200, 201]:
                     return MessageResult(
                         status=MessageStatus.SUCCESS,
@@ -797,6 +1084,8 @@ class UnifiedSignalMessenger(UnifiedBaseMessenger):
                         error=f"HTTP {response.status_code}: {response.text}"
                     )
                 
+        except RateLimitError:
+            raise
         except Exception as e:
             return MessageResult(
                 status=MessageStatus.FAILED,
@@ -857,7 +1146,8 @@ class UnifiedSignalMessenger(UnifiedBaseMessenger):
         try:
             # Extract UUID from error message
             import re
-            uuid_match = re.search(r'"([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})"', error_text)
+            # The API returns the error JSON-encoded, so the quotes may be escaped
+            uuid_match = re.search(r'\\?"([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})\\?"', error_text)
             
             if not uuid_match:
                 logger.error("Could not extract UUID from untrusted identity error")
@@ -910,16 +1200,19 @@ class UnifiedMultiMessenger:
     Consolidates the functionality of multiple messenger implementations
     """
     
-    def __init__(self, platforms: Optional[List[str]] = None):
+    def __init__(self, platforms: Optional[List[str]] = None, outbox: Optional[DeliveryOutbox] = None):
         """
         Initialize multi-messenger
         
         Args:
             platforms: List of platforms to use ('telegram', 'signal', 'whatsapp')
+            outbox: Delivery outbox consulted for sends that carry a report_id
+                    (default: logs/delivery_outbox.json, created on first use)
         """
         self.env_config = EnvironmentConfig('daily_report')
         self.platforms = platforms or ['telegram', 'signal']  # WhatsApp optional
         self.messengers = {}
+        self._outbox = outbox
         
         # Initialize messengers for each platform
         for platform in self.platforms:
@@ -939,13 +1232,32 @@ class UnifiedMultiMessenger:
         
         logger.info(f"🚀 MultiMessenger initialized with platforms: {list(self.messengers.keys())}")
     
-    async def send_to_all(self, message: str, **kwargs) -> Dict[str, MessageResult]:
-        """Send message to all configured platforms"""
+    @property
+    def outbox(self) -> DeliveryOutbox:
+        """Delivery outbox used for idempotent sends"""
+        if self._outbox is None:
+            self._outbox = DeliveryOutbox()
+        return self._outbox
+    
+    async def send_to_all(self, message: str, report_id: Optional[str] = None, **kwargs) -> Dict[str, MessageResult]:
+        """
+        Send message to all configured platforms
+        
+        Args:
+            message: Message text
+            report_id: Idempotency scope (e.g. 'daily-report-2025-08-18'). When given, the
+                       message is split per platform and only chunks of this exact content
+                       not yet acknowledged in the outbox are sent, so retries and reruns
+                       never duplicate; changed content under the same id is sent in full
+            **kwargs: Platform-specific parameters
+        """
         results = {}
         
         # Send to all platforms concurrently
         tasks = [
             self._send_to_platform(platform, messenger, message, **kwargs)
+            if report_id is None else
+            self._send_chunks_to_platform(platform, messenger, message, report_id, **kwargs)
             for platform, messenger in self.messengers.items()
         ]
         
@@ -979,6 +1291,60 @@ class UnifiedMultiMessenger:
                 error=str(e)
             )
     
+    async def _send_chunks_to_platform(self, platform: str, messenger: UnifiedBaseMessenger, message: str,
+                                       report_id: str, **kwargs) -> MessageResult:
+        """Send the chunks of a report that the outbox has not acknowledged for this platform"""
+        chunks = messenger._split_message(message)
+        digest = content_report_id(message)
+        keys = [idempotency_key(report_id, platform, i, digest) for i in range(len(chunks))]
+        pending = set(self.outbox.pending_keys(keys))
+        
+        if not pending:
+            logger.info(f"⏭️ {platform}: report {report_id} already delivered, skipping")
+            return MessageResult(
+                status=MessageStatus.SUCCESS,
+                platform=platform,
+                metadata={'report_id': report_id, 'chunks': len(chunks), 'sent': 0,
+                          'skipped': len(chunks), 'duplicate': True}
+            )
+        
+        todo = [(chunk, key) for chunk, key in zip(chunks, keys) if key in pending]
+        try:
+            batch_results = await messenger.send_batch([chunk for chunk, _ in todo], **kwargs)
+        except Exception as e:
+            logger.error(f"Failed to send to {platform}: {e}")
+            batch_results = [
+                MessageResult(status=MessageStatus.FAILED, platform=platform, error=str(e)) for _ in todo
+            ]
+        
+        sent = 0
+        errors = []
+        last_result = None
+        for (chunk, key), last_result in zip(todo, batch_results):
+            if last_result.success:
+                self.outbox.acknowledge(key, last_result.message_id, chunk)
+                sent += 1
+            else:
+                self.outbox.record_failure(key, last_result.error)
+                errors.append(last_result.error)
+        
+        delivered = len(chunks) - len(pending) + sent
+        if delivered == len(chunks):
+            status = MessageStatus.SUCCESS
+        elif delivered > 0:
+            status = MessageStatus.PARTIAL
+        else:
+            status = MessageStatus.FAILED
+        
+        return MessageResult(
+            status=status,
+            platform=platform,
+            message_id=last_result.message_id if last_result else None,
+            error='; '.join(str(e) for e in errors if e) or None,
+            metadata={'report_id': report_id, 'chunks': len(chunks), 'sent': sent,
+                      'skipped': len(chunks) - len(pending), 'duplicate': False}
+        )
+    
     async def send_structured_financial_data(self, structured_data: str, **kwargs) -> Dict[str, MessageResult]:
         """Send structured financial data to all platforms"""
         results = {}
@@ -1002,19 +1368,44 @@ class UnifiedMultiMessenger:
         
         return results
     
-    async def send_attachment(self, file_path: str, caption: Optional[str] = None, **kwargs) -> Dict[str, MessageResult]:
-        """Send single attachment to all platforms"""
+    async def send_attachment(self, file_path: str, caption: Optional[str] = None,
+                              report_id: Optional[str] = None, **kwargs) -> Dict[str, MessageResult]:
+        """
+        Send single attachment to all platforms
+        
+        With a report_id, platforms that already acknowledged this file (same
+        name and contents) for the report are skipped (see send_to_all).
+        """
         attachment = AttachmentData(
             file_path=Path(file_path),
             caption=caption
         )
         
         results = {}
+        digest = None
+        if report_id and attachment.file_path.exists():
+            digest = content_report_id(attachment.file_path.read_bytes())
         
         for platform, messenger in self.messengers.items():
+            key = idempotency_key(report_id, platform, f"attachment:{attachment.file_path.name}",
+                                  digest) if report_id else None
+            if key and self.outbox.is_acknowledged(key):
+                logger.info(f"⏭️ {platform}: {attachment.file_path.name} already delivered for {report_id}, skipping")
+                results[platform] = MessageResult(
+                    status=MessageStatus.SUCCESS,
+                    platform=platform,
+                    metadata={'report_id': report_id, 'duplicate': True}
+                )
+                continue
+            
             try:
                 result = await messenger.send_attachment(attachment, **kwargs)
                 results[platform] = result
+                if key:
+                    if result.success:
+                        self.outbox.acknowledge(key, result.message_id)
+                    else:
+                        self.outbox.record_failure(key, result.error)
             except Exception as e:
                 results[platform] = MessageResult(
                     status=MessageStatus.FAILED,
@@ -7,14 +7,21 @@ ZERO TOLERANCE for fake or unvalidated prices
 
 import asyncio
 import aiohttp
+import json
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import math
+import time
+from collections import defaultdict, deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import statistics
 import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from src.core.metrics import registry as metrics_registry
+from src.core.replay import active_cassette, http_request, replay_delay
+from src.core.tracing import propagate
 
 # Add Signals directory to path for yfinance helper
 current_dir = Path(__file__).parent
@@ -25,6 +32,11 @@ if str(signals_dir) not in sys.path:
 # Setup logging
 logger = logging.getLogger(__name__)
 
+PRICE_SOURCE_LATENCY = metrics_registry.histogram(
+    'price_source_seconds', 'Latency of successful price source lookups', ('source',))
+PRICE_SOURCE_OUTCOMES = metrics_registry.counter(
+    'price_source_requests_total', 'Price source lookups by outcome', ('source', 'outcome'))
+
 @dataclass
 class PriceData:
     """Price data with source and timestamp"""
@@ -43,6 +55,63 @@ class ValidationResult:
     is_valid: bool
     reason: str
 
+class SourceLatencyTracker:
+    """
+    Rolling per-source latency samples driving adaptive timeouts and hedging
+
+    Until a source has `min_samples` successful lookups it gets the
+    configured defaults; afterwards its timeout is twice its p99 and its
+    hedge point is its p95, both clamped to [min_timeout, max_timeout].
+    """
+    
+    def __init__(self, window: int = 50, min_samples: int = 5, min_timeout: float = 1.0,
+                 max_timeout: float = 10.0, default_hedge_delay: float = 2.0):
+        self.min_samples = min_samples
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.default_hedge_delay = default_hedge_delay
+        self.samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self.outcomes: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    
+    def record(self, source: str, seconds: float, outcome: str):
+        """Record a lookup; outcome is ok, failed, timeout or cancelled"""
+        self.outcomes[source][outcome] += 1
+        PRICE_SOURCE_OUTCOMES.inc(source=source, outcome=outcome)
+        if outcome == 'ok':
+            self.samples[source].append(seconds)
+            PRICE_SOURCE_LATENCY.observe(seconds, source=source)
+    
+    def percentile(self, source: str, pct: float) -> Optional[float]:
+        """Nearest-rank latency percentile, or None before min_samples successes"""
+        samples = sorted(self.samples.get(source, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[max(1, math.ceil(pct / 100 * len(samples))) - 1]
+    
+    def timeout_for(self, source: str) -> float:
+        p99 = self.percentile(source, 99)
+        if p99 is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, p99 * 2))
+    
+    def hedge_delay(self, source: str) -> float:
+        p95 = self.percentile(source, 95)
+        if p95 is None:
+            return min(self.default_hedge_delay, self.max_timeout)
+        return min(self.timeout_for(source), max(self.min_timeout, p95))
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            source: {
+                **dict(self.outcomes[source]),
+                'p50_ms': round((self.percentile(source, 50) or 0) * 1000, 1),
+                'p95_ms': round((self.percentile(source, 95) or 0) * 1000, 1),
+                'timeout_s': round(self.timeout_for(source), 2),
+                'hedge_after_s': round(self.hedge_delay(source), 2)
+            }
+            for source in sorted(set(self.outcomes) | set(self.samples))
+        }
+
 class MultiAPIValidator:
     """Enhanced multi-source forex price validator with yfinance integration"""
     
@@ -120,6 +189,20 @@ class MultiAPIValidator:
         self.price_cache = {}
         self.cache_ttl = 300
         
+        # Quorum mode: stop as soon as min_sources in-range quotes agree within
+        # max_variance and cancel the stragglers, so a validation takes as long
+        # as the min_sources-th fastest provider rather than the slowest one
+        self.quorum_mode = True
+        
+        # Overall budget for one validation; quotes collected so far are kept when it runs out
+        self.fetch_timeout = 30.0
+        
+        # Low-quota APIs are only called as hedges for slow or failing primaries
+        self.backup_sources = ('fixer', 'exchangerates')
+        
+        # Per-source latency history for adaptive timeouts and hedge points
+        self.source_latency = SourceLatencyTracker()
+        
     async def get_validated_price(self, pair: str) -> ValidationResult:
         """Get validated price for currency pair from multiple sources"""
         
@@ -229,49 +312,133 @@ class MultiAPIValidator:
             reason="Successfully validated"
         )
     
-    async def _fetch_prices_from_all_apis(self, pair: str) -> List[PriceData]:
-        """Enhanced price fetching from all available APIs including yfinance"""
-        tasks = []
+    def _price_sources(self) -> List[Tuple[str, Callable[[str], Awaitable[Optional[PriceData]]]]]:
+        """Available price sources in priority order"""
+        sources = []
         
         # Priority 1: yfinance (free, unlimited, reliable)
         if self.yfinance_helper:
-            tasks.append(self._fetch_yfinance_price(pair))
+            sources.append(('yfinance', self._fetch_yfinance_price))
         
         # Priority 2: Enhanced data fetcher (Alpha Vantage, Twelve Data)
         if self.data_fetcher:
-            tasks.append(self._fetch_enhanced_price(pair))
+            sources.append(('enhanced_data_fetcher', self._fetch_enhanced_price))
         
-        # Priority 3: Traditional forex APIs  
-        tasks.append(self._fetch_exchangerate_api(pair))
-        tasks.append(self._fetch_freecurrency_api(pair))
-        tasks.append(self._fetch_currencyapi(pair))
+        # Priority 3: Traditional forex APIs
+        sources.append(('exchangerate', self._fetch_exchangerate_api))
+        sources.append(('freecurrency', self._fetch_freecurrency_api))
+        sources.append(('currencyapi', self._fetch_currencyapi))
         
         # Priority 4: Lower limit APIs (use sparingly)
-        tasks.append(self._fetch_fixer_api(pair))
-        tasks.append(self._fetch_exchangerates_api(pair))
+        sources.append(('fixer', self._fetch_fixer_api))
+        sources.append(('exchangerates', self._fetch_exchangerates_api))
+        return sources
+    
+    def _has_quorum(self, pair: str, prices: List[PriceData]) -> bool:
+        """True when the quotes so far would already pass validation"""
+        if len(prices) < self.min_sources:
+            return False
+        values = [p.price for p in prices]
+        if not all(self._is_price_in_valid_range(pair, value) for value in values):
+            return False
+        mean_price = statistics.mean(values)
+        return max(abs(value - mean_price) / mean_price for value in values) <= self.max_variance
+    
+    async def _fetch_prices_from_all_apis(self, pair: str) -> List[PriceData]:
+        """
+        Fetch quotes from the primary sources concurrently, hedging to backups
+        
+        Each source gets an adaptive timeout; a primary that fails, times out
+        or runs past its usual latency launches one backup source. In quorum
+        mode the first moment the collected quotes would validate, the rest
+        are cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        sources = self._price_sources()
+        primaries = [(name, fetch) for name, fetch in sources if name not in self.backup_sources]
+        backups = [(name, fetch) for name, fetch in sources if name in self.backup_sources]
+        
+        running: Dict[asyncio.Future, Tuple[str, float]] = {}
+        hedged = set()
+        valid_prices: List[PriceData] = []
+        launched = 0
+        deadline = loop.time() + self.fetch_timeout
+        
+        def launch(name, fetch):
+            nonlocal launched
+            running[asyncio.ensure_future(fetch(pair))] = (name, loop.time())
+            launched += 1
+        
+        def hedge(task, reason):
+            # At most one backup per source; called while the task is still in `running`
+            hedged.add(task)
+            if backups:
+                name, fetch = backups.pop(0)
+                logger.debug(f"Hedging {running[task][0]} for {pair} ({reason}) with {name}")
+                launch(name, fetch)
+        
+        for name, fetch in primaries:
+            launch(name, fetch)
         
-        # Execute all API calls concurrently with timeout
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True), 
-                timeout=30.0
-            )
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout fetching prices for {pair}")
-            return []
-        
-        # Filter out failed calls and None results
-        valid_prices = []
-        for i, result in enumerate(results):
-            if isinstance(result, PriceData):
-                valid_prices.append(result)
-                logger.debug(f"Successfully fetched price from source {result.source} for {pair}: {result.price}")
-            elif isinstance(result, Exception):
-                logger.warning(f"API call {i} failed for {pair}: {result}")
-            elif result is None:
-                logger.debug(f"API call {i} returned None for {pair}")
-        
-        logger.info(f"Fetched {len(valid_prices)} valid prices for {pair} from {len(tasks)} sources")
+            while running:
+                now = loop.time()
+                wake = deadline
+                for task, (name, started) in running.items():
+                    wake = min(wake, started + self.source_latency.timeout_for(name))
+                    if backups and task not in hedged:
+                        wake = min(wake, started + self.source_latency.hedge_delay(name))
+                
+                done, _ = await asyncio.wait(list(running), timeout=max(0.0, wake - now),
+                                             return_when=asyncio.FIRST_COMPLETED)
+                now = loop.time()
+                
+                for task in done:
+                    name, started = running[task]
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.warning(f"Price source {name} failed for {pair}: {e}")
+                        result = None
+                    if isinstance(result, PriceData):
+                        self.source_latency.record(name, now - started, 'ok')
+                        valid_prices.append(result)
+                        logger.debug(f"Successfully fetched price from source {result.source} for {pair}: {result.price}")
+                    else:
+                        self.source_latency.record(name, now - started, 'failed')
+                        logger.debug(f"Price source {name} returned no price for {pair}")
+                        if task not in hedged:
+                            hedge(task, 'no price')
+                    del running[task]
+                
+                if self.quorum_mode and self._has_quorum(pair, valid_prices):
+                    logger.debug(f"Quorum of {len(valid_prices)} reached for {pair}, "
+                                 f"cancelling {len(running)} pending sources")
+                    break
+                
+                if now >= deadline:
+                    logger.error(f"Timeout fetching prices for {pair}; keeping {len(valid_prices)} quotes")
+                    break
+                
+                for task, (name, started) in list(running.items()):
+                    if now >= started + self.source_latency.timeout_for(name):
+                        logger.warning(f"Price source {name} timed out for {pair}")
+                        self.source_latency.record(name, now - started, 'timeout')
+                        task.cancel()
+                        if task not in hedged:
+                            hedge(task, 'timeout')
+                        del running[task]
+                    elif backups and task not in hedged and now >= started + self.source_latency.hedge_delay(name):
+                        hedge(task, 'slow')
+        finally:
+            now = loop.time()
+            for task, (name, started) in running.items():
+                task.cancel()
+                self.source_latency.record(name, now - started, 'cancelled')
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        
+        logger.info(f"Fetched {len(valid_prices)} valid prices for {pair} from {launched} sources")
         return valid_prices
     
     async def _fetch_yfinance_price(self, pair: str) -> Optional[PriceData]:
@@ -284,7 +451,7 @@ class MultiAPIValidator:
             loop = asyncio.get_event_loop()
             price = await loop.run_in_executor(
                 None, 
-                self.yfinance_helper.get_current_price, 
+                propagate(self.yfinance_helper.get_current_price), 
                 pair
             )
             
@@ -311,7 +478,7 @@ class MultiAPIValidator:
             loop = asyncio.get_event_loop()
             price = await loop.run_in_executor(
                 None,
-                self.data_fetcher.get_current_price_validated,
+                propagate(self.data_fetcher.get_current_price_validated),
                 pair
             )
             
@@ -328,6 +495,29 @@ class MultiAPIValidator:
         
         return None
     
+    async def _get_json(self, url: str, timeout: int = 10) -> Tuple[int, Any]:
+        """GET a JSON API through the active record/replay cassette; returns (status, body or None)"""
+        cassette = active_cassette()
+        request = http_request('GET', url) if cassette else None
+        if cassette and cassette.replaying:
+            interaction = cassette.lookup('http', request)
+            await replay_delay(cassette, interaction)
+            recorded = interaction['response']
+            return recorded['status'], json.loads(recorded['body']) if recorded['status'] == 200 else None
+        
+        started = time.perf_counter()
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, timeout=timeout) as response:
+                body = await response.text()
+                if cassette and cassette.recording:
+                    cassette.record('http', request, {
+                        'status': response.status,
+                        'reason': response.reason or '',
+                        'headers': {'Content-Type': response.headers.get('content-type', '')},
+                        'body': body
+                    }, time.perf_counter() - started)
+                return response.status, json.loads(body) if response.status == 200 else None
+    
     async def _fetch_exchangerate_api(self, pair: str) -> Optional[PriceData]:
         """Fetch from ExchangeRate-API"""
         try:
@@ -336,18 +526,16 @@ class MultiAPIValidator:
             
             url = f"{self.apis['exchangerate']['base_url']}/{self.apis['exchangerate']['key']}/pair/{base_currency}/{target_currency}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('result') == 'success':
-                            price = float(data['conversion_rate'])
-                            return PriceData(
-                                pair=pair,
-                                price=price,
-                                source='exchangerate',
-                                timestamp=datetime.now()
-                            )
+            status, data = await self._get_json(url)
+            if status == 200:
+                if data.get('result') == 'success':
+                    price = float(data['conversion_rate'])
+                    return PriceData(
+                        pair=pair,
+                        price=price,
+                        source='exchangerate',
+                        timestamp=datetime.now()
+                    )
             return None
         except Exception as e:
             logger.warning(f"ExchangeRate-API error for {pair}: {e}")
@@ -361,18 +549,16 @@ class MultiAPIValidator:
             
             url = f"{self.apis['fixer']['base_url']}/latest?access_key={self.apis['fixer']['key']}&base={base_currency}&symbols={target_currency}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('success'):
-                            price = float(data['rates'][target_currency])
-                            return PriceData(
-                                pair=pair,
-                                price=price,
-                                source='fixer',
-                                timestamp=datetime.now()
-                            )
+            status, data = await self._get_json(url)
+            if status == 200:
+                if data.get('success'):
+                    price = float(data['rates'][target_currency])
+                    return PriceData(
+                        pair=pair,
+                        price=price,
+                        source='fixer',
+                        timestamp=datetime.now()
+                    )
             return None
         except Exception as e:
             logger.warning(f"Fixer.io error for {pair}: {e}")
@@ -386,18 +572,16 @@ class MultiAPIValidator:
             
             url = f"{self.apis['currencyapi']['base_url']}/latest?apikey={self.apis['currencyapi']['key']}&base_currency={base_currency}&currencies={target_currency}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if target_currency in data.get('data', {}):
-                            price = float(data['data'][target_currency]['value'])
-                            return PriceData(
-                                pair=pair,
-                                price=price,
-                                source='currencyapi',
-                                timestamp=datetime.now()
-                            )
+            status, data = await self._get_json(url)
+            if status == 200:
+                if target_currency in data.get('data', {}):
+                    price = float(data['data'][target_currency]['value'])
+                    return PriceData(
+                        pair=pair,
+                        price=price,
+                        source='currencyapi',
+                        timestamp=datetime.now()
+                    )
             return None
         except Exception as e:
             logger.warning(f"CurrencyAPI error for {pair}: {e}")
@@ -411,18 +595,16 @@ class MultiAPIValidator:
             
             url = f"{self.apis['freecurrency']['base_url']}/latest?apikey={self.apis['freecurrency']['key']}&base_currency={base_currency}&currencies={target_currency}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if target_currency in data.get('data', {}):
-                            price = float(data['data'][target_currency])
-                            return PriceData(
-                                pair=pair,
-                                price=price,
-                                source='freecurrency',
-                                timestamp=datetime.now()
-                            )
+            status, data = await self._get_json(url)
+            if status == 200:
+                if target_currency in data.get('data', {}):
+                    price = float(data['data'][target_currency])
+                    return PriceData(
+                        pair=pair,
+                        price=price,
+                        source='freecurrency',
+                        timestamp=datetime.now()
+                    )
             return None
         except Exception as e:
             logger.warning(f"FreeCurrencyAPI error for {pair}: {e}")
@@ -436,18 +618,16 @@ class MultiAPIValidator:
             
             url = f"{self.apis['exchangerates']['base_url']}/latest?access_key={self.apis['exchangerates']['key']}&base={base_currency}&symbols={target_currency}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('success'):
-                            price = float(data['rates'][target_currency])
-                            return PriceData(
-                                pair=pair,
-                                price=price,
-                                source='exchangerates',
-                                timestamp=datetime.now()
-                            )
+            status, data = await self._get_json(url)
+            if status == 200:
+                if data.get('success'):
+                    price = float(data['rates'][target_currency])
+                    return PriceData(
+                        pair=pair,
+                        price=price,
+                        source='exchangerates',
+                        timestamp=datetime.now()
+                    )
             return None
         except Exception as e:
             logger.warning(f"ExchangeRatesAPI error for {pair}: {e}")
@@ -488,7 +668,10 @@ class MultiAPIValidator:
                     'enhanced_data_fetcher': self.data_fetcher is not None
                 },
                 'supported_pairs': list(self.valid_ranges.keys()),
-                'api_sources': list(self.apis.keys())
+                'api_sources': list(self.apis.keys()),
+                'quorum_mode': self.quorum_mode,
+                'backup_sources': list(self.backup_sources),
+                'source_latency': self.source_latency.snapshot()
             }
             
             # Test a quick validation to check system health
@@ -15,10 +15,18 @@ import requests
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from src.core.config import settings
+from src.core.deadline import budget_sleep, check as check_deadline, clamp_timeout
+from src.core.metrics import registry as metrics_registry
+from src.core.replay import http_get
 from .cache_manager import cache_manager
 
 logger = logging.getLogger(__name__)
 
+API_CALLS = metrics_registry.counter('api_calls_total', 'Rate-limited provider calls by outcome', ('api', 'outcome'))
+API_LATENCY = metrics_registry.histogram('api_call_seconds', 'Provider call latency', ('api',))
+API_RATE_LIMIT_WAIT = metrics_registry.counter('api_rate_limit_wait_seconds_total',
+                                               'Time spent waiting for provider rate limits', ('api',))
+
 class RateLimitTracker:
     """Thread-safe rate limit tracking for different APIs"""
     
@@ -80,6 +88,12 @@ class RateLimitTracker:
             
             return stats
     
+    def collect_samples(self):
+        """Scrape-time samples for the shared metrics registry"""
+        for api_name, windows in self.get_usage_stats().items():
+            for window, count in windows.items():
+                yield 'api_rate_limit_window_calls', {'api': api_name, 'window': window}, count
+    
     def time_until_reset(self, api_name: str, limit_type: str) -> Optional[int]:
         """Get seconds until the rate limit resets"""
         with self.lock:
@@ -102,6 +116,7 @@ class RateLimitTracker:
 
 # Global rate limit tracker
 rate_tracker = RateLimitTracker()
+metrics_registry.register_collector('rate_limits', rate_tracker.collect_samples)
 
 def rate_limited(api_name: str, calls_per_day: int = None, calls_per_minute: int = None, 
                 calls_per_hour: int = None, priority: int = 1):
@@ -140,10 +155,12 @@ def rate_limited(api_name: str, calls_per_day: int = None, calls_per_minute: int
                     sleep_time = min(reset_time or 60, 60)  # Wait up to 1 minute
                     
                     logger.warning(f"Rate limit hit for {api_name} ({limit_type}). Waiting {sleep_time}s")
-                    time.sleep(sleep_time)
+                    budget_sleep(sleep_time, f'rate_limit.{api_name}')
                     wait_time += sleep_time
+                    API_RATE_LIMIT_WAIT.inc(sleep_time, api=api_name)
             
             # Make the API call
+            started = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
                 
@@ -151,11 +168,15 @@ def rate_limited(api_name: str, calls_per_day: int = None, calls_per_minute: int
                 for limit_type, _, _ in rate_limits:
                     rate_tracker.record_call(api_name, limit_type)
                 
+                API_CALLS.inc(api=api_name, outcome='success')
                 return result
                 
             except Exception as e:
+                API_CALLS.inc(api=api_name, outcome='failure')
                 logger.error(f"API call failed for {api_name}: {e}")
                 raise
+            finally:
+                API_LATENCY.observe(time.perf_counter() - started, api=api_name)
         
         return wrapper
     return decorator
@@ -289,9 +310,15 @@ class SmartAPIManager:
             stats['available_apis'][data_type] = available
         
         return stats
+    
+    def collect_samples(self):
+        """Scrape-time health samples (no availability probes, which may hit the network)"""
+        for api_name, health in list(self.api_health.items()):
+            yield 'api_healthy', {'api': api_name}, 1 if health['status'] == 'healthy' else 0
 
 # Global API manager
 api_manager = SmartAPIManager()
+metrics_registry.register_collector('api_manager', api_manager.collect_samples)
 
 # Retry decorators for network issues
 def robust_api_call(max_attempts: int = 3, base_delay: float = 1.0):
@@ -309,11 +336,19 @@ def robust_api_call(max_attempts: int = 3, base_delay: float = 1.0):
     backoff.expo,
     (requests.exceptions.RequestException, ConnectionError),
     max_tries=3,
-    max_time=30
+    max_time=lambda: clamp_timeout(30)
 )
 def make_request_with_backoff(url: str, **kwargs) -> requests.Response:
-    """Make HTTP request with automatic backoff on failures"""
-    return requests.get(url, **kwargs)
+    """
+    Make HTTP request with automatic backoff on failures (recorded/replayed when a cassette is active)
+    
+    Inside a run deadline the request timeout and the total retry window
+    shrink to the remaining budget.
+    """
+    check_deadline('http_request')
+    if kwargs.get('timeout') is not None:
+        kwargs['timeout'] = clamp_timeout(kwargs['timeout'])
+    return http_get(url, **kwargs)
 
 def cached_api_call(api_name: str, ttl: int = None):
     """
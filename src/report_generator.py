@@ -12,6 +12,7 @@ import os
 
 from .signal_generator import TradingSignal, SignalComponent
 from src.core.config import settings
+from src.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ class ReportGenerator:
             'GBPJPY': 3
         }
     
+    @traced('report.generate', category='report', capture=('output_format',))
     def generate_comprehensive_report(self, signals: Dict[str, TradingSignal], 
                                     output_format: str = 'txt') -> str:
         """
@@ -402,6 +404,7 @@ class ReportGenerator:
         
         return html_template
     
+    @traced('report.save', category='report', capture=('output_format',))
     def save_report(self, report_content: str, output_format: str, 
                    output_dir: str = "reports") -> str:
         """Save report to file and return file path"""
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Scraper Orchestrator
+Runs several scraper targets (sources, or several pages of one source)
+concurrently on the shared browser, with a bounded number of contexts/pages
+in flight and per-domain politeness limits, and aggregates their results
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+from urllib.parse import urlsplit
+
+# Add utils directory to path
+sys.path.append(str(Path(__file__).parent.parent.parent / 'utils'))
+from domain_rate_limiter import DomainRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScrapeTarget:
+    """One page to scrape with a UnifiedBaseScraper subclass"""
+    name: str
+    scraper_class: Type
+    url: Optional[str] = None                       # defaults to the scraper's TARGET_URL
+    config_overrides: Dict[str, Any] = field(default_factory=dict)
+    timeout: Optional[float] = None                 # defaults to the orchestrator's target_timeout
+
+
+@dataclass
+class TargetResult:
+    """Outcome of one target"""
+    name: str
+    domain: str
+    success: bool
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    started_at: Optional[str] = None
+    duration: float = 0.0
+    waited: float = 0.0                             # seconds spent on politeness/pool limits
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'domain': self.domain,
+            'success': self.success,
+            'result': self.result,
+            'error': self.error,
+            'started_at': self.started_at,
+            'duration': round(self.duration, 3),
+            'waited': round(self.waited, 3)
+        }
+
+
+@dataclass
+class OrchestrationResult:
+    """Aggregated results of one orchestrated run"""
+    results: Dict[str, TargetResult] = field(default_factory=dict)
+    duration: float = 0.0
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    politeness: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> List[str]:
+        return [name for name, result in self.results.items() if result.success]
+
+    @property
+    def failed(self) -> List[str]:
+        return [name for name, result in self.results.items() if not result.success]
+
+    @property
+    def success(self) -> bool:
+        return bool(self.results) and not self.failed
+
+    def to_dict(self) -> Dict[str, Any]:
+        slowest = max((r.duration for r in self.results.values()), default=0.0)
+        return {
+            'success': self.success,
+            'timestamp': self.timestamp,
+            'duration': round(self.duration, 3),
+            'slowest_target': round(slowest, 3),
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'targets': {name: result.to_dict() for name, result in self.results.items()},
+            'politeness': self.politeness
+        }
+
+
+class ScraperOrchestrator:
+    """
+    Concurrent runner for scraper targets
+
+    Every target gets its own scraper instance forced onto the shared browser
+    pool (`reuse_browser`), so all targets share one Chromium process and the
+    pool's warm contexts. At most `max_contexts` targets hold a browser
+    context (one page each) at a time; beyond that, and on each domain, the
+    `DomainRateLimiter` spaces and caps requests. With enough slots the run
+    takes about as long as its slowest target.
+    """
+
+    def __init__(self, targets: Optional[List[ScrapeTarget]] = None, max_contexts: int = 4,
+                 rate_limiter: Optional[DomainRateLimiter] = None, target_timeout: float = 300.0,
+                 browser_pool=None):
+        """
+        Args:
+            targets: Targets to run
+            max_contexts: Browser contexts (and pages) in use at once
+            rate_limiter: Per-domain politeness; defaults to DomainRateLimiter()
+            target_timeout: Seconds before a single target is abandoned
+            browser_pool: Shared pool whose warm-context limit is raised to
+                          max_contexts (defaults to the process-wide pool)
+        """
+        self.targets: List[ScrapeTarget] = list(targets or [])
+        self.max_contexts = max_contexts
+        self.rate_limiter = rate_limiter or DomainRateLimiter()
+        self.target_timeout = target_timeout
+        self.browser_pool = browser_pool
+
+    def add_target(self, name: str, scraper_class: Type, url: Optional[str] = None,
+                   **config_overrides) -> ScrapeTarget:
+        """Register a target; names must be unique"""
+        if any(target.name == name for target in self.targets):
+            raise ValueError(f"Duplicate scrape target name: {name}")
+        target = ScrapeTarget(name, scraper_class, url, config_overrides)
+        self.targets.append(target)
+        return target
+
+    def _prepare_pool(self):
+        """Keep enough warm contexts for a full wave of concurrent targets"""
+        pool = self.browser_pool
+        if pool is None:
+            from browser_pool import get_browser_pool
+            pool = get_browser_pool()
+        pool.max_idle_contexts = max(pool.max_idle_contexts, self.max_contexts)
+
+    def _create_scraper(self, target: ScrapeTarget):
+        overrides = {
+            **target.config_overrides,
+            'reuse_browser': True,
+            # Separate output files and incremental state per target
+            'output_label': target.name
+        }
+        if target.url:
+            overrides['target_url'] = target.url
+        return target.scraper_class(overrides)
+
+    async def _run_target(self, target: ScrapeTarget, context_slots: asyncio.Semaphore) -> TargetResult:
+        started = time.monotonic()
+        started_at = datetime.now().isoformat()
+        domain = 'unknown'
+        try:
+            scraper = self._create_scraper(target)
+            domain = urlsplit(scraper.target_url).hostname or scraper.site_name
+        except Exception as e:
+            logger.error(f"❌ Could not create scraper for {target.name}: {e}")
+            return TargetResult(target.name, domain, False, error=str(e), started_at=started_at,
+                                duration=time.monotonic() - started)
+
+        waited = await self.rate_limiter.acquire(domain)
+        outcome: Optional[bool] = None
+        try:
+            wait_start = time.monotonic()
+            async with context_slots:
+                waited += time.monotonic() - wait_start
+                result = await asyncio.wait_for(scraper.scrape_data(),
+                                                timeout=target.timeout or self.target_timeout)
+            outcome = bool(result.get('success'))
+            logger.info(f"{'✅' if outcome else '❌'} {target.name} finished in "
+                        f"{time.monotonic() - started:.1f}s")
+            return TargetResult(target.name, domain, outcome, result=result,
+                                error=None if outcome else result.get('error'),
+                                started_at=started_at, duration=time.monotonic() - started, waited=waited)
+        except asyncio.TimeoutError:
+            outcome = False
+            # The scraper's own cleanup ran on cancellation; its context is discarded
+            logger.error(f"⏰ {target.name} timed out")
+            return TargetResult(target.name, domain, False, error='timeout', started_at=started_at,
+                                duration=time.monotonic() - started, waited=waited)
+        except Exception as e:
+            outcome = False
+            logger.error(f"❌ {target.name} failed: {e}")
+            return TargetResult(target.name, domain, False, error=str(e), started_at=started_at,
+                                duration=time.monotonic() - started, waited=waited)
+        finally:
+            self.rate_limiter.release(domain, outcome)
+
+    async def run(self, names: Optional[List[str]] = None) -> OrchestrationResult:
+        """
+        Run all targets (or the named subset) concurrently
+
+        Returns:
+            OrchestrationResult with one TargetResult per target
+        """
+        targets = [t for t in self.targets if names is None or t.name in names]
+        if not targets:
+            return OrchestrationResult()
+
+        self._prepare_pool()
+        context_slots = asyncio.Semaphore(self.max_contexts)
+        logger.info(f"🚀 Scraping {len(targets)} targets, up to {self.max_contexts} at a time")
+
+        started = time.monotonic()
+        results = await asyncio.gather(*(self._run_target(t, context_slots) for t in targets))
+        aggregated = OrchestrationResult(
+            results={result.name: result for result in results},
+            duration=time.monotonic() - started,
+            politeness=self.rate_limiter.get_statistics()
+        )
+        logger.info(f"🏁 Scraped {len(aggregated.succeeded)}/{len(targets)} targets in "
+                    f"{aggregated.duration:.1f}s")
+        return aggregated
+
+
+async def scrape_targets(targets: List[ScrapeTarget], max_contexts: int = 4) -> Dict[str, Any]:
+    """
+    Convenience function: scrape targets concurrently and return aggregated results
+
+    The shared browser stays up for later runs on the same loop; call
+    close_browser_pool() before that loop ends.
+
+    Args:
+        targets: Targets to run
+        max_contexts: Browser contexts (and pages) in use at once
+    """
+    orchestrator = ScraperOrchestrator(targets, max_contexts=max_contexts)
+    return (await orchestrator.run()).to_dict()
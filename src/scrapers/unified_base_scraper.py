@@ -10,10 +10,12 @@ import os
 import sys
 import logging
 import json
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext, TimeoutError
@@ -24,14 +26,23 @@ sys.path.append(str(Path(__file__).parent.parent.parent / 'utils'))
 sys.path.append(str(Path(__file__).parent.parent / 'utils'))
 from env_config import EnvironmentConfig
 from secure_session_manager import SecureSessionManager
+from browser_pool import get_browser_pool
+from resource_policy import ResourceBlockingPolicy
 from enhanced_error_handler import (
     resilient_operation, ErrorCategory, ErrorSeverity, RetryStrategy,
     retry_on_network_error, retry_on_authentication_error, circuit_breaker_protection,
     get_error_handler
 )
+from src.core.deadline import clamp_timeout
+from utils.http_client_pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
+
+def budget_ms(timeout_ms: int) -> int:
+    """Playwright timeout shortened to the run deadline (never 0, which Playwright treats as no limit)"""
+    return max(1, int(clamp_timeout(timeout_ms / 1000) * 1000))
+
 class ScrapingError(Exception):
     """Base exception for scraping operations"""
     pass
@@ -48,6 +59,37 @@ class SessionError(ScrapingError):
     """Session management failed"""
     pass
 
+def session_cookie_header(storage_state: Optional[Dict[str, Any]], url: str) -> str:
+    """
+    Cookie header a browser holding storage_state would send to url
+    
+    Applies the usual cookie rules: domain and subdomain match, path prefix,
+    secure cookies only over https, expired cookies dropped.
+    """
+    if not storage_state:
+        return ''
+    
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    path = parts.path or '/'
+    now = time.time()
+    
+    pairs = []
+    for cookie in storage_state.get('cookies', []):
+        domain = str(cookie.get('domain', '')).lower().lstrip('.')
+        if not domain or not (host == domain or host.endswith('.' + domain)):
+            continue
+        if not path.startswith(cookie.get('path') or '/'):
+            continue
+        if cookie.get('secure') and parts.scheme != 'https':
+            continue
+        expires = cookie.get('expires', -1)
+        if expires not in (None, -1) and expires < now:
+            continue
+        pairs.append(f"{cookie['name']}={cookie['value']}")
+    
+    return '; '.join(pairs)
+
 class UnifiedBaseScraper(ABC):
     """
     Unified base scraper that consolidates all common functionality
@@ -76,7 +118,11 @@ class UnifiedBaseScraper(ABC):
         # Core properties to be set by subclasses
         self.site_name = getattr(self, 'SITE_NAME', 'unknown')
         self.base_url = getattr(self, 'BASE_URL', '')
-        self.target_url = getattr(self, 'TARGET_URL', '')
+        self.target_url = self.config_overrides.get('target_url') or getattr(self, 'TARGET_URL', '')
+        self.login_path = getattr(self, 'LOGIN_PATH', '/login')
+        
+        # Distinguishes output files of several pages of one site scraped side by side
+        self.output_label = self.config_overrides.get('output_label')
         
         # Initialize directories
         self._setup_directories()
@@ -88,11 +134,24 @@ class UnifiedBaseScraper(ABC):
         # Browser configuration
         self.browser_config = self._get_browser_config()
         
+        # Reuse the process-wide browser and warm contexts unless disabled
+        reuse_default = str(self.optional_config.get('BROWSER_REUSE') or 'true').lower() != 'false'
+        self.reuse_browser = self.config_overrides.get('reuse_browser', reuse_default)
+        
+        # Try a plain HTTP fetch with the saved session before starting a browser
+        fast_path_default = str(self.optional_config.get('SCRAPER_HTTP_FAST_PATH') or 'true').lower() != 'false'
+        self.http_fast_path = self.config_overrides.get('http_fast_path', fast_path_default)
+        self.http_fast_path_timeout = self.config_overrides.get('http_fast_path_timeout', 20)
+        
+        # Requests the scrape never needs (images, fonts, trackers) are aborted
+        self.resource_policy = ResourceBlockingPolicy.from_config(self.config_overrides)
+        
         # State tracking
         self.browser = None
         self.context = None
         self.page = None
         self.session_data = {}
+        self._pooled_context = False
         
         logger.info(f"🚀 {self.__class__.__name__} initialized for {self.site_name}")
     
@@ -137,13 +196,33 @@ class UnifiedBaseScraper(ABC):
     async def initialize_browser(self) -> bool:
         """Initialize browser with session restoration"""
         try:
-            playwright = await async_playwright().start()
             # Extract browser launch options (only valid launch options)
             valid_launch_options = ['headless', 'executable_path', 'args', 'ignore_default_args', 
                                    'handle_sigint', 'handle_sigterm', 'handle_sighup', 'timeout',
                                    'env', 'devtools', 'proxy', 'downloads_path', 'slow_mo',
                                    'traces_dir', 'chromium_sandbox', 'firefox_user_prefs']
             launch_options = {k: v for k, v in self.browser_config.items() if k in valid_launch_options}
+            
+            if self.reuse_browser:
+                # Shared browser process; a warm context already carries the session
+                pool = get_browser_pool()
+                self.browser = await pool.get_browser(launch_options)
+                self.context = await pool.acquire_context(
+                    self.session_name,
+                    {
+                        'viewport': self.browser_config['viewport'],
+                        'user_agent': self.browser_config['user_agent'],
+                        'extra_http_headers': self.browser_config['extra_http_headers']
+                    },
+                    storage_state=lambda: self.session_manager.load_session_state(self.session_name),
+                    launch_options=launch_options
+                )
+                self._pooled_context = True
+                await self.resource_policy.install(self.context)
+                self.page = await self.context.new_page()
+                return True
+            
+            playwright = await async_playwright().start()
             self.browser = await playwright.chromium.launch(**launch_options)
             
             # Try to restore session
@@ -165,6 +244,7 @@ class UnifiedBaseScraper(ABC):
                 )
                 logger.info(f"🆕 Created new session for {self.site_name}")
             
+            await self.resource_policy.install(self.context)
             self.page = await self.context.new_page()
             return True
             
@@ -211,6 +291,23 @@ class UnifiedBaseScraper(ABC):
     )
     async def scrape_data(self) -> Dict[str, Any]:
         """Main scraping orchestration method"""
+        # Fast path: saved session cookies over plain HTTP, no browser
+        if self.http_fast_path:
+            fast_data = await self._try_http_fast_path()
+            if fast_data is not None:
+                processed_data = await self._process_data(fast_data)
+                output_file = await self._save_results(processed_data)
+                
+                logger.info(f"⚡ Scraping completed over HTTP for {self.site_name} (browser not needed)")
+                return {
+                    'success': True,
+                    'data': processed_data,
+                    'output_file': str(output_file),
+                    'mode': 'http',
+                    'timestamp': datetime.now().isoformat()
+                }
+        
+        succeeded = False
         try:
             # Initialize browser and authenticate
             await self.initialize_browser()
@@ -232,10 +329,12 @@ class UnifiedBaseScraper(ABC):
             output_file = await self._save_results(processed_data)
             
             logger.info(f"✅ Scraping completed successfully for {self.site_name}")
+            succeeded = True
             return {
                 'success': True,
                 'data': processed_data,
                 'output_file': str(output_file),
+                'mode': 'browser',
                 'timestamp': datetime.now().isoformat()
             }
             
@@ -248,7 +347,68 @@ class UnifiedBaseScraper(ABC):
                 'timestamp': datetime.now().isoformat()
             }
         finally:
-            await self.cleanup()
+            await self.cleanup(discard=not succeeded)
+    
+    async def _try_http_fast_path(self) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the target page over HTTP with the saved session cookies
+        
+        Returns validated raw data when the page is server-rendered, the session
+        is still accepted and the content passes _validate_data; None (fall back
+        to the browser) on any auth failure, missing content or error.
+        """
+        try:
+            session_state = await self.session_manager.load_session_state_async(self.session_name)
+            cookie_header = session_cookie_header(session_state, self.target_url)
+            if not cookie_header:
+                logger.info(f"No saved session cookies for {self.site_name}, using browser")
+                return None
+            
+            headers = dict(self.browser_config['extra_http_headers'])
+            headers['User-Agent'] = self.browser_config['user_agent']
+            headers['Cookie'] = cookie_header
+            
+            # Shared keep-alive client: repeat runs skip the TLS handshake
+            client = get_http_client(timeout=self.http_fast_path_timeout)
+            response = await client.get(self.target_url, headers=headers, follow_redirects=True)
+            final_url = str(response.url)
+            if response.status_code != 200:
+                logger.info(f"HTTP fast path got status {response.status_code}, using browser")
+                return None
+            html = response.text
+            
+            if self._is_login_url(final_url):
+                logger.info("Saved session was not accepted (redirected to login), using browser")
+                return None
+            
+            raw_data = await asyncio.to_thread(self._extract_data_from_html, html, final_url)
+            if raw_data is None:
+                return None
+            
+            validated_data = await self._validate_data(raw_data)
+            if not validated_data.get('validation', {}).get('is_valid'):
+                logger.info("HTTP fast path content incomplete, using browser")
+                return None
+            
+            return validated_data
+            
+        except Exception as e:
+            logger.info(f"HTTP fast path failed ({e}), using browser")
+            return None
+    
+    def _is_login_url(self, url: str) -> bool:
+        """True if url is the site's login page (path match, so /signals or ?next=login do not count)"""
+        path = urlsplit(url).path.rstrip('/').lower()
+        return path == self.login_path.rstrip('/').lower()
+    
+    def _extract_data_from_html(self, html: str, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Build the same raw data as _extract_data from fetched HTML
+        
+        Subclasses opt into the HTTP fast path by overriding this; the default
+        returns None, so the browser is always used.
+        """
+        return None
     
     @retry_on_network_error(max_retries=3)
     async def _navigate_to_target(self):
@@ -260,12 +420,12 @@ class UnifiedBaseScraper(ABC):
             # Try different wait strategies for better reliability
             try:
                 # First try with domcontentloaded which is more reliable
-                await self.page.goto(self.target_url, wait_until='domcontentloaded', timeout=60000)
+                await self.page.goto(self.target_url, wait_until='domcontentloaded', timeout=budget_ms(60000))
                 logger.info(f"✅ Page loaded with domcontentloaded: {self.target_url}")
             except Exception as nav_error:
                 logger.warning(f"⚠️ Initial navigation failed, trying alternative approach: {nav_error}")
                 # Fallback to commit which just waits for navigation to start
-                await self.page.goto(self.target_url, wait_until='commit', timeout=30000)
+                await self.page.goto(self.target_url, wait_until='commit', timeout=budget_ms(30000))
                 # Then wait for content to load
                 await asyncio.sleep(5)
                 logger.info(f"✅ Navigation started with commit: {self.target_url}")
@@ -281,7 +441,8 @@ class UnifiedBaseScraper(ABC):
     async def _save_results(self, data: Dict[str, Any]) -> Path:
         """Save scraped results to file"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{self.site_name}_data_{timestamp}.json"
+        prefix = f"{self.site_name}_{self.output_label}" if self.output_label else self.site_name
+        filename = f"{prefix}_data_{timestamp}.json"
         output_file = self.output_dir / filename
         
         try:
@@ -289,7 +450,7 @@ class UnifiedBaseScraper(ABC):
                 json.dump(data, f, indent=2, default=str)
             
             # Also save as latest
-            latest_file = self.output_dir / f"latest_{self.site_name}_data.json"
+            latest_file = self.output_dir / f"latest_{prefix}_data.json"
             with open(latest_file, 'w') as f:
                 json.dump(data, f, indent=2, default=str)
             
@@ -327,9 +488,31 @@ class UnifiedBaseScraper(ABC):
             except Exception as screenshot_error:
                 logger.error(f"Failed to take error screenshot: {screenshot_error}")
     
-    async def cleanup(self):
-        """Clean up browser resources"""
+    async def cleanup(self, discard: bool = True):
+        """
+        Clean up browser resources
+        
+        A pooled context goes back to the shared pool and the browser stays up;
+        with discard=True (after a failure) the context is closed instead.
+        """
         try:
+            if self._pooled_context:
+                if self.page:
+                    try:
+                        await self.page.close()
+                    except Exception as e:
+                        logger.debug(f"Error closing page: {e}")
+                if self.context:
+                    await get_browser_pool().release_context(self.session_name, self.context, healthy=not discard)
+                
+                self.page = None
+                self.context = None
+                self.browser = None
+                self._pooled_context = False
+                
+                logger.info(f"✅ Browser context returned to pool for {self.site_name}")
+                return
+            
             if self.context:
                 await self.context.close()
             if self.browser:
@@ -381,7 +564,7 @@ class UnifiedBaseScraper(ABC):
     async def wait_and_click(self, selector: str, timeout: int = 5000):
         """Wait for element and click it"""
         try:
-            await self.page.wait_for_selector(selector, timeout=timeout)
+            await self.page.wait_for_selector(selector, timeout=budget_ms(timeout))
             await self.page.click(selector)
             await asyncio.sleep(0.5)  # Brief pause after click
         except Exception as e:
@@ -390,7 +573,7 @@ class UnifiedBaseScraper(ABC):
     async def wait_and_type(self, selector: str, text: str, timeout: int = 5000):
         """Wait for element and type text"""
         try:
-            await self.page.wait_for_selector(selector, timeout=timeout)
+            await self.page.wait_for_selector(selector, timeout=budget_ms(timeout))
             await self.page.fill(selector, text)
             await asyncio.sleep(0.3)  # Brief pause after typing
         except Exception as e:
@@ -399,7 +582,15 @@ class UnifiedBaseScraper(ABC):
     async def wait_for_element(self, selector: str, timeout: int = 5000) -> bool:
         """Wait for element to appear"""
         try:
-            await self.page.wait_for_selector(selector, timeout=timeout)
+            await self.page.wait_for_selector(selector, timeout=budget_ms(timeout))
+            return True
+        except Exception:
+            return False
+    
+    async def wait_for_network_idle(self, timeout: int = 5000) -> bool:
+        """Wait until the page has had no network activity for 500 ms"""
+        try:
+            await self.page.wait_for_load_state('networkidle', timeout=budget_ms(timeout))
             return True
         except Exception:
             return False
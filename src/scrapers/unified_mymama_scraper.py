@@ -6,17 +6,99 @@ Replaces multiple duplicate scraper implementations with single, well-architecte
 """
 
 import asyncio
+import copy
 import logging
 import re
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
-from .unified_base_scraper import UnifiedBaseScraper, AuthenticationError, DataExtractionError
+from bs4 import BeautifulSoup
+
+from .unified_base_scraper import UnifiedBaseScraper, AuthenticationError, DataExtractionError, budget_ms
+from browser_pool import close_browser_pool
 from ..data_processors.financial_alerts import FinancialAlertsProcessor
 from ..data_processors.data_models import StructuredFinancialReport
+from ..data_processors.parsed_document import HTML_PARSER
+from ..data_processors.incremental import SectionHashStore
 
 logger = logging.getLogger(__name__)
 
+# Collects everything _extract_data needs in one round trip: the serialized page
+# (as page.content() returns it), body text, every table, and the first match of
+# each section's candidate selectors. Selectors the browser rejects are reported
+# so the caller can retry that section through Playwright's own selector engine.
+EXTRACTION_SCRIPT = """
+(sections) => {
+    const serialize = () => {
+        let html = '';
+        if (document.doctype) html = new XMLSerializer().serializeToString(document.doctype);
+        if (document.documentElement) html += document.documentElement.outerHTML;
+        return html;
+    };
+    const result = {
+        page_content: serialize(),
+        page_text: document.body ? document.body.innerText : '',
+        tables: Array.from(document.querySelectorAll('table')).map(
+            (table) => ({html: table.innerHTML, text: table.innerText})
+        ),
+        sections: {},
+        unsupported: {}
+    };
+    for (const [name, candidates] of Object.entries(sections)) {
+        result.sections[name] = {html: '', text: '', selector_used: 'none'};
+        result.unsupported[name] = [];
+        for (const [selector, label] of candidates) {
+            let element = null;
+            try {
+                element = document.querySelector(selector);
+            } catch (e) {
+                result.unsupported[name].push(selector);
+                continue;
+            }
+            if (element) {
+                result.sections[name] = {html: element.innerHTML, text: element.innerText, selector_used: label};
+                break;
+            }
+        }
+    }
+    return result;
+}
+"""
+
+# Elements whose boundaries become line breaks in rendered text
+_BLOCK_TAGS = [
+    'p', 'div', 'section', 'article', 'header', 'footer', 'main', 'aside', 'nav',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'table', 'tr', 'blockquote', 'pre'
+]
+
+
+def _rendered_text(element) -> str:
+    """
+    Approximate a browser's innerText for parsed HTML
+
+    Drops scripts/styles, breaks lines at block elements and <br>, separates
+    table cells with tabs and collapses the remaining whitespace, so the text
+    splits into the same lines the financial alerts processor sees from Playwright.
+    """
+    element = copy.copy(element)
+    for hidden in element.find_all(['script', 'style', 'noscript', 'template']):
+        hidden.decompose()
+    for br in element.find_all('br'):
+        br.replace_with('\n')
+    for cell in element.find_all(['td', 'th']):
+        cell.append('\t')
+    for block in element.find_all(_BLOCK_TAGS):
+        block.insert_before('\n')
+        block.insert_after('\n')
+
+    lines = []
+    for line in element.get_text().split('\n'):
+        line = re.sub(r'[ \f\r\v\xa0]+', ' ', line).strip(' \t')
+        if line:
+            lines.append(line)
+    return '\n'.join(lines)
+
+
 class UnifiedMyMamaScraper(UnifiedBaseScraper):
     """
     Unified MyMama scraper implementing the base scraper pattern
@@ -27,6 +109,7 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
     SITE_NAME = 'mymama'
     BASE_URL = 'https://www.mymama.uk'
     TARGET_URL = 'https://www.mymama.uk/copy-of-alerts-essentials-1'
+    LOGIN_PATH = '/login'
     
     def __init__(self, config_overrides: Optional[Dict] = None):
         """Initialize MyMama scraper"""
@@ -40,6 +123,11 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
         # Initialize data processor
         self.processor = FinancialAlertsProcessor()
         
+        # Section hashes of the last processed page; unchanged sections are not re-parsed
+        self.incremental = self.config_overrides.get('incremental', True)
+        state_name = f"section_hashes_{self.output_label}.json" if self.output_label else 'section_hashes.json'
+        self.section_store = SectionHashStore(self.cache_dir / state_name)
+        
         # MyMama-specific selectors
         self.selectors = {
             'login': {
@@ -60,13 +148,21 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
             'authentication_check': 'body:not(:has(input[type="password"]))'
         }
         
+        # Page readiness timeouts (ms), replacing fixed sleeps
+        self.readiness = {
+            'content_timeout': 10000,
+            'data_timeout': 5000,
+            'network_idle_timeout': 5000,
+            **self.config_overrides.get('readiness', {})
+        }
+        
         logger.info(f"🎯 MyMama scraper configured for user: {self.username}")
     
     async def _is_authenticated(self) -> bool:
         """Check if already authenticated with MyMama"""
         try:
             # Navigate to target page to check authentication
-            await self.page.goto(self.target_url, wait_until='domcontentloaded', timeout=15000)
+            await self.page.goto(self.target_url, wait_until='domcontentloaded', timeout=budget_ms(15000))
             
             # Wait briefly for any authentication redirects
             await asyncio.sleep(2)
@@ -101,7 +197,7 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
             # Navigate to login page if needed
             current_url = self.page.url
             if 'login' not in current_url.lower():
-                await self.page.goto(f"{self.BASE_URL}/login", wait_until='domcontentloaded')
+                await self.page.goto(f"{self.BASE_URL}{self.LOGIN_PATH}", wait_until='domcontentloaded')
             
             # Handle any modal dialogs that might appear
             await self._handle_modals()
@@ -161,18 +257,20 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
     async def _wait_for_page_ready(self):
         """Wait for MyMama page-specific load conditions"""
         try:
-            # Wait for main content area
-            await self.wait_for_element(self.selectors['content']['content_area'], timeout=10000)
+            readiness = self.readiness
             
-            # Wait for tables or alerts to load
-            tables_loaded = await self.wait_for_element(self.selectors['content']['tables'], timeout=5000)
-            alerts_loaded = await self.wait_for_element(self.selectors['content']['alerts'], timeout=5000)
+            # Wait for main content area
+            await self.wait_for_element(self.selectors['content']['content_area'], timeout=readiness['content_timeout'])
             
-            if not (tables_loaded or alerts_loaded):
+            # Wait for tables or alerts to load (whichever appears first)
+            data_selector = f"{self.selectors['content']['tables']}, {self.selectors['content']['alerts']}"
+            if not await self.wait_for_element(data_selector, timeout=readiness['data_timeout']):
                 logger.warning("No tables or alerts found - page may not have loaded completely")
             
-            # Additional wait for dynamic content
-            await asyncio.sleep(2)
+            # Dynamic content has settled once the network goes quiet; heavy
+            # assets are blocked, so this is usually reached quickly
+            if not await self.wait_for_network_idle(timeout=readiness['network_idle_timeout']):
+                logger.debug("Network did not go idle in time, extracting anyway")
             
             logger.info("✅ MyMama page ready for data extraction")
             
@@ -184,21 +282,23 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
         try:
             logger.info("🔍 Starting data extraction from MyMama...")
             
-            # Get page content
-            page_content = await self.page.content()
-            page_text = await self.page.inner_text('body')
-            
-            # Extract tables
-            tables_data = await self._extract_tables()
-            
-            # Extract forex data
-            forex_data = await self._extract_forex_section()
+            snapshot = await self._extract_snapshot()
             
-            # Extract options data
-            options_data = await self._extract_options_section()
-            
-            # Extract earnings data
-            earnings_data = await self._extract_earnings_section()
+            if snapshot:
+                page_content = snapshot['page_content']
+                page_text = snapshot['page_text']
+                tables_data = snapshot['tables']
+                forex_data = snapshot['sections']['forex']
+                options_data = snapshot['sections']['options']
+                earnings_data = snapshot['sections']['earnings']
+            else:
+                # Per-element path: one round trip per call
+                page_content = await self.page.content()
+                page_text = await self.page.inner_text('body')
+                tables_data = await self._extract_tables()
+                forex_data = await self._extract_forex_section()
+                options_data = await self._extract_options_section()
+                earnings_data = await self._extract_earnings_section()
             
             raw_data = {
                 'page_content': page_content,
@@ -218,6 +318,114 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
             logger.error(f"Data extraction failed: {e}")
             raise DataExtractionError(f"Failed to extract data from MyMama: {e}")
     
+    def _extract_data_from_html(self, html: str, url: str) -> Optional[Dict[str, Any]]:
+        """Raw data in the _extract_data layout from server-rendered HTML (HTTP fast path)"""
+        soup = BeautifulSoup(html, HTML_PARSER)
+        if soup.select_one(self.selectors['login']['password']):
+            logger.info("Fetched page shows a login form, session not accepted")
+            return None
+        
+        tables = soup.select('table')
+        
+        tables_data = []
+        for i, table in enumerate(tables):
+            table_text = _rendered_text(table)
+            tables_data.append({
+                'index': i,
+                'html': table.decode_contents(),
+                'text': table_text,
+                'row_count': len(table_text.split('\n')) if table_text else 0
+            })
+        
+        sections = {}
+        for name, candidates in self._section_selectors().items():
+            sections[name] = {'html': '', 'text': '', 'selector_used': 'none'}
+            for selector, label in candidates:
+                element = soup.select_one(selector)
+                if element:
+                    sections[name] = {
+                        'html': element.decode_contents(),
+                        'text': _rendered_text(element),
+                        'selector_used': label
+                    }
+                    break
+        
+        body = soup.body or soup
+        return {
+            'page_content': html,
+            'page_text': _rendered_text(body),
+            'tables': tables_data,
+            'forex': sections['forex'],
+            'options': sections['options'],
+            'earnings': sections['earnings'],
+            'extraction_timestamp': self._get_timestamp(),
+            'source_url': url
+        }
+    
+    def _section_selectors(self) -> Dict[str, List[List[str]]]:
+        """Candidate [selector, reported label] pairs per section, in priority order"""
+        content = self.selectors['content']
+        return {
+            'forex': [
+                [content['forex_section']] * 2,
+                ['table:first-of-type'] * 2,
+                ['.forex, .currency'] * 2,
+                ['[data-section="forex"]'] * 2,
+                # If no specific forex section, take the first table
+                ['table', 'table:first-of-type']
+            ],
+            'options': [
+                [content['options_section']] * 2,
+                ['[data-section="options"]'] * 2,
+                ['.options, .equity'] * 2,
+                ['table:nth-of-type(2)'] * 2
+            ],
+            'earnings': [
+                [content['earnings_section']] * 2,
+                ['[data-section="earnings"]'] * 2,
+                ['.earnings, .premium'] * 2,
+                ['table:last-of-type'] * 2
+            ]
+        }
+    
+    async def _extract_snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Extract page, tables and sections with a single page.evaluate call
+        
+        Returns None when the script fails, so the caller falls back to the
+        per-element path. Sections whose selectors the browser rejected are
+        re-extracted through Playwright's selector engine.
+        """
+        try:
+            snapshot = await self.page.evaluate(EXTRACTION_SCRIPT, self._section_selectors())
+        except Exception as e:
+            logger.warning(f"⚠️ Batched extraction failed, using per-element extraction: {e}")
+            return None
+        
+        snapshot['tables'] = [
+            {
+                'index': i,
+                'html': table['html'],
+                'text': table['text'],
+                'row_count': len(table['text'].split('\n')) if table['text'] else 0
+            }
+            for i, table in enumerate(snapshot.get('tables', []))
+        ]
+        
+        fallbacks = {
+            'forex': self._extract_forex_section,
+            'options': self._extract_options_section,
+            'earnings': self._extract_earnings_section
+        }
+        for name, unsupported in snapshot.get('unsupported', {}).items():
+            if unsupported and snapshot['sections'][name]['selector_used'] == 'none':
+                logger.debug(f"Selectors {unsupported} not supported in page, retrying {name} section")
+                snapshot['sections'][name] = await fallbacks[name]()
+        
+        matched = ', '.join(f"{name}={section.get('selector_used')}" for name, section in snapshot['sections'].items())
+        logger.info(f"✅ Extracted {len(snapshot['tables'])} tables in one pass (sections: {matched})")
+        return snapshot
+    
     async def _extract_tables(self) -> List[Dict[str, Any]]:
         """Extract all tables from the page"""
         tables = []
@@ -246,12 +454,7 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
         """Extract forex-specific data"""
         try:
             # Try multiple selectors for forex section
-            forex_selectors = [
-                self.selectors['content']['forex_section'],
-                'table:first-of-type',
-                '.forex, .currency',
-                '[data-section="forex"]'
-            ]
+            forex_selectors = [selector for selector, _ in self._section_selectors()['forex'][:-1]]
             
             for selector in forex_selectors:
                 element = await self.page.query_selector(selector)
@@ -281,12 +484,7 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
         """Extract options-specific data"""
         try:
             # Look for options-related content
-            options_selectors = [
-                self.selectors['content']['options_section'],
-                '[data-section="options"]',
-                '.options, .equity',
-                'table:nth-of-type(2)'
-            ]
+            options_selectors = [selector for selector, _ in self._section_selectors()['options']]
             
             for selector in options_selectors:
                 element = await self.page.query_selector(selector)
@@ -307,12 +505,7 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
         """Extract earnings-specific data"""
         try:
             # Look for earnings-related content
-            earnings_selectors = [
-                self.selectors['content']['earnings_section'],
-                '[data-section="earnings"]',
-                '.earnings, .premium',
-                'table:last-of-type'
-            ]
+            earnings_selectors = [selector for selector, _ in self._section_selectors()['earnings']]
             
             for selector in earnings_selectors:
                 element = await self.page.query_selector(selector)
@@ -405,22 +598,35 @@ class UnifiedMyMamaScraper(UnifiedBaseScraper):
             logger.info("🔄 Processing MyMama data...")
             
             # Use the financial alerts processor
-            structured_report = await asyncio.to_thread(
-                self.processor.process_scraped_data,
-                data.get('page_content', ''),
-                data.get('page_text', '')
-            )
+            change_set = None
+            if self.incremental:
+                structured_report, change_set = await asyncio.to_thread(
+                    self.processor.process_incremental,
+                    data.get('page_content', ''),
+                    self.section_store,
+                    data.get('page_text', '')
+                )
+            else:
+                structured_report = await asyncio.to_thread(
+                    self.processor.process_scraped_data,
+                    data.get('page_content', ''),
+                    data.get('page_text', '')
+                )
             
             # Convert structured report to dict format for consistency
+            report_dict = structured_report.to_dict()
             processed_data = {
-                'forex_forecasts': [f.to_dict() for f in structured_report.forex_forecasts],
-                'options_trades': [o.to_dict() for o in structured_report.options_trades],
-                'stock_crypto_forecasts': [s.to_dict() for s in structured_report.stock_crypto_forecasts],
-                'swing_trades': [sw.to_dict() for sw in structured_report.swing_trades],
-                'day_trades': [d.to_dict() for d in structured_report.day_trades],
-                'earnings_reports': [e.to_dict() for e in structured_report.earnings_reports],
-                'table_sections': [t.to_dict() for t in structured_report.table_sections],
+                'forex_forecasts': report_dict['forex_forecasts'],
+                'options_trades': report_dict['options_trades'],
+                'stock_crypto_forecasts': report_dict['stock_crypto_forecasts'],
+                'swing_trades': report_dict['swing_trades'],
+                'day_trades': report_dict['day_trades'],
+                'earnings_reports': report_dict['earnings_reports'],
+                'table_sections': report_dict['table_sections'],
                 'summary_stats': structured_report.get_summary_stats(),
+                # Per-section diff against the previous scrape, for "what changed" updates
+                'change_set': change_set.to_dict() if change_set else None,
+                'has_changes': change_set.has_changes if change_set else True,
                 'source': 'mymama',
                 'source_url': data.get('source_url'),
                 'extraction_timestamp': data.get('extraction_timestamp'),
@@ -474,5 +680,7 @@ if __name__ == "__main__":
                 
         except Exception as e:
             print(f"❌ Error: {e}")
+        finally:
+            await close_browser_pool()
     
     asyncio.run(main())
\ No newline at end of file
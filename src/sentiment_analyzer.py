@@ -7,12 +7,14 @@ import logging
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-import numpy as np
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 from src.core.config import settings
 from .data_fetcher import data_fetcher
 from .cache_manager import cache_manager
+from .utils.pattern_matcher import MultiPatternMatcher
+from .utils.lazy import LazySingleton, lazy_import
+
+np = lazy_import('numpy')
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,7 @@ class SentimentAnalyzer:
     """Multi-source sentiment analysis for forex markets"""
     
     def __init__(self):
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
         self.vader = SentimentIntensityAnalyzer()
         self.alpha_vantage_calls_today = 0
         
@@ -68,6 +71,15 @@ class SentimentAnalyzer:
             'monetary easing', 'maintain accommodation', 'pause', 'patient'
         ]
         
+        # Currency codes reported as keywords
+        self.currency_codes = ['usd', 'eur', 'jpy', 'gbp', 'cad', 'chf', 'aud', 'nzd']
+        
+        # Compiled once; each text is scanned a single time for all keywords
+        self.keyword_matcher = MultiPatternMatcher(
+            self.currency_codes + self.bullish_keywords + self.bearish_keywords, case='lower'
+        )
+        self.cb_matcher = MultiPatternMatcher(self.hawkish_terms + self.dovish_terms, case='lower')
+        
         # Source weights for composite sentiment
         self.source_weights = {
             'alpha_vantage': 0.40,  # AI-powered, highest quality
@@ -271,11 +283,11 @@ class SentimentAnalyzer:
         base_score = vader_scores['compound']
         
         # Forex-specific enhancements
-        text_lower = text.lower()
+        found = self.keyword_matcher.found(text)
         
         # Keyword sentiment boosts
-        bullish_count = sum(1 for keyword in self.bullish_keywords if keyword in text_lower)
-        bearish_count = sum(1 for keyword in self.bearish_keywords if keyword in text_lower)
+        bullish_count = sum(1 for keyword in self.bullish_keywords if keyword in found)
+        bearish_count = sum(1 for keyword in self.bearish_keywords if keyword in found)
         
         # Calculate keyword sentiment
         keyword_sentiment = 0.0
@@ -301,10 +313,10 @@ class SentimentAnalyzer:
     
     def _analyze_central_bank_tone(self, text: str) -> float:
         """Analyze central bank communication for hawkish/dovish tone"""
-        text_lower = text.lower()
+        found = self.cb_matcher.found(text)
         
-        hawkish_count = sum(1 for term in self.hawkish_terms if term in text_lower)
-        dovish_count = sum(1 for term in self.dovish_terms if term in text_lower)
+        hawkish_count = sum(1 for term in self.hawkish_terms if term in found)
+        dovish_count = sum(1 for term in self.dovish_terms if term in found)
         
         if hawkish_count == 0 and dovish_count == 0:
             # Use VADER as fallback
@@ -321,37 +333,36 @@ class SentimentAnalyzer:
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract relevant forex keywords from text"""
-        text_lower = text.lower()
+        found = self.keyword_matcher.found(text)
         found_keywords = []
         
         # Check for currency names and codes
-        currencies = ['usd', 'eur', 'jpy', 'gbp', 'cad', 'chf', 'aud', 'nzd']
-        for currency in currencies:
-            if currency in text_lower:
+        for currency in self.currency_codes:
+            if currency in found:
                 found_keywords.append(currency.upper())
         
         # Check for bullish/bearish indicators
         for keyword in self.bullish_keywords:
-            if keyword in text_lower:
+            if keyword in found:
                 found_keywords.append(f"bullish:{keyword}")
                 
         for keyword in self.bearish_keywords:
-            if keyword in text_lower:
+            if keyword in found:
                 found_keywords.append(f"bearish:{keyword}")
         
         return found_keywords[:10]  # Limit to top 10
     
     def _extract_cb_keywords(self, text: str) -> List[str]:
         """Extract central bank specific keywords"""
-        text_lower = text.lower()
+        found = self.cb_matcher.found(text)
         found_keywords = []
         
         for term in self.hawkish_terms:
-            if term in text_lower:
+            if term in found:
                 found_keywords.append(f"hawkish:{term}")
                 
         for term in self.dovish_terms:
-            if term in text_lower:
+            if term in found:
                 found_keywords.append(f"dovish:{term}")
         
         return found_keywords[:5]
@@ -483,4 +494,4 @@ class SentimentAnalyzer:
         }
 
 # Global sentiment analyzer instance
-sentiment_analyzer = SentimentAnalyzer()
\ No newline at end of file
+sentiment_analyzer = LazySingleton(SentimentAnalyzer, 'sentiment_analyzer')
\ No newline at end of file
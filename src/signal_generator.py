@@ -2,17 +2,21 @@
 Composite signal generation for forex trading
 Combines technical analysis, economic fundamentals, and sentiment analysis
 """
-import numpy as np
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from src.core.config import settings
+from src.core.deadline import allows_optional, check as check_deadline
+from src.core.tracing import traced
 from .technical_analysis import technical_analyzer
 from .economic_analyzer import economic_analyzer
 from .sentiment_analyzer import sentiment_analyzer
 from .data_fetcher import data_fetcher
+from .utils.lazy import LazySingleton, lazy_import
+
+np = lazy_import('numpy')
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +100,7 @@ class SignalGenerator:
             'risk_reward_ratio': 2.0
         }
     
+    @traced('generate_weekly_signal', capture=('pair',))
     def generate_weekly_signal(self, pair: str) -> TradingSignal:
         """
         Generate comprehensive weekly trading signal
@@ -110,11 +115,17 @@ class SignalGenerator:
             # 2. Economic Fundamentals
             economic_component = self._analyze_economic_signals(pair)
             
-            # 3. Market Sentiment
-            sentiment_component = self._analyze_sentiment_signals(pair)
+            # 3. Market Sentiment (optional: dropped when the run deadline is close)
+            if allows_optional('analysis.sentiment', pair=pair):
+                sentiment_component = self._analyze_sentiment_signals(pair)
+            else:
+                sentiment_component = self._create_skipped_component('sentiment')
             
-            # 4. Geopolitical Events
-            geopolitical_component = self._analyze_geopolitical_signals(pair)
+            # 4. Geopolitical Events (optional)
+            if allows_optional('analysis.geopolitical', pair=pair):
+                geopolitical_component = self._analyze_geopolitical_signals(pair)
+            else:
+                geopolitical_component = self._create_skipped_component('geopolitical')
             
             # Collect all components
             components = {
@@ -170,6 +181,7 @@ class SignalGenerator:
             logger.error(f"Error generating signal for {pair}: {e}")
             return self._create_error_signal(pair, str(e))
     
+    @traced('analysis.technical', capture=('pair',))
     def _analyze_technical_signals(self, pair: str) -> SignalComponent:
         """Analyze multi-timeframe technical signals for increased signal frequency"""
         try:
@@ -366,6 +378,7 @@ class SignalGenerator:
                 details={'error': str(e)}
             )
     
+    @traced('analysis.economic', capture=('pair',))
     def _analyze_economic_signals(self, pair: str) -> SignalComponent:
         """Analyze economic fundamental signals"""
         try:
@@ -423,6 +436,7 @@ class SignalGenerator:
                 details={'error': str(e)}
             )
     
+    @traced('analysis.sentiment', capture=('pair',))
     def _analyze_sentiment_signals(self, pair: str) -> SignalComponent:
         """Analyze market sentiment signals"""
         try:
@@ -466,6 +480,7 @@ class SignalGenerator:
                 details={'error': str(e)}
             )
     
+    @traced('analysis.geopolitical', capture=('pair',))
     def _analyze_geopolitical_signals(self, pair: str) -> SignalComponent:
         """Analyze geopolitical event signals"""
         try:
@@ -821,6 +836,16 @@ class SignalGenerator:
             'confidence_level': confidence
         }
     
+    def _create_skipped_component(self, component: str) -> SignalComponent:
+        """Zero-confidence placeholder for an optional component skipped to meet the run deadline"""
+        return SignalComponent(
+            component=component,
+            score=0.0,
+            confidence=0.0,
+            weight=self.base_weights[component],
+            details={'skipped': 'run deadline'}
+        )
+    
     def _create_error_signal(self, pair: str, error_msg: str) -> TradingSignal:
         """Create error signal when analysis fails"""
         return TradingSignal(
@@ -848,12 +873,14 @@ class SignalGenerator:
             days_ahead += 7
         return today + timedelta(days=days_ahead)
     
+    @traced('generate_signals_for_pairs', category='run')
     def generate_signals_for_pairs(self, pairs: List[str]) -> Dict[str, TradingSignal]:
         """Generate signals for multiple currency pairs"""
         signals = {}
         
         for pair in pairs:
             try:
+                check_deadline(f'signal.{pair}')
                 signal = self.generate_weekly_signal(pair)
                 signals[pair] = signal
                 logger.info(f"Generated signal for {pair}: {signal.action}")
@@ -864,4 +891,4 @@ class SignalGenerator:
         return signals
 
 # Global signal generator instance
-signal_generator = SignalGenerator()
\ No newline at end of file
+signal_generator = LazySingleton(SignalGenerator, 'signal_generator')
\ No newline at end of file
@@ -2,8 +2,8 @@
 Technical analysis module with 4-hour candlestick patterns and indicators
 Critical: 4-hour timeframe is mandatory for candlestick pattern detection
 """
-import numpy as np
-import pandas as pd
+from __future__ import annotations
+
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -11,6 +11,10 @@ import logging
 
 from src.core.config import settings
 from .data_fetcher import data_fetcher
+from .utils.lazy import LazySingleton, lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
 
 logger = logging.getLogger(__name__)
 
@@ -1046,4 +1050,4 @@ class TechnicalAnalyzer:
         }
 
 # Global technical analyzer instance
-technical_analyzer = TechnicalAnalyzer()
\ No newline at end of file
+technical_analyzer = LazySingleton(TechnicalAnalyzer, 'technical_analyzer')
\ No newline at end of file
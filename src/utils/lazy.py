@@ -0,0 +1,170 @@
+"""
+Lazy singletons and deferred imports
+Module-level service instances (data fetcher, cache manager, analyzers) are
+built on first use and heavy third-party libraries (pandas, numpy, redis)
+are imported on first attribute access, so CLI entry points, --help and
+health-check scripts start without paying for either.
+"""
+
+import importlib
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Libraries worth warming in the background before an analysis run
+HEAVY_LIBRARIES = ('numpy', 'pandas', 'feedparser', 'vaderSentiment.vaderSentiment', 'redis')
+
+_MISSING = object()
+
+
+class LazySingleton:
+    """
+    Stand-in for a module-level `instance = Factory()`
+
+    Importing the module, or `from module import instance`, does not run the
+    constructor; the first attribute access (or isinstance() check) does,
+    exactly once even across threads. Replacing the module attribute with
+    mock.patch still swaps out the whole object. Dunder lookups are not
+    forwarded, so introspection does not build the instance.
+    """
+
+    __slots__ = ('_lazy_factory', '_lazy_instance', '_lazy_lock', '_lazy_name')
+
+    def __init__(self, factory: Callable[[], Any], name: Optional[str] = None):
+        object.__setattr__(self, '_lazy_factory', factory)
+        object.__setattr__(self, '_lazy_instance', _MISSING)
+        object.__setattr__(self, '_lazy_lock', threading.Lock())
+        object.__setattr__(self, '_lazy_name', name or getattr(factory, '__name__', repr(factory)))
+
+    def _lazy_get(self) -> Any:
+        instance = self._lazy_instance
+        if instance is _MISSING:
+            with self._lazy_lock:
+                instance = self._lazy_instance
+                if instance is _MISSING:
+                    started = time.perf_counter()
+                    instance = self._lazy_factory()
+                    object.__setattr__(self, '_lazy_instance', instance)
+                    logger.debug(f"Initialized {self._lazy_name} in "
+                                 f"{(time.perf_counter() - started) * 1000:.1f}ms")
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        return getattr(self._lazy_get(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._lazy_get(), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(self._lazy_get(), name)
+
+    @property
+    def __class__(self):
+        return type(self._lazy_get())
+
+    def __repr__(self) -> str:
+        if self._lazy_instance is _MISSING:
+            return f"<lazy {self._lazy_name} (not initialized)>"
+        return repr(self._lazy_instance)
+
+
+class LazyModule(ModuleType):
+    """Module placeholder that imports the real module on first attribute access"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazy_module'] is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Module proxy for `import name` that defers the import to first use
+
+    Returns the real module if it is already imported. Annotations that
+    mention the module (`df: pd.DataFrame`) need
+    `from __future__ import annotations` to stay lazy.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def resolve(obj: Any) -> Any:
+    """The real object behind a LazySingleton (built if needed); other objects as-is"""
+    if type(obj) is LazySingleton:
+        return obj._lazy_get()
+    return obj
+
+
+def is_initialized(obj: Any) -> bool:
+    """Whether a LazySingleton has built its instance (True for other objects)"""
+    if type(obj) is LazySingleton:
+        return obj._lazy_instance is not _MISSING
+    return True
+
+
+def reset_singleton(obj: LazySingleton):
+    """Drop the built instance so the next use constructs a fresh one"""
+    with obj._lazy_lock:
+        object.__setattr__(obj, '_lazy_instance', _MISSING)
+
+
+def preload(modules: Iterable[str] = HEAVY_LIBRARIES, singletons: Iterable[LazySingleton] = (),
+            max_workers: int = 2) -> Dict[str, Future]:
+    """
+    Import modules and build singletons in background threads
+
+    Lets a long-running process overlap warm-up with other startup work
+    while short-lived commands never pay for it. Failures are logged, not
+    raised; wait on the returned futures to block until warm-up is done.
+
+    Returns:
+        Future per module name / singleton name
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='preload')
+    futures: Dict[str, Future] = {}
+
+    def load_module(name: str):
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.debug(f"Preload skipped {name}: {e}")
+
+    def build(singleton: LazySingleton):
+        try:
+            singleton._lazy_get()
+        except Exception as e:
+            logger.warning(f"Preload of {singleton._lazy_name} failed: {e}")
+
+    for name in modules:
+        futures[name] = executor.submit(load_module, name)
+    for singleton in singletons:
+        futures[singleton._lazy_name] = executor.submit(build, singleton)
+    executor.shutdown(wait=False)
+    return futures
@@ -0,0 +1,145 @@
+"""
+Multi-pattern substring matcher
+Finds every occurrence of many literal patterns (currency pairs, tickers,
+keywords, section headers) in one pass over the text instead of one
+`pattern in text` scan per pattern.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """One occurrence of a pattern; offsets refer to the case-folded text"""
+    pattern: str
+    start: int
+    end: int
+
+
+def _trie_pattern(patterns: List[str]) -> str:
+    """Regex source matching the longest of patterns, with common prefixes factored out"""
+    trie: Dict[str, dict] = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional: try the longer pattern first, fall back to the one ending here
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+class MultiPatternMatcher:
+    """
+    Compiled set of literal patterns with plain substring semantics
+
+    All patterns are compiled into one trie-shaped regex (shared prefixes are
+    factored out, as in an Aho-Corasick goto function) inside a zero-width
+    lookahead, so a single C-level scan reports a match at every position -
+    overlapping and nested occurrences included (``'ease'`` is found inside
+    ``'increase'``, just like ``'ease' in text``). The regex prefers the longest
+    pattern at each position; shorter patterns starting there are prefixes of
+    it and are reported from a precomputed table, so the result equals what an
+    Aho-Corasick automaton would return.
+
+    Patterns are reported as given; with ``case='upper'`` or ``case='lower'``
+    both patterns and text are case-folded once before matching.
+    """
+
+    def __init__(self, patterns: Iterable[str], case: Optional[str] = 'upper'):
+        """
+        Args:
+            patterns: Literal patterns to look for (empty strings are ignored)
+            case: 'upper', 'lower', or None for case-sensitive matching
+        """
+        if case not in ('upper', 'lower', None):
+            raise ValueError(f"case must be 'upper', 'lower' or None, got {case!r}")
+        self.case = case
+
+        # Folded pattern -> patterns as given (several spellings may fold together)
+        self._originals: Dict[str, List[str]] = {}
+        for pattern in patterns:
+            if pattern:
+                self._originals.setdefault(self.fold(pattern), []).append(pattern)
+        self.patterns: List[str] = [p for originals in self._originals.values() for p in originals]
+
+        folded = sorted(self._originals, key=len, reverse=True)
+        # Patterns also matched wherever a longer pattern matches
+        self._prefixes: Dict[str, List[str]] = {
+            longer: [p for p in folded if len(p) < len(longer) and longer.startswith(p)]
+            for longer in folded
+        }
+        self._regex = re.compile('(?=(' + _trie_pattern(folded) + '))') if folded else None
+
+    def fold(self, text: str) -> str:
+        """Apply the matcher's case folding to text"""
+        if self.case == 'upper':
+            return text.upper()
+        if self.case == 'lower':
+            return text.lower()
+        return text
+
+    def finditer(self, text: str, folded: bool = False) -> Iterator[PatternMatch]:
+        """
+        Every occurrence of every pattern, ordered by start position
+
+        Args:
+            text: Text to scan
+            folded: Set when text is already case-folded by fold()
+        """
+        if self._regex is None or not text:
+            return
+        if not folded:
+            text = self.fold(text)
+        for match in self._regex.finditer(text):
+            longest = match.group(1)
+            start = match.start()
+            for folded_pattern in (longest, *self._prefixes[longest]):
+                for pattern in self._originals[folded_pattern]:
+                    yield PatternMatch(pattern, start, start + len(folded_pattern))
+
+    def found(self, text: str) -> Set[str]:
+        """Patterns occurring anywhere in text (`pattern in text` for all patterns at once)"""
+        if self._regex is None or not text:
+            return set()
+        found: Set[str] = set()
+        for longest in set(self._regex.findall(self.fold(text))):
+            for folded_pattern in (longest, *self._prefixes[longest]):
+                found.update(self._originals[folded_pattern])
+        return found
+
+    def line_hits(self, text: str, folded: bool = False) -> Dict[str, List[int]]:
+        """
+        Line numbers (text split on newlines) containing each pattern
+
+        Each pattern maps to its ascending, de-duplicated line indices; patterns
+        that never occur are absent.
+        """
+        hits: Dict[str, List[int]] = {}
+        if self._regex is None or not text:
+            return hits
+        if not folded:
+            text = self.fold(text)
+        line, line_end = 0, text.find('\n')
+        for match in self._regex.finditer(text):
+            start = match.start()
+            # Matches arrive in position order, so the line number only moves forward
+            while line_end != -1 and start > line_end:
+                line += 1
+                line_end = text.find('\n', line_end + 1)
+            longest = match.group(1)
+            for folded_pattern in (longest, *self._prefixes[longest]):
+                for pattern in self._originals[folded_pattern]:
+                    lines = hits.setdefault(pattern, [])
+                    if not lines or lines[-1] != line:
+                        lines.append(line)
+        return hits
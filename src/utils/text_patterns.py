@@ -0,0 +1,205 @@
+"""
+Precompiled patterns for financial text extraction
+Every regular expression the parsers apply per line lives here, compiled
+once at import, together with memoized number/date/time normalizers: the
+same tokens ('1.0850', 'Jan 15', 'BMO') recur on every line and every page,
+so each distinct token is parsed only once.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+# Memo size for per-token normalizers; a week of pages has far fewer distinct tokens
+_TOKEN_CACHE_SIZE = 4096
+
+# Numbers
+
+NUMBER = re.compile(r'(\d+\.?\d*)')
+NUMBER_TOKENS = re.compile(r'\d+\.?\d*')
+DECIMAL = re.compile(r'[\d.]+')
+
+# Tokens
+
+TICKER_TOKEN = re.compile(r'\b([A-Z]{1,5})\b')
+NON_UPPER_ALPHA = re.compile(r'[^A-Z]')
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+COMPANY_WITH_TICKER = re.compile(r'^(.+?)\s*\(([A-Z]+)\)$')
+
+# Stop loss / take profit in free text (case-insensitive)
+
+STOP_LOSS = re.compile(r'(?:sl|stop loss)[:\s]*(\d+\.?\d*)', re.I)
+TAKE_PROFIT = re.compile(r'(?:tp|take profit|target)[:\s]*(\d+\.?\d*)', re.I)
+ENTRY = re.compile(r'entry[:\s]*(\d+\.?\d*)', re.I)
+
+# Daily alert page fields (applied to upper-cased lines)
+
+FOREX_HIGH = re.compile(r'HIGH:\s*([\d.]+)')
+FOREX_AVERAGE = re.compile(r'AVERAGE:\s*([\d.]+)')
+FOREX_LOW = re.compile(r'LOW:\s*([\d.]+)')
+FOREX_PIPS = re.compile(r'(\d+(?:\s*-\s*\d+)?)\s*PIPS')
+MT4_BUY = re.compile(r'MT4\s+BUY\s*[<>]\s*([\d.]+)')
+MT4_SELL = re.compile(r'MT4\s+SELL\s*[<>]\s*([\d.]+)')
+FOREX_EXIT = re.compile(r'EXIT:?\s*([\d.]+)')
+
+STOCK_ENTRY = re.compile(r'ENTRY:?\s*\$?([\d.]+)')
+STOCK_TAKE_PROFIT = re.compile(r'(?:TAKE PROFIT|TP):?\s*\$?([\d.]+)')
+STOCK_STOP_LOSS = re.compile(r'(?:STOP LOSS|SL):?\s*\$?([\d.]+)')
+
+WEEK_52_HIGH = re.compile(r'52 WEEK HIGH:\s*([\d.]+)')
+WEEK_52_LOW = re.compile(r'52 WEEK LOW:\s*([\d.]+)')
+CALL_STRIKE = re.compile(r'CALL\s*>\s*([\d.]+)')
+PUT_STRIKE = re.compile(r'PUT\s*<\s*([\d.]+)')
+
+# Earnings
+
+EPS_PATTERNS = (
+    re.compile(r'eps[:\s]+\$?(\d+\.?\d*)', re.I),
+    re.compile(r'earnings[:\s]+\$?(\d+\.?\d*)', re.I),
+    re.compile(r'\$(\d+\.?\d*)\s+eps', re.I),
+)
+
+# Dates as written in free text (first match wins, in this order)
+TEXT_DATE_PATTERNS = (
+    re.compile(r'(\w{3})\s+(\d{1,2})', re.I),   # Jan 15
+    re.compile(r'(\d{1,2})/(\d{1,2})', re.I),   # 1/15
+    re.compile(r'today|tomorrow|this week|next week', re.I),
+)
+
+# Dates in table cells (first match wins, in this order)
+CELL_DATE_PATTERNS = (
+    re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2,4})'),  # MM/DD/YYYY or MM/DD/YY
+    re.compile(r'(\d{1,2})-(\d{1,2})-(\d{2,4})'),  # MM-DD-YYYY
+    re.compile(r'(\w{3})\s+(\d{1,2})'),            # Jan 15
+    re.compile(r'(\d{1,2})\s+(\w{3})'),            # 15 Jan
+)
+
+# Release time indicators (checked in this order)
+RELEASE_TIMES = {
+    'bmo': 'BMO',
+    'before market open': 'BMO',
+    'before open': 'BMO',
+    'pre-market': 'BMO',
+    'amc': 'AMC',
+    'after market close': 'AMC',
+    'after close': 'AMC',
+    'after hours': 'AMC',
+    'post-market': 'AMC',
+    'during market': 'DMH',
+    'market hours': 'DMH',
+}
+
+# Price forms in free text (utils.ForexParser)
+TEXT_PRICE_PATTERNS = (
+    re.compile(r'\b\d+\.\d{2,5}\b'),        # Standard forex price
+    re.compile(r'\b\d{1,3}\.\d{2,4}\b'),    # JPY pairs
+    re.compile(r'@\s*(\d+\.?\d*)'),         # Price after @
+    re.compile(r':\s*(\d+\.?\d*)'),         # Price after :
+)
+
+
+@lru_cache(maxsize=256)
+def pair_entry_patterns(pair: str) -> Tuple['re.Pattern', ...]:
+    """Entry price patterns mentioning a specific pair (compiled once per pair)"""
+    pair = re.escape(pair)
+    return (
+        re.compile(rf'{pair}.*?@\s*(\d+\.?\d*)', re.I),
+        ENTRY,
+        re.compile(rf'buy\s+{pair}.*?(\d+\.?\d*)', re.I),
+        re.compile(rf'sell\s+{pair}.*?(\d+\.?\d*)', re.I),
+    )
+
+
+def first_group(pattern: 're.Pattern', text: str, group: int = 1) -> Optional[str]:
+    """Group of the first match of a precompiled pattern, or None"""
+    match = pattern.search(text)
+    return match.group(group) if match else None
+
+
+@lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def parse_number(text: Optional[str]) -> Optional[float]:
+    """First number in text as float ('$1.23 est' -> 1.23), or None"""
+    if not text:
+        return None
+    match = NUMBER.search(text)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return None
+    return None
+
+
+@lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def extract_price_text(text: str) -> Optional[str]:
+    """First price-looking token in text, without '@'/':' markers"""
+    for pattern in TEXT_PRICE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(0).replace('@', '').replace(':', '').strip()
+    return None
+
+
+@lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def find_eps(text: str) -> Optional[float]:
+    """EPS estimate mentioned in text"""
+    for pattern in EPS_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            try:
+                return float(match.group(1))
+            except ValueError:
+                continue
+    return None
+
+
+@lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def find_date(text: str) -> Optional[str]:
+    """Date phrase in free text ('Jan 15', '1/15', 'tomorrow'), as written"""
+    for pattern in TEXT_DATE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+
+@lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def normalize_date(date_str: Optional[str]) -> Optional[str]:
+    """Date portion of a table cell, or its first 20 characters"""
+    if not date_str:
+        return None
+    for pattern in CELL_DATE_PATTERNS:
+        match = pattern.search(date_str)
+        if match:
+            return match.group(0)
+    return date_str.strip()[:20]
+
+
+@lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def find_release_time(text: Optional[str]) -> Optional[str]:
+    """BMO/AMC/DMH indicated in text, or None"""
+    if not text:
+        return None
+    text_lower = text.lower()
+    for phrase, normalized in RELEASE_TIMES.items():
+        if phrase in text_lower:
+            return normalized
+    return None
+
+
+@lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def parse_datetime(text: str, formats: Sequence[str]) -> Optional[datetime]:
+    """
+    Parse text with the first matching strptime format
+
+    Results (including failures) are memoized per (text, formats), so a
+    repeated timestamp never walks the format list again. `formats` must be
+    hashable (a tuple).
+    """
+    for fmt in formats:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
@@ -0,0 +1,116 @@
+"""
+Stand-ins for modules some checkouts lack (playwright, secure_config_manager)
+
+stub_missing_modules() installs a stand-in only when the real module cannot be
+found, and only while the code under test is imported. On exit the stand-ins
+and the modules imported against them leave sys.modules again, so other test
+files still see the real import state.
+"""
+import base64
+import importlib.util
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class FakeSecureConfigManager:
+    """SecureConfigManager's file contract: encrypt to and decrypt from <dir>/config.enc"""
+
+    def __init__(self, config_dir):
+        self.config_dir = Path(config_dir)
+        self.config_file = self.config_dir / 'config.enc'
+        self.decrypt_calls = 0
+
+    def encrypt_config(self, data) -> bool:
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        self.config_file.write_bytes(base64.b64encode(json.dumps(data).encode()))
+        return True
+
+    def decrypt_config(self):
+        self.decrypt_calls += 1
+        if not self.config_file.exists():
+            return None
+        return json.loads(base64.b64decode(self.config_file.read_bytes()))
+
+
+def _playwright():
+    package = ModuleType('playwright')
+    package.__path__ = []
+    async_api = ModuleType('playwright.async_api')
+
+    async def async_playwright(*args, **kwargs):
+        raise RuntimeError('playwright is not installed')
+
+    async_api.async_playwright = async_playwright
+    for name in ('Page', 'Browser', 'BrowserContext'):
+        setattr(async_api, name, type(name, (), {}))
+    async_api.TimeoutError = type('TimeoutError', (Exception,), {})
+    package.async_api = async_api
+    return {'playwright': package, 'playwright.async_api': async_api}
+
+
+def _secure_config_manager():
+    module = ModuleType('secure_config_manager')
+    module.SecureConfigManager = FakeSecureConfigManager
+    return {'secure_config_manager': module}
+
+
+_BUILDERS = {'playwright': _playwright, 'secure_config_manager': _secure_config_manager}
+
+
+def _missing(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is None
+    except (ImportError, ValueError):
+        return True
+
+
+def _public(module):
+    return [value for key, value in vars(module).items() if not key.startswith('__')]
+
+
+def _bound_to(stubs, candidates):
+    """Modules among `candidates` imported against the stand-ins, directly or through each other"""
+    tainted = {id(module) for module in stubs.values()}
+    tainted |= {id(value) for module in stubs.values() for value in _public(module)}
+    bound = set()
+    changed = True
+    while changed:
+        changed = False
+        for name in candidates - bound:
+            module = sys.modules.get(name)
+            if module is None:
+                continue
+            values = _public(module)
+            if any(id(value) in tainted for value in values):
+                bound.add(name)
+                tainted.add(id(module))
+                tainted |= {id(value) for value in values if getattr(value, '__module__', None) == name}
+                changed = True
+    return bound
+
+
+@contextmanager
+def stub_missing_modules(*names: str):
+    """Import code under test with stand-ins for whichever of `names` are missing"""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.append(str(REPO_ROOT))
+    stubs = {}
+    for name in names:
+        if _missing(name):
+            stubs.update(_BUILDERS[name]())
+    if not stubs:
+        yield
+        return
+
+    before = set(sys.modules)
+    sys.modules.update(stubs)
+    try:
+        yield
+    finally:
+        for name in _bound_to(stubs, set(sys.modules) - before - set(stubs)) | set(stubs):
+            sys.modules.pop(name, None)
@@ -0,0 +1,71 @@
+"""
+Unit tests for the analysis benchmark fixtures, runner and baseline comparison
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.analysis_fixtures import FixtureDataFetcher, synthetic_ohlc
+from benchmarks.analysis_benchmark import measure, run_benchmark
+from benchmarks.stats import compare_to_baseline
+
+
+class TestFixtures:
+    """Seeded OHLC and the offline data fetcher"""
+
+    def test_synthetic_ohlc_is_seeded(self):
+        first = synthetic_ohlc(50, seed=7)
+        assert first == synthetic_ohlc(50, seed=7)
+        assert first != synthetic_ohlc(50, seed=8)
+        # Provider order: most recent first
+        assert first[0]['timestamp'] > first[-1]['timestamp']
+        assert all(c['low'] <= min(c['open'], c['close']) and c['high'] >= max(c['open'], c['close'])
+                   for c in first)
+
+    def test_fetcher_save_and_load(self, tmp_path):
+        fetcher = FixtureDataFetcher(seed=3, candles=30)
+        rates = fetcher.fetch_forex_data('EURUSD', '1hour')['data']
+        news = fetcher.fetch_news_sentiment('EUR USD forex')
+        assert fetcher.get_current_price('EURUSD') == fetcher.fetch_forex_data('EURUSD')['data'][0]['close']
+        assert fetcher.fetch_forex_data('EUR') is None
+
+        loaded = FixtureDataFetcher.load(fetcher.save(tmp_path / 'fixtures.json'))
+        assert loaded.seed == 3
+        assert loaded.fetch_forex_data('EURUSD', '1hour')['data'] == rates
+        assert loaded.fetch_news_sentiment('EUR USD forex') == news
+        assert loaded.calls == {'fetch_forex_data': 1, 'fetch_news_sentiment': 1}
+
+
+class TestRunner:
+    """Measurement, sections and regressions"""
+
+    def test_measure_counts_slow_warmup(self):
+        calls = []
+        # A warm-up that already exceeds min_time is the only sample
+        assert measure(lambda: calls.append(1), min_time=0.0)['count'] == 1
+        assert len(calls) == 1
+
+        calls.clear()
+        # Otherwise the warm-up is discarded and max_repeat caps the samples
+        assert measure(lambda: calls.append(1), min_time=60.0, max_repeat=3)['count'] == 3
+        assert len(calls) == 4
+
+    def test_compare_to_baseline(self):
+        baseline = {'a': {'p50_ms': 10.0}, 'b': {'p50_ms': 10.0}, 'tiny': {'p50_ms': 0.01},
+                    'gone': {'p50_ms': 1.0}}
+        current = {'a': {'p50_ms': 14.0}, 'b': {'p50_ms': 11.0}, 'tiny': {'p50_ms': 0.04},
+                   'new': {'p50_ms': 5.0}, 'skip': {'skipped': 'no talib'}}
+        regressions = compare_to_baseline(current, baseline, threshold=0.25)
+        assert [r.case for r in regressions] == ['a']
+        assert regressions[0].ratio == 1.4
+
+    def test_small_run(self):
+        report = run_benchmark(sizes=[60], pairs=['EURUSD'], min_time=0.0,
+                               sections=['technical', 'economic', 'report'],
+                               fetcher=FixtureDataFetcher(seed=1, candles=60))
+        cases = report['cases']
+        assert {'technical.rsi[60]', 'technical.macd[60]', 'economic.currency_differential[1]'} <= set(cases)
+        assert any(case.startswith('report.html') for case in cases)
+        assert all(result['count'] >= 1 for result in cases.values())
+        assert report['fixture_calls']['fetch_forex_data'] > 0
@@ -0,0 +1,234 @@
+"""
+Unit tests for the shared browser pool
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.browser_pool as browser_pool
+from utils.browser_pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+
+    async def close(self):
+        self.context.pages.remove(self)
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.pages = []
+        self.closed = False
+        self._handlers = {}
+
+    def on(self, event, handler):
+        self._handlers.setdefault(event, []).append(handler)
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+        for handler in self._handlers.get('close', []):
+            handler(self)
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+        self._handlers = {}
+
+    def is_connected(self):
+        return self.connected
+
+    def on(self, event, handler):
+        self._handlers.setdefault(event, []).append(handler)
+
+    def crash(self):
+        self.connected = False
+        for handler in self._handlers.get('disconnected', []):
+            handler(self)
+
+    async def new_context(self, **options):
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+        for handler in self._handlers.get('disconnected', []):
+            handler(self)
+
+
+class FakeLaunchPool(BrowserPool):
+    """Pool whose 'launch' creates a FakeBrowser instead of starting Chromium"""
+
+    def __init__(self, **kwargs):
+        super().__init__(cdp_url='', **kwargs)
+        self.browsers = []
+
+    async def _start_browser(self, launch_options):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        self._browser = browser
+        self._disconnected = False
+        browser.on('disconnected', lambda *_: self._mark_disconnected(browser))
+        self._browser_started = time.monotonic()
+        self._browser_uses = 0
+        self._stats['launches'] += 1
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestBrowserPool:
+    """Tests for browser reuse and warm contexts"""
+
+    def test_browser_and_context_are_reused(self):
+        async def scenario():
+            pool = FakeLaunchPool()
+            loads = []
+
+            def load_state():
+                loads.append(1)
+                return {'cookies': [{'name': 'session'}]}
+
+            for _ in range(3):
+                context = await pool.acquire_context('mymama_session', {'viewport': None}, load_state)
+                await context.new_page()
+                await pool.release_context('mymama_session', context)
+            return pool, context, loads
+
+        pool, context, loads = run(scenario())
+        stats = pool.get_statistics()
+        assert stats['launches'] == 1
+        assert stats['contexts_created'] == 1 and stats['contexts_reused'] == 2
+        # Storage state is only loaded when a context is created
+        assert len(loads) == 1
+        assert context.options['storage_state'] == {'cookies': [{'name': 'session'}]}
+        # Pages are closed on release, cookies stay with the warm context
+        assert context.pages == [] and not context.closed
+
+    def test_failed_checkout_discards_context(self):
+        async def scenario():
+            pool = FakeLaunchPool()
+            with pytest.raises(RuntimeError):
+                async with pool.checkout('s') as context:
+                    raise RuntimeError('scrape failed')
+            second = await pool.acquire_context('s')
+            return pool, context, second
+
+        pool, first, second = run(scenario())
+        assert first.closed
+        assert second is not first
+        assert pool.get_statistics()['launches'] == 1
+
+    def test_disconnected_browser_is_relaunched(self):
+        async def scenario():
+            pool = FakeLaunchPool()
+            context = await pool.acquire_context('s')
+            await pool.release_context('s', context)
+            pool.browsers[0].crash()
+            replacement = await pool.acquire_context('s')
+            return pool, context, replacement
+
+        pool, context, replacement = run(scenario())
+        assert len(pool.browsers) == 2
+        assert replacement is not context
+        assert replacement in pool.browsers[1].contexts
+
+    def test_stale_browser_recycled_only_when_idle(self):
+        async def scenario():
+            pool = FakeLaunchPool(browser_max_uses=1)
+            busy = await pool.acquire_context('a')
+            # Limit reached but a context is in use: keep the process
+            other = await pool.acquire_context('b')
+            launches_while_busy = len(pool.browsers)
+            await pool.release_context('a', busy)
+            await pool.release_context('b', other)
+            await pool.acquire_context('a')
+            return pool, launches_while_busy, busy
+
+        pool, launches_while_busy, busy = run(scenario())
+        assert launches_while_busy == 1
+        assert len(pool.browsers) == 2
+        assert busy.closed
+
+    def test_idle_contexts_expire(self):
+        async def scenario():
+            pool = FakeLaunchPool(context_ttl=0.0)
+            context = await pool.acquire_context('s')
+            await pool.release_context('s', context)
+            await asyncio.sleep(0.01)
+            fresh = await pool.acquire_context('s')
+            return context, fresh
+
+        context, fresh = run(scenario())
+        assert context.closed and fresh is not context
+
+    def test_warm_and_close(self):
+        async def scenario():
+            pool = FakeLaunchPool(max_idle_contexts=2)
+            await pool.warm('s', count=3)
+            warmed = pool.get_statistics()['idle_contexts']['s']
+            await pool.close()
+            return pool, warmed
+
+        pool, warmed = run(scenario())
+        assert warmed == 2
+        assert not pool.browsers[0].connected
+        assert pool.get_statistics()['idle_contexts'] == {}
+
+    def test_new_event_loop_terminates_previous_driver(self, monkeypatch, caplog):
+        import subprocess
+        from types import SimpleNamespace
+
+        monkeypatch.setattr(browser_pool, '_playwright_version', lambda: (1, 40))
+        driver = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+        pool = FakeLaunchPool()
+
+        async def first_loop():
+            await pool.acquire_context('s')
+            # What Playwright's driver process looks like from the pool
+            pool._playwright = SimpleNamespace(_impl_obj=SimpleNamespace(_connection=SimpleNamespace(
+                _transport=SimpleNamespace(_proc=driver))))
+
+        try:
+            run(first_loop())
+            context = run(pool.acquire_context('s'))
+            assert driver.wait(timeout=5) != 0
+        finally:
+            driver.kill()
+        assert len(pool.browsers) == 2
+        assert context in pool.browsers[1].contexts
+        assert 'call close_browser_pool()' in caplog.text
+
+    def test_driver_of_unknown_playwright_release_is_left_alone(self, monkeypatch, caplog):
+        from types import SimpleNamespace
+
+        monkeypatch.setattr(browser_pool, '_playwright_version', lambda: (2, 1))
+        killed = []
+        monkeypatch.setattr(browser_pool.os, 'kill', lambda pid, sig: killed.append(pid))
+        pool = FakeLaunchPool()
+
+        async def first_loop():
+            await pool.acquire_context('s')
+            pool._playwright = SimpleNamespace(_impl_obj=SimpleNamespace(_connection=SimpleNamespace(
+                _transport=SimpleNamespace(_proc=SimpleNamespace(pid=4242)))))
+
+        run(first_loop())
+        run(pool.acquire_context('s'))
+        assert killed == []
+        assert 'Cannot locate the driver process of Playwright (2, 1)' in caplog.text
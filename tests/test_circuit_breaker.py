@@ -0,0 +1,173 @@
+"""
+Unit tests for the shared sliding-window circuit breaker and its adapters
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
+from src.core.exceptions import CircuitBreakerOpenError, CircuitBreakerTimeoutError
+
+
+def make_breaker(**config):
+    defaults = {'failure_threshold': 100, 'recovery_timeout': 0.05, 'success_threshold': 2,
+                'minimum_calls': 10, 'exponential_backoff': False}
+    return CircuitBreaker('test', CircuitBreakerConfig(**{**defaults, **config}))
+
+
+class TestSlidingWindow:
+    """Opening on streaks, error rate and slow-call rate"""
+
+    def test_consecutive_failures(self):
+        breaker = make_breaker(failure_threshold=3)
+        for _ in range(3):
+            breaker.record_failure(ValueError('down'))
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.open_reason == '3 consecutive failures'
+
+    def test_error_rate_without_streak(self):
+        breaker = make_breaker()
+        # Alternating outcomes never build a streak but fail half the calls
+        for i in range(9):
+            if i % 2:
+                breaker.record_success(0.01)
+            else:
+                breaker.record_failure(latency=0.01)
+        assert breaker.state is CircuitState.CLOSED  # Below minimum_calls
+        breaker.record_failure(latency=0.01)
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.open_reason.startswith('failure rate 60%')
+
+    def test_slow_calls_trip_before_timeouts(self):
+        breaker = make_breaker(timeout=2.0)  # Slow from 1s
+        for _ in range(4):
+            breaker.record_success(0.1)
+        for _ in range(5):
+            breaker.record_success(1.5)
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_success(1.5)
+        assert breaker.state is CircuitState.OPEN
+        assert 'slow-call rate' in breaker.open_reason
+        assert breaker.stats.failed_requests == 0
+
+    def test_window_forgets_old_outcomes(self):
+        breaker = make_breaker(window_size=10)
+        for _ in range(5):
+            breaker.record_failure(latency=0.01)
+        for _ in range(10):
+            breaker.record_success(0.02)
+        window = breaker.window_stats()
+        assert (window['calls'], window['failure_rate']) == (10, 0.0)
+        assert window['latency_p95'] == 0.02
+
+    def test_excluded_and_unrecorded_exceptions_ignored(self):
+        breaker = make_breaker(failure_threshold=1, excluded_exceptions=[KeyError],
+                               recorded_exceptions=(ConnectionError,))
+        breaker.record_failure(KeyError('x'))
+        breaker.record_failure(ValueError('x'))
+        assert breaker.state is CircuitState.CLOSED and breaker.stats.total_requests == 0
+        breaker.record_failure(ConnectionError('x'))
+        assert breaker.state is CircuitState.OPEN
+
+
+class TestRecovery:
+    """Half-open probing"""
+
+    def test_single_probe_admitted_then_closes(self):
+        breaker = make_breaker()
+        breaker.force_open()
+        assert not breaker.can_execute()
+        time.sleep(0.06)
+        assert breaker.can_execute()
+        assert breaker.state is CircuitState.HALF_OPEN
+        # Other callers fail fast while the probe is out
+        assert not breaker.can_execute()
+        breaker.record_success(0.01)
+        assert breaker.can_execute()
+        breaker.record_success(0.01)
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.stats.rejected_requests == 2
+
+    def test_failed_probe_reopens_with_backoff(self):
+        breaker = make_breaker(exponential_backoff=True, recovery_timeout=0.05)
+        breaker.force_open()
+        time.sleep(0.06)
+        assert breaker.can_execute()
+        breaker.record_failure(latency=0.01)
+        assert breaker.state is CircuitState.OPEN
+        assert 0.05 < breaker.retry_in() <= 0.1
+
+    def test_async_calls_share_one_probe(self):
+        breaker = make_breaker(success_threshold=1, timeout=1.0)
+        breaker.force_open()
+        time.sleep(0.06)
+
+        async def service():
+            await asyncio.sleep(0.05)
+            return 'ok'
+
+        async def run():
+            return await asyncio.gather(*(breaker.call_async(service) for _ in range(3)),
+                                        return_exceptions=True)
+
+        results = asyncio.run(run())
+        assert results.count('ok') == 1
+        assert sum(isinstance(r, CircuitBreakerOpenError) for r in results) == 2
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_async_timeout(self):
+        breaker = make_breaker(timeout=0.01)
+        with pytest.raises(CircuitBreakerTimeoutError):
+            asyncio.run(breaker.call_async(asyncio.sleep, 1))
+        assert breaker.stats.timeouts == 1
+
+
+class TestAdapters:
+    """Existing entry points use the shared implementation"""
+
+    def test_forex_signals_breaker(self):
+        from forex_signals.core.exceptions import ForexSignalsError
+        from forex_signals.utils.circuit_breaker import get_circuit_breaker
+
+        breaker = get_circuit_breaker('forex_adapter_test', failure_threshold=2, expected_exception=ConnectionError)
+
+        def fail():
+            raise ConnectionError('down')
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call_sync(fail)
+        with pytest.raises(ForexSignalsError) as raised:
+            breaker.call_sync(lambda: 'ok')
+        assert raised.value.error_code == 'CIRCUIT_BREAKER_OPEN'
+        assert breaker.get_stats()['failed_calls'] == 2
+
+    def test_network_breakers_registered(self):
+        from network_resilience import NetworkHealthMonitor
+        from src.core.circuit_breaker import get_all_circuit_breakers
+
+        breaker = NetworkHealthMonitor().get_circuit_breaker('https://adapter.test')
+        breaker.record_success(0.2)
+        assert breaker.status['window']['calls'] == 1
+        assert 'network:https://adapter.test' in get_all_circuit_breakers()
+
+    def test_circuit_breaker_protection_stops_retrying_when_open(self):
+        from enhanced_error_handler import circuit_breaker_protection, get_error_handler
+
+        calls = []
+
+        @circuit_breaker_protection('adapter_test')
+        async def send():
+            calls.append(1)
+            raise ConnectionError('down')
+
+        breaker = get_error_handler().get_or_create_circuit_breaker('external_service_adapter_test_call')
+        breaker.force_open()
+        with pytest.raises(CircuitBreakerOpenError):
+            asyncio.run(send())
+        assert calls == []
@@ -0,0 +1,119 @@
+"""
+Unit tests for run deadlines and budgeted waits
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.deadline import (allows_optional, budget_sleep, clamp_timeout, current_deadline,
+                               fits, run_deadline)
+from src.core.exceptions import DeadlineExceeded
+
+
+class TestDeadline:
+    """Clamping, nesting, skips and the optional-work reserve"""
+
+    def test_helpers_without_deadline(self):
+        assert current_deadline() is None
+        assert clamp_timeout(30) == 30
+        assert fits(1e9) and allows_optional('sentiment')
+        with run_deadline() as deadline:
+            assert deadline is None
+
+    def test_clamp_and_nesting(self):
+        with run_deadline(10, name='outer') as outer:
+            assert 9 < clamp_timeout(30) <= 10
+            assert clamp_timeout(2) == 2
+            with run_deadline(60, name='inner') as inner:
+                # A nested deadline never outlives its parent
+                assert inner.expires_at == outer.expires_at
+                inner.skip('fetch', 'test')
+            assert current_deadline() is outer
+        assert current_deadline() is None
+        assert [s['stage'] for s in outer.report()['skipped']] == ['fetch']
+
+    def test_budget_sleep_refuses_long_waits(self):
+        with run_deadline(0.5) as deadline:
+            budget_sleep(0.01, 'short')
+            with pytest.raises(DeadlineExceeded) as raised:
+                budget_sleep(5, 'rate_limit.fred')
+        assert raised.value.error_code == 'DEADLINE_EXCEEDED'
+        assert deadline.report()['skipped'][0]['stage'] == 'rate_limit.fred'
+
+    def test_optional_work_skipped_inside_reserve(self):
+        with run_deadline(10, reserve=2) as deadline:
+            assert allows_optional('analysis.sentiment', pair='EURUSD')
+        with run_deadline(10, reserve=20) as deadline:
+            assert not allows_optional('analysis.sentiment', pair='EURUSD')
+        assert deadline.skipped[0]['pair'] == 'EURUSD'
+
+    def test_deadline_follows_tasks_and_threads(self):
+        async def run():
+            with run_deadline(5) as deadline:
+                in_task = await asyncio.create_task(asyncio.sleep(0, current_deadline()))
+                in_thread = await asyncio.to_thread(current_deadline)
+                return deadline, in_task, in_thread
+
+        deadline, in_task, in_thread = asyncio.run(run())
+        assert in_task is deadline and in_thread is deadline
+
+
+class TestBudgetedCallers:
+    """Layers that wait or retry stop at the deadline"""
+
+    def test_retry_manager_stops_before_deadline(self):
+        from forex_signals.utils.retry import RetryManager
+
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            raise ConnectionError('down')
+
+        manager = RetryManager(max_attempts=5, base_delay=10, jitter=False)
+        started = time.perf_counter()
+        with run_deadline(1) as deadline:
+            with pytest.raises(ConnectionError):
+                manager.execute_sync(flaky)
+        assert time.perf_counter() - started < 1
+        assert len(calls) == 1
+        assert 'would miss the deadline' in deadline.skipped[0]['reason']
+
+    def test_expired_run_makes_no_requests(self):
+        from src.rate_limiter import make_request_with_backoff
+
+        with run_deadline(0) as deadline:
+            with pytest.raises(DeadlineExceeded):
+                make_request_with_backoff('http://127.0.0.1:9/never', timeout=30)
+        assert deadline.skipped[0]['stage'] == 'http_request'
+
+    def test_skipped_component_is_neutral(self):
+        from src.signal_generator import SignalGenerator
+
+        component = SignalGenerator()._create_skipped_component('sentiment')
+        assert (component.score, component.confidence) == (0.0, 0.0)
+        assert component.details == {'skipped': 'run deadline'}
+
+    def test_production_generator_skips_optional_stage(self, monkeypatch):
+        from Signals.src.signal_generator import SignalGenerator as ProductionGenerator
+
+        generator = ProductionGenerator()
+        calls = []
+        monkeypatch.setattr(generator, '_analyze_geopolitical_signals', lambda pair: calls.append(pair))
+        with run_deadline(10, reserve=20) as deadline:
+            generator.generate_weekly_signal('EURUSD')
+        assert calls == []
+        assert deadline.skipped[0]['stage'] == 'analysis.geopolitical'
+
+    def test_signals_request_checks_expired_deadline(self):
+        from Signals.src.rate_limiter import make_request_with_backoff
+
+        with run_deadline(0) as deadline:
+            with pytest.raises(DeadlineExceeded):
+                make_request_with_backoff('http://127.0.0.1:9/never', timeout=30)
+        assert deadline.skipped[0]['stage'] == 'http_request'
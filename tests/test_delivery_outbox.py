@@ -0,0 +1,172 @@
+"""
+Unit tests for the delivery outbox and idempotent multi-platform sends
+"""
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.messengers.delivery_outbox import DeliveryOutbox, idempotency_key, content_report_id
+from benchmarks.messaging_benchmark import configure_stub_environment
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return DeliveryOutbox(tmp_path / 'outbox.json')
+
+
+class TestDeliveryOutbox:
+    """Tests for acknowledgement bookkeeping"""
+
+    def test_acknowledge_persists_across_instances(self, tmp_path):
+        key = idempotency_key('daily-report-2025-08-18', 'Telegram', 1)
+        assert key == 'daily-report-2025-08-18:telegram:1'
+
+        DeliveryOutbox(tmp_path / 'outbox.json').acknowledge(key, message_id='42', content='part 2')
+        reloaded = DeliveryOutbox(tmp_path / 'outbox.json')
+        assert reloaded.is_acknowledged(key)
+        assert reloaded.get_statistics()['acked'] == 1
+
+    def test_failure_never_overwrites_ack(self, outbox):
+        outbox.acknowledge('r:signal:0')
+        outbox.record_failure('r:signal:0', 'timeout')
+        assert outbox.is_acknowledged('r:signal:0')
+
+    def test_pending_keys_and_forget(self, outbox):
+        keys = [idempotency_key('r', 'signal', i) for i in range(3)]
+        outbox.acknowledge(keys[1])
+        assert outbox.pending_keys(keys) == [keys[0], keys[2]]
+        assert outbox.forget('r') == 1
+        assert outbox.pending_keys(keys) == keys
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        outbox_file = tmp_path / 'outbox.json'
+        stale = (datetime.now() - timedelta(hours=30)).isoformat()
+        outbox_file.write_text(json.dumps({'entries': {
+            'r:telegram:0': {'key': 'r:telegram:0', 'status': 'acked', 'updated_at': stale, 'attempts': 1}
+        }}))
+        outbox = DeliveryOutbox(outbox_file, ttl_hours=24)
+        assert not outbox.is_acknowledged('r:telegram:0')
+        assert outbox.get_statistics()['entries'] == 0
+
+    def test_corrupt_file_fails_open(self, tmp_path):
+        outbox_file = tmp_path / 'outbox.json'
+        outbox_file.write_text('{not json')
+        assert DeliveryOutbox(outbox_file).get_statistics()['entries'] == 0
+
+    def test_instances_sharing_a_file_keep_each_others_acks(self, tmp_path):
+        first = DeliveryOutbox(tmp_path / 'outbox.json')
+        second = DeliveryOutbox(tmp_path / 'outbox.json')
+        first.acknowledge('r:telegram:0')
+        second.acknowledge('r:signal:0')
+        first.record_failure('r:email:0', 'timeout')
+
+        reloaded = DeliveryOutbox(tmp_path / 'outbox.json')
+        assert reloaded.is_acknowledged('r:telegram:0')
+        assert reloaded.is_acknowledged('r:signal:0')
+        assert reloaded.get_statistics()['failed'] == 1
+        # A failure recorded by one instance never overwrites another's ack
+        first.record_failure('r:signal:0', 'late retry')
+        assert DeliveryOutbox(tmp_path / 'outbox.json').is_acknowledged('r:signal:0')
+
+    def test_concurrent_writers_lose_nothing(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        outboxes = [DeliveryOutbox(tmp_path / 'outbox.json') for _ in range(4)]
+        keys = [idempotency_key('r', 'telegram', i) for i in range(40)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: outboxes[i % 4].acknowledge(keys[i]), range(len(keys))))
+
+        assert DeliveryOutbox(tmp_path / 'outbox.json').pending_keys(keys) == []
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['outbox.json', 'outbox.lock']
+
+    def test_content_report_id_is_stable(self):
+        assert content_report_id('report') == content_report_id('report')
+        assert content_report_id('report') != content_report_id('report 2')
+
+
+class FlakyMessenger:
+    """Stand-in platform messenger failing the sends listed in `fail_on`"""
+
+    def __init__(self, name, max_length=12, fail_on=()):
+        self.platform_name = name
+        self.max_length = max_length
+        self.fail_on = set(fail_on)
+        self.sent = []
+        self.calls = 0
+
+    def _split_message(self, message):
+        from src.messengers.unified_messenger import UnifiedBaseMessenger
+        self._get_max_message_length = lambda: self.max_length
+        return UnifiedBaseMessenger._split_message(self, message)
+
+    async def send_message(self, message, **kwargs):
+        from src.messengers.unified_messenger import MessageResult, MessageStatus
+        self.calls += 1
+        if self.calls in self.fail_on:
+            return MessageResult(status=MessageStatus.FAILED, platform=self.platform_name, error='boom')
+        self.sent.append(message)
+        return MessageResult(status=MessageStatus.SUCCESS, platform=self.platform_name,
+                             message_id=str(self.calls))
+
+    async def send_batch(self, messages, chat_id=None, **kwargs):
+        return [await self.send_message(message, chat_id=chat_id) for message in messages]
+
+
+class TestIdempotentSendToAll:
+    """UnifiedMultiMessenger.send_to_all with a report_id"""
+
+    @pytest.fixture
+    def multi(self, outbox):
+        configure_stub_environment('http://127.0.0.1:9', 'http://127.0.0.1:9')
+        from src.messengers.unified_messenger import UnifiedMultiMessenger
+        multi = UnifiedMultiMessenger(platforms=[], outbox=outbox)
+        multi.messengers = {
+            'telegram': FlakyMessenger('telegram'),
+            'signal': FlakyMessenger('signal', fail_on={2})
+        }
+        return multi
+
+    REPORT = "line one\nline two\nline three"
+
+    def test_retry_resends_only_missing_chunks(self, multi):
+        first = asyncio.run(multi.send_to_all(self.REPORT, report_id='report-1'))
+        assert first['telegram'].success
+        assert first['signal'].status == 'partial'
+        assert first['signal'].metadata['sent'] == 2
+
+        second = asyncio.run(multi.send_to_all(self.REPORT, report_id='report-1'))
+        assert second['telegram'].metadata['duplicate']
+        assert second['signal'].success
+        assert second['signal'].metadata == {
+            'report_id': 'report-1', 'chunks': 3, 'sent': 1, 'skipped': 2, 'duplicate': False
+        }
+
+        # Every chunk reached every platform exactly once
+        assert sorted(multi.messengers['telegram'].sent) == sorted(multi.messengers['signal'].sent)
+        assert len(multi.messengers['signal'].sent) == 3
+        assert multi.messengers['signal'].sent[-1].startswith('[Part 2/3]')
+
+    def test_changed_content_under_same_report_id_is_sent_in_full(self, multi):
+        telegram = multi.messengers['telegram']
+        asyncio.run(multi.send_to_all(self.REPORT, report_id='report-1'))
+        first_run = len(telegram.sent)
+
+        corrected = asyncio.run(multi.send_to_all(self.REPORT + "\nline four", report_id='report-1'))
+        metadata = corrected['telegram'].metadata
+        assert (metadata['sent'], metadata['skipped']) == (metadata['chunks'], 0)
+        # The corrected report goes out whole, never mixed with old chunks
+        assert 'line one' in ''.join(telegram.sent[first_run:])
+        assert 'line four' in telegram.sent[-1]
+
+    def test_without_report_id_always_sends(self, multi):
+        asyncio.run(multi.send_to_all('short', report_id=None))
+        asyncio.run(multi.send_to_all('short'))
+        assert multi.messengers['telegram'].sent == ['short', 'short']
+        assert multi.outbox.get_statistics()['entries'] == 0
+
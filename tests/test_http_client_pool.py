@@ -0,0 +1,112 @@
+"""
+Unit tests for the shared keep-alive HTTP client pool
+"""
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.http_client_pool import HttpClientPool, get_client_pool, close_http_clients, is_shared_client
+from benchmarks.messaging_stubs import TelegramStubServer, SignalStubServer, StubBehavior
+from benchmarks.messaging_benchmark import (
+    configure_stub_environment, BENCHMARK_SIGNAL_GROUP, BENCHMARK_SIGNAL_NUMBER
+)
+
+
+class TestHttpClientPool:
+    """Tests for client reuse and lifecycle"""
+
+    def test_same_client_per_base_url(self):
+        pool = HttpClientPool()
+
+        async def scenario():
+            try:
+                first = pool.get_client('https://api.telegram.org/botA')
+                second = pool.get_client('https://api.telegram.org/botA/')
+                other = pool.get_client('https://api.telegram.org/botB')
+                return first is second, first is other, pool.stats()
+            finally:
+                await pool.close_all()
+
+        same, shared_with_other, stats = asyncio.run(scenario())
+        assert same
+        assert not shared_with_other
+        # Both bot tokens share one connection pool to api.telegram.org
+        assert stats['clients'] == 2
+        assert stats['origins'] == 1
+
+    def test_separate_pools_per_event_loop(self):
+        pool = HttpClientPool()
+
+        async def scenario():
+            client = pool.get_client('http://localhost:8080')
+            await pool.close_all()
+            return client
+
+        first = asyncio.run(scenario())
+        second = asyncio.run(scenario())
+        assert first is not second
+        assert first.is_closed and second.is_closed
+
+    def test_close_all_releases_clients(self):
+        pool = HttpClientPool()
+
+        async def scenario():
+            client = pool.get_client('http://localhost:8080')
+            assert pool.owns(client)
+            await pool.close_all()
+            replacement = pool.get_client('http://localhost:8080')
+            owned = pool.owns(client)
+            await pool.close_all()
+            return client, replacement, owned
+
+        client, replacement, owned = asyncio.run(scenario())
+        assert client.is_closed
+        assert replacement is not client
+        assert not owned
+
+    def test_http2_requires_h2(self):
+        with patch('utils.http_client_pool.HTTP2_AVAILABLE', False):
+            assert HttpClientPool(http2=True).http2 is False
+
+
+class TestMessengerClientReuse:
+    """Messengers draw their clients from the shared pool"""
+
+    def test_unified_messengers_reuse_pooled_connections(self):
+        async def scenario():
+            behavior = StubBehavior()
+            telegram = TelegramStubServer(behavior)
+            signal = SignalStubServer(behavior, group_id=BENCHMARK_SIGNAL_GROUP,
+                                      phone_number=BENCHMARK_SIGNAL_NUMBER)
+            async with telegram, signal:
+                configure_stub_environment(telegram.base_url, signal.base_url)
+                from src.messengers.unified_messenger import UnifiedMultiMessenger
+
+                clients = []
+                try:
+                    for i in range(3):
+                        multi = UnifiedMultiMessenger(platforms=['telegram', 'signal'])
+                        for messenger in multi.messengers.values():
+                            messenger.rate_limiter.min_interval = 0
+                        results = await multi.send_to_all(f"msg {i}")
+                        assert all(result.success for result in results.values())
+                        clients.append({name: m.client for name, m in multi.messengers.items()})
+                        await multi.cleanup()
+                    stats = get_client_pool().stats()
+                finally:
+                    await close_http_clients()
+                return clients, stats, telegram.stats, signal.stats
+
+        with patch.dict(os.environ, {}, clear=False):
+            clients, stats, telegram_stats, signal_stats = asyncio.run(scenario())
+
+        # Cleanup leaves shared clients open, so later messengers reuse them
+        assert clients[0]['telegram'] is clients[2]['telegram']
+        assert clients[0]['signal'] is clients[2]['signal']
+        assert is_shared_client(clients[0]['telegram']) is False  # closed at shutdown
+        assert stats['clients'] == 2
+        assert telegram_stats.delivered == 3
+        assert signal_stats.delivered == 3
@@ -0,0 +1,101 @@
+"""
+Import-time budget for the signal generation package
+
+Runs `python -X importtime` in a fresh interpreter so heavy libraries and
+module-level singletons that creep back into the import path fail here.
+"""
+import os
+import subprocess
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.lazy import LazySingleton, is_initialized, lazy_import, reset_singleton, resolve
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative microseconds allowed for `import src.signal_generator`
+IMPORT_BUDGET_US = 1_000_000
+
+# Must not be imported just by importing the package
+DEFERRED_LIBRARIES = {'pandas', 'numpy', 'redis', 'feedparser', 'vaderSentiment', 'talib', 'pandas_ta', 'yfinance'}
+
+
+def import_profile(statement):
+    """Run statement under -X importtime; return ({module: cumulative_us}, stdout)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr[-2000:]
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative)
+    return timings, result.stdout
+
+
+class TestImportBudget:
+    """`import src.signal_generator` stays cheap"""
+
+    def test_heavy_libraries_are_deferred(self):
+        timings, _ = import_profile('import src.signal_generator')
+        loaded = {name.split('.')[0] for name in timings} & DEFERRED_LIBRARIES
+        assert not loaded, f"imported at startup: {sorted(loaded)}"
+
+    def test_import_within_budget(self):
+        timings, _ = import_profile('import src.signal_generator')
+        assert timings['src.signal_generator'] < IMPORT_BUDGET_US
+
+    def test_singletons_are_not_built_on_import(self):
+        statement = ('import src.signal_generator as sg, src.data_fetcher as df, src.cache_manager as cm;'
+                     'from src.utils.lazy import is_initialized;'
+                     'print(any(map(is_initialized, [sg.signal_generator, df.data_fetcher, cm.cache_manager])))')
+        _, stdout = import_profile(statement)
+        assert stdout.strip() == 'False'
+
+
+class Service:
+    instances = 0
+
+    def __init__(self):
+        Service.instances += 1
+        self.value = 42
+
+    def ping(self):
+        return 'pong'
+
+
+class TestLazySingleton:
+    """Behaves like the instance once used"""
+
+    def test_built_once_on_first_use(self):
+        Service.instances = 0
+        service = LazySingleton(Service)
+        assert not is_initialized(service)
+
+        threads = [threading.Thread(target=service.ping) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert Service.instances == 1
+        assert isinstance(service, Service)
+        assert resolve(service).value == 42
+
+    def test_attribute_writes_and_reset(self):
+        Service.instances = 0
+        service = LazySingleton(Service)
+        service.value = 7
+        assert resolve(service).value == 7
+
+        reset_singleton(service)
+        assert not is_initialized(service)
+        assert service.value == 42
+        assert Service.instances == 2
+
+    def test_lazy_import(self):
+        json_module = lazy_import('json')
+        assert json_module.dumps([1]) == '[1]'
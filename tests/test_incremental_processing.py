@@ -0,0 +1,130 @@
+"""
+Unit tests for incremental, per-section processing of scraped pages
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_processors.financial_alerts import FinancialAlertsProcessor
+from src.data_processors.incremental import ChangeSet, SectionHashStore
+
+FOREX_TEXT = """FOREX PAIRS
+EURUSD
+HIGH: 1.0950
+AVERAGE: 1.0875
+LOW: 1.0800
+MT4 BUY < 1.0850
+EXIT: 1.0920"""
+
+SWING_TEXT = """Premium Swing Trades
+Apple Inc (AAPL)
+Earnings Report: Oct 30
+Current Price: $190.00
+Rationale: Strong services growth"""
+
+TABLE_HTML = """
+<h3>Sector Moves</h3>
+<table>
+  <tr><th>Sector</th><th>Change</th></tr>
+  <tr><td>Tech</td><td>{tech}</td></tr>
+</table>
+"""
+
+
+def make_page(forex=FOREX_TEXT, swing=SWING_TEXT, tech='+1.2%'):
+    html = '<html><body>' + TABLE_HTML.format(tech=tech) + '</body></html>'
+    return html, forex + '\n\n' + swing
+
+
+class TestChangeSet:
+    """Diffing section states"""
+
+    def test_statuses(self):
+        previous = {
+            'forex': {'hash': 'a', 'items': [{'pair': 'EURUSD'}]},
+            'day': {'hash': 'b', 'items': [{'ticker': 'MSFT'}]},
+            'swing': {'hash': 'c', 'items': [{'ticker': 'AAPL'}]}
+        }
+        current = {
+            'forex': {'hash': 'a2', 'items': [{'pair': 'EURUSD'}, {'pair': 'GBPUSD'}]},
+            'swing': {'hash': 'c2', 'items': [{'ticker': 'AAPL'}]},
+            'table:0': {'hash': 'd', 'items': [{'title': 'T'}]}
+        }
+        change_set = ChangeSet.compare(previous, current)
+
+        assert change_set.changes['forex'].status == 'changed'
+        assert change_set.changes['forex'].added_items == [{'pair': 'GBPUSD'}]
+        # New hash but identical items is not a change
+        assert change_set.changes['swing'].status == 'unchanged'
+        assert change_set.changes['table:0'].status == 'added'
+        assert change_set.changes['day'].status == 'removed'
+        assert change_set.changes['day'].removed_items == [{'ticker': 'MSFT'}]
+        assert set(change_set.changed_sections) == {'forex', 'table:0', 'day'}
+        assert set(change_set.to_dict()['sections']) == {'forex', 'table:0', 'day'}
+
+
+class TestSectionHashStore:
+    """Persistence of section state"""
+
+    def test_round_trip(self, tmp_path):
+        state_file = tmp_path / 'section_hashes.json'
+        store = SectionHashStore(state_file)
+        store.update('page', {'forex': {'hash': 'a', 'items': [{'pair': 'EURUSD'}]}})
+
+        reloaded = SectionHashStore(state_file)
+        assert reloaded.page_hash == 'page'
+        assert reloaded.get('forex')['items'] == [{'pair': 'EURUSD'}]
+
+    def test_unreadable_file_is_empty(self, tmp_path):
+        state_file = tmp_path / 'section_hashes.json'
+        state_file.write_text('{not json')
+        store = SectionHashStore(state_file)
+        assert store.page_hash is None
+        assert store.sections == {}
+
+
+class TestIncrementalProcessing:
+    """FinancialAlertsProcessor.process_incremental"""
+
+    def test_first_run_matches_full_processing(self, tmp_path):
+        processor = FinancialAlertsProcessor()
+        html, text = make_page()
+        store = SectionHashStore(tmp_path / 'state.json')
+
+        report, change_set = processor.process_incremental(html, store, text)
+        full = processor.process_scraped_data(html, text)
+
+        assert report.to_dict()['forex_forecasts'] == full.to_dict()['forex_forecasts']
+        assert report.to_dict()['swing_trades'] == full.to_dict()['swing_trades']
+        assert report.to_dict()['table_sections'] == full.to_dict()['table_sections']
+        assert report.forex_forecasts and report.swing_trades and report.table_sections
+        assert set(change_set.changed_sections) == {'forex', 'swing', 'table:0'}
+
+    def test_identical_page_reuses_everything(self, tmp_path):
+        processor = FinancialAlertsProcessor()
+        html, text = make_page()
+        store = SectionHashStore(tmp_path / 'state.json')
+        first, _ = processor.process_incremental(html, store, text)
+
+        second, change_set = processor.process_incremental(html, store, text)
+        assert not change_set.has_changes
+        assert change_set.parsed_sections == []
+        assert second.to_dict()['swing_trades'] == first.to_dict()['swing_trades']
+
+    def test_only_changed_sections_are_parsed(self, tmp_path):
+        processor = FinancialAlertsProcessor()
+        store = SectionHashStore(tmp_path / 'state.json')
+        html, text = make_page()
+        processor.process_incremental(html, store, text)
+
+        html, text = make_page(forex=FOREX_TEXT.replace('1.0920', '1.0990'), tech='-0.4%')
+        report, change_set = processor.process_incremental(html, store, text)
+
+        assert set(change_set.parsed_sections) == {'forex', 'table:0'}
+        assert 'swing' in change_set.reused_sections
+        assert set(change_set.changed_sections) == {'forex', 'table:0'}
+        assert change_set.changes['forex'].added_items[0]['exit'] == '1.0990'
+        assert report.forex_forecasts[0].exit == '1.0990'
+        assert report.swing_trades[0].ticker == 'AAPL'
+        assert report.table_sections[0].rows == [['Tech', '-0.4%']]
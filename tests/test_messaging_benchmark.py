@@ -0,0 +1,92 @@
+"""
+Unit tests for the messaging benchmark harness and API stand-ins
+"""
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stats import percentile, summarize_latencies
+from benchmarks.messaging_stubs import TelegramStubServer, SignalStubServer, StubBehavior
+from benchmarks.messaging_benchmark import run_benchmark
+
+
+class TestLatencyStats:
+    """Tests for percentile and latency summaries"""
+
+    def test_percentile_nearest_rank(self):
+        samples = list(range(1, 101))
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 99) == 99
+        assert percentile(samples, 100) == 100
+
+    def test_percentile_empty(self):
+        assert percentile([], 99) == 0.0
+
+    def test_summarize_latencies(self):
+        summary = summarize_latencies([0.010, 0.020, 0.030, 0.040], wall_time_s=2.0)
+        assert summary.count == 4
+        assert summary.p50_ms == 20.0
+        assert summary.max_ms == 40.0
+        assert summary.throughput_per_s == 2.0
+
+
+class TestStubServers:
+    """Tests for the Telegram and Signal stand-ins"""
+
+    def test_telegram_rate_limit_returns_retry_after(self):
+        async def scenario():
+            async with TelegramStubServer(StubBehavior(rate_limit_every=2, retry_after=7)) as server:
+                async with httpx.AsyncClient(base_url=f"{server.base_url}/botTOKEN") as client:
+                    first = await client.post('/sendMessage', json={'chat_id': 1, 'text': 'a'})
+                    second = await client.post('/sendMessage', json={'chat_id': 1, 'text': 'b'})
+                return first, second, server.stats
+
+        first, second, stats = asyncio.run(scenario())
+        assert first.status_code == 200
+        assert first.json()['ok'] is True
+        assert second.status_code == 429
+        assert second.json()['parameters']['retry_after'] == 7
+        assert second.headers['Retry-After'] == '7'
+        assert stats.rate_limited == 1
+        assert stats.delivered == 1
+
+    def test_signal_untrusted_identity_cleared_by_trust(self):
+        async def scenario():
+            async with SignalStubServer(StubBehavior(untrusted_identity_every=2)) as server:
+                async with httpx.AsyncClient(base_url=server.base_url) as client:
+                    payload = {'number': '+1', 'recipients': ['g'], 'message': 'x'}
+                    responses = [await client.post('/v2/send', json=payload) for _ in range(2)]
+                    responses.append(await client.put('/v1/identities/+1/trust/abc'))
+                    responses.append(await client.post('/v2/send', json=payload))
+                return responses, server.stats
+
+        (delivered, untrusted, trust, redelivered), stats = asyncio.run(scenario())
+        assert delivered.status_code == 201
+        assert untrusted.status_code == 400
+        assert 'Untrusted Identity' in untrusted.text
+        assert trust.status_code == 204
+        assert redelivered.status_code == 201
+        assert stats.untrusted_identity == 1
+        assert stats.trust_requests == 1
+
+
+class TestMessagingBenchmark:
+    """End-to-end run of the benchmark against the stand-ins"""
+
+    def test_unified_driver_reports_latency(self):
+        with patch.dict(os.environ, {}, clear=False):
+            report = asyncio.run(run_benchmark(messages=5, concurrency=2, drivers=['unified']))
+
+        result = report['results']['unified']
+        assert result['count'] == 5
+        assert result['platform_deliveries'] == 10
+        assert result['platform_failures'] == 0
+        assert result['p99_ms'] >= result['p50_ms'] > 0
+        assert result['stubs']['telegram']['delivered'] == 5
+        assert result['stubs']['signal']['delivered'] == 5
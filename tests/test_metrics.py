@@ -0,0 +1,132 @@
+"""
+Unit tests for the shared metrics registry and /metrics endpoint
+"""
+import math
+import os
+import sys
+import threading
+
+import pytest
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.metrics import (
+    CACHE_REQUESTS, MetricsRegistry, MetricsServer, histogram_quantile, parse_metrics, registry
+)
+
+
+class TestMetricsRegistry:
+    """Counters, gauges, histograms and collectors"""
+
+    def test_counter_and_gauge(self):
+        metrics = MetricsRegistry()
+        calls = metrics.counter('calls_total', 'Calls', ('api',))
+        calls.inc(api='fred')
+        calls.inc(2, api='fred')
+        assert calls.value(api='fred') == 3
+        assert metrics.counter('calls_total', 'Calls', ('api',)) is calls
+
+        with pytest.raises(ValueError):
+            calls.inc(-1, api='fred')
+        with pytest.raises(ValueError):
+            calls.inc(host='fred')
+        with pytest.raises(ValueError):
+            metrics.gauge('calls_total', 'Calls', ('api',))
+
+        depth = metrics.gauge('queue_depth', 'Depth')
+        depth.set(5)
+        depth.dec(2)
+        assert depth.value() == 3
+
+    def test_counter_thread_safety(self):
+        counter = MetricsRegistry().counter('hits_total', 'Hits')
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert counter.value() == 8000
+
+    def test_histogram_buckets_and_quantile(self):
+        latency = MetricsRegistry().histogram('latency_seconds', 'Latency', ('api',), buckets=(0.1, 0.5, 1.0))
+        for value in (0.05, 0.2, 0.3, 0.7, 3.0):
+            latency.observe(value, api='fred')
+
+        snapshot = latency.snapshot(api='fred')
+        assert snapshot['buckets'] == {0.1: 1, 0.5: 3, 1.0: 4, math.inf: 5}
+        assert snapshot['count'] == 5
+        assert snapshot['sum'] == pytest.approx(4.25)
+
+        assert histogram_quantile(0.5, snapshot['buckets']) == pytest.approx(0.1 + 0.4 * 0.75)
+        # Beyond the last finite bucket the upper bound is unknown
+        assert histogram_quantile(0.99, snapshot['buckets']) == 1.0
+        assert histogram_quantile(0.5, {0.1: 0, math.inf: 0}) is None
+
+    def test_render_and_parse_round_trip(self):
+        metrics = MetricsRegistry()
+        metrics.counter('requests_total', 'Requests', ('host',)).inc(host='api.example.com')
+        metrics.histogram('call_seconds', 'Calls', buckets=(1.0,)).observe(0.5)
+        metrics.register_collector('breakers', lambda: [('breaker_open', {'breaker': 'fred'}, 1),
+                                                        ('breaker_failures_total', {'breaker': 'fred'}, 4)])
+        metrics.register_collector('broken', lambda: 1 / 0)
+
+        text = metrics.render()
+        assert '# TYPE requests_total counter' in text
+        assert '# TYPE breaker_failures_total counter' in text
+        assert '# TYPE breaker_open gauge' in text
+
+        parsed = parse_metrics(text)
+        assert parsed['requests_total'] == [({'host': 'api.example.com'}, 1.0)]
+        assert parsed['call_seconds_bucket'] == [({'le': '1'}, 1.0), ({'le': '+Inf'}, 1.0)]
+        assert parsed['breaker_open'] == [({'breaker': 'fred'}, 1.0)]
+
+    def test_label_values_are_escaped(self):
+        metrics = MetricsRegistry()
+        metrics.counter('odd_total', 'Odd', ('name',)).inc(name='a"b\\c')
+        assert parse_metrics(metrics.render())['odd_total'][0][0] == {'name': 'a"b\\c'}
+
+
+class TestMetricsServer:
+    """Local /metrics endpoint"""
+
+    def test_serves_metrics(self):
+        metrics = MetricsRegistry()
+        metrics.counter('pings_total', 'Pings').inc()
+        server = MetricsServer(metrics, port=0)
+        port = server.start()
+        try:
+            response = requests.get(f'http://127.0.0.1:{port}/metrics', timeout=5)
+            assert response.status_code == 200
+            assert parse_metrics(response.text)['pings_total'] == [({}, 1.0)]
+            assert requests.get(f'http://127.0.0.1:{port}/other', timeout=5).status_code == 404
+        finally:
+            server.stop()
+
+
+class TestComponentWiring:
+    """Existing components report into the shared registry"""
+
+    def test_lru_cache_hits_and_misses(self):
+        from src.core.cache_optimizer import LRUCache
+
+        cache = LRUCache(max_size=10, name='test_lru')
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('missing')
+        assert CACHE_REQUESTS.value(cache='test_lru', tier='memory', result='hit') == 1
+        assert CACHE_REQUESTS.value(cache='test_lru', tier='none', result='miss') == 1
+
+    def test_circuit_breakers_collected(self):
+        from circuit_breaker import get_circuit_breaker
+
+        breaker = get_circuit_breaker('metrics_test_service')
+        breaker.call(lambda: 'ok')
+        parsed = parse_metrics(registry.render())
+        requests_total = {labels['breaker']: value for labels, value in parsed['circuit_breaker_requests_total']}
+        assert requests_total['metrics_test_service'] == 1
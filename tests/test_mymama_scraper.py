@@ -0,0 +1,251 @@
+"""
+Unit tests for MyMama page extraction
+"""
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from tests.module_stubs import stub_missing_modules
+
+with stub_missing_modules('playwright', 'secure_config_manager'):
+    from src.scrapers.unified_base_scraper import UnifiedBaseScraper, session_cookie_header
+    from src.scrapers.unified_mymama_scraper import EXTRACTION_SCRIPT, UnifiedMyMamaScraper, _rendered_text
+
+FOREX_TABLE = '<tr><td>EURUSD</td><td>1.0850</td></tr><tr><td>GBPUSD</td><td>1.2710</td></tr>'
+
+# What EXTRACTION_SCRIPT returns for a page with two tables, a forex section and
+# an earnings selector the browser's querySelector rejects
+SNAPSHOT = {
+    'page_content': f'<!DOCTYPE html><html><body><table>{FOREX_TABLE}</table><table></table></body></html>',
+    'page_text': 'EURUSD\t1.0850\nGBPUSD\t1.2710',
+    'tables': [
+        {'html': FOREX_TABLE, 'text': 'EURUSD\t1.0850\nGBPUSD\t1.2710'},
+        {'html': '', 'text': ''},
+    ],
+    'sections': {
+        'forex': {'html': FOREX_TABLE, 'text': 'EURUSD\t1.0850\nGBPUSD\t1.2710',
+                  'selector_used': 'table:first-of-type'},
+        'options': {'html': '', 'text': '', 'selector_used': 'none'},
+        'earnings': {'html': '', 'text': '', 'selector_used': 'none'},
+    },
+    'unsupported': {'forex': [], 'options': [], 'earnings': ['.earnings, .premium']},
+}
+
+
+class FakeElement:
+    def __init__(self, html, text):
+        self.html = html
+        self.text = text
+
+    async def inner_html(self):
+        return self.html
+
+    async def inner_text(self):
+        return self.text
+
+
+class FakePage:
+    """Answers the batched evaluate with a fixed snapshot"""
+
+    def __init__(self, snapshot=None, elements=None):
+        self.snapshot = snapshot
+        self.elements = elements or {}
+        self.evaluated = []
+
+    async def evaluate(self, script, arg):
+        self.evaluated.append((script, arg))
+        if self.snapshot is None:
+            raise RuntimeError('Execution context was destroyed')
+        return self.snapshot
+
+    async def query_selector(self, selector):
+        return self.elements.get(selector)
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    """MyMama scraper without credentials, session store or browser"""
+    def base_init(self, component='daily_report', config_overrides=None):
+        self.config_overrides = config_overrides or {}
+        self.credentials = {'MYMAMA_USERNAME': 'user', 'MYMAMA_PASSWORD': 'secret'}
+        self.optional_config = {}
+        self.output_label = None
+        self.cache_dir = tmp_path
+
+    with patch.object(UnifiedBaseScraper, '__init__', base_init):
+        return UnifiedMyMamaScraper()
+
+
+class TestExtractSnapshot:
+    """Single-pass DOM extraction"""
+
+    def test_snapshot_is_parsed_into_tables_and_sections(self, scraper):
+        earnings = FakeElement('<p>AAPL beats</p>', 'AAPL beats')
+        scraper.page = FakePage(dict(SNAPSHOT), {'.earnings, .premium': earnings})
+
+        snapshot = asyncio.run(scraper._extract_snapshot())
+
+        # One round trip, carrying every section's candidate selectors
+        assert scraper.page.evaluated == [(EXTRACTION_SCRIPT, scraper._section_selectors())]
+        assert snapshot['page_text'] == SNAPSHOT['page_text']
+        assert snapshot['tables'] == [
+            {'index': 0, 'html': FOREX_TABLE, 'text': 'EURUSD\t1.0850\nGBPUSD\t1.2710', 'row_count': 2},
+            {'index': 1, 'html': '', 'text': '', 'row_count': 0},
+        ]
+        assert snapshot['sections']['forex']['selector_used'] == 'table:first-of-type'
+        assert snapshot['sections']['options']['selector_used'] == 'none'
+        # The rejected selector is retried through Playwright's selector engine
+        assert snapshot['sections']['earnings'] == {
+            'html': '<p>AAPL beats</p>', 'text': 'AAPL beats', 'selector_used': '.earnings, .premium'
+        }
+
+    def test_failed_evaluate_falls_back(self, scraper):
+        scraper.page = FakePage(None)
+        assert asyncio.run(scraper._extract_snapshot()) is None
+
+
+class TestSessionCookieHeader:
+    """Cookies a browser would send with the HTTP fast path"""
+
+    def test_cookie_rules(self):
+        state = {'cookies': [
+            {'name': 'sid', 'value': 'a1', 'domain': '.mymama.uk', 'path': '/'},
+            {'name': 'secure', 'value': 'b2', 'domain': 'www.mymama.uk', 'path': '/', 'secure': True},
+            {'name': 'account', 'value': 'c3', 'domain': 'www.mymama.uk', 'path': '/account'},
+            {'name': 'stale', 'value': 'd4', 'domain': 'mymama.uk', 'path': '/', 'expires': time.time() - 60},
+            {'name': 'other', 'value': 'e5', 'domain': 'example.com', 'path': '/'},
+        ]}
+        url = 'https://www.mymama.uk/copy-of-alerts-essentials-1'
+        assert session_cookie_header(state, url) == 'sid=a1; secure=b2'
+        assert session_cookie_header(state, url.replace('https', 'http')) == 'sid=a1'
+        assert session_cookie_header(None, url) == ''
+
+
+class TestRenderedText:
+    """innerText approximation for parsed HTML"""
+
+    def test_blocks_cells_and_hidden_elements(self):
+        html = ('<div><h2>Forex  Alerts</h2><script>track()</script>'
+                '<p>EURUSD<br>BUY&nbsp;now</p>'
+                '<table><tr><td>GBPUSD</td><td>1.2710</td></tr></table></div>')
+        element = BeautifulSoup(html, 'html.parser').div
+        assert _rendered_text(element) == 'Forex Alerts\nEURUSD\nBUY now\nGBPUSD\t1.2710'
+        # The parsed tree is left untouched
+        assert element.script is not None
+
+
+class TestExtractDataFromHtml:
+    """HTTP fast path extraction"""
+
+    def test_server_rendered_page(self, scraper):
+        html = ('<html><body><main><div data-testid="forex">'
+                '<table><tr><td>EURUSD</td><td>1.0850</td></tr></table></div>'
+                '<div class="options-section"><p>SPY calls</p></div></main></body></html>')
+        data = scraper._extract_data_from_html(html, 'https://www.mymama.uk/alerts')
+
+        assert data['page_content'] == html
+        assert data['source_url'] == 'https://www.mymama.uk/alerts'
+        assert data['page_text'] == 'EURUSD\t1.0850\nSPY calls'
+        assert data['tables'] == [{'index': 0, 'html': '<tr><td>EURUSD</td><td>1.0850</td></tr>',
+                                   'text': 'EURUSD\t1.0850', 'row_count': 1}]
+        assert data['forex']['selector_used'] == scraper.selectors['content']['forex_section']
+        assert data['forex']['text'] == 'EURUSD\t1.0850'
+        assert data['options'] == {'html': '<p>SPY calls</p>', 'text': 'SPY calls',
+                                   'selector_used': scraper.selectors['content']['options_section']}
+        assert data['earnings']['selector_used'] == 'table:last-of-type'
+
+    def test_login_form_means_session_rejected(self, scraper):
+        html = '<html><body><form><input type="password"></form></body></html>'
+        assert scraper._extract_data_from_html(html, 'https://www.mymama.uk/alerts') is None
+
+
+class FakeSessionManager:
+    """Async-only loader: the fast path must not decrypt on the event loop"""
+
+    def __init__(self, state):
+        self.state = state
+
+    async def load_session_state_async(self, session_name):
+        return self.state
+
+
+SERVER_PAGE = ('<html><body><main><div data-testid="forex">'
+               '<table><tr><td>EURUSD</td><td>1.0850</td></tr></table></div>'
+               '<div class="options-section"><p>SPY calls</p></div>'
+               '<table><tr><td>AAPL</td><td>2.10</td></tr></table></main></body></html>')
+LOGIN_PAGE = '<html><body><form><input type="password"></form></body></html>'
+
+
+class TestHttpFastPath:
+    """Plain HTTP fetch with the saved session cookies"""
+
+    @staticmethod
+    def run_fast_path(scraper, handler):
+        scraper.session_name = 'mymama_session'
+        scraper.target_url = UnifiedMyMamaScraper.TARGET_URL
+        scraper.login_path = UnifiedMyMamaScraper.LOGIN_PATH
+        scraper.http_fast_path_timeout = 5
+        scraper.browser_config = {'user_agent': 'test-agent', 'extra_http_headers': {}}
+        scraper.session_manager = FakeSessionManager({'cookies': [
+            {'name': 'sid', 'value': 'a1', 'domain': '.mymama.uk', 'path': '/'}
+        ]})
+        requests = []
+
+        def record(request):
+            requests.append(request)
+            return handler(request)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+            try:
+                with patch.dict(UnifiedBaseScraper._try_http_fast_path.__globals__,
+                                {'get_http_client': lambda **kwargs: client}):
+                    return await scraper._try_http_fast_path()
+            finally:
+                await client.aclose()
+
+        return asyncio.run(run()), requests
+
+    def test_login_url_is_matched_on_the_path(self, scraper):
+        scraper.login_path = '/login'
+        assert scraper._is_login_url('https://www.mymama.uk/login')
+        assert scraper._is_login_url('https://www.mymama.uk/Login/?next=/alerts')
+        assert not scraper._is_login_url('https://www.mymama.uk/signals')
+        assert not scraper._is_login_url('https://www.mymama.uk/design?assign=1')
+        assert not scraper._is_login_url('https://www.mymama.uk/alerts?next=login')
+
+    def test_server_rendered_page_skips_the_browser(self, scraper):
+        data, requests = self.run_fast_path(
+            scraper, lambda request: httpx.Response(200, html=SERVER_PAGE))
+
+        assert data['validation']['is_valid']
+        assert data['forex']['text'] == 'EURUSD\t1.0850'
+        assert requests[0].headers['Cookie'] == 'sid=a1'
+
+    def test_redirect_to_login_falls_back(self, scraper):
+        def handler(request):
+            if request.url.path == '/login':
+                return httpx.Response(200, html=LOGIN_PAGE)
+            return httpx.Response(302, headers={'Location': 'https://www.mymama.uk/login'})
+
+        data, requests = self.run_fast_path(scraper, handler)
+        assert data is None
+        assert [request.url.path for request in requests] == ['/copy-of-alerts-essentials-1', '/login']
+
+    def test_redirect_to_a_non_login_page_is_accepted(self, scraper):
+        def handler(request):
+            if request.url.path == '/signals':
+                return httpx.Response(200, html=SERVER_PAGE)
+            return httpx.Response(302, headers={'Location': 'https://www.mymama.uk/signals'})
+
+        data, _ = self.run_fast_path(scraper, handler)
+        assert data['source_url'] == 'https://www.mymama.uk/signals'
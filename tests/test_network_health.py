@@ -0,0 +1,163 @@
+"""
+Unit tests for passive network health tracking
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network_resilience import ConnectivityStatus, ConnectivityTest, NetworkHealthMonitor
+from src.core.metrics import MetricsRegistry, MetricsServer
+from src.core.network_health import PassiveHealthTracker, endpoint_key, health_tracker
+
+
+@pytest.fixture
+def live_server():
+    """Local HTTP endpoint"""
+    server = MetricsServer(MetricsRegistry(), port=0)
+    port = server.start()
+    yield f'http://127.0.0.1:{port}'
+    server.stop()
+
+
+def make_monitor(tracker, delay=0.0, **config):
+    """Monitor whose HTTP probes are recorded instead of sent"""
+    monitor = NetworkHealthMonitor({'idle_threshold': 60, **config}, tracker=tracker)
+    probed = []
+
+    async def fake_probe(url):
+        probed.append(url)
+        await asyncio.sleep(delay)
+        return ConnectivityTest(endpoint=url, success=True, response_time=delay, status_code=200)
+
+    monitor.check_http_connectivity = fake_probe
+    return monitor, probed
+
+
+class TestPassiveHealthTracker:
+    """Observations, idle time and summaries"""
+
+    def test_endpoint_key(self):
+        assert endpoint_key('https://API.Telegram.org/bot123/sendMessage') == 'api.telegram.org'
+        assert endpoint_key('8.8.8.8') == '8.8.8.8'
+
+    def test_idle_recent_and_snapshot(self):
+        tracker = PassiveHealthTracker(per_endpoint=3)
+        assert tracker.idle_for('https://a.test') == float('inf')
+        for i in range(4):
+            tracker.observe('https://a.test/q', i != 3, 0.1, status_code=200 if i != 3 else 503)
+        tracker.observe('https://b.test', False, 1.0, error='ConnectError', source='probe')
+
+        assert tracker.idle_for('https://a.test/other') < 1
+        assert len(tracker.recent(url='https://a.test')) == 3   # Bounded per endpoint
+        assert [o.endpoint for o in tracker.recent()][-1] == 'b.test'
+
+        snapshot = tracker.snapshot()
+        assert snapshot['a.test']['success_rate'] == round(2 / 3, 3)
+        assert snapshot['b.test']['probes'] == 1
+        assert snapshot['b.test']['last_error'] == 'ConnectError'
+
+    def test_live_requests_are_observed(self, live_server):
+        from src.core.replay import http_get
+
+        health_tracker.clear()
+        http_get(live_server + '/metrics', timeout=5)
+        http_get(live_server + '/missing', timeout=5)
+        observations = health_tracker.recent(url=live_server)
+        assert [o.status_code for o in observations] == [200, 404]
+        # A 4xx is the service answering
+        assert all(o.success and o.source == 'traffic' for o in observations)
+
+
+class TestNetworkHealthMonitor:
+    """Health comes from traffic; probes only cover idle endpoints"""
+
+    def test_only_idle_endpoints_probed(self):
+        tracker = PassiveHealthTracker()
+        monitor, probed = make_monitor(tracker, probe_urls=['https://busy.test', 'https://quiet.test'])
+        tracker.observe('https://busy.test/api', True, 0.2)
+
+        tests = asyncio.run(monitor.probe_idle_endpoints())
+        assert probed == ['https://quiet.test']
+        assert len(tests) == 1 and monitor.test_history == tests
+        # The probe itself counts as activity
+        assert asyncio.run(monitor.probe_idle_endpoints()) == []
+        assert tracker.snapshot()['quiet.test']['probes'] == 1
+
+    def test_probes_run_concurrently(self):
+        urls = [f'https://idle{i}.test' for i in range(4)]
+        monitor, probed = make_monitor(PassiveHealthTracker(), delay=0.1, probe_urls=urls)
+
+        started = time.perf_counter()
+        asyncio.run(monitor.probe_idle_endpoints())
+        assert time.perf_counter() - started < 0.3
+        assert sorted(probed) == urls
+
+    def test_check_health_from_traffic(self):
+        tracker = PassiveHealthTracker()
+        monitor, probed = make_monitor(tracker, probe_urls=['https://api.telegram.org'])
+        for _ in range(3):
+            tracker.observe('https://api.telegram.org/bot1/sendMessage', False, 5.0, error='ConnectTimeout')
+        tracker.observe('https://www.google.com', True, 0.1)
+
+        health = asyncio.run(monitor.check_health())
+        assert probed == []
+        assert health.status is ConnectivityStatus.POOR
+        assert health.failed_connections == 3
+        assert 'Telegram API unreachable' in health.issues
+        assert 'api.telegram.org' in monitor.get_network_statistics()['passive']
+
+    def test_busy_failing_host_does_not_outvote_the_others(self):
+        tracker = PassiveHealthTracker()
+        monitor, _ = make_monitor(tracker, probe_urls=[])
+        for _ in range(40):
+            tracker.observe('https://api.telegram.org/bot1/sendMessage', False, 5.0, error='ConnectTimeout')
+        tracker.observe('https://www.google.com', True, 0.1)
+        tracker.observe('https://www.mymama.uk/alerts', True, 0.3)
+
+        health = asyncio.run(monitor.check_health())
+        assert health.endpoint_loss == {'api.telegram.org': 1.0, 'www.google.com': 0.0, 'www.mymama.uk': 0.0}
+        assert health.packet_loss_rate == pytest.approx(1 / 3)
+        assert health.status is ConnectivityStatus.DEGRADED
+        assert health.failed_connections == 40
+        assert health.response_time_avg == pytest.approx(0.2)
+        assert 'Telegram API unreachable' in health.issues
+
+    def test_session_of_a_finished_loop_is_reported(self, caplog):
+        monitor = NetworkHealthMonitor(tracker=PassiveHealthTracker())
+
+        async def probe_and_close():
+            session = await monitor._get_session()
+            await monitor.close()
+            return session
+
+        asyncio.run(monitor._get_session())   # Loop ends without close()
+        assert asyncio.run(probe_and_close()).closed
+        assert 'Probe session of a finished event loop was never closed' in caplog.text
+
+        caplog.clear()
+        asyncio.run(probe_and_close())
+        assert 'never closed' not in caplog.text
+
+    def test_pooled_httpx_requests_are_observed(self):
+        from benchmarks.messaging_stubs import TelegramStubServer, StubBehavior
+        from utils.http_client_pool import HttpClientPool
+
+        async def scenario():
+            pool = HttpClientPool()
+            async with TelegramStubServer(StubBehavior()) as server:
+                try:
+                    client = pool.get_client(server.base_url)
+                    await client.post('/botTOKEN/sendMessage', json={'chat_id': 1, 'text': 'hi'})
+                finally:
+                    await pool.close_all()
+                return server.base_url
+
+        health_tracker.clear()
+        base_url = asyncio.run(scenario())
+        observations = health_tracker.recent(url=base_url)
+        assert len(observations) == 1 and observations[0].success
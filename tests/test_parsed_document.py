@@ -0,0 +1,88 @@
+"""
+Unit tests for the shared parsed HTML document
+"""
+import os
+import sys
+from dataclasses import asdict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_processors.parsed_document import ParsedDocument
+from src.data_processors.financial_alerts import FinancialAlertsProcessor
+from src.utils.pattern_matcher import MultiPatternMatcher
+
+SAMPLE_HTML = """
+<html><body>
+<h2>Forex</h2>
+<p>EURUSD</p><p>ENTRY: 1.0850</p><p>EXIT: 1.0920</p><p>HIGH: 1.0950</p><p>LOW: 1.0800</p>
+<p>Trading gbp/jpy today</p>
+<table>
+  <tr><th>Symbol</th><th>Signal</th></tr>
+  <tr><td>AAPL</td><td>BUY</td></tr>
+  <tr><td>TSLA</td><td>SELL</td></tr>
+</table>
+</body></html>
+"""
+
+
+class TestParsedDocument:
+    """Tests for the lazily built indexes"""
+
+    def test_pair_index_matches_substring_search(self):
+        document = ParsedDocument(SAMPLE_HTML)
+        for needle in ['EURUSD', 'GBP/JPY', 'EUR/USD', 'USDJPY']:
+            expected = [i for i, line in enumerate(document.lines) if needle in line.upper()]
+            assert document.line_indices(needle) == expected
+        assert document.find_line('GBP/JPY') is not None
+        assert document.find_line('USDCHF') is None
+
+    def test_case_sensitive_lookup(self):
+        document = ParsedDocument(SAMPLE_HTML)
+        assert document.find_line('Forex', case_sensitive=True) is not None
+        assert document.find_line('FOREX', case_sensitive=True) is None
+
+    def test_table_indexes(self):
+        document = ParsedDocument(SAMPLE_HTML)
+        table = document.tables[0]
+        assert document.select('table') == document.tables
+        assert document.header_texts(table) == ['symbol', 'signal']
+        assert [c.get_text() for c in document.cells(document.rows(table)[2])] == ['TSLA', 'SELL']
+        assert document.rows(table) is document.rows(table)
+
+    def test_pattern_lines_are_memoized_per_matcher(self):
+        document = ParsedDocument(SAMPLE_HTML)
+        matcher = MultiPatternMatcher(['EURUSD', 'GBP/JPY', 'AAPL'])
+        hits = document.pattern_lines(matcher)
+        assert hits['GBP/JPY'] == document.line_indices('GBP/JPY')
+        assert hits['AAPL'] == document.line_indices('AAPL')
+        assert document.pattern_lines(matcher) is hits
+
+    def test_coerce_reuses_document(self):
+        document = ParsedDocument(SAMPLE_HTML)
+        assert ParsedDocument.coerce(document) is document
+        assert ParsedDocument.coerce(SAMPLE_HTML).tables
+
+    def test_coerce_adopts_rendered_text(self):
+        document = ParsedDocument(SAMPLE_HTML)
+        assert document.find_line('USDCAD') is None
+        ParsedDocument.coerce(document, 'USDCAD rendered only')
+        assert document.lines == ['USDCAD rendered only']
+        assert document.find_line('USDCAD') == 0
+
+
+class TestFinancialAlertsWithDocument:
+    """FinancialAlertsProcessor on a shared document"""
+
+    def test_same_report_from_html_or_document(self):
+        processor = FinancialAlertsProcessor()
+        text = ParsedDocument(SAMPLE_HTML).soup_text
+
+        from_html = processor.process_scraped_data(SAMPLE_HTML, text)
+        from_document = processor.process_scraped_data(ParsedDocument(SAMPLE_HTML))
+
+        assert [asdict(f) for f in from_html.forex_forecasts] == \
+            [asdict(f) for f in from_document.forex_forecasts]
+        assert from_document.forex_forecasts[0].pair == 'EURUSD'
+        assert [asdict(t) for t in from_document.table_sections] == \
+            [asdict(t) for t in from_html.table_sections]
+        assert from_document.table_sections[0].headers == ['Symbol', 'Signal']
@@ -0,0 +1,60 @@
+"""
+Unit tests for the multi-pattern matcher
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.pattern_matcher import MultiPatternMatcher, PatternMatch
+
+
+class TestMultiPatternMatcher:
+    """Tests for substring-equivalent matching"""
+
+    def test_overlapping_and_nested_matches(self):
+        matcher = MultiPatternMatcher(['increase', 'ease', 'in', 'inc'], case='lower')
+        matches = list(matcher.finditer('Rates INCREASE'))
+        assert PatternMatch('increase', 6, 14) in matches
+        assert PatternMatch('inc', 6, 9) in matches
+        assert PatternMatch('in', 6, 8) in matches
+        assert PatternMatch('ease', 10, 14) in matches
+        assert [m.start for m in matches] == sorted(m.start for m in matches)
+
+    def test_found_equals_substring_checks(self):
+        rng = random.Random(7)
+        patterns = ['EURUSD', 'USD', 'EUR/USD', 'SPY', 'S', 'USDJPY', 'JPY', 'GBP/JPY', 'A.B']
+        alphabet = 'EURSDJPYGB/ .A\n'
+        matcher = MultiPatternMatcher(patterns)
+        for _ in range(300):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            assert matcher.found(text) == {p for p in patterns if p in text.upper()}
+
+    def test_line_hits_match_per_line_scan(self):
+        text = "intro\nEURUSD buy\nnothing\ngbpjpy and EURUSD\nEUR/USD"
+        matcher = MultiPatternMatcher(['EURUSD', 'GBPJPY', 'EUR/USD', 'CHF'])
+        lines = text.split('\n')
+        expected = {}
+        for pattern in matcher.patterns:
+            hits = [i for i, line in enumerate(lines) if pattern in line.upper()]
+            if hits:
+                expected[pattern] = hits
+        assert matcher.line_hits(text) == expected
+
+    def test_case_sensitive_mode(self):
+        matcher = MultiPatternMatcher(['Premium Day Trades'], case=None)
+        assert matcher.found('Premium Day Trades') == {'Premium Day Trades'}
+        assert matcher.found('PREMIUM DAY TRADES') == set()
+
+    def test_patterns_reported_as_given(self):
+        matcher = MultiPatternMatcher(['EurUsd', 'EURUSD'])
+        assert matcher.found('eurusd') == {'EurUsd', 'EURUSD'}
+
+    def test_empty_inputs(self):
+        assert MultiPatternMatcher([]).found('anything') == set()
+        assert MultiPatternMatcher(['X']).line_hits('') == {}
+        with pytest.raises(ValueError):
+            MultiPatternMatcher(['x'], case='title')
@@ -0,0 +1,118 @@
+"""
+Unit tests for quorum, hedging and adaptive timeouts in MultiAPIValidator
+"""
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.price_validator import MultiAPIValidator, PriceData, SourceLatencyTracker
+
+PRIMARIES = ('_fetch_exchangerate_api', '_fetch_freecurrency_api', '_fetch_currencyapi')
+BACKUPS = ('_fetch_fixer_api', '_fetch_exchangerates_api')
+
+
+def fake_source(name, delay, price=1.1, calls=None):
+    async def fetch(pair):
+        if calls is not None:
+            calls.append(name)
+        await asyncio.sleep(delay)
+        if price is None:
+            return None
+        return PriceData(pair=pair, price=price, source=name, timestamp=datetime.now())
+    return fetch
+
+
+@pytest.fixture
+def validator():
+    validator = MultiAPIValidator()
+    validator.yfinance_helper = None
+    validator.data_fetcher = None
+    validator.source_latency = SourceLatencyTracker(default_hedge_delay=5.0)
+    return validator
+
+
+def install(validator, delays, prices=None, calls=None):
+    prices = prices or {}
+    for method, delay in delays.items():
+        setattr(validator, method, fake_source(method, delay, prices.get(method, 1.1), calls))
+
+
+class TestQuorum:
+    """Early return once min_sources agree"""
+
+    def test_returns_at_quorum_and_cancels_stragglers(self, validator):
+        validator.yfinance_helper = object()
+        install(validator, {**{m: 0.01 for m in PRIMARIES}, '_fetch_yfinance_price': 5.0,
+                            **{m: 5.0 for m in BACKUPS}})
+
+        started = time.perf_counter()
+        prices = asyncio.run(validator._fetch_prices_from_all_apis('EURUSD'))
+        assert time.perf_counter() - started < 1.0
+        assert len(prices) == 3
+        assert validator.source_latency.outcomes['yfinance']['cancelled'] == 1
+
+    def test_disagreement_waits_for_more_quotes(self, validator):
+        validator.yfinance_helper = object()
+        install(validator, {**{m: 0.01 for m in PRIMARIES}, '_fetch_yfinance_price': 0.2},
+                {'_fetch_currencyapi': 1.2})
+        started = time.perf_counter()
+        prices = asyncio.run(validator._fetch_prices_from_all_apis('EURUSD'))
+        # No quorum while the outlier is in the set, so every primary is awaited
+        assert time.perf_counter() - started >= 0.2
+        assert len(prices) == 4
+        assert not validator._has_quorum('EURUSD', prices)
+
+    def test_quorum_mode_off_collects_all(self, validator):
+        validator.quorum_mode = False
+        install(validator, {**{m: 0.01 for m in PRIMARIES}, **{m: 0.01 for m in BACKUPS}})
+        prices = asyncio.run(validator._fetch_prices_from_all_apis('EURUSD'))
+        # Backups only run as hedges
+        assert sorted(p.source for p in prices) == sorted(PRIMARIES)
+
+
+class TestHedgingAndTimeouts:
+    """Backups for failing or slow primaries and partial results on deadline"""
+
+    def test_failed_primary_hedges_to_backup(self, validator):
+        calls = []
+        install(validator, {**{m: 0.01 for m in PRIMARIES}, **{m: 0.01 for m in BACKUPS}},
+                {'_fetch_currencyapi': None}, calls)
+        prices = asyncio.run(validator._fetch_prices_from_all_apis('EURUSD'))
+        assert sorted(p.source for p in prices) == ['_fetch_exchangerate_api', '_fetch_fixer_api',
+                                                    '_fetch_freecurrency_api']
+        assert '_fetch_exchangerates_api' not in calls
+
+    def test_slow_primary_hedges_before_timeout(self, validator):
+        validator.source_latency.default_hedge_delay = 0.05
+        install(validator, {'_fetch_exchangerate_api': 0.01, '_fetch_freecurrency_api': 0.01,
+                            '_fetch_currencyapi': 5.0, **{m: 0.01 for m in BACKUPS}})
+        started = time.perf_counter()
+        prices = asyncio.run(validator._fetch_prices_from_all_apis('EURUSD'))
+        assert time.perf_counter() - started < 1.0
+        assert len(prices) == 3
+
+    def test_deadline_keeps_collected_quotes(self, validator):
+        validator.fetch_timeout = 0.1
+        install(validator, {'_fetch_exchangerate_api': 0.01, '_fetch_freecurrency_api': 5.0,
+                            '_fetch_currencyapi': 5.0, **{m: 5.0 for m in BACKUPS}})
+        prices = asyncio.run(validator._fetch_prices_from_all_apis('EURUSD'))
+        assert [p.source for p in prices] == ['_fetch_exchangerate_api']
+
+    def test_adaptive_timeout_from_percentiles(self):
+        tracker = SourceLatencyTracker(min_samples=5, min_timeout=0.5, max_timeout=10.0, default_hedge_delay=2.0)
+        assert tracker.timeout_for('fixer') == 10.0
+        assert tracker.hedge_delay('fixer') == 2.0
+
+        for seconds in (0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.5):
+            tracker.record('fixer', seconds, 'ok')
+        tracker.record('fixer', 9.0, 'timeout')
+        assert tracker.percentile('fixer', 50) == 0.6
+        assert tracker.timeout_for('fixer') == 3.0
+        assert tracker.hedge_delay('fixer') == 1.5
+        assert tracker.snapshot()['fixer']['timeout'] == 1
@@ -0,0 +1,163 @@
+"""
+Unit tests for retry_after parsing and adaptive per-chat rate limiting
+"""
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.messengers.rate_limit_feedback import AdaptiveRateLimiter, parse_retry_after
+from enhanced_error_handler import CircuitBreaker, CircuitBreakerState, get_error_handler
+from utils.http_client_pool import close_http_clients
+from benchmarks.messaging_stubs import TelegramStubServer, StubBehavior
+from benchmarks.messaging_benchmark import configure_stub_environment
+
+
+class TestParseRetryAfter:
+    """Tests for extracting server retry hints"""
+
+    def test_telegram_body_parameter(self):
+        body = {'ok': False, 'error_code': 429, 'parameters': {'retry_after': 14}}
+        assert parse_retry_after({}, body) == 14.0
+
+    def test_retry_after_header_seconds(self):
+        assert parse_retry_after({'Retry-After': '3'}) == 3.0
+
+    def test_retry_after_header_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        value = parse_retry_after({'Retry-After': format_datetime(retry_at, usegmt=True)})
+        assert 25 <= value <= 30
+
+    def test_naive_http_date_is_utc(self, monkeypatch):
+        from forex_signals.messaging.base import retry_after_from_response
+
+        class Response:
+            headers = {'Retry-After': format_datetime(
+                (datetime.now(timezone.utc) + timedelta(seconds=30)).replace(tzinfo=None))}
+
+            def json(self):
+                raise ValueError('not json')
+
+        # Local time far from UTC must not shift the computed wait
+        monkeypatch.setenv('TZ', 'Asia/Tokyo')
+        time.tzset()
+        try:
+            assert 25 <= retry_after_from_response(Response()) <= 30
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_missing_hint(self):
+        assert parse_retry_after({}, {'ok': False}) is None
+        assert parse_retry_after({'Retry-After': 'soon'}) is None
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for AIMD pacing"""
+
+    def test_throttle_backs_off_and_success_recovers(self):
+        limiter = AdaptiveRateLimiter(min_interval=1.0, max_interval=10.0)
+        limiter.on_throttle('chat', retry_after=0)
+        assert limiter.get_stats()['chat']['interval'] == 2.0
+        assert limiter.get_stats()['chat']['throttles'] == 1
+
+        for _ in range(50):
+            limiter.on_success('chat')
+        assert limiter.get_stats()['chat']['interval'] == 1.0
+
+    def test_pace_resumes_once_retry_after_window_passes(self):
+        limiter = AdaptiveRateLimiter(min_interval=0)
+        limiter.on_throttle('chat', retry_after=0.1)
+        assert limiter.get_stats()['chat']['interval'] == 1.0
+
+        async def scenario():
+            waits = [await limiter.acquire('chat') for _ in range(3)]
+            return waits, limiter.get_stats()['chat']['interval']
+
+        # Only the first send waits out the window; the rest go at the old pace
+        waits, interval = asyncio.run(scenario())
+        assert waits[0] >= 0.05 and waits[1:] == [0.0, 0.0]
+        assert interval == 0.0
+
+    def test_success_inside_window_only_decays(self):
+        limiter = AdaptiveRateLimiter(min_interval=0.1)
+        limiter.on_throttle('chat', retry_after=60)
+        limiter.on_success('chat')
+        assert limiter.get_stats()['chat']['interval'] == 0.9
+
+    def test_interval_capped_at_max(self):
+        limiter = AdaptiveRateLimiter(min_interval=1.0, max_interval=5.0)
+        for _ in range(10):
+            limiter.on_throttle('chat', retry_after=0)
+        assert limiter.get_stats()['chat']['interval'] == 5.0
+
+    def test_acquire_waits_for_retry_after(self):
+        limiter = AdaptiveRateLimiter(min_interval=0)
+        limiter.on_throttle('chat', retry_after=0.2)
+
+        async def scenario():
+            started = time.monotonic()
+            await limiter.acquire('chat')
+            return time.monotonic() - started
+
+        assert asyncio.run(scenario()) >= 0.15
+
+    def test_chats_are_independent(self):
+        limiter = AdaptiveRateLimiter(min_interval=0)
+        limiter.on_throttle('busy', retry_after=5)
+
+        async def scenario():
+            return await limiter.acquire('quiet')
+
+        assert asyncio.run(scenario()) == 0.0
+
+
+class TestCircuitBreakerThrottling:
+    """Throttling must not count as failure"""
+
+    def test_record_throttle_keeps_breaker_closed(self):
+        breaker = CircuitBreaker(name='test', failure_threshold=2)
+        for _ in range(5):
+            breaker.record_throttle()
+        assert breaker.state == CircuitBreakerState.CLOSED
+        assert breaker.failure_count == 0
+        assert breaker.throttle_count == 5
+
+
+class TestMessengerThrottleFeedback:
+    """UnifiedTelegramMessenger against a throttling stand-in"""
+
+    def test_telegram_429_is_retried_after_retry_after(self):
+        async def scenario():
+            async with TelegramStubServer(StubBehavior(rate_limit_every=2, retry_after=0)) as server:
+                configure_stub_environment(server.base_url, 'http://127.0.0.1:9')
+                from src.messengers.unified_messenger import UnifiedTelegramMessenger
+                from utils.env_config import EnvironmentConfig
+
+                messenger = UnifiedTelegramMessenger(EnvironmentConfig('daily_report'))
+                messenger.rate_limiter.min_interval = 0
+                try:
+                    results = [await messenger.send_message(f"msg {i}") for i in range(4)]
+                finally:
+                    await messenger.cleanup()
+                    await close_http_clients()
+                return results, server.stats, messenger.get_rate_limit_stats()
+
+        with patch.dict(os.environ, {}, clear=False):
+            results, stats, pacing = asyncio.run(scenario())
+
+        assert all(result.success for result in results)
+        assert stats.rate_limited >= 1
+        assert stats.delivered == 4
+        assert sum(chat['throttles'] for chat in pacing.values()) == stats.rate_limited
+
+        breaker = get_error_handler().get_or_create_circuit_breaker('external_service_messaging_platform_call')
+        assert breaker.throttle_count >= stats.rate_limited
+        assert breaker.state == CircuitBreakerState.CLOSED
@@ -0,0 +1,141 @@
+"""
+Unit tests for the record/replay transport
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.exceptions import CassetteMissError
+from src.core.metrics import MetricsRegistry, MetricsServer
+from src.core.replay import Cassette, http_get, http_request, redact_url, use_cassette
+
+
+@pytest.fixture
+def live_server():
+    """Local HTTP endpoint whose response changes between calls"""
+    metrics = MetricsRegistry()
+    hits = metrics.counter('hits_total', 'Hits')
+    server = MetricsServer(metrics, port=0)
+    port = server.start()
+    yield f'http://127.0.0.1:{port}/metrics', hits
+    server.stop()
+
+
+class TestRedaction:
+    """Credentials never reach the cassette"""
+
+    def test_query_and_env_secrets(self, monkeypatch):
+        monkeypatch.setenv('FOREX_EXCHANGERATE_API_KEY', 'sekrit-value-123')
+        url = redact_url('https://api.example.com/v6/sekrit-value-123/pair/EUR/USD?b=2&apikey=abc',
+                         params={'a': 1, 'token': 'xyz'})
+        assert 'sekrit' not in url and 'abc' not in url and 'xyz' not in url
+        assert url == ('https://api.example.com/v6/REDACTED/pair/EUR/USD'
+                       '?a=1&apikey=REDACTED&b=2&token=REDACTED')
+
+    def test_path_and_settings_secrets(self, monkeypatch):
+        from src.core import config
+
+        url = redact_url('https://v6.exchangerate-api.com/v6/c554d55ee2da8edcf00d3fd0/pair/EUR/USD')
+        assert url == 'https://v6.exchangerate-api.com/v6/REDACTED/pair/EUR/USD'
+
+        # Keys held only by a settings object (not in os.environ)
+        monkeypatch.setattr(config.settings, 'news_api_key', 'settings-only-key-987')
+        assert redact_url('https://news.test/v2/settings-only-key-987/top') == \
+            'https://news.test/v2/REDACTED/top'
+
+    def test_different_keys_match(self):
+        assert http_request('GET', 'https://x.test/q?api_key=one') == \
+            http_request('GET', 'https://x.test/q', params={'api_key': 'two'})
+
+
+class TestCassette:
+    """Recording, replay order, misses and persistence"""
+
+    def test_record_then_replay_http(self, tmp_path, live_server):
+        url, hits = live_server
+        path = tmp_path / 'run.json.gz'
+
+        with use_cassette(path, 'record') as cassette:
+            first = http_get(url, timeout=5).text
+            hits.inc()
+            second = http_get(url, timeout=5).text
+        assert cassette.stats['recorded'] == 2
+        assert first != second
+
+        with use_cassette(path, 'replay') as cassette:
+            assert http_get(url, timeout=5).text == first
+            assert http_get(url, timeout=5).text == second
+            # The last recorded response repeats
+            assert http_get(url, timeout=5).text == second
+            with pytest.raises(CassetteMissError):
+                http_get(url + '?other=1')
+        assert cassette.stats == {'played': 3, 'missed': 1, 'recorded': 0}
+
+    def test_make_request_with_backoff_replays(self, tmp_path):
+        from src.rate_limiter import make_request_with_backoff
+
+        cassette = Cassette(tmp_path / 'api.json', 'record')
+        cassette.record('http', http_request('GET', 'https://api.example.com/rates?apikey=k'),
+                        {'status': 200, 'headers': {'Content-Type': 'application/json'}, 'body': '{"rate": 1.1}'},
+                        0.5)
+        cassette.save()
+
+        with use_cassette(tmp_path / 'api.json', 'replay'):
+            response = make_request_with_backoff('https://api.example.com/rates?apikey=other', timeout=30)
+        assert response.status_code == 200
+        assert response.json() == {'rate': 1.1}
+
+    def test_call_replays_values_errors_and_latency(self, tmp_path):
+        path = tmp_path / 'calls.json'
+        with use_cassette(path, 'record') as cassette:
+            assert cassette.call('quote', {'symbol': 'EURUSD=X'}, lambda: {'bid': 1.1}) == {'bid': 1.1}
+            with pytest.raises(ZeroDivisionError):
+                cassette.call('quote', {'symbol': 'BAD'}, lambda: 1 / 0)
+
+        with use_cassette(path, 'replay', latency=0.05) as cassette:
+            started = time.perf_counter()
+            assert cassette.call('quote', {'symbol': 'EURUSD=X'}, pytest.fail) == {'bid': 1.1}
+            assert time.perf_counter() - started >= 0.05
+            with pytest.raises(RuntimeError, match='ZeroDivisionError'):
+                cassette.call('quote', {'symbol': 'BAD'}, pytest.fail)
+
+    def test_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError):
+            Cassette(tmp_path / 'x.json', 'rewind')
+        with pytest.raises(ValueError):
+            Cassette(tmp_path / 'x.json', 'record', latency='slow')
+
+
+class TestAsyncHttpClientReplay:
+    """AsyncHttpClient serves replayed responses without touching the network"""
+
+    def test_replayed_get(self, tmp_path):
+        from async_http_client import AsyncHttpClient
+
+        cassette = Cassette(tmp_path / 'async.json', 'record')
+        cassette.record('http', http_request('GET', 'https://api.example.com/news', {'q': 'EUR'}),
+                        {'status': 200, 'headers': {'Content-Type': 'application/json'}, 'body': '[1, 2]'}, 0.2)
+        cassette.record('http', http_request('GET', 'https://api.example.com/down'),
+                        {'status': 503, 'headers': {}, 'body': 'unavailable'}, 0.1)
+        cassette.save()
+
+        async def run():
+            client = AsyncHttpClient({'cache_dir': str(tmp_path / 'cache'), 'request_delay': 0})
+            try:
+                ok = await client.get('https://api.example.com/news', params={'q': 'EUR'}, cache_ttl=None)
+                down = await client.get('https://api.example.com/down', cache_ttl=None)
+                missing = await client.get('https://api.example.com/unrecorded', cache_ttl=None)
+                return ok, down, missing, client.get_metrics()
+            finally:
+                await client.close()
+
+        with use_cassette(tmp_path / 'async.json', 'replay'):
+            ok, down, missing, metrics = asyncio.run(run())
+        assert ok['data'] == [1, 2] and ok['status'] == 200
+        assert down is None and missing is None
+        assert metrics['successful_requests'] == 1 and metrics['failed_requests'] == 2
@@ -0,0 +1,101 @@
+"""
+Unit tests for the scraper resource blocking policy
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.resource_policy import DEFAULT_ALLOWLIST, ResourceBlockingPolicy
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = SimpleNamespace(resource_type=resource_type, url=url)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = 'aborted'
+
+    async def continue_(self):
+        self.outcome = 'continued'
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def unroute(self, pattern, handler):
+        self.routes = [r for r in self.routes if r != (pattern, handler)]
+
+
+class TestResourceBlockingPolicy:
+    """Tests for block/allow decisions"""
+
+    def test_heavy_types_and_trackers_are_blocked(self):
+        policy = ResourceBlockingPolicy()
+        assert policy.should_block('image', 'https://www.mymama.uk/logo.png')
+        assert policy.should_block('font', 'https://fonts.example.com/a.woff2')
+        assert policy.should_block('script', 'https://www.googletagmanager.com/gtm.js')
+        assert policy.should_block('xhr', 'https://region1.google-analytics.com/g/collect')
+
+    def test_page_content_is_allowed(self):
+        policy = ResourceBlockingPolicy()
+        assert not policy.should_block('document', 'https://www.mymama.uk/copy-of-alerts-essentials-1')
+        assert not policy.should_block('script', 'https://www.mymama.uk/app.js')
+        assert not policy.should_block('fetch', 'https://www.mymama.uk/api/data')
+        # Host match is by domain, not substring
+        assert not policy.should_block('script', 'https://notdoubleclick.net.example.com/x.js')
+
+    def test_allowlist_wins(self):
+        policy = ResourceBlockingPolicy()
+        assert not policy.should_block('image', 'https://www.google.com/recaptcha/api2/payload')
+
+    def test_from_config(self):
+        with patch.dict(os.environ, {'BROWSER_RESOURCE_ALLOWLIST': 'static.example.com',
+                                     'BROWSER_BLOCKED_TYPES': 'image,stylesheet'}):
+            policy = ResourceBlockingPolicy.from_config({})
+        assert policy.should_block('stylesheet', 'https://a.com/site.css')
+        assert not policy.should_block('font', 'https://a.com/f.woff')
+        assert not policy.should_block('image', 'https://static.example.com/img.png')
+        assert 'recaptcha' in policy.allowlist
+
+        disabled = ResourceBlockingPolicy.from_config({'block_resources': False})
+        assert not disabled.should_block('image', 'https://a.com/x.png')
+
+    def test_config_allowlist_extends_defaults_and_unknown_keys_ignored(self):
+        policy = ResourceBlockingPolicy.from_config({'resource_policy': {
+            'allowlist': ['cdn.example.com'], 'blocked_types': ['image'], 'block_fonts': True
+        }})
+        assert policy.allowlist[:len(DEFAULT_ALLOWLIST)] == DEFAULT_ALLOWLIST
+        assert 'cdn.example.com' in policy.allowlist
+        assert not policy.should_block('image', 'https://www.google.com/recaptcha/api2/payload')
+        assert not policy.should_block('font', 'https://a.com/f.woff')
+
+    def test_route_handler_and_single_install(self):
+        async def scenario():
+            policy = ResourceBlockingPolicy()
+            context = FakeContext()
+            assert await policy.install(context)
+            assert not await policy.install(context)
+
+            # A new policy (next scraper run on a pooled context) replaces the old route
+            replacement = ResourceBlockingPolicy()
+            assert await replacement.install(context)
+            assert len(context.routes) == 1
+
+            image, page = FakeRoute('image', 'https://a.com/x.png'), FakeRoute('document', 'https://a.com/')
+            handler = context.routes[0][1]
+            await handler(image)
+            await handler(page)
+            return replacement, image, page
+
+        policy, image, page = asyncio.run(scenario())
+        assert image.outcome == 'aborted' and page.outcome == 'continued'
+        assert policy.get_statistics() == {'enabled': True, 'blocked': 1, 'allowed': 1}
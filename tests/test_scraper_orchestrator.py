@@ -0,0 +1,136 @@
+"""
+Unit tests for the concurrent scraper orchestrator and per-domain politeness
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.domain_rate_limiter import DomainRateLimiter
+from src.scrapers.scraper_orchestrator import ScraperOrchestrator, ScrapeTarget
+
+
+class FakePool:
+    max_idle_contexts = 2
+
+
+class FakeScraper:
+    """Stands in for a UnifiedBaseScraper subclass"""
+    TARGET_URL = 'https://example.com/alerts'
+    running = 0
+    peak = 0
+
+    def __init__(self, config_overrides=None):
+        self.config_overrides = config_overrides or {}
+        self.site_name = 'example'
+        self.target_url = self.config_overrides.get('target_url') or self.TARGET_URL
+        self.delay = self.config_overrides.get('delay', 0.05)
+
+    async def scrape_data(self):
+        FakeScraper.running += 1
+        FakeScraper.peak = max(FakeScraper.peak, FakeScraper.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.config_overrides.get('fail'):
+                return {'success': False, 'error': 'no data'}
+            return {'success': True, 'data': {'label': self.config_overrides['output_label']}}
+        finally:
+            FakeScraper.running -= 1
+
+
+def make_orchestrator(max_contexts=4, min_delay=0.0, per_domain=4):
+    FakeScraper.running = FakeScraper.peak = 0
+    limiter = DomainRateLimiter(min_delay=min_delay, max_concurrent_per_domain=per_domain, jitter=(0.0, 0.0))
+    return ScraperOrchestrator(max_contexts=max_contexts, rate_limiter=limiter, browser_pool=FakePool())
+
+
+class TestDomainRateLimiter:
+    """RateLimiter semantics for concurrent tasks"""
+
+    def test_starts_are_spaced_per_domain(self):
+        limiter = DomainRateLimiter(min_delay=0.05, max_concurrent_per_domain=3, jitter=(0.0, 0.0))
+        starts = []
+
+        async def request(domain):
+            await limiter.acquire(domain)
+            starts.append((domain, time.monotonic()))
+            limiter.release(domain)
+
+        async def run():
+            await asyncio.gather(*(request('a.com') for _ in range(3)), request('b.com'))
+
+        began = time.monotonic()
+        asyncio.run(run())
+        a_starts = sorted(t for d, t in starts if d == 'a.com')
+        assert a_starts[1] - a_starts[0] >= 0.045
+        assert a_starts[2] - a_starts[1] >= 0.045
+        # Other domains do not queue behind a.com
+        assert [t for d, t in starts if d == 'b.com'][0] - began < 0.04
+
+    def test_adaptive_delay(self):
+        limiter = DomainRateLimiter(min_delay=1.0, max_delay=2.0, failure_threshold=3)
+        for _ in range(4):
+            limiter.record_failure('a.com')
+        assert limiter.delay_for('a.com') == 1.5
+        for _ in range(3):
+            limiter.record_failure('a.com')
+        assert limiter.delay_for('a.com') == 2.0
+        for _ in range(7):
+            limiter.record_success('a.com')
+        assert limiter.delay_for('a.com') == 1.0
+
+
+class TestScraperOrchestrator:
+    """Concurrent runs and aggregation"""
+
+    def test_runs_concurrently(self):
+        orchestrator = make_orchestrator()
+        for i in range(4):
+            orchestrator.add_target(f'page{i}', FakeScraper, delay=0.2)
+
+        result = asyncio.run(orchestrator.run())
+        assert result.success
+        assert FakeScraper.peak == 4
+        # Close to the slowest single page, not the sum of all pages
+        assert result.duration < 0.5
+        assert result.results['page2'].result['data'] == {'label': 'page2'}
+
+    def test_context_limit(self):
+        orchestrator = make_orchestrator(max_contexts=2)
+        for i in range(5):
+            orchestrator.add_target(f'page{i}', FakeScraper)
+        asyncio.run(orchestrator.run())
+        assert FakeScraper.peak == 2
+
+    def test_per_domain_limit_and_urls(self):
+        orchestrator = make_orchestrator(per_domain=1)
+        orchestrator.add_target('a1', FakeScraper)
+        orchestrator.add_target('a2', FakeScraper)
+        orchestrator.add_target('b1', FakeScraper, url='https://other.example.org/page')
+
+        result = asyncio.run(orchestrator.run())
+        assert result.results['b1'].domain == 'other.example.org'
+        assert FakeScraper.peak == 2
+
+    def test_failures_and_timeouts_are_aggregated(self):
+        orchestrator = make_orchestrator()
+        orchestrator.add_target('ok', FakeScraper)
+        orchestrator.add_target('bad', FakeScraper, fail=True)
+        orchestrator.targets.append(ScrapeTarget('slow', FakeScraper, config_overrides={'delay': 1}, timeout=0.05))
+
+        result = asyncio.run(orchestrator.run())
+        assert result.succeeded == ['ok']
+        assert set(result.failed) == {'bad', 'slow'}
+        assert result.results['slow'].error == 'timeout'
+        assert result.to_dict()['targets']['bad']['error'] == 'no data'
+        assert orchestrator.rate_limiter.get_statistics()['example.com']['failures'] == 2
+
+    def test_duplicate_names_rejected(self):
+        orchestrator = make_orchestrator()
+        orchestrator.add_target('page', FakeScraper)
+        with pytest.raises(ValueError):
+            orchestrator.add_target('page', FakeScraper)
@@ -202,6 +202,21 @@ class TestSecureSessionManager(unittest.TestCase):
             self.assertIn("age_hours", session)
             self.assertIn("size_kb", session)
 
+    def test_concurrent_save_and_load_keep_sessions_apart(self):
+        """Concurrent saves and loads never swap data through config.enc"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        names = [f"session_{i}" for i in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            saved = list(pool.map(lambda n: self.manager.save_session_state({"owner": n}, n), names))
+        self.assertTrue(all(saved))
+        
+        self.manager.store.invalidate()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            loaded = list(pool.map(self.manager.load_session_state, names * 3))
+        self.assertEqual([data["owner"] for data in loaded], names * 3)
+        self.assertFalse((self.session_dir / "config.enc").exists())
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
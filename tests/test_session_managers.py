@@ -0,0 +1,177 @@
+"""
+Unit tests for the session managers built on the shared SessionStore
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.module_stubs import stub_missing_modules
+
+with stub_missing_modules('secure_config_manager'):
+    from enhanced_session_manager import EnhancedSessionManager, SessionInfo
+    from secure_session_manager import SecureSessionManager
+    from utils.optimized_session_manager import OptimizedSessionManager
+
+COOKIES = {'cookies': [{'name': 'sid', 'value': 'a1', 'domain': '.mymama.uk', 'path': '/'}]}
+
+
+class TestSecureSessionManager:
+    """Decrypted sessions are cached on (inode, mtime_ns, size)"""
+
+    def test_unchanged_file_is_decrypted_once(self, tmp_path):
+        manager = SecureSessionManager(str(tmp_path))
+        assert manager.save_session_state(COOKIES, 'alpha')
+        manager.store.invalidate()
+
+        assert manager.load_session_state('alpha') == COOKIES
+        assert manager.load_session_state('alpha') == COOKIES
+        stats = manager.store.get_statistics()
+        assert (stats['decrypts'], stats['hits'], stats['misses']) == (1, 1, 1)
+
+    def test_file_changed_by_another_manager_is_reloaded(self, tmp_path):
+        reader = SecureSessionManager(str(tmp_path))
+        writer = SecureSessionManager(str(tmp_path))
+        assert writer.save_session_state(COOKIES, 'alpha')
+        assert reader.load_session_state('alpha') == COOKIES
+
+        updated = {'cookies': COOKIES['cookies'] * 2}
+        assert writer.save_session_state(updated, 'alpha')
+        assert reader.load_session_state('alpha') == updated
+        assert reader.store.get_statistics()['decrypts'] == 2
+
+    def test_staging_leaves_session_file_in_place(self, tmp_path):
+        manager = SecureSessionManager(str(tmp_path))
+        assert manager.save_session_state(COOKIES, 'alpha')
+        session_file = manager._session_file('alpha')
+        manager.store.invalidate()
+
+        assert manager.load_session_state('alpha') == COOKIES
+        assert session_file.exists()
+        assert not (tmp_path / 'config.enc').exists()
+
+    def test_concurrent_saves_and_loads_share_the_staging_file(self, tmp_path):
+        manager = SecureSessionManager(str(tmp_path))
+        names = [f'session_{i}' for i in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert all(pool.map(lambda name: manager.save_session_state({'name': name}, name), names))
+            manager.store.invalidate()
+            # The same file is loaded repeatedly while others are staged
+            loaded = list(pool.map(manager.load_session_state, names * 3))
+        assert [data['name'] for data in loaded] == names * 3
+
+    def test_async_load_hits_the_cache(self, tmp_path):
+        manager = SecureSessionManager(str(tmp_path))
+
+        async def run():
+            assert await manager.save_session_state_async(COOKIES, 'alpha')
+            return await manager.load_session_state_async('alpha')
+
+        assert asyncio.run(run()) == COOKIES
+        assert manager.store.get_statistics()['decrypts'] == 0
+
+
+class TestEnhancedSessionManager:
+    """Disk layer, removal and expiry"""
+
+    def test_disk_round_trip_is_cached(self, tmp_path):
+        manager = EnhancedSessionManager(str(tmp_path))
+
+        async def run():
+            assert await manager._save_encrypted_session(SessionInfo('enhanced_round_trip', COOKIES))
+            manager.store.invalidate()
+            first = await manager._load_encrypted_session('enhanced_round_trip')
+            second = await manager._load_encrypted_session('enhanced_round_trip')
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first.data == second.data == COOKIES
+        assert manager.store.get_statistics()['decrypts'] == 1
+        assert not (tmp_path / 'enhanced_round_trip' / 'config.enc').exists()
+
+    def test_concurrent_disk_loads(self, tmp_path):
+        manager = EnhancedSessionManager(str(tmp_path))
+        names = [f'enhanced_concurrent_{i}' for i in range(4)]
+
+        async def run():
+            for name in names:
+                assert await manager._save_encrypted_session(SessionInfo(name, {'name': name}))
+            manager.store.invalidate()
+            return await asyncio.gather(*(manager._load_encrypted_session(name) for name in names * 3))
+
+        assert [info.data['name'] for info in asyncio.run(run())] == names * 3
+
+    def test_remove_session_drops_file_and_cache(self, tmp_path):
+        manager = EnhancedSessionManager(str(tmp_path))
+
+        async def run():
+            assert await manager.save_session_state(COOKIES, 'enhanced_removed')
+            await manager._remove_session('enhanced_removed')
+            return await manager.load_session_state('enhanced_removed')
+
+        assert asyncio.run(run()) is None
+        assert not (tmp_path / 'enhanced_removed').exists()
+        assert manager.store.get_statistics()['cached_sessions'] == 0
+
+    def test_cleanup_expired_sessions_by_file_age(self, tmp_path):
+        manager = EnhancedSessionManager(str(tmp_path), {'max_session_age_hours': 1})
+
+        async def run():
+            assert await manager._save_encrypted_session(SessionInfo('enhanced_stale', COOKIES))
+            assert await manager._save_encrypted_session(SessionInfo('enhanced_fresh', COOKIES))
+            stale = time.time() - 2 * 3600
+            os.utime(tmp_path / 'enhanced_stale' / 'session.enc', (stale, stale))
+            return await manager.cleanup_expired_sessions()
+
+        assert asyncio.run(run()) == 1
+        assert not (tmp_path / 'enhanced_stale').exists()
+        assert (tmp_path / 'enhanced_fresh' / 'session.enc').exists()
+
+
+class TestOptimizedSessionManager:
+    """Lazy registry on top of the shared store"""
+
+    def test_load_uses_the_shared_cache(self, tmp_path):
+        manager = OptimizedSessionManager(str(tmp_path))
+        assert manager.save_session('alpha', COOKIES, async_save=False)
+
+        assert manager.load_session('alpha') == COOKIES
+        assert manager.load_session('alpha', use_cache=False) == COOKIES
+        stats = manager.store.get_statistics()
+        assert (stats['decrypts'], stats['hits']) == (1, 1)
+        assert manager.batch_load_sessions(['alpha', 'missing']) == {'alpha': COOKIES, 'missing': None}
+
+    def test_delete_session(self, tmp_path):
+        manager = OptimizedSessionManager(str(tmp_path))
+        assert manager.save_session('alpha', COOKIES, async_save=False)
+
+        assert manager.delete_session('alpha')
+        assert manager.load_session('alpha') is None
+        assert not (tmp_path / 'alpha').exists()
+        assert not manager.delete_session('alpha')
+
+    def test_cleanup_old_sessions_by_mtime(self, tmp_path):
+        manager = OptimizedSessionManager(str(tmp_path))
+        assert manager.save_session('stale', COOKIES, async_save=False)
+        assert manager.save_session('fresh', COOKIES, async_save=False)
+        stale = time.time() - 8 * 86400
+        os.utime(manager._session_file('stale'), (stale, stale))
+
+        assert manager.cleanup_old_sessions(days=7) == 1
+        assert manager.load_session('stale') is None
+        assert manager.load_session('fresh') == COOKIES
+
+    def test_sessions_saved_elsewhere_are_found_on_scan(self, tmp_path):
+        assert SecureSessionManager(str(tmp_path)).save_session_state(COOKIES, 'alpha')
+        assert OptimizedSessionManager(str(tmp_path)).load_session('alpha') == COOKIES
+
+    def test_legacy_session_files_are_reported(self, tmp_path, caplog):
+        (tmp_path / 'alpha.session').write_bytes(b'legacy')
+        with caplog.at_level(logging.WARNING):
+            manager = OptimizedSessionManager(str(tmp_path))
+        assert manager.load_session('alpha') is None
+        assert 'alpha.session' in caplog.text
@@ -0,0 +1,155 @@
+"""
+Unit tests for the shared decrypted-session cache
+"""
+import asyncio
+import json
+import os
+import shutil
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.session_store import SessionStore, session_checksum, staging_lock
+
+
+class FakeCipherFiles:
+    """Reversible 'encryption' that counts how often files are decrypted"""
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+
+    def read(self, path):
+        self.reads += 1
+        return json.loads(path.read_bytes()[::-1].decode())
+
+    def write(self, path, data):
+        self.writes += 1
+        path.write_bytes(json.dumps(data).encode()[::-1])
+        return True
+
+
+def make_store(max_entries=32):
+    files = FakeCipherFiles()
+    return SessionStore(files.read, files.write, max_entries=max_entries), files
+
+
+class TestSessionStore:
+    """Caching keyed by file identity"""
+
+    def test_unchanged_file_is_decrypted_once(self, tmp_path):
+        store, files = make_store()
+        path = tmp_path / 'session.enc'
+        store.save(path, {'cookies': [1]})
+        store.invalidate()
+
+        assert store.load(path) == {'cookies': [1]}
+        assert store.load(path) == {'cookies': [1]}
+        assert files.reads == 1
+        assert store.get_statistics()['hits'] == 1
+
+    def test_save_primes_cache(self, tmp_path):
+        store, files = make_store()
+        path = tmp_path / 'session.enc'
+        store.save(path, {'token': 'abc'})
+
+        assert store.load(path) == {'token': 'abc'}
+        assert files.reads == 0
+        assert store.checksum(path) == session_checksum({'token': 'abc'})
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        store, files = make_store()
+        path = tmp_path / 'session.enc'
+        store.save(path, {'v': 1})
+
+        # Another process rewrites the session with a different size
+        other, _ = make_store()
+        other.save(path, {'v': 12345})
+        assert store.load(path) == {'v': 12345}
+        assert files.reads == 1
+
+    def test_returned_data_is_a_copy(self, tmp_path):
+        store, _ = make_store()
+        path = tmp_path / 'session.enc'
+        store.save(path, {'cookies': []})
+
+        store.load(path)['cookies'].append('mutated')
+        assert store.load(path) == {'cookies': []}
+
+    def test_verify_runs_only_on_decrypt(self, tmp_path):
+        store, _ = make_store()
+        path = tmp_path / 'session.enc'
+        store.save(path, {'v': 1})
+        store.invalidate()
+        calls = []
+
+        def verify(data):
+            calls.append(data)
+            return True
+
+        store.load(path, verify=verify)
+        store.load(path, verify=verify)
+        assert len(calls) == 1
+
+        store.invalidate()
+        assert store.load(path, verify=lambda data: False) is None
+        assert store.get_statistics()['verify_failures'] == 1
+
+    def test_missing_file(self, tmp_path):
+        store, _ = make_store()
+        path = tmp_path / 'session.enc'
+        store.save(path, {'v': 1})
+        path.unlink()
+        assert store.load(path) is None
+        assert store.get_statistics()['cached_sessions'] == 0
+
+    def test_lru_bound(self, tmp_path):
+        store, _ = make_store(max_entries=2)
+        for i in range(3):
+            store.save(tmp_path / f'{i}.enc', {'i': i})
+        assert store.get_statistics()['cached_sessions'] == 2
+        assert store.peek(tmp_path / '0.enc') is None
+
+    def test_async_api(self, tmp_path):
+        store, files = make_store()
+        path = tmp_path / 'session.enc'
+
+        async def run():
+            assert await store.save_async(path, {'v': 1})
+            store.invalidate()
+            first = await store.load_async(path)
+            second = await store.load_async(path)
+            return first, second
+
+        assert asyncio.run(run()) == ({'v': 1}, {'v': 1})
+        assert files.reads == 1
+
+    def test_staging_lock_serialises_shared_staging_file(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Stage every file through one fixed path, as SecureConfigManager does
+        staging = tmp_path / 'config.enc'
+        files = FakeCipherFiles()
+
+        def write(path, data):
+            with staging_lock(staging):
+                files.write(staging, data)
+                staging.rename(path)
+            return True
+
+        def read(path):
+            with staging_lock(staging):
+                shutil.copyfile(path, staging)
+                try:
+                    return files.read(staging)
+                finally:
+                    staging.unlink()
+
+        store = SessionStore(read, write)
+        paths = [tmp_path / f'{i}.enc' for i in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert all(pool.map(lambda p: store.save(p, {'path': p.name}), paths))
+            store.invalidate()
+            loaded = list(pool.map(store.load, paths * 3))
+        assert [data['path'] for data in loaded] == [p.name for p in paths * 3]
+        assert staging_lock(staging) is staging_lock(str(staging))
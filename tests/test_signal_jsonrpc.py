@@ -0,0 +1,129 @@
+"""
+Unit tests for the Signal JSON-RPC send mode and its REST fallback
+"""
+import asyncio
+import base64
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.messengers.signal_jsonrpc import SignalJsonRpcClient, SignalJsonRpcError, rest_group_to_rpc_target
+from utils.http_client_pool import close_http_clients
+from benchmarks.messaging_stubs import SignalStubServer, StubBehavior
+from benchmarks.messaging_benchmark import configure_stub_environment, BENCHMARK_SIGNAL_NUMBER
+
+INTERNAL_GROUP_ID = 'aGVsbG8gd29ybGQgZ3JvdXAgaWQ='
+REST_GROUP_ID = 'group.' + base64.b64encode(INTERNAL_GROUP_ID.encode()).decode()
+
+
+class TestJsonRpcHelpers:
+    """Tests for parameter mapping"""
+
+    def test_rest_group_id_is_decoded(self):
+        assert rest_group_to_rpc_target(REST_GROUP_ID) == {'groupId': INTERNAL_GROUP_ID}
+
+    def test_phone_number_becomes_recipient(self):
+        assert rest_group_to_rpc_target('+15550001111') == {'recipient': ['+15550001111']}
+
+    def test_send_error_reports_recipient_failures(self):
+        ok = {'result': {'timestamp': 1, 'results': [{'type': 'SUCCESS'}]}}
+        failed = {'result': {'timestamp': 1, 'results': [{'type': 'IDENTITY_FAILURE'}]}}
+        assert SignalJsonRpcClient.send_error(ok) is None
+        assert 'IDENTITY_FAILURE' in SignalJsonRpcClient.send_error(failed)
+        assert SignalJsonRpcClient.send_error({'error': {'code': -1, 'message': 'boom'}}) == 'boom'
+
+    def test_messenger_shares_the_package_modules(self):
+        import src.messengers.unified_messenger as unified
+
+        # One copy of each module, so exception and isinstance checks agree
+        assert unified.SignalJsonRpcError is SignalJsonRpcError
+        assert not {'signal_jsonrpc', 'delivery_outbox', 'rate_limit_feedback'} & set(sys.modules)
+
+    def test_failed_recipients_and_rate_limit(self):
+        partial = {'result': {'results': [
+            {'recipientAddress': {'number': '+15550001111'}, 'type': 'SUCCESS'},
+            {'recipientAddress': {'uuid': 'a-b', 'number': None}, 'type': 'IDENTITY_FAILURE'},
+        ]}}
+        limited = {'error': {'code': -5, 'message': 'rate limiting', 'data': {'retryAfterSeconds': 7}}}
+        assert SignalJsonRpcClient.failed_recipients(partial) == {'a-b': 'IDENTITY_FAILURE'}
+        assert not SignalJsonRpcClient.rate_limited(partial)
+        assert SignalJsonRpcClient.rate_limited(limited)
+        assert SignalJsonRpcClient.retry_after(limited) == 7.0
+
+
+def _run_signal(jsonrpc: bool, send_mode: str = 'auto', behavior: StubBehavior = None):
+    async def scenario():
+        async with SignalStubServer(behavior or StubBehavior(), group_id=REST_GROUP_ID,
+                                    phone_number=BENCHMARK_SIGNAL_NUMBER, jsonrpc=jsonrpc) as server:
+            configure_stub_environment('http://127.0.0.1:9', server.base_url)
+            os.environ['SIGNAL_GROUP_ID'] = REST_GROUP_ID
+            os.environ['SIGNAL_SEND_MODE'] = send_mode
+            from src.messengers.unified_messenger import UnifiedSignalMessenger
+            from utils.env_config import EnvironmentConfig
+
+            messenger = UnifiedSignalMessenger(EnvironmentConfig('daily_report'))
+            messenger.rate_limiter.min_interval = 0
+            try:
+                results = await messenger.send_batch(['part 1', 'part 2', 'part 3'])
+                single = await messenger.send_message('single')
+            finally:
+                await messenger.cleanup()
+                await close_http_clients()
+            server.pacing = messenger.get_rate_limit_stats()
+            return results + [single], server
+
+    with patch.dict(os.environ, {}, clear=False):
+        return asyncio.run(scenario())
+
+
+class TestSignalSendModes:
+    """UnifiedSignalMessenger against the signal-cli stand-in"""
+
+    def test_batch_goes_through_one_jsonrpc_request(self):
+        results, server = _run_signal(jsonrpc=True)
+
+        assert all(result.success for result in results)
+        assert all(result.metadata.get('transport') == 'jsonrpc' for result in results)
+        # version probe + one batch for three chunks + one single send
+        assert server.stats.by_endpoint['api/v1/rpc'] == 3
+        assert 'v2/send' not in server.stats.by_endpoint
+        assert [p['message'] for p in server.rpc_sends] == ['part 1', 'part 2', 'part 3', 'single']
+        assert server.rpc_sends[0]['groupId'] == INTERNAL_GROUP_ID
+
+    def test_auto_mode_falls_back_to_rest(self):
+        results, server = _run_signal(jsonrpc=False)
+
+        assert all(result.success for result in results)
+        # One failed probe, then REST for every message
+        assert server.stats.by_endpoint.get('api/v1/rpc', 0) == 0
+        assert server.stats.by_endpoint['v2/send'] == 4
+
+    def test_rest_mode_never_probes(self):
+        results, server = _run_signal(jsonrpc=True, send_mode='rest')
+
+        assert all(result.success for result in results)
+        assert 'api/v1/rpc' not in server.stats.by_endpoint
+        assert server.stats.by_endpoint['v2/send'] == 4
+
+    def test_recipient_failures_retry_only_those_recipients(self):
+        results, server = _run_signal(jsonrpc=True, behavior=StubBehavior(untrusted_identity_every=2))
+
+        assert all(result.success for result in results)
+        assert server.stats.untrusted_identity >= 1 and server.stats.trust_requests >= 1
+        # Each message reaches the group once; the untrusted member gets a direct resend
+        group_sends = [p['message'] for p in server.rpc_sends if 'groupId' in p]
+        direct_sends = [p for p in server.rpc_sends if 'recipient' in p]
+        assert group_sends == ['part 1', 'part 2', 'part 3', 'single']
+        assert direct_sends and all(len(p['recipient']) == 1 for p in direct_sends)
+        assert 'v2/send' not in server.stats.by_endpoint
+
+    def test_batch_waits_out_rate_limits(self):
+        results, server = _run_signal(jsonrpc=True, behavior=StubBehavior(rate_limit_every=2, retry_after=0))
+
+        assert all(result.success for result in results)
+        assert server.stats.rate_limited >= 2
+        assert sorted(p['message'] for p in server.rpc_sends) == ['part 1', 'part 2', 'part 3', 'single']
+        assert sum(chat['throttles'] for chat in server.pacing.values()) == server.stats.rate_limited
+        assert 'v2/send' not in server.stats.by_endpoint
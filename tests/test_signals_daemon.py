@@ -0,0 +1,172 @@
+"""
+Unit tests for the resident signals daemon
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from signals_daemon import DaemonConfig, SignalsDaemon, send_command
+
+
+class FakeGenerator:
+    def __init__(self):
+        self.currency_pairs = ['EURUSD', 'USDJPY']
+
+
+class FakeSystem:
+    """Stands in for EnhancedAPISignalsDailyV2"""
+    builds = 0
+    running = 0
+    peak = 0
+    runs = []
+
+    def __init__(self):
+        FakeSystem.builds += 1
+        self.signal_generator = FakeGenerator()
+
+    async def generate_and_send_daily_signals(self):
+        FakeSystem.running += 1
+        FakeSystem.peak = max(FakeSystem.peak, FakeSystem.running)
+        try:
+            FakeSystem.runs.append(list(self.signal_generator.currency_pairs))
+            await asyncio.sleep(0.02)
+            return True
+        finally:
+            FakeSystem.running -= 1
+
+
+def make_daemon(tmp_path, **config):
+    FakeSystem.builds = FakeSystem.running = FakeSystem.peak = 0
+    FakeSystem.runs = []
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps({'daemon': {'socket_path': str(tmp_path / 'd.sock'), 'metrics_port': 0, **config}}))
+    return SignalsDaemon(config_path, system_factory=FakeSystem, tick=0.01)
+
+
+class TestDaemonConfig:
+    """config.json sections"""
+
+    def test_defaults_and_app_settings_fallback(self, tmp_path):
+        assert DaemonConfig.load(tmp_path / 'missing.json').report_time == '06:00'
+
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({'app_settings': {'report_time': '07:30', 'report_days': ['monday']},
+                                    'daemon': {'prewarm_minutes': 10}}))
+        config = DaemonConfig.load(path)
+        assert (config.report_time, config.report_days, config.prewarm_minutes) == ('07:30', ['monday'], 10)
+
+
+class TestSignalsDaemon:
+    """Warm runs, triggers and reload"""
+
+    def test_pipeline_is_built_once_and_pairs_restored(self, tmp_path):
+        daemon = make_daemon(tmp_path)
+
+        async def run():
+            first = await daemon.run_job()
+            second = await daemon.run_job(pairs=['gbpusd'])
+            third = await daemon.run_job()
+            return first, second, third
+
+        records = asyncio.run(run())
+        assert all(record.success for record in records)
+        assert FakeSystem.builds == 1
+        assert FakeSystem.runs == [['EURUSD', 'USDJPY'], ['GBPUSD'], ['EURUSD', 'USDJPY']]
+
+    def test_concurrent_warm_ups_build_one_pipeline(self, tmp_path, monkeypatch):
+        daemon = make_daemon(tmp_path)
+        build = daemon.system_factory
+
+        def slow_build():
+            time.sleep(0.05)
+            return build()
+
+        monkeypatch.setattr(daemon, 'system_factory', slow_build)
+
+        async def run():
+            # Background warm-up after a reload racing a run-now request
+            warm = asyncio.create_task(asyncio.to_thread(daemon.warm_up))
+            record = await daemon.run_job()
+            return await warm, record
+
+        warmed, record = asyncio.run(run())
+        assert warmed and record.success
+        assert FakeSystem.builds == 1
+
+    def test_runs_are_serialized(self, tmp_path):
+        daemon = make_daemon(tmp_path)
+
+        async def run():
+            await asyncio.gather(*(daemon.run_job() for _ in range(3)))
+
+        asyncio.run(run())
+        assert FakeSystem.peak == 1
+        assert len(daemon.history) == 3
+
+    def test_schedule_and_reload(self, tmp_path):
+        daemon = make_daemon(tmp_path, report_time='06:00', report_days=['monday'])
+        assert daemon.next_run().endswith('06:00:00')
+        # Run plus pre-warm job
+        assert len(daemon.scheduler.jobs) == 2
+
+        async def run():
+            await daemon.run_job()
+            daemon.config_path.write_text(json.dumps({'daemon': {'report_time': '07:15',
+                                                                 'socket_path': str(tmp_path / 'd.sock')}}))
+            await daemon.reload_config()
+            await asyncio.sleep(0.05)
+
+        asyncio.run(run())
+        assert daemon.next_run().endswith('07:15:00')
+        assert len(daemon.scheduler.jobs) == 10
+        assert FakeSystem.builds == 2
+
+    def test_socket_api(self, tmp_path):
+        daemon = make_daemon(tmp_path)
+        socket_path = tmp_path / 'd.sock'
+
+        async def run():
+            server = asyncio.create_task(daemon.serve(install_signal_handlers=False))
+            while not socket_path.exists():
+                await asyncio.sleep(0.01)
+            try:
+                ran = await send_command('run-pairs', socket_path, pairs=['CHFJPY'])
+                status = await send_command('status', socket_path)
+                bad = await send_command('explode', socket_path)
+                return ran, status, bad
+            finally:
+                daemon.stop()
+                await server
+
+        ran, status, bad = asyncio.run(run())
+        assert ran['ok'] and ran['job']['pairs'] == ['CHFJPY']
+        assert status['status']['warm'] is True
+        assert status['status']['last_runs'][0]['success'] is True
+        assert not bad['ok']
+        assert not socket_path.exists()
+
+    def test_trace_written_when_configured(self, tmp_path):
+        daemon = make_daemon(tmp_path, trace_dir=str(tmp_path / 'traces'))
+        record = asyncio.run(daemon.run_job())
+        events = json.loads(open(record.trace_path).read())['traceEvents']
+        assert events[0]['name'] == 'daily_signals'
+        assert events[0]['args']['job_id'] == record.job_id
+
+    def test_run_budget_reported_and_enforced(self, tmp_path, monkeypatch):
+        import signals_daemon
+
+        daemon = make_daemon(tmp_path, run_budget_seconds=5)
+        record = asyncio.run(daemon.run_job())
+        assert record.success and record.deadline['budget_s'] == 5.0
+        assert record.to_dict()['deadline']['skipped'] == []
+
+        # A run that ignores its deadline is cancelled after the grace period
+        monkeypatch.setattr(signals_daemon, 'HARD_DEADLINE_GRACE', 0.0)
+        daemon = make_daemon(tmp_path, run_budget_seconds=0.005)
+        record = asyncio.run(daemon.run_job())
+        assert record.success is False and 'deadline' in record.error
+        assert record.deadline['skipped'][0]['reason'] == 'cancelled at hard deadline'
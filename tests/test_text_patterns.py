@@ -0,0 +1,80 @@
+"""
+Unit tests for the precompiled text patterns and memoized normalizers
+"""
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.exceptions import DataValidationError
+from src.core.validators import DateTimeValidator
+from src.utils import text_patterns
+
+
+class TestNormalizers:
+    """Same results as the inline regex loops they replace"""
+
+    def test_parse_number(self):
+        assert text_patterns.parse_number('$1.23 est') == 1.23
+        assert text_patterns.parse_number('EPS 2') == 2.0
+        assert text_patterns.parse_number('n/a') is None
+        assert text_patterns.parse_number('') is None
+
+    def test_dates(self):
+        assert text_patterns.normalize_date(' 01/15/2024 (Mon)') == '01/15/2024'
+        assert text_patterns.normalize_date('15 Jan') == '15 Jan'
+        assert text_patterns.normalize_date('  sometime next quarter, maybe later ') == 'sometime next quarte'
+        assert text_patterns.find_date('AAPL reports Jan 15 after close') == 'Jan 15'
+        assert text_patterns.find_date('reports on 1/15') == '1/15'
+
+    def test_free_text_date_order(self):
+        # The 'Jan 15' form is tried first, then '1/15', then relative words
+        assert text_patterns.find_date('1/15') == '1/15'
+        assert text_patterns.find_date('tomorrow') == 'tomorrow'
+        assert text_patterns.find_date('?') is None
+
+    def test_eps_and_release_time(self):
+        assert text_patterns.find_eps('EPS: $1.52 est') == 1.52
+        assert text_patterns.find_eps('consensus $0.80 eps') == 0.80
+        assert text_patterns.find_eps('no estimate') is None
+        assert text_patterns.find_release_time('Before Market Open') == 'BMO'
+        assert text_patterns.find_release_time('reports AMC') == 'AMC'
+        assert text_patterns.find_release_time('') is None
+
+    def test_extract_price_text(self):
+        assert text_patterns.extract_price_text('Buy EURUSD 1.08500') == '1.08500'
+        assert text_patterns.extract_price_text('Entry @ 150') == '150'
+        assert text_patterns.extract_price_text('none') is None
+
+    def test_pair_entry_patterns(self):
+        patterns = text_patterns.pair_entry_patterns('EUR/USD')
+        assert patterns is text_patterns.pair_entry_patterns('EUR/USD')
+        assert patterns[0].search('eur/usd buy @ 1.0850').group(1) == '1.0850'
+
+    def test_repeated_tokens_are_memoized(self):
+        text_patterns.parse_number.cache_clear()
+        for _ in range(5):
+            text_patterns.parse_number('1.0850')
+        info = text_patterns.parse_number.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+
+class TestParseDatetime:
+    """strptime format walking, memoized"""
+
+    def test_validator_formats(self):
+        assert DateTimeValidator.validate_datetime_string('2024-01-05T10:00:00Z') == datetime(2024, 1, 5, 10)
+        assert DateTimeValidator.validate_datetime_string('25/12/2024') == datetime(2024, 12, 25)
+        with pytest.raises(DataValidationError):
+            DateTimeValidator.validate_datetime_string('yesterday')
+
+    def test_failures_are_memoized(self):
+        formats = ('%Y-%m-%d',)
+        text_patterns.parse_datetime.cache_clear()
+        assert text_patterns.parse_datetime('bad', formats) is None
+        assert text_patterns.parse_datetime('bad', formats) is None
+        assert text_patterns.parse_datetime.cache_info().hits == 1
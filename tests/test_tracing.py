@@ -0,0 +1,161 @@
+"""
+Unit tests for hierarchical run tracing
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.tracing import Tracer, current_span, propagate, set_attribute, span, trace_run, traced
+
+
+@traced('fetch', category='fetch', provider='fred', capture=('series_id',))
+def fetch(series_id):
+    time.sleep(0.005)
+    return series_id
+
+
+@traced('analysis', capture=('pair',))
+async def analyze(pair):
+    await asyncio.sleep(0.005)
+    with span('cache.get', category='cache'):
+        set_attribute('tier', 'memory')
+    return fetch(f'{pair}-rate')
+
+
+def by_name(tracer):
+    spans = {}
+    for recorded in tracer.spans:
+        spans.setdefault(recorded.name, []).append(recorded)
+    return spans
+
+
+class TestTracing:
+    """Span nesting, attributes and export"""
+
+    def test_no_tracer_is_noop(self):
+        with span('anything') as active:
+            assert active is None
+            set_attribute('ignored', 1)
+        assert fetch('GDP') == 'GDP'
+        assert current_span() is None
+
+    def test_nesting_across_tasks(self):
+        async def run():
+            with trace_run('signals') as tracer:
+                await asyncio.gather(analyze('EURUSD'), analyze('USDJPY'))
+            return tracer
+
+        tracer = asyncio.run(run())
+        spans = by_name(tracer)
+        root = spans['signals'][0]
+        assert root.parent_id is None
+
+        analyses = {s.attributes['pair']: s for s in spans['analysis']}
+        assert set(analyses) == {'EURUSD', 'USDJPY'}
+        assert all(s.parent_id == root.span_id for s in analyses.values())
+
+        for fetched in spans['fetch']:
+            pair = fetched.attributes['series_id'].split('-')[0]
+            assert fetched.parent_id == analyses[pair].span_id
+            assert fetched.attributes['provider'] == 'fred'
+        assert {s.attributes['tier'] for s in spans['cache.get']} == {'memory'}
+
+    def test_propagate_into_executor(self):
+        with trace_run('run') as tracer:
+            with span('parent') as parent:
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    list(pool.map(propagate(fetch), ['A', 'B']))
+                    pool.submit(fetch, 'orphan').result()
+
+        fetches = {s.attributes['series_id']: s for s in by_name(tracer)['fetch']}
+        assert fetches['A'].parent_id == fetches['B'].parent_id == parent.span_id
+        # Bare submit does not carry the context
+        assert 'orphan' not in fetches
+
+    def test_errors_are_recorded(self):
+        with trace_run('run') as tracer:
+            with pytest.raises(ValueError):
+                with span('boom'):
+                    raise ValueError('bad pair')
+        assert by_name(tracer)['boom'][0].error == 'ValueError: bad pair'
+        assert tracer.summary()[-1]['errors'] == 1
+
+    def test_chrome_trace_and_summary(self, tmp_path):
+        async def run():
+            with trace_run('signals') as tracer:
+                await analyze('GBPUSD')
+            return tracer
+
+        tracer = asyncio.run(run())
+        path = tracer.export_chrome_trace(tmp_path / 'trace.json')
+        events = json.loads(path.read_text())['traceEvents']
+        assert {e['ph'] for e in events} == {'X'}
+        assert [e['name'] for e in events][0] == 'signals'
+        assert all(e['dur'] >= 0 for e in events)
+
+        rows = {row['stage']: row for row in tracer.summary()}
+        assert rows['signals']['total_ms'] >= rows['analysis']['total_ms'] >= rows['fetch']['total_ms']
+        # Root time is almost entirely spent in its children
+        assert rows['signals']['self_ms'] < rows['analysis']['total_ms']
+        assert 'analysis' in tracer.format_summary()
+
+    def test_explicit_tracer_reused(self):
+        tracer = Tracer('shared')
+        with trace_run('first', tracer=tracer):
+            fetch('X')
+        with trace_run('second', tracer=tracer):
+            fetch('Y')
+        assert len(by_name(tracer)['fetch']) == 2
+
+    def test_daemon_run_path_is_traced(self, monkeypatch):
+        from types import SimpleNamespace
+        from forex_signals.messaging.base import MessageResult, MessageStatus
+        from forex_signals.messaging.manager import MessagingManager
+        from forex_signals.signals.generator import ForexSignalGenerator
+        from Signals.src.signal_generator import SignalGenerator as ProductionGenerator
+
+        production = ProductionGenerator()
+        monkeypatch.setattr(production, '_analyze_geopolitical_signals',
+                            lambda pair: production._create_skipped_component('geopolitical'))
+
+        # The objects EnhancedAPISignalsDailyV2 drives, wired without settings or network
+        generator = ForexSignalGenerator.__new__(ForexSignalGenerator)
+        generator.__dict__.update(
+            settings=SimpleNamespace(analysis_weights={}), currency_pairs=['EURUSD'],
+            validator=SimpleNamespace(validate_signal_result=lambda r: SimpleNamespace(is_valid=True, errors=[])),
+            setup_successful=True, signal_generator=production, report_generator=None, correlation_id=None)
+
+        class Messenger:
+            platform_name = 'telegram'
+
+            def is_enabled(self):
+                return True
+
+            async def send_with_retry(self, **kwargs):
+                return MessageResult(status=MessageStatus.SUCCESS, platform='telegram')
+
+        manager = MessagingManager.__new__(MessagingManager)
+        manager.settings = SimpleNamespace(message_retry_attempts=1, message_retry_delay=0)
+        manager.messengers = {'telegram': Messenger()}
+
+        async def run():
+            with trace_run('daily_signals') as tracer:
+                await generator.generate_forex_signals()
+                await manager.send_message('report')
+            return tracer
+
+        spans = by_name(asyncio.run(run()))
+        root = spans['daily_signals'][0]
+        generate = spans['signals.generate'][0]
+        assert generate.parent_id == root.span_id
+        # Analysis runs in an executor thread and keeps its parent
+        assert spans['generate_signals_for_pairs'][0].parent_id == generate.span_id
+        assert spans['analysis.technical'][0].attributes['pair'] == 'EURUSD'
+        assert spans['send.telegram'][0].parent_id == spans['send.all'][0].span_id
@@ -3,13 +3,14 @@ Utility functions for daily financial report automation
 Enhanced with comprehensive error handling and validation
 """
 
-import re
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union
 import logging
 from pathlib import Path
 
+from src.utils import text_patterns
+
 logger = logging.getLogger(__name__)
 
 # Import error handling
@@ -118,20 +119,7 @@ class ForexParser:
     @classmethod
     def _extract_price(cls, text: str) -> Optional[str]:
         """Extract price from text"""
-        # Look for price patterns
-        price_patterns = [
-            r'\b\d+\.\d{2,5}\b',  # Standard forex price
-            r'\b\d{1,3}\.\d{2,4}\b',  # JPY pairs
-            r'@\s*(\d+\.?\d*)',  # Price after @
-            r':\s*(\d+\.?\d*)',  # Price after :
-        ]
-        
-        for pattern in price_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(0).replace('@', '').replace(':', '').strip()
-        
-        return None
+        return text_patterns.extract_price_text(text)
     
     @classmethod
     def _parse_table_signals(cls, table: List[List[str]]) -> Dict:
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Shared Browser Pool
+Keeps one Chromium process (or a CDP connection to an external one) alive for
+the whole process, plus a few warm, already-authenticated contexts per session,
+so scraper runs and their retries skip the browser cold start
+"""
+
+import asyncio
+import importlib.metadata
+import logging
+import os
+import re
+import signal
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+StorageState = Union[Dict[str, Any], str, None]
+
+# Playwright releases whose driver process is reachable at
+# playwright._impl_obj._connection._transport._proc (private API): [min, max)
+DRIVER_PROC_VERSIONS = ((1, 9), (2, 0))
+
+
+def _playwright_version() -> Optional[Tuple[int, int]]:
+    """Installed Playwright (major, minor), or None if unknown"""
+    try:
+        numbers = re.findall(r'\d+', importlib.metadata.version('playwright'))
+    except importlib.metadata.PackageNotFoundError:
+        return None
+    return (int(numbers[0]), int(numbers[1])) if len(numbers) >= 2 else None
+
+
+def _driver_pid(playwright) -> Optional[int]:
+    """PID of a Playwright driver, only for releases known to keep it where we look"""
+    version = _playwright_version()
+    low, high = DRIVER_PROC_VERSIONS
+    if version is None or not low <= version < high:
+        logger.warning(f"Cannot locate the driver process of Playwright {version or 'unknown'}")
+        return None
+    proc = getattr(getattr(getattr(getattr(playwright, '_impl_obj', None), '_connection', None),
+                           '_transport', None), '_proc', None)
+    return getattr(proc, 'pid', None)
+
+
+@dataclass
+class _PooledContext:
+    """An idle context together with its bookkeeping"""
+    context: Any
+    created_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    closed: bool = False
+
+
+class BrowserPool:
+    """
+    Process-wide browser and warm context pool
+
+    `get_browser()` launches Chromium once (or connects over CDP when
+    `cdp_url` is set) and hands the same process to every caller until a
+    health check fails: disconnected, older than `browser_max_age` seconds or
+    used for more than `browser_max_uses` contexts. The browser is then
+    recycled transparently.
+
+    Contexts are checked out per key (usually the session name) with
+    `acquire_context()` and given back with `release_context()`. A returned
+    context keeps its cookies and local storage, so the next checkout is
+    already logged in; its pages are closed. Contexts are restored from
+    `storage_state` only when no warm context is available, and are
+    discarded after `context_ttl` seconds or when released as unhealthy.
+
+    Playwright objects are bound to the event loop that created them, so the
+    owner of each loop must call `close_browser_pool()` before the loop ends.
+    If that was skipped and the pool is used from a new loop, it closes what
+    the old loop left behind when that loop still runs, or as a last resort
+    terminates the old Playwright driver (taking Chromium down with it).
+    """
+
+    def __init__(self, max_idle_contexts: int = 2, context_ttl: float = 1800.0,
+                 browser_max_age: float = 6 * 3600.0, browser_max_uses: int = 200,
+                 cdp_url: Optional[str] = None):
+        """
+        Args:
+            max_idle_contexts: Warm contexts kept per key
+            context_ttl: Seconds before an idle context is re-created from storage state
+            browser_max_age: Seconds before the browser process is recycled
+            browser_max_uses: Contexts served before the browser process is recycled
+            cdp_url: Connect to an already running Chromium (e.g. http://localhost:9222)
+                     instead of launching one; defaults to $BROWSER_CDP_URL
+        """
+        self.max_idle_contexts = max_idle_contexts
+        self.context_ttl = context_ttl
+        self.browser_max_age = browser_max_age
+        self.browser_max_uses = browser_max_uses
+        self.cdp_url = cdp_url if cdp_url is not None else os.getenv('BROWSER_CDP_URL') or None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._playwright = None
+        self._browser = None
+        self._browser_started: float = 0.0
+        self._browser_uses = 0
+        self._disconnected = False
+        self._idle: Dict[str, List[_PooledContext]] = {}
+        self._in_use: Dict[int, _PooledContext] = {}
+        self._stats = {
+            'launches': 0,
+            'recycles': 0,
+            'contexts_created': 0,
+            'contexts_reused': 0,
+            'contexts_discarded': 0
+        }
+
+    def _bind_loop(self):
+        """Start over on a new event loop, releasing what the old loop left behind"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._browser is not None or self._playwright is not None:
+                logger.info("Event loop changed, starting a new browser pool")
+                self._abandon_loop()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._idle = {}
+            self._in_use = {}
+
+    def _abandon_loop(self):
+        """Release the browser and Playwright driver of a loop that was not closed with close_browser_pool()"""
+        old_loop, browser, playwright = self._loop, self._browser, self._playwright
+        self._playwright = None
+        self._browser = None
+        if old_loop is not None and old_loop.is_running():
+            # Still serving another thread: close them there
+            asyncio.run_coroutine_threadsafe(self._close_objects(browser, playwright), old_loop)
+            return
+        # The loop is gone, so nothing can be awaited. Last resort: the driver handles
+        # SIGTERM by closing the browsers it launched (a CDP browser is only disconnected)
+        logger.warning("Browser pool was not closed before its event loop ended; "
+                       "call close_browser_pool() on the loop that used it")
+        pid = _driver_pid(playwright) if playwright is not None else None
+        if pid is None:
+            if browser is not None:
+                logger.warning("Could not terminate the Playwright driver of the previous event loop")
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)
+            logger.warning(f"Terminated Playwright driver {pid} left by a closed event loop")
+        except OSError as e:
+            logger.debug(f"Playwright driver {pid} already gone: {e}")
+
+    @staticmethod
+    async def _close_objects(browser, playwright):
+        try:
+            if browser is not None:
+                await browser.close()
+            if playwright is not None:
+                await playwright.stop()
+        except Exception as e:
+            logger.debug(f"Error closing browser of previous event loop: {e}")
+
+    def _is_alive(self) -> bool:
+        """Browser exists and its connection is up"""
+        if self._browser is None or self._disconnected:
+            return False
+        try:
+            return self._browser.is_connected()
+        except Exception:
+            return False
+
+    def _is_stale(self) -> bool:
+        """Browser is due for recycling (age or number of contexts served)"""
+        return (time.monotonic() - self._browser_started > self.browser_max_age
+                or self._browser_uses >= self.browser_max_uses)
+
+    def is_healthy(self) -> bool:
+        """True when the current browser can keep serving contexts"""
+        return self._is_alive() and not self._is_stale()
+
+    async def get_browser(self, launch_options: Optional[Dict[str, Any]] = None):
+        """
+        Shared browser, launched (or connected) on first use and after recycling
+
+        Args:
+            launch_options: Options for chromium.launch(); ignored when connecting over CDP
+        """
+        self._bind_loop()
+        async with self._lock:
+            if not self._is_alive():
+                if self._browser is not None:
+                    await self._shutdown_browser('browser disconnected')
+                await self._start_browser(launch_options or {})
+            elif self._is_stale() and not self._in_use:
+                # Recycle only between runs; contexts in use keep the old process
+                await self._shutdown_browser('browser reached its age/use limit')
+                await self._start_browser(launch_options or {})
+            return self._browser
+
+    async def _start_browser(self, launch_options: Dict[str, Any]):
+        """Launch Chromium or connect to the CDP endpoint"""
+        from playwright.async_api import async_playwright
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        if self.cdp_url:
+            self._browser = await self._playwright.chromium.connect_over_cdp(self.cdp_url)
+            logger.info(f"🔌 Connected to browser over CDP at {self.cdp_url}")
+        else:
+            self._browser = await self._playwright.chromium.launch(**launch_options)
+            logger.info("🚀 Launched shared browser process")
+
+        self._disconnected = False
+        browser = self._browser
+        browser.on('disconnected', lambda *_: self._mark_disconnected(browser))
+        self._browser_started = time.monotonic()
+        self._browser_uses = 0
+        self._stats['launches'] += 1
+
+    def _mark_disconnected(self, browser):
+        # Ignore the event fired by a browser the pool already closed
+        if browser is self._browser:
+            self._disconnected = True
+            logger.warning("Shared browser disconnected; it will be relaunched on next use")
+
+    async def _shutdown_browser(self, reason: str):
+        """Close idle contexts and the browser (disconnect only, for CDP)"""
+        logger.info(f"♻️ Recycling shared browser: {reason}")
+        for entries in self._idle.values():
+            for entry in entries:
+                await self._close_context(entry)
+        self._idle = {}
+        self._in_use = {}
+        browser, self._browser = self._browser, None
+        try:
+            if browser is not None:
+                await browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser: {e}")
+        self._stats['recycles'] += 1
+
+    async def _close_context(self, entry: _PooledContext):
+        if entry.closed:
+            return
+        entry.closed = True
+        self._stats['contexts_discarded'] += 1
+        try:
+            await entry.context.close()
+        except Exception as e:
+            logger.debug(f"Error closing context: {e}")
+
+    async def acquire_context(self, key: str, context_options: Optional[Dict[str, Any]] = None,
+                              storage_state: Union[StorageState, Callable[[], StorageState]] = None,
+                              launch_options: Optional[Dict[str, Any]] = None):
+        """
+        Check out a context for key, warm if one is idle
+
+        Args:
+            key: Pool key, usually the session name
+            context_options: Options for browser.new_context()
+            storage_state: Saved session (or a callable returning it) used when a
+                           new context has to be created; not evaluated otherwise
+            launch_options: Passed to get_browser() if the browser must be (re)started
+
+        Returns:
+            A Playwright BrowserContext; give it back with release_context()
+        """
+        browser = await self.get_browser(launch_options)
+
+        async with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                entry = idle.pop()
+                if entry.closed or time.monotonic() - entry.created_at > self.context_ttl:
+                    await self._close_context(entry)
+                    continue
+                entry.uses += 1
+                self._in_use[id(entry.context)] = entry
+                self._stats['contexts_reused'] += 1
+                logger.info(f"♻️ Reusing warm browser context for {key}")
+                return entry.context
+
+            options = dict(context_options or {})
+            state = storage_state() if callable(storage_state) else storage_state
+            if state:
+                options['storage_state'] = state
+            context = await browser.new_context(**options)
+            entry = _PooledContext(context, uses=1)
+            context.on('close', lambda *_: setattr(entry, 'closed', True))
+            self._in_use[id(context)] = entry
+            self._browser_uses += 1
+            self._stats['contexts_created'] += 1
+            logger.info(f"{'✅ Restored' if state else '🆕 Created'} browser context for {key}")
+            return context
+
+    async def release_context(self, key: str, context, healthy: bool = True):
+        """
+        Return a context to the pool
+
+        Args:
+            key: Pool key used for acquire_context()
+            context: The checked-out context
+            healthy: False to discard it (e.g. after a failed run)
+        """
+        if self._lock is None:
+            return
+        async with self._lock:
+            entry = self._in_use.pop(id(context), None)
+            if entry is None:
+                # Created by an earlier browser that was recycled meanwhile
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+                return
+
+            idle = self._idle.setdefault(key, [])
+            if not healthy or entry.closed or not self.is_healthy() or len(idle) >= self.max_idle_contexts:
+                await self._close_context(entry)
+                return
+
+            try:
+                for page in list(context.pages):
+                    await page.close()
+            except Exception as e:
+                logger.debug(f"Discarding context that failed to reset: {e}")
+                await self._close_context(entry)
+                return
+            idle.append(entry)
+
+    @asynccontextmanager
+    async def checkout(self, key: str, context_options: Optional[Dict[str, Any]] = None,
+                       storage_state: Union[StorageState, Callable[[], StorageState]] = None,
+                       launch_options: Optional[Dict[str, Any]] = None):
+        """`async with pool.checkout(key) as context:` - discards the context if the block raises"""
+        context = await self.acquire_context(key, context_options, storage_state, launch_options)
+        healthy = False
+        try:
+            yield context
+            healthy = True
+        finally:
+            await self.release_context(key, context, healthy=healthy)
+
+    async def warm(self, key: str, context_options: Optional[Dict[str, Any]] = None,
+                   storage_state: Union[StorageState, Callable[[], StorageState]] = None,
+                   count: int = 1, launch_options: Optional[Dict[str, Any]] = None):
+        """Pre-create up to `count` idle contexts for key (e.g. before a scheduled run)"""
+        contexts = []
+        for _ in range(min(count, self.max_idle_contexts)):
+            contexts.append(await self.acquire_context(key, context_options, storage_state, launch_options))
+        for context in contexts:
+            await self.release_context(key, context)
+
+    async def close(self):
+        """Close every context and the browser, and stop Playwright"""
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            self._abandon_loop()
+            self._idle = {}
+            self._in_use = {}
+            self._loop = None
+            return
+        if self._browser is not None:
+            await self._shutdown_browser('pool closed')
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping Playwright: {e}")
+            self._playwright = None
+        self._loop = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Pool statistics"""
+        return {
+            **self._stats,
+            'connected': self.is_healthy(),
+            'mode': 'cdp' if self.cdp_url else 'launch',
+            'browser_uses': self._browser_uses,
+            'idle_contexts': {key: len(entries) for key, entries in self._idle.items()},
+            'contexts_in_use': len(self._in_use)
+        }
+
+
+_default_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Process-wide browser pool"""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = BrowserPool()
+    return _default_pool
+
+
+async def close_browser_pool():
+    """Shut down the process-wide pool; call it on every event loop that used the pool, before the loop ends"""
+    if _default_pool is not None:
+        await _default_pool.close()
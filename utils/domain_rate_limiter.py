@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Per-Domain Politeness Limiter
+Async counterpart of the RateLimiter in security-utils.py for concurrent
+scrapes: requests to the same domain are spaced by a minimum interval (with
+jitter), capped in number at any one time, and slowed down adaptively after
+repeated failures
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DomainRateLimiter:
+    """
+    Politeness limits per domain, shared by concurrent tasks
+
+    Semantics follow security-utils.py RateLimiter: consecutive request starts
+    on a domain are at least `min_delay` seconds apart plus random jitter;
+    more than `failure_threshold` failures multiply the domain's delay by
+    `backoff_factor` (capped at `max_delay`); each success takes one failure
+    off the count and the delay resets once the count reaches zero. On top of
+    that, at most `max_concurrent_per_domain` requests to a domain are in
+    flight. Different domains never wait for each other.
+
+    Start slots are reserved in order, so N tasks hitting one domain start
+    `delay` apart instead of all polling for the same free moment.
+    """
+
+    def __init__(self, min_delay: float = 1.0, max_delay: float = 10.0,
+                 max_concurrent_per_domain: int = 2, jitter: Tuple[float, float] = (0.0, 0.5),
+                 failure_threshold: int = 3, backoff_factor: float = 1.5):
+        """
+        Args:
+            min_delay: Seconds between request starts on one domain
+            max_delay: Upper bound for the adaptive delay
+            max_concurrent_per_domain: Requests in flight per domain
+            jitter: Random extra delay range (seconds) added to each spacing
+            failure_threshold: Failures tolerated before the delay grows
+            backoff_factor: Delay multiplier per failure past the threshold
+        """
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_concurrent_per_domain = max_concurrent_per_domain
+        self.jitter = jitter
+        self.failure_threshold = failure_threshold
+        self.backoff_factor = backoff_factor
+
+        self.failure_counts: Dict[str, int] = {}
+        self.adaptive_delays: Dict[str, float] = {}
+        self._next_start: Dict[str, float] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def delay_for(self, domain: str) -> float:
+        """Current spacing between request starts on domain (without jitter)"""
+        return self.adaptive_delays.get(domain, self.min_delay)
+
+    def wait_time(self, domain: str) -> float:
+        """Seconds until the next request to domain may start"""
+        return max(0.0, self._next_start.get(domain, 0.0) - time.monotonic())
+
+    def _domain_stats(self, domain: str) -> Dict[str, float]:
+        return self._stats.setdefault(domain, {'requests': 0, 'failures': 0, 'waited_seconds': 0.0})
+
+    async def acquire(self, domain: str) -> float:
+        """
+        Wait for a concurrency slot and this task's start time on domain
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        semaphore = self._semaphores.get(domain)
+        if semaphore is None:
+            semaphore = self._semaphores[domain] = asyncio.Semaphore(self.max_concurrent_per_domain)
+        await semaphore.acquire()
+
+        try:
+            # Reserve the next start slot before sleeping so waiters queue up in order
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(domain, 0.0))
+            self._next_start[domain] = start_at + self.delay_for(domain) + random.uniform(*self.jitter)
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        waited = time.monotonic() - started
+        stats = self._domain_stats(domain)
+        stats['requests'] += 1
+        stats['waited_seconds'] += waited
+        return waited
+
+    def release(self, domain: str, success: Optional[bool] = True):
+        """
+        Free the domain slot and record the outcome
+
+        Args:
+            domain: Domain passed to acquire()
+            success: True/False to adapt the delay, None to record nothing
+        """
+        if success is True:
+            self.record_success(domain)
+        elif success is False:
+            self.record_failure(domain)
+        semaphore = self._semaphores.get(domain)
+        if semaphore is not None:
+            semaphore.release()
+
+    def record_failure(self, domain: str):
+        """Record a failure for adaptive rate limiting"""
+        self.failure_counts[domain] = self.failure_counts.get(domain, 0) + 1
+        self._domain_stats(domain)['failures'] += 1
+
+        # Increase delay for domains with failures
+        if self.failure_counts[domain] > self.failure_threshold:
+            current_delay = self.delay_for(domain)
+            new_delay = min(current_delay * self.backoff_factor, self.max_delay)
+            self.adaptive_delays[domain] = new_delay
+            logger.warning(f"Increased delay for {domain} to {new_delay:.1f}s due to failures")
+
+    def record_success(self, domain: str):
+        """Record a success for adaptive rate limiting"""
+        if domain in self.failure_counts:
+            # Gradually reduce failure count
+            self.failure_counts[domain] = max(0, self.failure_counts[domain] - 1)
+
+            # Reset delay if no recent failures
+            if self.failure_counts[domain] == 0 and domain in self.adaptive_delays:
+                del self.adaptive_delays[domain]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Per-domain request, failure and wait totals"""
+        return {
+            domain: {**stats, 'delay': self.delay_for(domain)}
+            for domain, stats in self._stats.items()
+        }
@@ -37,9 +37,17 @@ class EnvironmentConfig:
         'daily_report': [
             'MYMAMA_GUEST_PASSWORD',
             'TELEGRAM_THREAD_ID',
+            'TELEGRAM_API_URL',
             'SIGNAL_API_URL',
+            'SIGNAL_RPC_URL',
+            'SIGNAL_SEND_MODE',
             'SIGNAL_CLI_PATH',
             'CHROME_BINARY_PATH',
+            'BROWSER_REUSE',
+            'BROWSER_CDP_URL',
+            'BROWSER_BLOCK_RESOURCES',
+            'BROWSER_RESOURCE_ALLOWLIST',
+            'SCRAPER_HTTP_FAST_PATH',
             'WHATSAPP_PHONE_NUMBER',
             'WHATSAPP_GROUP_NAME',
             'WHATSAPP_GROUP_NAMES',
@@ -58,7 +66,11 @@ class EnvironmentConfig:
     }
     
     DEFAULT_VALUES = {
+        'TELEGRAM_API_URL': 'https://api.telegram.org',
         'SIGNAL_API_URL': 'http://localhost:8080',
+        'SIGNAL_SEND_MODE': 'auto',
+        'BROWSER_REUSE': 'true',
+        'SCRAPER_HTTP_FAST_PATH': 'true',
         'SMTP_PORT': '587',
         'SMTP_SERVER': 'smtp.gmail.com',
         'WHATSAPP_HEADLESS': 'true',
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client Pool
+Process-wide registry of keep-alive httpx clients shared by all messengers,
+so each run pays one TLS handshake per host instead of one per messenger.
+Every request made through a pooled client is reported to the passive
+network health tracker.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import time
+import weakref
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.core.network_health import observe as observe_network
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (pip install 'httpx[http2]')
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=300.0
+)
+
+
+def _origin(base_url: str) -> str:
+    """scheme://host[:port] of a URL; connections are pooled per origin"""
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class _ObservedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper reporting each request's outcome and latency"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError as e:
+            observe_network(str(request.url), False, time.perf_counter() - started, error=type(e).__name__)
+            raise
+        observe_network(str(request.url), response.status_code < 500, time.perf_counter() - started,
+                        status_code=response.status_code)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class _LoopPool:
+    """Clients and transports owned by a single event loop"""
+
+    def __init__(self):
+        self.transports: Dict[str, httpx.AsyncHTTPTransport] = {}
+        self.clients: Dict[Tuple[str, float], httpx.AsyncClient] = {}
+
+
+class HttpClientPool:
+    """
+    Registry of shared httpx.AsyncClient instances keyed by base URL
+
+    Clients are created lazily on first use. Clients whose base URLs share an
+    origin (e.g. every bot token on api.telegram.org) also share one connection
+    pool, so keep-alive connections are reused across messengers. httpx
+    connections are bound to the event loop that opened them, so each loop
+    gets its own set; repeated asyncio.run() calls stay safe.
+    """
+
+    def __init__(self, limits: httpx.Limits = DEFAULT_LIMITS, http2: Optional[bool] = None):
+        """
+        Args:
+            limits: Connection limits and keep-alive expiry per origin
+            http2: Force HTTP/2 on/off (default: on when h2 is installed)
+        """
+        self.limits = limits
+        self.http2 = HTTP2_AVAILABLE if http2 is None else (http2 and HTTP2_AVAILABLE)
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool]" = weakref.WeakKeyDictionary()
+
+    def _loop_pool(self) -> _LoopPool:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = _LoopPool()
+            self._pools[loop] = pool
+        return pool
+
+    def get_client(self, base_url: str = '', timeout: float = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+        """
+        Get (or lazily create) the shared client for a base URL
+
+        Must be called from inside a running event loop. Callers must not close
+        the returned client; use close_all() at shutdown instead.
+
+        Args:
+            base_url: Base URL requests are made relative to ('' for absolute URLs)
+            timeout: Default request timeout for the client
+
+        Returns:
+            Shared httpx.AsyncClient
+        """
+        pool = self._loop_pool()
+        key = (base_url.rstrip('/'), float(timeout))
+        client = pool.clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+
+        origin = _origin(base_url) if base_url else ''
+        transport = pool.transports.get(origin)
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2, retries=1)
+            pool.transports[origin] = transport
+            logger.debug(f"Created pooled transport for {origin or 'absolute URLs'} (http2={self.http2})")
+
+        client = httpx.AsyncClient(base_url=key[0], timeout=timeout, transport=_ObservedTransport(transport))
+        pool.clients[key] = client
+        return client
+
+    def owns(self, client) -> bool:
+        """True if the client was handed out by this pool"""
+        return any(client in pool.clients.values() for pool in list(self._pools.values()))
+
+    def stats(self) -> Dict[str, int]:
+        """Number of live clients and origins across all loops"""
+        pools = list(self._pools.values())
+        return {
+            'event_loops': len(pools),
+            'clients': sum(len(pool.clients) for pool in pools),
+            'origins': sum(len(pool.transports) for pool in pools),
+            'http2': self.http2
+        }
+
+    async def close_all(self):
+        """Close every client and transport owned by the current event loop"""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.pop(loop, None)
+        if pool is None:
+            return
+
+        # Closing a client also closes its (possibly shared) transport; httpcore
+        # tolerates repeated closes, and is_closed lets holders re-fetch a client
+        for client in pool.clients.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing pooled client: {e}")
+        for transport in pool.transports.values():
+            try:
+                await transport.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing pooled transport: {e}")
+        logger.debug(f"Closed {len(pool.clients)} pooled HTTP clients")
+
+
+_pool: Optional[HttpClientPool] = None
+
+
+def get_client_pool() -> HttpClientPool:
+    """Get the process-wide client pool"""
+    global _pool
+    if _pool is None:
+        _pool = HttpClientPool()
+    return _pool
+
+
+def get_http_client(base_url: str = '', timeout: float = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+    """Convenience wrapper for get_client_pool().get_client()"""
+    return get_client_pool().get_client(base_url, timeout)
+
+
+def is_shared_client(client) -> bool:
+    """True if the client belongs to the shared pool and must not be closed by its user"""
+    return _pool is not None and _pool.owns(client)
+
+
+async def close_http_clients():
+    """Shutdown hook: close all pooled clients for the running event loop"""
+    if _pool is not None:
+        await _pool.close_all()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Resource Blocking Policy
+Aborts requests a scrape never needs (images, media, fonts, analytics/tracker
+scripts) through Playwright request routing, while an allowlist keeps anything
+the login flow depends on
+"""
+
+import logging
+import os
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCKED_TYPES = ['image', 'media', 'font']
+
+DEFAULT_BLOCKED_HOSTS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'facebook.net',
+    'hotjar.com',
+    'clarity.ms',
+    'segment.io',
+    'mixpanel.com',
+    'newrelic.com',
+    'nr-data.net'
+]
+
+# Captcha/challenge widgets render images and scripts the login form needs
+DEFAULT_ALLOWLIST = ['recaptcha', 'hcaptcha.com', 'challenges.cloudflare.com']
+
+# Keys a 'resource_policy' override may set
+_POLICY_KEYS = ('blocked_types', 'blocked_hosts', 'allowlist')
+
+# Policy routed on each (possibly pooled and reused) browser context
+_context_policies: "weakref.WeakKeyDictionary[Any, ResourceBlockingPolicy]" = weakref.WeakKeyDictionary()
+
+
+def _env_list(name: str) -> Optional[List[str]]:
+    value = os.getenv(name)
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+@dataclass
+class ResourceBlockingPolicy:
+    """
+    Which requests to abort while scraping
+
+    A request is blocked when its Playwright resource type is in
+    `blocked_types` or its host is (a subdomain of) one of `blocked_hosts`,
+    unless its URL contains any `allowlist` substring. Everything else,
+    including documents, XHR/fetch and first-party scripts, goes through.
+    """
+    blocked_types: List[str] = field(default_factory=lambda: list(DEFAULT_BLOCKED_TYPES))
+    blocked_hosts: List[str] = field(default_factory=lambda: list(DEFAULT_BLOCKED_HOSTS))
+    allowlist: List[str] = field(default_factory=lambda: list(DEFAULT_ALLOWLIST))
+    enabled: bool = True
+    blocked_count: int = 0
+    allowed_count: int = 0
+
+    def __post_init__(self):
+        self._blocked_types = {t.lower() for t in self.blocked_types}
+        self._blocked_hosts = tuple(h.lower().lstrip('.') for h in self.blocked_hosts)
+
+    @classmethod
+    def from_config(cls, overrides: Optional[Dict[str, Any]] = None) -> 'ResourceBlockingPolicy':
+        """
+        Build a policy from scraper config overrides and environment
+
+        Overrides: 'block_resources' (bool) and 'resource_policy' (dict of
+        blocked_types / blocked_hosts / allowlist; other keys are ignored with a
+        warning). Environment: BROWSER_BLOCK_RESOURCES, BROWSER_BLOCKED_TYPES,
+        BROWSER_BLOCKED_HOSTS, BROWSER_RESOURCE_ALLOWLIST (comma-separated).
+        """
+        overrides = overrides or {}
+        policy = dict(overrides.get('resource_policy') or {})
+        unknown = sorted(set(policy) - set(_POLICY_KEYS))
+        if unknown:
+            logger.warning(f"Ignoring unknown resource_policy keys: {', '.join(map(str, unknown))}")
+            for key in unknown:
+                del policy[key]
+
+        enabled = overrides.get('block_resources')
+        if enabled is None:
+            enabled = os.getenv('BROWSER_BLOCK_RESOURCES', 'true').lower() != 'false'
+
+        for key, env_name in (('blocked_types', 'BROWSER_BLOCKED_TYPES'),
+                              ('blocked_hosts', 'BROWSER_BLOCKED_HOSTS')):
+            if key not in policy and _env_list(env_name) is not None:
+                policy[key] = _env_list(env_name)
+
+        # Extra allowlist entries add to the defaults rather than replace them
+        allowlist = list(DEFAULT_ALLOWLIST) + list(policy.pop('allowlist', None) or [])
+        allowlist += _env_list('BROWSER_RESOURCE_ALLOWLIST') or []
+
+        return cls(enabled=bool(enabled), allowlist=allowlist, **policy)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """True if a request of this type and URL should be aborted"""
+        if not self.enabled:
+            return False
+        if any(pattern in url for pattern in self.allowlist):
+            return False
+        if resource_type.lower() in self._blocked_types:
+            return True
+        host = (urlsplit(url).hostname or '').lower()
+        return any(host == blocked or host.endswith('.' + blocked) for blocked in self._blocked_hosts)
+
+    async def _handle_route(self, route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked_count += 1
+            await route.abort()
+        else:
+            self.allowed_count += 1
+            await route.continue_()
+
+    async def install(self, context) -> bool:
+        """
+        Route a browser context's requests through the policy
+
+        Safe to call repeatedly with pooled contexts: a context carries at most
+        one policy route, and a different policy replaces the previous one.
+        Returns True if routing was (re)installed by this call.
+        """
+        previous = _context_policies.get(context)
+        if previous is self:
+            return False
+        if previous is not None:
+            await context.unroute('**/*', previous._handle_route)
+            del _context_policies[context]
+        if not self.enabled:
+            return False
+        await context.route('**/*', self._handle_route)
+        _context_policies[context] = self
+        logger.debug(f"Resource blocking active: types={sorted(self._blocked_types)}, "
+                     f"{len(self._blocked_hosts)} tracker hosts, {len(self.allowlist)} allowlisted patterns")
+        return True
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Blocked/allowed request counts"""
+        return {
+            'enabled': self.enabled,
+            'blocked': self.blocked_count,
+            'allowed': self.allowed_count
+        }
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Session Store
+Decrypted-session cache shared by the session managers: a session file is
+decrypted and checksummed once, then served from memory until its mtime or
+size changes, with an async API that keeps crypto work off the event loop
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SessionData = Dict[str, Any]
+PathLike = Union[str, Path]
+
+
+_staging_locks: Dict[str, threading.Lock] = {}
+_staging_guard = threading.Lock()
+
+
+def staging_lock(path: PathLike) -> threading.Lock:
+    """
+    Process-wide lock for a fixed staging file
+
+    SecureConfigManager always encrypts to and decrypts from <dir>/config.enc,
+    so the managers stage each session file there. Every stage-and-rename
+    must hold this lock, or concurrent saves and loads swap each other's data.
+    """
+    key = str(Path(path).resolve())
+    with _staging_guard:
+        lock = _staging_locks.get(key)
+        if lock is None:
+            lock = _staging_locks[key] = threading.Lock()
+        return lock
+
+
+def session_checksum(data: Any) -> str:
+    """Integrity checksum of session data (canonical JSON, sha256 prefix)"""
+    data_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data_str.encode()).hexdigest()[:16]
+
+
+@dataclass
+class _CachedSession:
+    """Decrypted payload of one session file at a given (mtime, size)"""
+    file_key: Tuple[int, int, int]
+    data: SessionData
+    checksum: str
+
+
+class SessionStore:
+    """
+    Encrypted session files with an in-memory decrypted cache
+
+    The store does not know how sessions are encrypted: each manager passes
+    `read_file(path) -> dict | None` and `write_file(path, data) -> bool`
+    built on its own encryption. A load stats the file and returns the cached
+    payload when its inode, mtime and size are unchanged; only a changed file
+    is decrypted again, and only then is the optional `verify` callback (e.g.
+    a checksum comparison) run. A save writes through and caches the payload
+    with the checksum computed once, at write time.
+
+    Callers always receive a deep copy, so mutating a loaded session never
+    alters the cache.
+    """
+
+    def __init__(self, read_file: Callable[[Path], Optional[SessionData]],
+                 write_file: Callable[[Path, SessionData], bool],
+                 max_entries: int = 32):
+        """
+        Args:
+            read_file: Decrypts and parses a session file (None if unreadable)
+            write_file: Encrypts and writes a session file, returning success
+            max_entries: Decrypted sessions kept in memory (LRU)
+        """
+        self.read_file = read_file
+        self.write_file = write_file
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, _CachedSession]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'decrypts': 0,
+            'writes': 0,
+            'verify_failures': 0
+        }
+
+    @staticmethod
+    def _file_key(path: Path) -> Optional[Tuple[int, int, int]]:
+        """(inode, mtime_ns, size) of a file, or None if it does not exist"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _remember(self, key: str, entry: _CachedSession):
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def load(self, path: PathLike,
+             verify: Optional[Callable[[SessionData], bool]] = None) -> Optional[SessionData]:
+        """
+        Decrypted session data, from memory when the file is unchanged
+
+        Args:
+            path: Session file
+            verify: Integrity check run only after an actual decrypt; a False
+                    result rejects the file and nothing is cached
+
+        Returns:
+            A copy of the session data, or None if missing/unreadable/rejected
+        """
+        cached = self.peek(path)
+        if cached is not None:
+            return cached
+
+        path = Path(path)
+        file_key = self._file_key(path)
+        if file_key is None:
+            self.invalidate(path)
+            return None
+
+        with self._lock:
+            self._stats['misses'] += 1
+        data = self.read_file(path)
+        with self._lock:
+            self._stats['decrypts'] += 1
+        if data is None:
+            return None
+        if verify is not None and not verify(data):
+            with self._lock:
+                self._stats['verify_failures'] += 1
+            self.invalidate(path)
+            return None
+
+        # Stat again: the file may have been rewritten while it was being read
+        if self._file_key(path) == file_key:
+            self._remember(str(path.resolve()),
+                           _CachedSession(file_key, copy.deepcopy(data), session_checksum(data)))
+        return data
+
+    def save(self, path: PathLike, data: SessionData) -> bool:
+        """Encrypt and write session data, caching the plaintext on success"""
+        path = Path(path)
+        if not self.write_file(path, data):
+            self.invalidate(path)
+            return False
+        with self._lock:
+            self._stats['writes'] += 1
+        file_key = self._file_key(path)
+        if file_key is not None:
+            self._remember(str(path.resolve()),
+                           _CachedSession(file_key, copy.deepcopy(data), session_checksum(data)))
+        return True
+
+    async def load_async(self, path: PathLike,
+                         verify: Optional[Callable[[SessionData], bool]] = None) -> Optional[SessionData]:
+        """load() with decryption in a worker thread; cache hits never leave the loop"""
+        cached = self.peek(path)
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self.load, path, verify)
+
+    async def save_async(self, path: PathLike, data: SessionData) -> bool:
+        """save() with encryption in a worker thread"""
+        return await asyncio.to_thread(self.save, path, data)
+
+    def peek(self, path: PathLike) -> Optional[SessionData]:
+        """Cached data if the file is unchanged, without ever decrypting"""
+        key = str(Path(path).resolve())
+        file_key = self._file_key(Path(path))
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or file_key is None or entry.file_key != file_key:
+                return None
+            self._cache.move_to_end(key)
+            self._stats['hits'] += 1
+            return copy.deepcopy(entry.data)
+
+    def checksum(self, path: PathLike) -> Optional[str]:
+        """Checksum of the cached payload of an unchanged file (no decrypt)"""
+        path = Path(path)
+        file_key = self._file_key(path)
+        with self._lock:
+            entry = self._cache.get(str(path.resolve()))
+            if entry is None or entry.file_key != file_key:
+                return None
+            return entry.checksum
+
+    def invalidate(self, path: Optional[PathLike] = None):
+        """Drop one cached session, or all of them"""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(str(Path(path).resolve()), None)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Cache hit/miss and crypto counters"""
+        with self._lock:
+            total = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'cached_sessions': len(self._cache),
+                'hit_rate': self._stats['hits'] / total if total else 0.0
+            }